@@ -8,6 +8,9 @@ import logging
 import os
 import time
 
+# Origin of the startup profile: discord.py and every module below count as imports.
+_IMPORT_STARTED = time.perf_counter()
+
 # Configure logging BEFORE importing discord to prevent duplicate handlers
 logging.basicConfig(
     level=logging.INFO,
@@ -31,7 +34,7 @@ logging.getLogger("discord.client").addFilter(_PyNaClFilter())
 
 # Now import discord after logging is configured
 import discord
-from discord.app_commands.errors import TransformerError
+from discord.app_commands.errors import CommandNotFound, TransformerError
 from discord.ext import commands
 
 # Remove any handlers discord.py added to prevent duplicate output
@@ -45,9 +48,10 @@ from config import (
     AI_MAX_TOKENS,
     AI_MODEL,
     AI_TIMEOUT_SECONDS,
+    DB_MAINTENANCE_INTERVAL_SECONDS,
+    DB_MAINTENANCE_RETRY_SECONDS,
     DB_PATH,
     DIG_LLM_ENABLED,
-    ECONOMY_EVENT_TRIGGER_HOUR_LOCAL,
     ECONOMY_EVENT_WAKE_SECONDS,
     ECONOMY_EVENTS_ENABLED,
     FIRST_GAME_POOL_DAILY_AMOUNT,
@@ -58,7 +62,10 @@ from config import (
     LOBBY_RALLY_COOLDOWN_SECONDS,
     LOBBY_READY_COOLDOWN_SECONDS,
     LOBBY_READY_THRESHOLD,
+    LOOP_PROBE_INTERVAL_SECONDS,
     MAX_DEBT,
+    PERF_METRICS_ENABLED,
+    SLOW_QUERY_THRESHOLD_MS,
     USE_GLICKO,
 )
 from domain.models.lobby import LobbyKind
@@ -73,9 +80,12 @@ from utils.command_registry import (
 )
 from utils.economy_event_display import build_public_economy_event_embed
 from utils.formatting import JOPACOIN_EMOJI_ID, JOPACOIN_EMOTE
-from utils.game_date import get_game_date
+from utils.game_date import game_day_start_ts, get_game_date
 from utils.guild import normalize_guild_id
+from utils.perf_metrics import PerfMetrics, run_loop_probe, set_perf_metrics
+from utils.startup_profile import StartupProfile
 from utils.thread_safety import ensure_thread_writable
+from utils.update_coalescer import lobby_message_coalescer, lobby_message_key
 
 # Bot setup
 
@@ -87,6 +97,13 @@ intents.presences = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 usage_monitor = UsageMonitor()
 set_global_usage_monitor(usage_monitor)
+perf_metrics = PerfMetrics(
+    enabled=PERF_METRICS_ENABLED, slow_query_ms=SLOW_QUERY_THRESHOLD_MS
+)
+set_perf_metrics(perf_metrics)
+startup_profile = StartupProfile(started_at=_IMPORT_STARTED)
+startup_profile.add_phase("imports", time.perf_counter() - _IMPORT_STARTED)
+bot.startup_profile = startup_profile
 
 # Kept locally for one-way cleanup of lobby messages created before the
 # conditional queue was retired. It is not a supported lobby reaction.
@@ -149,16 +166,16 @@ def _retain_background_task(task: asyncio.Task) -> asyncio.Task:
 # when Discord dispatches on_ready repeatedly during a reconnect.
 _reminder_recovery_task: asyncio.Task | None = None
 
-# Prediction market background task handles
-_prediction_refresh_task: asyncio.Task | None = None
-_prediction_digest_task: asyncio.Task | None = None
-_manashop_debt_task: asyncio.Task | None = None
-_duel_challenge_task: asyncio.Task | None = None
-_economy_event_task: asyncio.Task | None = None
-_first_game_pool_task: asyncio.Task | None = None
+# The one supervised task that runs every background job (see
+# services/job_scheduler_service.py).
+_job_scheduler_task: asyncio.Task | None = None
 
-DUEL_WORKER_WAKE_SECONDS = 60
+DUEL_WORKER_RETRY_SECONDS = 60
 FIRST_GAME_POOL_WAKE_SECONDS = 900
+MANASHOP_DEBT_INTERVAL_SECONDS = 3600
+
+# Last PST game-date each guild's first-game pools were funded for.
+_first_game_pool_dates: dict[int, str] = {}
 
 
 def _log_task_exit(name: str):
@@ -231,58 +248,56 @@ async def _supervised_loop(name: str, body) -> None:
             backoff = min(backoff * 2, 300)
 
 
-async def _prediction_refresh_loop() -> None:
-    """Per-market refresh worker.
+async def _prediction_refresh_job(_job: dict) -> int:
+    """Per-market refresh: drift price + repost ladder for every due market.
 
-    Wakes every ``PREDICTION_REFRESH_WAKE_SECONDS`` and processes any open
-    market whose ``last_refresh_at`` is older than ``PREDICTION_REFRESH_SECONDS``.
-    Refresh = drift price + repost ladder. If there were trades since the last
-    refresh, also posts a daily-summary message in the market thread.
+    A market is due once its ``last_refresh_at`` is ``PREDICTION_REFRESH_SECONDS``
+    old. All due markets are refreshed as one batch; if there were trades since
+    a market's last refresh, a daily-summary message is also posted in its
+    thread. The job then sleeps until the stalest open market comes due.
     """
     from config import PREDICTION_REFRESH_WAKE_SECONDS
 
-    await bot.wait_until_ready()
-    logger.info("prediction refresh loop started (wake=%ss)", PREDICTION_REFRESH_WAKE_SECONDS)
-    while not bot.is_closed():
-        try:
-            now_ts = int(time.time())
-            due = await asyncio.to_thread(
-                bot.prediction_service.get_markets_due_for_refresh, now_ts
-            )
-            logger.info("refresh wake: %d markets due", len(due))
-            for market in due:
-                try:
-                    await _process_one_refresh(market)
-                except Exception as ex:
-                    logger.exception("refresh failed for market %s: %s", market.get("prediction_id"), ex)
-        except Exception as ex:
-            logger.exception("prediction refresh outer loop error: %s", ex)
-        await asyncio.sleep(PREDICTION_REFRESH_WAKE_SECONDS)
-
-
-async def _duel_challenge_loop() -> None:
-    """Claim and deliver persisted duel reminders and expirations."""
-    await bot.wait_until_ready()
-    logger.info("duel challenge loop started (wake=%ss)", DUEL_WORKER_WAKE_SECONDS)
-    while not bot.is_closed():
-        now = int(time.time())
+    now_ts = int(time.time())
+    due = await asyncio.to_thread(
+        bot.prediction_service.get_markets_due_for_refresh, now_ts
+    )
+    logger.info("refresh run: %d markets due", len(due))
+    if due:
+        await _process_refresh_batch(due)
+    next_due = await asyncio.to_thread(bot.prediction_service.get_next_refresh_due_at)
+    # A market whose refresh failed is still due; retry it on the wake cadence.
+    if next_due <= int(time.time()):
+        return int(time.time()) + PREDICTION_REFRESH_WAKE_SECONDS
+    return next_due
+
+
+async def _duel_challenge_job(_job: dict) -> int | None:
+    """Claim and deliver persisted duel reminders and expirations.
+
+    Sleeps until the next reminder or expiry; binding a new challenge's
+    message pulls the job earlier. A challenge still due after the run
+    failed to deliver, so it is retried after ``DUEL_WORKER_RETRY_SECONDS``.
+    """
+    now = int(time.time())
+    service = getattr(bot, "duel_service", None)
+    cog = bot.get_cog("DuelCommands")
+    if service is None or cog is None:
+        return None
+    due = await asyncio.to_thread(service.get_due_challenge_ids, now)
+    for challenge_id, guild_id in due:
         try:
-            service = getattr(bot, "duel_service", None)
-            cog = bot.get_cog("DuelCommands")
-            if service is not None and cog is not None:
-                due = await asyncio.to_thread(service.get_due_challenge_ids, now)
-                for challenge_id, guild_id in due:
-                    try:
-                        await cog.process_due_challenge(challenge_id, guild_id, now)
-                    except Exception:  # noqa: BLE001
-                        logger.exception(
-                            "duel due delivery failed challenge=%s guild=%s",
-                            challenge_id,
-                            guild_id,
-                        )
+            await cog.process_due_challenge(challenge_id, guild_id, now)
         except Exception:  # noqa: BLE001
-            logger.exception("duel challenge loop wake failed")
-        await asyncio.sleep(DUEL_WORKER_WAKE_SECONDS)
+            logger.exception(
+                "duel due delivery failed challenge=%s guild=%s",
+                challenge_id,
+                guild_id,
+            )
+    next_due = await asyncio.to_thread(service.get_next_due_at)
+    if next_due is not None and next_due <= now:
+        return now + DUEL_WORKER_RETRY_SECONDS
+    return next_due
 
 
 async def _announce_economy_event(guild: discord.Guild, event: dict) -> bool:
@@ -323,90 +338,80 @@ async def _announce_economy_event(guild: discord.Guild, event: dict) -> bool:
     return True
 
 
-async def _economy_event_loop() -> None:
+async def _economy_event_job(_job: dict) -> float:
     """Activate one rolling-band economy event per day."""
-    await bot.wait_until_ready()
-    logger.info(
-        "economy event loop started (wake=%ss trigger=%02d:00 Pacific events=%s)",
-        ECONOMY_EVENT_WAKE_SECONDS,
-        ECONOMY_EVENT_TRIGGER_HOUR_LOCAL,
-        ECONOMY_EVENTS_ENABLED,
-    )
-    while not bot.is_closed():
-        for guild in list(bot.guilds):
-            try:
-                event, _created = await asyncio.to_thread(
-                    bot.economy_event_service.ensure_daily_event,
-                    guild.id,
-                )
-                # Durable stamps make the initial post and its 12-hour
-                # reminder independently retryable after delivery failures.
-                announcement_slot = (
-                    bot.economy_event_service.pending_announcement_slot(event)
-                    if event
-                    else None
-                )
-                if announcement_slot:
-                    announced = await _announce_economy_event(guild, event)
-                    if announced:
-                        marker = (
-                            bot.economy_event_service.mark_event_announced
-                            if announcement_slot == "initial"
-                            else bot.economy_event_service.mark_event_reminder_announced
-                        )
-                        await asyncio.to_thread(marker, guild.id, event["event_id"])
-            except Exception:  # noqa: BLE001
-                logger.exception("economy event wake failed for guild=%s", guild.id)
-        sleep_seconds = ECONOMY_EVENT_WAKE_SECONDS
+    for guild in list(bot.guilds):
         try:
-            seconds_until_trigger = await asyncio.to_thread(
-                bot.economy_event_service.seconds_until_next_trigger
+            event, _created = await asyncio.to_thread(
+                bot.economy_event_service.ensure_daily_event,
+                guild.id,
             )
-            sleep_seconds = min(
-                ECONOMY_EVENT_WAKE_SECONDS,
-                max(0.0, float(seconds_until_trigger)),
+            # Durable stamps make the initial post and its 12-hour
+            # reminder independently retryable after delivery failures.
+            announcement_slot = (
+                bot.economy_event_service.pending_announcement_slot(event)
+                if event
+                else None
             )
+            if announcement_slot:
+                announced = await _announce_economy_event(guild, event)
+                if announced:
+                    marker = (
+                        bot.economy_event_service.mark_event_announced
+                        if announcement_slot == "initial"
+                        else bot.economy_event_service.mark_event_reminder_announced
+                    )
+                    await asyncio.to_thread(marker, guild.id, event["event_id"])
         except Exception:  # noqa: BLE001
-            logger.exception(
-                "economy event trigger scheduling failed; using configured wake interval"
-            )
-        await asyncio.sleep(sleep_seconds)
+            logger.exception("economy event run failed for guild=%s", guild.id)
+    delay = ECONOMY_EVENT_WAKE_SECONDS
+    try:
+        seconds_until_trigger = await asyncio.to_thread(
+            bot.economy_event_service.seconds_until_next_trigger
+        )
+        delay = min(ECONOMY_EVENT_WAKE_SECONDS, max(0.0, float(seconds_until_trigger)))
+    except Exception:  # noqa: BLE001
+        logger.exception(
+            "economy event trigger scheduling failed; using configured wake interval"
+        )
+    return time.time() + delay
 
 
-async def _first_game_pool_loop() -> None:
-    """Fund both stacked lobby pools once per fixed-PST game-date."""
-    await bot.wait_until_ready()
-    logger.info(
-        "first-game pool loop started (wake=%ss daily=%s JC per lobby)",
-        FIRST_GAME_POOL_WAKE_SECONDS,
-        FIRST_GAME_POOL_DAILY_AMOUNT,
-    )
-    # Funding is processed at most once per PST game-date per guild, so
-    # remember the last date each guild processed and skip the redundant
-    # BEGIN IMMEDIATE write transaction on the ~95 other daily wakes.
-    processed_game_dates: dict[int, str] = {}
-    while not bot.is_closed():
-        game_date = get_game_date()
-        for guild in list(bot.guilds):
-            if processed_game_dates.get(guild.id) == game_date:
-                continue
-            try:
-                funding = await asyncio.to_thread(
-                    bot.loan_service.fund_first_game_pools,
-                    guild.id,
-                    game_date,
-                    FIRST_GAME_POOL_DAILY_AMOUNT,
-                )
-                processed_game_dates[guild.id] = game_date
-                if isinstance(funding, dict) and funding.get("funded_dates"):
-                    await _refresh_first_game_pool_lobby_messages(guild.id)
-            except Exception:  # noqa: BLE001
-                logger.exception(
-                    "first-game pool funding failed for guild=%s date=%s",
-                    guild.id,
-                    game_date,
-                )
-        await asyncio.sleep(FIRST_GAME_POOL_WAKE_SECONDS)
+async def _first_game_pool_job(_job: dict) -> int:
+    """Fund both stacked lobby pools once per fixed-PST game-date.
+
+    Funding only changes at the 4 AM PST rollover, so the job sleeps until
+    the next one. Guilds already funded for the current date (remembered in
+    ``_first_game_pool_dates``) skip the BEGIN IMMEDIATE write transaction;
+    a failed guild is retried after ``FIRST_GAME_POOL_WAKE_SECONDS``.
+    """
+    now = int(time.time())
+    game_date = get_game_date()
+    failed = False
+    for guild in list(bot.guilds):
+        if _first_game_pool_dates.get(guild.id) == game_date:
+            continue
+        try:
+            funding = await asyncio.to_thread(
+                bot.loan_service.fund_first_game_pools,
+                guild.id,
+                game_date,
+                FIRST_GAME_POOL_DAILY_AMOUNT,
+            )
+            _first_game_pool_dates[guild.id] = game_date
+            if isinstance(funding, dict) and funding.get("funded_dates"):
+                await _refresh_first_game_pool_lobby_messages(guild.id)
+        except Exception:  # noqa: BLE001
+            failed = True
+            logger.exception(
+                "first-game pool funding failed for guild=%s date=%s",
+                guild.id,
+                game_date,
+            )
+    next_rollover = game_day_start_ts(now) + 86400
+    if failed:
+        return min(next_rollover, now + FIRST_GAME_POOL_WAKE_SECONDS)
+    return next_rollover
 
 
 async def _refresh_first_game_pool_lobby_messages(guild_id: int) -> None:
@@ -477,9 +482,49 @@ async def _refresh_first_game_pool_lobby_messages(guild_id: int) -> None:
 bot.refresh_first_game_pool_lobby_messages = _refresh_first_game_pool_lobby_messages
 
 
+async def _process_refresh_batch(markets: list[dict]) -> None:
+    """Refresh ``markets`` in one read/write pass, then publish results concurrently."""
+    from config import PREDICTION_REFRESH_POST_CONCURRENCY
+
+    try:
+        summaries = await asyncio.to_thread(
+            bot.prediction_service.refresh_markets,
+            [market["prediction_id"] for market in markets],
+        )
+    except Exception:
+        logger.exception(
+            "batched refresh failed for %d markets; refreshing one at a time", len(markets)
+        )
+        for market in markets:
+            try:
+                await _process_one_refresh(market)
+            except Exception as ex:
+                logger.exception("refresh failed for market %s: %s", market.get("prediction_id"), ex)
+        return
+
+    semaphore = asyncio.Semaphore(max(1, PREDICTION_REFRESH_POST_CONCURRENCY))
+
+    async def publish(market: dict, summary: dict) -> None:
+        async with semaphore:
+            try:
+                await _publish_refresh(market, summary)
+            except Exception as ex:
+                logger.exception("refresh publish failed for market %s: %s", market.get("prediction_id"), ex)
+
+    await asyncio.gather(
+        *(publish(market, summary) for market, summary in zip(markets, summaries, strict=True))
+    )
+
+
 async def _process_one_refresh(market: dict) -> None:
     pid = market["prediction_id"]
     summary = await asyncio.to_thread(bot.prediction_service.refresh_market, pid)
+    await _publish_refresh(market, summary)
+
+
+async def _publish_refresh(market: dict, summary: dict) -> None:
+    """Re-render the market embed and post the daily summary for one refresh."""
+    pid = market["prediction_id"]
     if summary.get("skipped"):
         logger.info("refresh skipped pid=%s reason=%s", pid, summary.get("reason"))
         return
@@ -553,50 +598,80 @@ def _next_digest_run(now, anchor_hours):
     return min(c for c in candidates if c > now)
 
 
-async def _prediction_digest_loop() -> None:
-    """Twice-a-day digest of open markets, posted to each guild's gamba channel.
-
-    Fires at ``PREDICTION_DIGEST_HOUR_UTC`` and 12h opposite it (every 12 hours).
-    """
+def _digest_anchor_hours() -> list[int]:
+    """UTC hours of the digest: ``PREDICTION_DIGEST_HOUR_UTC`` and 12h opposite it."""
     from config import PREDICTION_DIGEST_HOUR_UTC
 
-    anchor_hours = sorted(
+    return sorted(
         {PREDICTION_DIGEST_HOUR_UTC % 24, (PREDICTION_DIGEST_HOUR_UTC + 12) % 24}
     )
-    await bot.wait_until_ready()
-    logger.info("prediction digest loop started (anchor_hours_utc=%s)", anchor_hours)
-    while not bot.is_closed():
-        try:
-            now = _dt.datetime.now(_dt.UTC)
-            target = _next_digest_run(now, anchor_hours)
-            wait_s = max(60.0, (target - now).total_seconds())
-            await asyncio.sleep(wait_s)
-            logger.info("digest firing for %d guilds", len(bot.guilds))
-            await _post_daily_digest_all_guilds()
-        except Exception as ex:
-            logger.exception("digest outer loop error: %s", ex)
-            await asyncio.sleep(60)
 
 
-async def _manashop_debt_loop() -> None:
-    await bot.wait_until_ready()
-    logger.info("manashop debt loop started")
-    while not bot.is_closed():
-        try:
-            buff_service = getattr(bot, "buff_service", None)
-            player_repo = getattr(bot, "player_repo", None)
-            bankruptcy_repo = getattr(bot, "bankruptcy_repo", None)
-            if buff_service is not None and player_repo is not None and bankruptcy_repo is not None:
-                settled = await asyncio.to_thread(
-                    buff_service.settle_due_dark_bargains,
-                    player_repo=player_repo,
-                    bankruptcy_repo=bankruptcy_repo,
-                )
-                if settled:
-                    logger.info("settled %d due Dark Bargain debt(s): %s", len(settled), settled)
-        except Exception as ex:
-            logger.exception("manashop debt loop error: %s", ex)
-        await asyncio.sleep(3600)
+async def _prediction_digest_job(_job: dict) -> float:
+    """Twice-a-day digest of open markets, posted to each guild's gamba channel."""
+    logger.info("digest firing for %d guilds", len(bot.guilds))
+    await _post_daily_digest_all_guilds()
+    now = _dt.datetime.now(_dt.UTC)
+    return _next_digest_run(now, _digest_anchor_hours()).timestamp()
+
+
+async def _manashop_debt_job(_job: dict) -> None:
+    buff_service = getattr(bot, "buff_service", None)
+    player_repo = getattr(bot, "player_repo", None)
+    bankruptcy_repo = getattr(bot, "bankruptcy_repo", None)
+    if buff_service is None or player_repo is None or bankruptcy_repo is None:
+        return None
+    settled = await asyncio.to_thread(
+        buff_service.settle_due_dark_bargains,
+        player_repo=player_repo,
+        bankruptcy_repo=bankruptcy_repo,
+    )
+    if settled:
+        logger.info("settled %d due Dark Bargain debt(s): %s", len(settled), settled)
+    return None
+
+
+async def _db_maintenance_job(_job: dict) -> float | None:
+    """SQLite checkpoint/ANALYZE/vacuum pass, deferred while a lobby or match is live."""
+    maintenance = getattr(bot, "database_maintenance_service", None)
+    if maintenance is None:
+        return None
+    report = await asyncio.to_thread(maintenance.run)
+    if report is None or not report.completed:
+        return time.time() + DB_MAINTENANCE_RETRY_SECONDS
+    return None
+
+
+def _register_background_jobs(scheduler) -> None:
+    """Register bot.py's recurring jobs; cogs register their own in ``cog_load``."""
+    scheduler.register("prediction_refresh", _prediction_refresh_job)
+    scheduler.register(
+        "prediction_digest",
+        _prediction_digest_job,
+        first_due_at=_next_digest_run(
+            _dt.datetime.now(_dt.UTC), _digest_anchor_hours()
+        ).timestamp(),
+    )
+    scheduler.register(
+        "manashop_debt",
+        _manashop_debt_job,
+        interval_seconds=MANASHOP_DEBT_INTERVAL_SECONDS,
+    )
+    scheduler.register("duel_challenges", _duel_challenge_job)
+    if ECONOMY_EVENTS_ENABLED:
+        scheduler.register("economy_events", _economy_event_job)
+    if FIRST_GAME_POOL_DAILY_AMOUNT > 0:
+        scheduler.register("first_game_pool", _first_game_pool_job)
+        # Funding is idempotent per game-date, so run it on start too: guilds
+        # joined while the bot was down should not wait for the rollover.
+        scheduler.schedule("first_game_pool", due_at=time.time())
+    if DB_MAINTENANCE_INTERVAL_SECONDS > 0:
+        scheduler.register(
+            "db_maintenance",
+            _db_maintenance_job,
+            interval_seconds=DB_MAINTENANCE_INTERVAL_SECONDS,
+            first_due_at=time.time() + DB_MAINTENANCE_RETRY_SECONDS,
+        )
 
 
 async def _post_daily_digest_all_guilds() -> None:
@@ -732,9 +807,30 @@ EXTENSIONS = [
     "commands.survey",
 ]
 
+# Cogs behind the commands a lobby needs (/lobby, /shuffle, /record and player
+# registration). setup_hook loads only these, so the gateway connects without
+# waiting on the rest; DEFERRED_EXTENSIONS load in the background right after.
+CORE_EXTENSIONS = ("commands.registration", "commands.lobby", "commands.match")
+DEFERRED_EXTENSIONS = [ext for ext in EXTENSIONS if ext not in CORE_EXTENSIONS]
+
+# Third-party modules the deferred cogs' renderers import at module level.
+# Importing them on a worker thread first keeps those imports off the event
+# loop, so core commands stay responsive while the rest of the bot loads.
+# (matplotlib and litellm stay lazy: they load on first chart / first LLM call.)
+_DEFERRED_PRELOAD_MODULES = (
+    "numpy",
+    "PIL.Image",
+    "PIL.ImageDraw",
+    "PIL.ImageFilter",
+    "PIL.ImageFont",
+    "pilmoji",
+)
+
+_deferred_extensions_task: asyncio.Task | None = None
 
-async def _load_extensions():
-    """Load command extensions if not already loaded."""
+
+async def _load_extensions(extensions=EXTENSIONS, *, stage: str = "Extension load"):
+    """Load command extensions if not already loaded; return the newly loaded ones."""
     # Ensure services are initialized before loading extensions
     _init_services()
 
@@ -742,7 +838,7 @@ async def _load_extensions():
     skipped_extensions = []
     failed_extensions = []
 
-    for ext in EXTENSIONS:
+    for ext in extensions:
         if ext in bot.extensions:
             skipped_extensions.append(ext)
             logger.debug(f"Extension {ext} already loaded, skipping")
@@ -754,14 +850,73 @@ async def _load_extensions():
         except Exception as exc:
             failed_extensions.append(ext)
             logger.error(f"Failed to load extension {ext}: {exc}", exc_info=True)
+        # Each load runs synchronously on the loop; let queued events through
+        # between cogs when this runs in the background.
+        await asyncio.sleep(0)
 
     # Log summary
     logger.info(
-        f"Extension loading complete: {len(loaded_extensions)} loaded, "
+        f"{stage} complete: {len(loaded_extensions)} loaded, "
         f"{len(skipped_extensions)} skipped, {len(failed_extensions)} failed"
     )
 
-    _log_command_registration("Extension load")
+    _log_command_registration(stage)
+    return loaded_extensions
+
+
+def _preload_deferred_modules() -> None:
+    import importlib
+
+    for module_name in _DEFERRED_PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as exc:
+            # The owning cog reports the real failure when it loads.
+            logger.debug("Startup preload of %s skipped: %s", module_name, exc)
+
+
+async def _load_deferred_extensions() -> None:
+    """Load the non-core cogs while the gateway connects."""
+    with startup_profile.phase("deferred_preload"):
+        await asyncio.to_thread(_preload_deferred_modules)
+    with startup_profile.phase("deferred_extensions"):
+        loaded = await _load_extensions(DEFERRED_EXTENSIONS, stage="Deferred extension load")
+    if bot.is_ready():
+        # READY was dispatched before these cogs registered their listeners.
+        _replay_ready_listeners(loaded)
+    startup_profile.mark("all_commands_loaded")
+    startup_profile.log()
+
+
+def _replay_ready_listeners(extensions: list[str]) -> None:
+    modules = set(extensions)
+    for cog in list(bot.cogs.values()):
+        if type(cog).__module__ not in modules:
+            continue
+        for name, listener in cog.get_listeners():
+            if name == "on_ready":
+                _retain_background_task(asyncio.create_task(listener()))
+
+
+def _start_deferred_extensions() -> asyncio.Task:
+    global _deferred_extensions_task
+    if _deferred_extensions_task is None:
+        _deferred_extensions_task = asyncio.create_task(_load_deferred_extensions())
+        _deferred_extensions_task.add_done_callback(_log_task_exit("deferred_extensions"))
+    return _deferred_extensions_task
+
+
+async def _wait_for_deferred_extensions() -> None:
+    task = _deferred_extensions_task
+    if task is not None and not task.done():
+        # asyncio.wait neither cancels the load if on_ready is cancelled nor
+        # re-raises its failure; the done-callback already logs that.
+        await asyncio.wait({task})
+
+
+def _deferred_extensions_loading() -> bool:
+    task = _deferred_extensions_task
+    return task is not None and not task.done()
 
 
 
@@ -777,14 +932,64 @@ async def update_lobby_message(
     lobby_kind: LobbyKind | str | None = None,
     clear_content: bool = False,
     lobby_service=None,
+    immediate: bool = False,
 ) -> bool:
-    """Refresh lobby embed on the pinned lobby message (also updates thread since msg is thread starter)."""
+    """Refresh lobby embed on the pinned lobby message (also updates thread since msg is thread starter).
+
+    Refreshes for the same message are coalesced: while one is pending, newer
+    calls replace its lobby snapshot and share its result, and edits are spaced
+    by ``LOBBY_EMBED_MIN_EDIT_INTERVAL_SECONDS`` unless the lobby just became
+    ready or ``immediate`` is set.
+    """
     if lobby_service is None:
         _init_services()  # Ensure services are initialized
         lobby_service = bot.lobby_service
     kind = _normalize_lobby_kind_or_open(
         lobby_kind if lobby_kind is not None else getattr(lobby, "kind", None)
     )
+    # Every roster change lands here; keep the lobby's pre-shuffle current.
+    speculator = getattr(bot, "shuffle_speculation_service", None)
+    if speculator is not None:
+        speculator.notify(guild_id, kind)
+    request = {
+        "message": message,
+        "lobby": lobby,
+        "guild_id": guild_id,
+        "expected_message_id": expected_message_id,
+        "kind": kind,
+        "clear_content": clear_content,
+        "lobby_service": lobby_service,
+    }
+    return await lobby_message_coalescer.submit(
+        lobby_message_key(guild_id, kind, message),
+        request,
+        _publish_lobby_message,
+        immediate=immediate or _lobby_is_ready(lobby_service, lobby),
+        merge=_merge_lobby_message_requests,
+    )
+
+
+def _lobby_is_ready(lobby_service, lobby) -> bool:
+    try:
+        return bool(lobby_service.is_ready(lobby))
+    except Exception:
+        return False
+
+
+def _merge_lobby_message_requests(queued: dict, newer: dict) -> dict:
+    # Latest snapshot wins, but a caller that asked to strip message content
+    # must not lose that because a plain refresh superseded it.
+    if queued["clear_content"] and not newer["clear_content"]:
+        return {**newer, "clear_content": True}
+    return newer
+
+
+async def _publish_lobby_message(request: dict) -> bool:
+    lobby = request["lobby"]
+    guild_id = request["guild_id"]
+    kind = request["kind"]
+    expected_message_id = request["expected_message_id"]
+    lobby_service = request["lobby_service"]
     lock = _get_lobby_message_update_lock(guild_id, kind)
     async with lock:
         try:
@@ -813,9 +1018,9 @@ async def update_lobby_message(
                     "embed": embed,
                     "allowed_mentions": discord.AllowedMentions.none(),
                 }
-                if clear_content:
+                if request["clear_content"]:
                     edit_kwargs["content"] = None
-                await message.edit(**edit_kwargs)
+                await request["message"].edit(**edit_kwargs)
                 logger.info(f"Updated lobby embed: {lobby.get_player_count()} players")
                 return True
         except Exception as exc:
@@ -1352,10 +1557,38 @@ def clear_lobby_rally_cooldowns(
         del _lobby_ready_cooldowns[key]
 
 
+def _mark_commands_available() -> None:
+    """Time to first command: core cogs loaded and gateway up, whichever is later."""
+    startup_profile.mark_after("commands_available", "core_commands_loaded", "gateway_ready")
+
+
 @bot.event
 async def setup_hook():
-    """Load command cogs."""
-    await _load_extensions()
+    """Load the core cogs now and the rest in the background."""
+    services_started = time.perf_counter()
+    _init_services()
+    # The database stage covers schema creation and pending migrations.
+    schema_seconds = _container.init_timings.get("database", 0.0)
+    startup_profile.add_phase("schema", schema_seconds)
+    startup_profile.add_phase("services", time.perf_counter() - services_started - schema_seconds)
+    with startup_profile.phase("core_extensions"):
+        await _load_extensions(CORE_EXTENSIONS, stage="Core extension load")
+    # Returning lets discord.py open the gateway; core commands answer as
+    # soon as it is up.
+    startup_profile.mark("core_commands_loaded")
+    _mark_commands_available()
+    _start_deferred_extensions()
+    if PERF_METRICS_ENABLED:
+        _retain_background_task(
+            asyncio.create_task(
+                _supervised_loop(
+                    "loop_probe",
+                    lambda: run_loop_probe(
+                        perf_metrics, interval_seconds=LOOP_PROBE_INTERVAL_SECONDS
+                    ),
+                )
+            )
+        )
 
 
 def _log_command_registration(stage: str):
@@ -1417,6 +1650,14 @@ async def _refresh_vanity_tax_memberships_async() -> None:
     await asyncio.to_thread(_refresh_vanity_tax_memberships, snapshot)
 
 
+@bot.event
+async def on_guild_join(guild: discord.Guild) -> None:
+    """Fund a newly joined guild's first-game pools without waiting for the rollover."""
+    scheduler = getattr(bot, "job_scheduler", None)
+    if FIRST_GAME_POOL_DAILY_AMOUNT > 0 and scheduler is not None:
+        scheduler.schedule("first_game_pool", due_at=time.time())
+
+
 @bot.event
 async def on_member_join(member: discord.Member) -> None:
     service = getattr(bot, "vanity_tax_service", None)
@@ -1444,9 +1685,14 @@ async def on_member_remove(member: discord.Member) -> None:
 @bot.event
 async def on_ready():
     """Called when bot is ready."""
+    startup_profile.mark("gateway_ready")
+    _mark_commands_available()
     logger.info(f"{bot.user} connected. Guilds: {len(bot.guilds)}")
     await _refresh_vanity_tax_memberships_async()
 
+    # Syncing a partial tree would delete the deferred cogs' commands from
+    # Discord, so the sync waits for background loading to finish.
+    await _wait_for_deferred_extensions()
     _log_command_registration("Pre-sync")
     logger.info(f"Loaded cogs: {list(bot.cogs.keys())}")
 
@@ -1497,48 +1743,20 @@ async def on_ready():
         )
         region_task.add_done_callback(_log_region_backfill)
 
-    # Start prediction-market background tasks (refresh worker + daily digest).
-    # Both are wrapped in a supervisor that auto-restarts the body on a
-    # crash, and a done-callback that surfaces an unexpected exit to the log
-    # so we can never lose a feature to silent failure.
-    global _prediction_refresh_task, _prediction_digest_task, _manashop_debt_task
-    global _duel_challenge_task, _economy_event_task, _first_game_pool_task
-    if _prediction_refresh_task is None or _prediction_refresh_task.done():
-        _prediction_refresh_task = bot.loop.create_task(
-            _supervised_loop("prediction_refresh", _prediction_refresh_loop)
-        )
-        _prediction_refresh_task.add_done_callback(_log_task_exit("prediction_refresh"))
-    if _prediction_digest_task is None or _prediction_digest_task.done():
-        _prediction_digest_task = bot.loop.create_task(
-            _supervised_loop("prediction_digest", _prediction_digest_loop)
-        )
-        _prediction_digest_task.add_done_callback(_log_task_exit("prediction_digest"))
-    if _manashop_debt_task is None or _manashop_debt_task.done():
-        _manashop_debt_task = bot.loop.create_task(
-            _supervised_loop("manashop_debt", _manashop_debt_loop)
-        )
-        _manashop_debt_task.add_done_callback(_log_task_exit("manashop_debt"))
-    if _duel_challenge_task is None or _duel_challenge_task.done():
-        _duel_challenge_task = bot.loop.create_task(
-            _supervised_loop("duel_challenges", _duel_challenge_loop)
-        )
-        _duel_challenge_task.add_done_callback(
-            _log_task_exit("duel_challenges")
-        )
-    if ECONOMY_EVENTS_ENABLED and (
-        _economy_event_task is None or _economy_event_task.done()
-    ):
-        _economy_event_task = bot.loop.create_task(
-            _supervised_loop("economy_events", _economy_event_loop)
-        )
-        _economy_event_task.add_done_callback(_log_task_exit("economy_events"))
-    if FIRST_GAME_POOL_DAILY_AMOUNT > 0 and (
-        _first_game_pool_task is None or _first_game_pool_task.done()
+    # Every recurring background job runs on the shared scheduler. It is
+    # wrapped in a supervisor that auto-restarts it on a crash, and a
+    # done-callback that surfaces an unexpected exit to the log so we can
+    # never lose a feature to silent failure.
+    global _job_scheduler_task
+    scheduler = getattr(bot, "job_scheduler", None)
+    if scheduler is not None and (
+        _job_scheduler_task is None or _job_scheduler_task.done()
     ):
-        _first_game_pool_task = bot.loop.create_task(
-            _supervised_loop("first_game_pool", _first_game_pool_loop)
+        _register_background_jobs(scheduler)
+        _job_scheduler_task = bot.loop.create_task(
+            _supervised_loop("job_scheduler", scheduler.run)
         )
-        _first_game_pool_task.add_done_callback(_log_task_exit("first_game_pool"))
+        _job_scheduler_task.add_done_callback(_log_task_exit("job_scheduler"))
 
     reminder_svc = getattr(bot, "reminder_service", None)
     if reminder_svc:
@@ -1551,6 +1769,9 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
     """Global error handler for app commands - prevents infinite 'thinking...' state."""
     usage_monitor.record_command_failure()
     command = interaction.command
+    perf_metrics.command_finished(
+        getattr(interaction, "id", None), getattr(command, "qualified_name", None)
+    )
     qualified_name = getattr(command, "qualified_name", "") or ""
     interaction_data = interaction.data
     root_name = interaction_data.get("name", "") if isinstance(interaction_data, dict) else ""
@@ -1585,6 +1806,10 @@ async def on_app_command_error(interaction: discord.Interaction, error: discord.
             f"Could not find user `{value}`. "
             "Please use @mention or select from Discord's user picker when typing."
         )
+    elif isinstance(error, CommandNotFound) and _deferred_extensions_loading():
+        # Discord still knows the previous deploy's commands; this one's cog
+        # is a few seconds away from being loaded.
+        error_msg = "The bot is still starting up. Please try again in a few seconds."
     else:
         # Generic error message
         error_msg = "An error occurred while processing your command. Please try again."
@@ -1612,7 +1837,17 @@ async def on_interaction(interaction: discord.Interaction):
     if interaction.type != discord.InteractionType.application_command:
         return
     command = interaction.command
+    startup_profile.mark("first_command")
     usage_monitor.record_command(getattr(command, "qualified_name", None) or getattr(command, "name", None))
+    perf_metrics.command_started(interaction.id)
+
+
+@bot.event
+async def on_app_command_completion(interaction: discord.Interaction, command) -> None:
+    """Close the latency sample opened in ``on_interaction``."""
+    perf_metrics.command_finished(
+        getattr(interaction, "id", None), getattr(command, "qualified_name", None)
+    )
 
 
 def _is_sword_emoji(emoji) -> bool:
@@ -2036,6 +2271,7 @@ async def on_raw_reaction_add(payload):
                 payload.guild_id,
                 lobby_kind=lobby_kind,
             )
+            await lobby_cog.arm_curfew_sweep(user.id, payload.guild_id)
 
         # Mention user in thread to subscribe them
         thread_id = await asyncio.to_thread(
@@ -4,6 +4,7 @@ Admin commands: maintenance helpers and testing utilities.
 
 import asyncio
 import functools
+import io
 import logging
 import random
 import time
@@ -711,7 +712,10 @@ class AdminCommands(commands.Cog):
         await interaction.response.send_message(message[:2000], ephemeral=True)
 
     @admin.command(name="health", description="Show bot health and since-startup usage (Admin only)")
-    async def health(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        prometheus="Attach latency histograms as a Prometheus text dump",
+    )
+    async def health(self, interaction: discord.Interaction, prometheus: bool = False):
         if not has_admin_permission(interaction):
             await interaction.response.send_message(
                 "❌ Admin only! You need Administrator or Manage Server permissions.",
@@ -732,12 +736,22 @@ class AdminCommands(commands.Cog):
             return
 
         snapshot = await asyncio.to_thread(monitoring_service.snapshot, self.bot)
-        if can_respond:
+        if not can_respond:
+            return
+        if prometheus:
+            dump = monitoring_service.prometheus_text().encode("utf-8")
             await safe_followup(
                 interaction,
                 content=format_health_snapshot(snapshot),
+                file=discord.File(io.BytesIO(dump), filename="metrics.prom"),
                 ephemeral=True,
             )
+            return
+        await safe_followup(
+            interaction,
+            content=format_health_snapshot(snapshot),
+            ephemeral=True,
+        )
 
     @admin.command(
         name="addfake", description="Add fake users to lobby for testing (Admin only)"
@@ -17,15 +17,16 @@ from discord.ext import commands
 from commands.checks import require_guild
 from config import AI_RATE_LIMIT_REQUESTS, AI_RATE_LIMIT_WINDOW
 from utils.interaction_safety import safe_defer, safe_followup
-from utils.rate_limiter import RateLimiter
+from utils.rate_limiter import GLOBAL_LOAD_BUDGET, RateLimiter
 
 if TYPE_CHECKING:
     from services.sql_query_service import SQLQueryService
 
 logger = logging.getLogger("cama_bot.commands.ask")
 
-# Rate limiter for AI queries (separate from global to control AI costs)
-AI_RATE_LIMITER = RateLimiter()
+# Rate limiter for AI queries (separate from global to control AI costs); an
+# LLM round trip still draws on the bot-wide load budget.
+AI_RATE_LIMITER = RateLimiter(budget=GLOBAL_LOAD_BUDGET)
 
 
 class AskCommands(commands.Cog):
@@ -73,10 +74,12 @@ class AskCommands(commands.Cog):
             user_id=interaction.user.id,
             limit=AI_RATE_LIMIT_REQUESTS,
             per_seconds=AI_RATE_LIMIT_WINDOW,
+            cost=5,
         )
         if not rl_result.allowed:
+            reason = "The bot is busy" if rl_result.shed else "Rate limited"
             await interaction.response.send_message(
-                f"Rate limited. Try again in {rl_result.retry_after_seconds:.0f} seconds.",
+                f"{reason}. Try again in {rl_result.retry_after_seconds:.0f} seconds.",
                 ephemeral=True,
             )
             return
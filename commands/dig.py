@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from commands.checks import require_dig_channel, require_guild
 
@@ -86,6 +86,7 @@ from services.dig_constants import get_layer as get_layer_def
 from services.permissions import has_admin_permission
 from utils.embed_safety import add_lines_field, truncate_field
 from utils.formatting import JOPACOIN_EMOTE
+from utils.game_date import game_day_start_ts
 from utils.interaction_safety import safe_defer, safe_followup, send_public_or_ephemeral
 from utils.neon_helpers import get_neon_service, send_neon_result
 from utils.pet_activity import record_pet_activity
@@ -184,19 +185,28 @@ class DigCommands(commands.Cog):
         self._last_weather_date: str | None = None
 
     async def cog_load(self) -> None:
-        self._weather_broadcast_loop.start()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.register(
+                "dig_weather",
+                self._weather_broadcast,
+                first_due_at=game_day_start_ts(int(time.time())) + 86400,
+            )
 
     async def cog_unload(self) -> None:
-        self._weather_broadcast_loop.cancel()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.unregister("dig_weather")
 
-    @tasks.loop(minutes=10)
-    async def _weather_broadcast_loop(self) -> None:
-        """Check every 10 min if the game day rolled over; if so, post weather."""
+    async def _weather_broadcast(self, _job: dict | None = None) -> int:
+        """Post the day's layer weather just after each game-day rollover."""
         today = await asyncio.to_thread(self.dig_service._get_game_date)
-        if today == self._last_weather_date:
-            return
-        self._last_weather_date = today
+        if today != self._last_weather_date:
+            self._last_weather_date = today
+            await self._broadcast_weather()
+        return game_day_start_ts(int(time.time())) + 86400
 
+    async def _broadcast_weather(self) -> None:
         for guild in self.bot.guilds:
             try:
                 weather = await asyncio.to_thread(self.dig_service.get_weather, guild.id)
@@ -232,11 +242,6 @@ class DigCommands(commands.Cog):
             except Exception:
                 logger.exception("Failed to broadcast weather for guild %s", guild.id)
 
-    @_weather_broadcast_loop.before_loop
-    async def _before_weather_loop(self) -> None:
-        await self.bot.wait_until_ready()
-        self._last_weather_date = await asyncio.to_thread(self.dig_service._get_game_date)
-
     # ------------------------------------------------------------------
     # Channel routing
     # ------------------------------------------------------------------
@@ -523,11 +528,13 @@ class DigCommands(commands.Cog):
 
         guild_id = interaction.guild.id
         rl = GLOBAL_RATE_LIMITER.check(
-            scope="dig", guild_id=guild_id, user_id=interaction.user.id, limit=2, per_seconds=30
+            scope="dig", guild_id=guild_id, user_id=interaction.user.id, limit=2, per_seconds=30,
+            cost=2,
         )
         if not rl.allowed:
+            reason = "The tunnels are crowded" if rl.shed else "Slow down"
             await interaction.response.send_message(
-                f"Slow down! Wait {rl.retry_after_seconds}s.", ephemeral=True
+                f"{reason}! Wait {rl.retry_after_seconds}s.", ephemeral=True
             )
             return
 
@@ -216,7 +216,7 @@ class DuelCommands(commands.Cog):
             return
 
         try:
-            await asyncio.to_thread(
+            bound = await asyncio.to_thread(
                 self.duel_service.bind_message,
                 challenge.challenge_id,
                 guild_id,
@@ -239,6 +239,7 @@ class DuelCommands(commands.Cog):
                 actor_id,
             )
             return
+        self._schedule_due_work(bound)
 
         try:
             await message.edit(
@@ -948,7 +949,7 @@ class DuelCommands(commands.Cog):
             return
 
         try:
-            await asyncio.to_thread(
+            bound = await asyncio.to_thread(
                 self.duel_service.bind_message,
                 challenge.challenge_id,
                 challenge.guild_id,
@@ -970,6 +971,7 @@ class DuelCommands(commands.Cog):
             await self._delete_unbound_replacement(message, challenge)
             await self._mark_recovery_delivery_failed(challenge)
             return
+        self._schedule_due_work(bound)
 
         view = DuelChallengeView(self, challenge.challenge_id)
         self.bot.add_view(view, message_id=message.id)
@@ -981,6 +983,16 @@ class DuelCommands(commands.Cog):
                 challenge.challenge_id,
             )
 
+    def _schedule_due_work(self, challenge: DuelChallenge) -> None:
+        """Pull the duel worker's next run up to a newly bound challenge's deadline."""
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is None:
+            return
+        due_at = challenge.expires_at
+        if challenge.next_reminder_at is not None:
+            due_at = min(due_at, challenge.next_reminder_at)
+        scheduler.schedule("duel_challenges", due_at=due_at)
+
     async def _mark_recovery_delivery_failed(
         self, challenge: DuelChallenge
     ) -> None:
@@ -1254,10 +1254,12 @@ class InfoCommands(commands.Cog):
             user_id=interaction.user.id,
             limit=2,
             per_seconds=30,
+            cost=3,
         )
         if not rl.allowed:
+            reason = "The bot is busy right now" if rl.shed else "Please wait"
             await interaction.response.send_message(
-                f"⏳ Please wait {rl.retry_after_seconds}s before using `/calibration` again.",
+                f"⏳ {reason}; try `/calibration` again in {rl.retry_after_seconds}s.",
                 ephemeral=True,
             )
             return
@@ -12,7 +12,7 @@ from collections.abc import Awaitable
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from commands.checks import require_guild
 from config import LOBBY_CHANNEL_ID, LOWSKILL_LOBBY_CHANNEL_ID
@@ -45,6 +45,10 @@ LOWSKILL_CUTOFF_TEXT = f"{LobbyService.LOWSKILL_RATING_CUTOFF:.0f}"
 # AFK no-shows) instead of editing it in place.
 READYCHECK_STALE_THRESHOLD = 30 * 60  # 30 minutes
 
+# The curfew sweep runs when the next queued player's window starts; one that
+# could not remove a player in an active window retries after this long.
+CURFEW_SWEEP_RETRY_SECONDS = 60
+
 
 def _get_recent_signup_ids(player_data: dict[int, dict]) -> set[int]:
     """Return lobby signups that are recent enough to count as ready."""
@@ -95,27 +99,33 @@ class LobbyCommands(commands.Cog):
         self._lobby_player_notification_tasks: set[asyncio.Task] = set()
 
     async def cog_load(self) -> None:
-        if self.curfew_service is not None:
-            self._curfew_sweep_loop.start()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if self.curfew_service is not None and scheduler is not None:
+            scheduler.register("curfew_sweep", self._curfew_sweep)
 
     async def cog_unload(self) -> None:
-        if self.curfew_service is not None:
-            self._curfew_sweep_loop.cancel()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.unregister("curfew_sweep")
 
     # ────────────────────────────────────────────────────────────────────
     # Curfew-window enforcement
     # ────────────────────────────────────────────────────────────────────
 
-    @tasks.loop(minutes=1)
-    async def _curfew_sweep_loop(self):
+    async def _curfew_sweep(self, _job: dict | None = None) -> int | None:
+        """Remove queued players whose window started; sleep until the next one starts.
+
+        Joins and new windows pull the job earlier (see ``arm_curfew_sweep``).
+        """
         guild_ids = [guild.id for guild in self.bot.guilds]
         if not guild_ids:
-            return
+            return None
+        now = int(time.time())
         try:
             kicks = await asyncio.to_thread(self.curfew_service.sweep, guild_ids)
         except Exception:
             logger.exception("Curfew sweep failed")
-            return
+            return now + CURFEW_SWEEP_RETRY_SECONDS
         for kick in kicks:
             try:
                 await self._deliver_curfew_kick(kick)
@@ -125,10 +135,29 @@ class LobbyCommands(commands.Cog):
                     kick.discord_id,
                     kick.guild_id,
                 )
-
-    @_curfew_sweep_loop.before_loop
-    async def _before_curfew_sweep(self):
-        await self.bot.wait_until_ready()
+        try:
+            next_at = await asyncio.to_thread(self.curfew_service.next_sweep_at, guild_ids)
+        except Exception:
+            logger.exception("Curfew sweep scheduling failed")
+            return now + CURFEW_SWEEP_RETRY_SECONDS
+        if next_at is not None and next_at <= now:
+            return now + CURFEW_SWEEP_RETRY_SECONDS
+        return next_at
+
+    async def arm_curfew_sweep(self, discord_id: int, guild_id: int | None) -> None:
+        """Schedule the curfew sweep for when this player's next window starts."""
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if self.curfew_service is None or scheduler is None:
+            return
+        try:
+            due_at = await asyncio.to_thread(
+                self.curfew_service.next_window_start, [discord_id], guild_id
+            )
+        except Exception:
+            logger.exception("Curfew sweep scheduling failed for discord_id=%s", discord_id)
+            return
+        if due_at is not None:
+            scheduler.schedule("curfew_sweep", due_at=due_at)
 
     async def _deliver_curfew_kick(self, kick) -> None:
         """DM a player removed from a lobby by the curfew sweep, then refresh the display."""
@@ -1111,6 +1140,7 @@ class LobbyCommands(commands.Cog):
             lobby.kind,
             join_cutoff_ns,
         )
+        await self.arm_curfew_sweep(interaction.user.id, guild_id)
 
         # Refresh lobby state
         lobby = await asyncio.to_thread(
@@ -1812,6 +1842,7 @@ class LobbyCommands(commands.Cog):
             lobby_kind,
             join_cutoff_ns,
         )
+        await self.arm_curfew_sweep(interaction.user.id, guild_id)
 
         # Refresh lobby state after join
         active_lobby = await asyncio.to_thread(
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from commands.checks import require_mafia_channel
 from config import MAFIA_CHANNEL_ID
@@ -50,6 +50,10 @@ ROLE_EMOJI = {
 }
 GODFATHER_EMOJI = "👑"
 THREAD_MEMBER_CONCURRENCY = 4
+# The phase job sleeps until the next reminder or fallback deadline; joins,
+# actions and votes wake it early. This is only the retry delay when a tick
+# leaves work already due (e.g. a resolve that raised).
+PHASE_TICK_RETRY_S = 5 * 60
 
 TWIST_LABEL = {
     MafiaTwist.BLOOD_MOON: "🌑 Blood Moon",
@@ -98,10 +102,14 @@ class MafiaCommands(commands.Cog):
         self._announced_phases: dict[int, set[tuple[str, str]]] = {}
 
     async def cog_load(self) -> None:
-        self._mafia_phase_loop.start()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.register("mafia_phase", self._mafia_phase_tick)
 
     async def cog_unload(self) -> None:
-        self._mafia_phase_loop.cancel()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.unregister("mafia_phase")
 
     # ────────────────────────────────────────────────────────────────────
     # Subcommands
@@ -169,6 +177,7 @@ class MafiaCommands(commands.Cog):
                 result.get("error", "Action rejected."), ephemeral=True
             )
             return
+        self._wake_phase_tick()
 
         if action_map[role] == MafiaActionType.INVESTIGATE:
             verdict = result.get("result", "?")
@@ -203,6 +212,7 @@ class MafiaCommands(commands.Cog):
                 result.get("error", "Vote rejected."), ephemeral=True
             )
             return
+        self._wake_phase_tick()
         verb = "changed to" if result.get("changed") else "locked in for"
         await interaction.response.send_message(
             f"🗳️ Vote {verb} {target.mention}. You can change it until dusk; "
@@ -251,6 +261,7 @@ class MafiaCommands(commands.Cog):
                 ephemeral=True,
             )
             return
+        self._wake_phase_tick()
         await interaction.response.send_message(
             "✅ You're queued for the next available Mafia roster. Seats go to "
             "registered, entry-fee-eligible players in signup order.",
@@ -314,6 +325,7 @@ class MafiaCommands(commands.Cog):
                 ephemeral=True,
             )
             return
+        self._wake_phase_tick()
         await self._post_setup(interaction.guild, game)
         await self._update_standings_board(interaction.guild, game)
         await interaction.followup.send(
@@ -336,6 +348,7 @@ class MafiaCommands(commands.Cog):
         if not summary.get("resolved"):
             await interaction.followup.send("No active game to stop.", ephemeral=True)
             return
+        self._wake_phase_tick()
         refreshed = await asyncio.to_thread(
             self.mafia_service.repo.get_game_by_id, summary["game_id"]
         )
@@ -361,6 +374,7 @@ class MafiaCommands(commands.Cog):
         if not result.get("ok"):
             await interaction.followup.send("No active game to abort.", ephemeral=True)
             return
+        self._wake_phase_tick()
         channel = _mafia_post_channel(interaction.guild)
         if channel is not None:
             if result.get("standings_message_id"):
@@ -535,6 +549,7 @@ class MafiaCommands(commands.Cog):
         await asyncio.to_thread(
             self.mafia_service.set_optout, guild_id, interaction.user.id, True
         )
+        self._wake_phase_tick()
         await interaction.response.send_message(
             "You're opted out. Mafia won't wait for or remind you, and any "
             "next-game signup was cancelled. Use `/mafia optin` to resume.",
@@ -549,6 +564,7 @@ class MafiaCommands(commands.Cog):
         await asyncio.to_thread(
             self.mafia_service.set_optout, guild_id, interaction.user.id, False
         )
+        self._wake_phase_tick()
         await interaction.response.send_message(
             "Welcome back. Use `/mafia join` if you want a seat in the next game.",
             ephemeral=True,
@@ -558,17 +574,43 @@ class MafiaCommands(commands.Cog):
     # Background phase loop
     # ────────────────────────────────────────────────────────────────────
 
-    @tasks.loop(minutes=5)
-    async def _mafia_phase_loop(self):
+    async def _mafia_phase_tick(self, _job: dict | None = None) -> int | None:
+        """Advance every guild's game and sleep until the earliest next deadline.
+
+        Returns None (sleep until woken) when no guild has a game running.
+        """
+        now = int(time.time())
+        due: list[int] = []
         for guild in list(self.bot.guilds):
             try:
-                await self._tick_guild(guild)
+                next_due = await self._tick_guild(guild)
             except Exception:
-                logger.exception("Mafia phase loop failed for guild %s", guild.id)
-
-    @_mafia_phase_loop.before_loop
-    async def _before_loop(self):
-        await self.bot.wait_until_ready()
+                logger.exception("Mafia phase tick failed for guild %s", guild.id)
+                next_due = now + PHASE_TICK_RETRY_S
+            if next_due is not None:
+                due.append(next_due)
+        if not due:
+            return None
+        earliest = min(due)
+        return earliest if earliest > now else now + PHASE_TICK_RETRY_S
+
+    def _wake_phase_tick(self) -> None:
+        """Run the phase job now so a join, action or vote is acted on promptly."""
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.schedule("mafia_phase", due_at=time.time())
+
+    @classmethod
+    def _next_deadline(cls, game, now: int) -> int | None:
+        """When an ACTIVE game next needs a tick: its reminder, else its fallback end."""
+        if game is None or getattr(game, "status", "ACTIVE") != "ACTIVE":
+            return None
+        if game.phase not in (MafiaPhase.NIGHT, MafiaPhase.DAY):
+            return None
+        phase_start = game.phase_started_at or game.started_at
+        reminder_at = phase_start + PHASE_REMINDER_AFTER_S
+        ends_at = cls._phase_ends_at(game)
+        return reminder_at if now < reminder_at < ends_at else ends_at
 
     @staticmethod
     def _phase_ends_at(game) -> int:
@@ -584,7 +626,15 @@ class MafiaCommands(commands.Cog):
             await self._post_setup(guild, new_game)
             await self._update_standings_board(guild, new_game)
 
-    async def _tick_guild(self, guild: discord.Guild) -> None:
+    async def _tick_guild(self, guild: discord.Guild) -> int | None:
+        """Advance one guild's game and return when it next needs a tick."""
+        await self._advance_guild(guild)
+        game = await asyncio.to_thread(
+            self.mafia_service.repo.get_active_game, guild.id
+        )
+        return self._next_deadline(game, int(time.time()))
+
+    async def _advance_guild(self, guild: discord.Guild) -> None:
         guild_id = guild.id
         game = await asyncio.to_thread(
             self.mafia_service.repo.get_active_game, guild_id
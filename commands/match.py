@@ -48,6 +48,7 @@ from utils.pin_helpers import safe_unpin_message
 from utils.rate_limiter import GLOBAL_RATE_LIMITER
 from utils.region import REGION_NAMES, resolve_region, summarize_region
 from utils.streaming import get_streaming_player_ids
+from utils.update_coalescer import flush_lobby_message_updates
 
 logger = logging.getLogger("cama_bot.commands.match")
 
@@ -1194,6 +1195,9 @@ class MatchCommands(commands.Cog):
         """Post the shuffle embed, persist its location, schedule reminders,
         lock the lobby thread, unpin, and reset the lobby."""
         kind = LobbyKind.normalize(lobby_kind)
+        # Land any debounced roster refresh before the lobby is torn down so it
+        # cannot publish a stale embed after the shuffle.
+        await flush_lobby_message_updates(guild_id, kind)
         lobby_channel_id = await asyncio.to_thread(
             self.lobby_service.get_lobby_channel_id,
             guild_id=guild_id,
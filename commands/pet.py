@@ -12,12 +12,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from functools import partial
 from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from commands.checks import require_guild, require_pet_channel
 from commands.pet_helpers import brawl_embeds
@@ -67,6 +68,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("cama_bot.commands.pet")
 
+# Hatches, evolutions, deaths and refunds are delivered by the sweep job,
+# which sleeps until the next one is due. Adopting, sacrificing and
+# challenging pull it earlier; this is only the retry delay after a failed
+# delivery or refund.
+PET_SWEEP_RETRY_SECONDS = 10 * 60
+
 FOOD_CHOICES = [
     app_commands.Choice(
         name=f"{food.display_name} ({food.cost} JC, +{food.restore} fullness)",
@@ -106,10 +113,14 @@ class PetCommands(commands.Cog):
         self._direct_death_deliveries: dict[int, int] = {}
 
     async def cog_load(self) -> None:
-        self._pet_sweep_loop.start()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.register("pet_sweep", self._pet_sweep)
 
     async def cog_unload(self) -> None:
-        self._pet_sweep_loop.cancel()
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.unregister("pet_sweep")
 
     # ────────────────────────────────────────────────────────────────────
     # Shared composition
@@ -284,6 +295,7 @@ class PetCommands(commands.Cog):
             await safe_followup(interaction, content=f"❌ {result.error}", ephemeral=True)
             return
         adopted = result.value["pet"]
+        self._schedule_sweep(adopted.hatched_at)
         gilded = result.value["egg_tier"] == "gilded"
         upgraded = result.value["upgraded"]
         flair = "a **gilded egg**" if gilded else "an egg"
@@ -696,6 +708,7 @@ class PetCommands(commands.Cog):
             await safe_followup(interaction, content=f"❌ {result.error}", ephemeral=True)
             return
         challenge = result.value
+        self._schedule_sweep(challenge["brawl"].expires_at)
         embed, file = await asyncio.to_thread(
             brawl_embeds.build_challenge_embed,
             challenge["brawl"],
@@ -796,6 +809,8 @@ class PetCommands(commands.Cog):
             return
         dead = result.value["dead_pet"]
         egg = result.value["new_pet"]
+        # The altar death is announced by the sweep.
+        self._schedule_sweep(int(time.time()))
         embed = discord.Embed(
             title=f"🩸 {dead.name} was given to the altar",
             description=(
@@ -1024,18 +1039,59 @@ class PetCommands(commands.Cog):
     # Background sweep
     # ────────────────────────────────────────────────────────────────────
 
-    @tasks.loop(minutes=10)
-    async def _pet_sweep_loop(self):
+    async def _pet_sweep(self, _job: dict | None = None) -> int:
+        """Run one sweep and return when the next one is due."""
+        now = int(time.time())
+        retry_at = now + PET_SWEEP_RETRY_SECONDS
+        complete = True
         if self.pet_brawl_service is not None:
             try:
                 await asyncio.to_thread(self.pet_brawl_service.sweep_stale)
             except Exception:
                 logger.exception("Pet brawl sweep failed")
+                complete = False
         try:
             result = await asyncio.to_thread(self.pet_service.sweep)
         except Exception:
             logger.exception("Pet sweep failed")
-            return
+            return retry_at
+        complete &= await self._deliver_sweep_batch(result)
+        complete &= not result.get("retry", False)
+        # Further hatch/death pages stream in as each batch is delivered.
+        cursor = result.get("cursor")
+        while cursor is not None:
+            try:
+                result = await asyncio.to_thread(
+                    self.pet_service.next_announcements, cursor
+                )
+            except Exception:
+                logger.exception("Pet announcement paging failed")
+                return retry_at
+            complete &= await self._deliver_sweep_batch(result)
+            cursor = result.get("cursor")
+        if not complete:
+            return retry_at
+        try:
+            due = [await asyncio.to_thread(self.pet_service.next_sweep_at)]
+            if self.pet_brawl_service is not None:
+                due.append(await asyncio.to_thread(self.pet_brawl_service.next_sweep_at))
+        except Exception:
+            logger.exception("Pet sweep scheduling failed")
+            return retry_at
+        next_due = min((at for at in due if at is not None), default=None)
+        # Work still due now (e.g. a death the eat command is delivering)
+        # waits one retry delay rather than spinning.
+        return retry_at if next_due is None or next_due <= now else next_due
+
+    def _schedule_sweep(self, due_at: int) -> None:
+        """Pull the sweep job forward to ``due_at``."""
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.schedule("pet_sweep", due_at=due_at)
+
+    async def _deliver_sweep_batch(self, result: dict) -> bool:
+        """Deliver one sweep page; False when any notice failed and must retry."""
+        delivered = True
         for hatch in result["hatches"]:
             try:
                 await self._deliver_hatch(hatch)
@@ -1043,6 +1099,7 @@ class PetCommands(commands.Cog):
                 logger.exception(
                     "Hatch delivery failed for pet %s; will retry", hatch.pet.pet_id
                 )
+                delivered = False
         for evolution in result.get("evolutions", []):
             try:
                 await self._deliver_evolution(evolution)
@@ -1051,6 +1108,7 @@ class PetCommands(commands.Cog):
                     "Evolution delivery failed for pet %s; will retry",
                     evolution.pet.pet_id,
                 )
+                delivered = False
         for death in result["deaths"]:
             if getattr(self, "_direct_death_deliveries", {}).get(
                 death.pet.pet_id, 0
@@ -1062,6 +1120,7 @@ class PetCommands(commands.Cog):
                 logger.exception(
                     "Death delivery failed for pet %s; will retry", death.pet.pet_id
                 )
+                delivered = False
         for refund in result["refunds"]:
             try:
                 await self._deliver_refund(refund)
@@ -1069,10 +1128,8 @@ class PetCommands(commands.Cog):
                 logger.exception(
                     "Refund summary failed for guild %s", refund.guild_id
                 )
-
-    @_pet_sweep_loop.before_loop
-    async def _before_sweep(self):
-        await self.bot.wait_until_ready()
+                delivered = False
+        return delivered
 
     def _pet_channel(self, guild_id: int) -> discord.TextChannel | None:
         if not PET_CHANNEL_ID:
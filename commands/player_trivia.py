@@ -31,6 +31,9 @@ from utils.pet_activity import record_pet_activity
 logger = logging.getLogger("cama_bot.commands.player_trivia")
 
 OPTION_LABELS = ("A", "B", "C", "D")
+# Background refresh of the precomputed question pools (see
+# PlayerTriviaService.refresh_question_pools).
+QUESTION_POOL_REFRESH_INTERVAL_S = 60
 
 
 @dataclass
@@ -309,6 +312,25 @@ class PlayerTriviaCog(commands.Cog):
         self.bot = bot
         self._sessions: dict[tuple[int, int], PlayerTriviaSession] = {}
 
+    async def cog_load(self) -> None:
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.register(
+                "player_trivia_pool",
+                self._refresh_question_pools,
+                interval_seconds=QUESTION_POOL_REFRESH_INTERVAL_S,
+            )
+
+    async def cog_unload(self) -> None:
+        scheduler = getattr(self.bot, "job_scheduler", None)
+        if scheduler is not None:
+            scheduler.unregister("player_trivia_pool")
+
+    async def _refresh_question_pools(self, _job: dict | None = None) -> None:
+        rebuilt = await asyncio.to_thread(self.bot.player_trivia_service.refresh_question_pools)
+        if rebuilt:
+            logger.debug("Rebuilt %d player-trivia question pool(s)", rebuilt)
+
     async def _edit_component_message(
         self,
         interaction: discord.Interaction,
@@ -1937,10 +1937,12 @@ class ProfileCommands(commands.Cog):
             user_id=interaction.user.id,
             limit=5,
             per_seconds=30,
+            cost=2,
         )
         if not rl.allowed:
+            reason = "The bot is busy right now" if rl.shed else "Please wait"
             await interaction.response.send_message(
-                f"⏳ Please wait {rl.retry_after_seconds}s before using `/profile` again.",
+                f"⏳ {reason}; try `/profile` again in {rl.retry_after_seconds}s.",
                 ephemeral=True,
             )
             return
@@ -926,6 +926,9 @@ class RegistrationCommands(commands.Cog):
             "already in while inside this window.",
             ephemeral=True,
         )
+        lobby_cog = self.bot.get_cog("LobbyCommands")
+        if lobby_cog is not None:
+            await lobby_cog.arm_curfew_sweep(interaction.user.id, guild_id)
 
     @player_curfew.command(name="remove", description="Remove one of your named curfew windows")
     @app_commands.describe(name="The window's name")
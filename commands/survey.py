@@ -20,12 +20,14 @@ from domain.models.survey import (
     Survey,
     SurveyQuestion,
     SurveyQuestionType,
+    SurveyRecipient,
     SurveyResults,
     SurveySession,
     SurveyStatus,
     SurveyTargetType,
 )
 from services.permissions import has_admin_permission
+from services.survey_delivery_engine import SurveyDeliveryEngine
 from utils.embed_safety import truncate_field
 from utils.formatting import escape_discord_text
 from utils.interaction_safety import safe_defer, safe_followup
@@ -33,8 +35,10 @@ from utils.interaction_safety import safe_defer, safe_followup
 logger = logging.getLogger("cama_bot.commands.survey")
 
 _ALLOWED_MENTIONS = discord.AllowedMentions.none()
-_DELIVERY_BATCH_SIZE = 25
+_DELIVERY_BATCH_SIZE = 250
 _DELIVERY_CONCURRENCY = 5
+_DELIVERY_SENDS_PER_SECOND = 10.0
+_DELIVERY_COMMIT_BATCH_SIZE = 25
 _DELIVERY_STALE_SECONDS = 300
 _DELIVERY_RECEIPT_GRACE_SECONDS = 30
 _DELIVERY_RECEIPT_SCAN_LIMIT = 500
@@ -826,6 +830,15 @@ class SurveyCommands(commands.Cog):
         self._delivery_lock = asyncio.Lock()
         self._delivery_semaphore = asyncio.Semaphore(_DELIVERY_CONCURRENCY)
         self._recovery_edit_semaphore = asyncio.Semaphore(_DELIVERY_CONCURRENCY)
+        self._delivery_engine = SurveyDeliveryEngine(
+            survey_service,
+            self._send_survey_dm,
+            max_concurrency=_DELIVERY_CONCURRENCY,
+            sends_per_second=_DELIVERY_SENDS_PER_SECOND,
+            chunk_size=_DELIVERY_COMMIT_BATCH_SIZE,
+        )
+        # Cumulative delivery throughput for this process.
+        self.delivery_stats = self._delivery_engine.totals
         self._ready_recovery_lock = asyncio.Lock()
         self._delivery_recovery_handle: asyncio.TimerHandle | None = None
         self._delivery_recovery_task: asyncio.Task[None] | None = None
@@ -1232,128 +1245,52 @@ class SurveyCommands(commands.Cog):
             raise ValueError("Survey response has no current question")
         return _question_embed(session, question)
 
-    async def _deliver_recipient(self, recipient) -> None:
-        async with self._delivery_semaphore:
+    async def _send_survey_dm(
+        self, recipient: SurveyRecipient, session: SurveySession
+    ) -> tuple[int, int]:
+        user = self.bot.get_user(recipient.discord_id)
+        if user is None:
+            user = await self.bot.fetch_user(recipient.discord_id)
+        message = await user.send(
+            embed=self._response_embed(session),
+            view=self._response_view(session),
+            nonce=_delivery_nonce(recipient.recipient_id),
+            allowed_mentions=_ALLOWED_MENTIONS,
+        )
+        return int(message.channel.id), int(message.id)
+
+    async def _deliver_claims(self, claims: list[SurveyRecipient]) -> None:
+        """Send one claimed batch and arm recovery for anything left unresolved."""
+        stats = await self._delivery_engine.deliver(claims)
+        logger.info(
+            "Survey delivery batch: %d sent, %d failed, %d rate limited in %.1fs (%.1f/s)",
+            stats.sent,
+            stats.failed,
+            stats.rate_limited,
+            stats.elapsed_seconds,
+            stats.sends_per_second,
+        )
+        if stats.failed or stats.unsaved_failures:
+            self._schedule_delivery_recovery(_DELIVERY_RECEIPT_GRACE_SECONDS)
+        if stats.unrecorded:
+            self._schedule_delivery_recovery(_DELIVERY_STALE_SECONDS)
+        for survey_id, discord_id in stats.late_receipts:
+            # The survey closed while this DM was in flight: replace its
+            # controls with the closed state.
             try:
-                session = await asyncio.to_thread(
+                latest = await asyncio.to_thread(
                     self.survey_service.get_response_session,
-                    recipient.survey_id,
-                    recipient.discord_id,
-                )
-            except Exception as exc:
-                # No Discord send was attempted, so this attempt can safely
-                # become a retryable delivery failure.
-                error_name = type(exc).__name__
-                logger.warning(
-                    "Survey delivery session could not be loaded (%s)",
-                    error_name,
-                )
-                try:
-                    await asyncio.to_thread(
-                        self.survey_service.mark_delivery_failed,
-                        recipient.recipient_id,
-                        recipient.attempt_count,
-                        error_name,
-                    )
-                except Exception as persist_exc:
-                    logger.warning(
-                        "Survey delivery failure state could not be saved (%s)",
-                        type(persist_exc).__name__,
-                    )
-                self._schedule_delivery_recovery(_DELIVERY_RECEIPT_GRACE_SECONDS)
-                return
-
-            if session is None:
-                error_name = "SessionUnavailable"
-                logger.warning("Survey DM delivery failed (%s)", error_name)
-                try:
-                    await asyncio.to_thread(
-                        self.survey_service.mark_delivery_failed,
-                        recipient.recipient_id,
-                        recipient.attempt_count,
-                        error_name,
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        "Survey delivery failure state could not be saved (%s)",
-                        type(exc).__name__,
-                    )
-                self._schedule_delivery_recovery(_DELIVERY_RECEIPT_GRACE_SECONDS)
-                return
-
-            try:
-                user = self.bot.get_user(recipient.discord_id)
-                if user is None:
-                    user = await self.bot.fetch_user(recipient.discord_id)
-                await asyncio.to_thread(
-                    self.survey_service.renew_delivery_claim,
-                    recipient.recipient_id,
-                    recipient.attempt_count,
-                )
-                view = self._response_view(session)
-                message = await user.send(
-                    embed=self._response_embed(session),
-                    view=view,
-                    nonce=_delivery_nonce(recipient.recipient_id),
-                    allowed_mentions=_ALLOWED_MENTIONS,
-                )
-            except Exception as exc:
-                # Never log respondent IDs or answer content. The persisted error is
-                # intentionally reduced to a category for the same privacy reason.
-                error_name = type(exc).__name__
-                logger.warning("Survey DM delivery failed (%s)", error_name)
-                try:
-                    await asyncio.to_thread(
-                        self.survey_service.mark_delivery_failed,
-                        recipient.recipient_id,
-                        recipient.attempt_count,
-                        error_name,
-                    )
-                except Exception as persist_exc:
-                    logger.warning(
-                        "Survey delivery failure state could not be saved (%s)",
-                        type(persist_exc).__name__,
-                    )
-                self._schedule_delivery_recovery(_DELIVERY_RECEIPT_GRACE_SECONDS)
-                return
-
-            try:
-                await asyncio.to_thread(
-                    self.survey_service.mark_delivery_sent,
-                    recipient.recipient_id,
-                    recipient.attempt_count,
-                    int(message.channel.id),
-                    int(message.id),
+                    survey_id,
+                    discord_id,
                 )
+                if latest is not None and latest.survey.status is SurveyStatus.CLOSED:
+                    await self._reconcile_response_message(latest)
             except Exception as exc:
-                # The DM succeeded. Do not relabel it as failed: the message's
-                # persistent component IDs and exact receipt let recovery
-                # resolve it.
                 logger.warning(
-                    "Survey delivery receipt could not be persisted (%s)",
+                    "Survey delivery receipt recovery was deferred (%s)",
                     type(exc).__name__,
                 )
-                try:
-                    await asyncio.to_thread(
-                        self.survey_service.reconcile_delivery_sent,
-                        recipient.recipient_id,
-                        recipient.attempt_count,
-                        int(message.channel.id),
-                        int(message.id),
-                    )
-                    latest = await asyncio.to_thread(
-                        self.survey_service.get_response_session,
-                        recipient.survey_id,
-                        recipient.discord_id,
-                    )
-                    if latest is not None and latest.survey.status is SurveyStatus.CLOSED:
-                        await self._reconcile_response_message(latest)
-                except Exception as reconcile_exc:
-                    logger.warning(
-                        "Survey delivery receipt recovery was deferred (%s)",
-                        type(reconcile_exc).__name__,
-                    )
-                    self._schedule_delivery_recovery(_DELIVERY_STALE_SECONDS)
+                self._schedule_delivery_recovery(_DELIVERY_STALE_SECONDS)
 
     async def _reconcile_delivery_receipt(self, recipient) -> bool:
         """Check DM history before a possibly delivered attempt can be retried."""
@@ -1470,10 +1407,7 @@ class SurveyCommands(commands.Cog):
                 )
                 if not claims:
                     break
-                await asyncio.gather(
-                    *(self._deliver_recipient(recipient) for recipient in claims),
-                    return_exceptions=False,
-                )
+                await self._deliver_claims(claims)
                 delivered += len(claims)
             return delivered
         except Exception:
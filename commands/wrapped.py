@@ -19,6 +19,7 @@ from commands.checks import require_guild
 from services.wrapped_service import get_random_flavor
 from utils.hero_lookup import get_hero_name
 from utils.interaction_safety import safe_defer, safe_followup
+from utils.rate_limiter import GLOBAL_RATE_LIMITER
 from utils.wrapped_drawing import (
     SLIDE_COLORS,
     draw_awards_grid,
@@ -495,7 +496,6 @@ class WrappedCog(commands.Cog):
     @app_commands.describe(
         user="View another user's wrapped",
     )
-    @app_commands.checks.cooldown(1, 60)
     @require_guild
     async def wrapped(
         self,
@@ -509,6 +509,22 @@ class WrappedCog(commands.Cog):
             )
             return
 
+        rl = GLOBAL_RATE_LIMITER.check(
+            scope="wrapped",
+            guild_id=interaction.guild.id,
+            user_id=interaction.user.id,
+            limit=1,
+            per_seconds=60,
+            cost=8,
+        )
+        if not rl.allowed:
+            reason = "The bot is busy right now" if rl.shed else "Please wait"
+            await interaction.response.send_message(
+                f"⏳ {reason}; try `/wrapped` again in {rl.retry_after_seconds}s.",
+                ephemeral=True,
+            )
+            return
+
         if not await safe_defer(interaction):
             return
 
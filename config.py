@@ -84,11 +84,26 @@ TAX_MAN_USER_IDS = _parse_int_list_raw(
     [],
 )
 TAX_FINE_COOLDOWN_SECONDS = _parse_int("TAX_FINE_COOLDOWN_SECONDS", 30 * 24 * 60 * 60)
+# Background jobs share one scheduler: at most this many run at once, and a
+# failed run is retried after base * 2^(attempt-1) seconds, capped at the max.
+JOB_SCHEDULER_MAX_CONCURRENCY = _parse_int("JOB_SCHEDULER_MAX_CONCURRENCY", 4)
+JOB_RETRY_BASE_SECONDS = _parse_int("JOB_RETRY_BASE_SECONDS", 30)
+JOB_RETRY_MAX_SECONDS = _parse_int("JOB_RETRY_MAX_SECONDS", 3600)
+# SQLite maintenance (WAL checkpoint, ANALYZE, incremental vacuum) runs once per
+# interval when no lobby or match is live, retrying sooner while one is (0
+# disables). No step waits for or holds the write lock much beyond the budget.
+DB_MAINTENANCE_INTERVAL_SECONDS = _parse_int("DB_MAINTENANCE_INTERVAL_SECONDS", 24 * 60 * 60)
+DB_MAINTENANCE_RETRY_SECONDS = _parse_int("DB_MAINTENANCE_RETRY_SECONDS", 15 * 60)
+DB_MAINTENANCE_MAX_LOCK_MS = _parse_int("DB_MAINTENANCE_MAX_LOCK_MS", 250)
 
 LOBBY_READY_THRESHOLD = _parse_int("LOBBY_READY_THRESHOLD", 10)
 LOBBY_MAX_PLAYERS = _parse_int("LOBBY_MAX_PLAYERS", 20)
 LOBBY_RALLY_COOLDOWN_SECONDS = _parse_int("LOBBY_RALLY_COOLDOWN_SECONDS", 120)  # 2 minutes
 LOBBY_READY_COOLDOWN_SECONDS = _parse_int("LOBBY_READY_COOLDOWN_SECONDS", 60)
+# Minimum spacing between lobby embed edits; bursts of joins coalesce into one edit
+LOBBY_EMBED_MIN_EDIT_INTERVAL_SECONDS = _parse_float(
+    "LOBBY_EMBED_MIN_EDIT_INTERVAL_SECONDS", 1.0
+)
 
 # Optional explicit gamba channel. Commands and announcements prefer this ID;
 # name-based discovery remains the fallback for multi-guild deployments.
@@ -435,6 +450,10 @@ AI_MAX_TOKENS = _parse_int("AI_MAX_TOKENS", 500)
 AI_RATE_LIMIT_REQUESTS = _parse_int("AI_RATE_LIMIT_REQUESTS", 10)  # Requests per window
 AI_RATE_LIMIT_WINDOW = _parse_int("AI_RATE_LIMIT_WINDOW", 60)  # Window in seconds
 AI_FEATURES_ENABLED = _parse_bool("AI_FEATURES_ENABLED", False)  # Global default for AI flavor text
+# Bot-wide load budget shared by every rate-limited command, in cost units
+# (an ordinary command costs 1). Expensive commands are shed once it runs dry.
+RATE_LIMIT_GLOBAL_BUDGET = _parse_int("RATE_LIMIT_GLOBAL_BUDGET", 240)
+RATE_LIMIT_GLOBAL_WINDOW_SECONDS = _parse_int("RATE_LIMIT_GLOBAL_WINDOW_SECONDS", 60)
 DIG_LLM_ENABLED = _parse_bool("DIG_LLM_ENABLED", True)  # Hard kill switch for Dig LLM calls
 
 # Glicko-2 rating system configuration
@@ -549,6 +568,9 @@ PREDICTION_REFRESH_SECONDS = _parse_int(
 PREDICTION_REFRESH_WAKE_SECONDS = _parse_int(
     "PREDICTION_REFRESH_WAKE_SECONDS", 3600
 )  # how often the worker wakes to scan
+PREDICTION_REFRESH_POST_CONCURRENCY = _parse_int(
+    "PREDICTION_REFRESH_POST_CONCURRENCY", 4
+)  # embed refreshes / thread summaries posted at once after a batch refresh
 PREDICTION_DRIFT_MIN = _parse_int("PREDICTION_DRIFT_MIN", -3)  # inclusive uniform integer drift
 PREDICTION_DRIFT_MAX = _parse_int("PREDICTION_DRIFT_MAX", 3)
 PREDICTION_FADE_TICKS = _parse_int(
@@ -615,3 +637,14 @@ NEON_BIGWIN_FULL_PAYOUT = _parse_int(
 NEON_BIGWIN_MIN_PAYOUT = _parse_int(
     "NEON_BIGWIN_MIN_PAYOUT", 500
 )  # Min payout to qualify for a big-win GIF
+
+# Hot-path latency instrumentation (command histograms, SQL timing, loop lag).
+# Off by default: it wraps every SQL statement and fetch, which costs more
+# than the cheapest queries it times. Turn it on to profile.
+PERF_METRICS_ENABLED = _parse_bool("PERF_METRICS_ENABLED", False)
+SLOW_QUERY_THRESHOLD_MS = _parse_float("SLOW_QUERY_THRESHOLD_MS", 100.0)
+LOOP_PROBE_INTERVAL_SECONDS = _parse_float("LOOP_PROBE_INTERVAL_SECONDS", 5.0)
+
+# Read-through Player cache (0 disables); entries are validated against
+# per-player version stamps maintained by triggers on ``players``.
+PLAYER_CACHE_MAX_ENTRIES = _parse_int("PLAYER_CACHE_MAX_ENTRIES", 2048)
@@ -7,12 +7,16 @@ from dataclasses import dataclass
 from domain.rating_constants import OPENSKILL_DISPLAY_SCALE, OPENSKILL_MIN_MU
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     Represents a player in the matchmaking system.
 
     This is a pure domain model with no infrastructure dependencies.
+
+    Slotted: whole guilds are loaded at once for percentiles and
+    calibration, and a per-instance ``__dict__`` would more than double
+    each player's footprint. Only the declared fields can be set.
     """
 
     name: str
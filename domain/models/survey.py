@@ -105,6 +105,19 @@ class SurveyRecipient:
     updated_at: int
 
 
+@dataclass(frozen=True, slots=True)
+class SurveyDeliveryOutcomes:
+    """Recipient IDs from one grouped commit of delivery outcomes."""
+
+    sent: tuple[int, ...] = ()
+    # DM receipts attached after the claim stopped being sendable, e.g. the
+    # survey closed mid-send; their controls may need reconciling.
+    reconciled: tuple[int, ...] = ()
+    failed: tuple[int, ...] = ()
+    # Outcomes whose claim was no longer active; nothing was written.
+    rejected: tuple[int, ...] = ()
+
+
 @dataclass(frozen=True, slots=True)
 class SurveyDraftAnswer:
     """One respondent-local draft answer without a respondent identifier."""
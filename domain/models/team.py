@@ -54,6 +54,8 @@ class Team:
     ROLES = ["1", "2", "3", "4", "5"]
     TEAM_SIZE = 5
 
+    __slots__ = ("players", "role_assignments")
+
     def __init__(self, players: list[Player], role_assignments: list[str] | None = None):
         """
         Initialize a team.
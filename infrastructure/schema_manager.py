@@ -49,6 +49,9 @@ class SchemaManager:
         conn = sqlite3.connect(self.db_path, uri=self.use_uri, isolation_level=None)
         conn.row_factory = sqlite3.Row
         if not self.use_uri:  # Skip WAL for in-memory databases
+            # Only takes effect on a new, empty file; existing databases are
+            # converted offline (scripts/db_maintenance.py).
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA busy_timeout=5000")
         return conn
@@ -888,6 +891,27 @@ class SchemaManager:
                 "add_curfew_window_days_column",
                 self._migration_add_curfew_window_days_column,
             ),
+            (
+                "create_player_cache_versions",
+                self._migration_create_player_cache_versions,
+            ),
+            (
+                "create_gambling_aggregates",
+                self._migration_create_gambling_aggregates,
+            ),
+            (
+                "create_prediction_book_versions",
+                self._migration_create_prediction_book_versions,
+            ),
+            (
+                "streamline_economy_ledger_triggers",
+                self._migration_streamline_economy_ledger_triggers,
+            ),
+            (
+                "index_economy_ledger_account_timeline",
+                self._migration_index_economy_ledger_account_timeline,
+            ),
+            ("create_scheduled_jobs", self._migration_create_scheduled_jobs),
         ]
 
     # --- Migrations ---
@@ -4629,6 +4653,368 @@ class SchemaManager:
         """
         self._add_column_if_not_exists(cursor, "player_curfew_windows", "days", "INTEGER")
 
+    def _migration_create_player_cache_versions(self, cursor) -> None:
+        """Stamp every players row write so the in-process player cache can validate entries.
+
+        Triggers bump ``version`` on any INSERT/UPDATE/DELETE of a player, no
+        matter which repository (or script) performs it. A row with no stamp
+        has implicit version 0.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS player_cache_versions (
+                discord_id INTEGER NOT NULL,
+                guild_id   INTEGER NOT NULL DEFAULT 0,
+                version    INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+            """
+        )
+        bump = """
+            INSERT INTO player_cache_versions (discord_id, guild_id, version)
+            VALUES ({row}.discord_id, COALESCE({row}.guild_id, 0), 1)
+            ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+        """
+        cursor.execute("DROP TRIGGER IF EXISTS trg_player_cache_versions_insert")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_player_cache_versions_insert
+            AFTER INSERT ON players
+            BEGIN
+                {bump.format(row="NEW")}
+            END
+            """
+        )
+        cursor.execute("DROP TRIGGER IF EXISTS trg_player_cache_versions_update")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_player_cache_versions_update
+            AFTER UPDATE ON players
+            BEGIN
+                {bump.format(row="NEW")}
+                INSERT INTO player_cache_versions (discord_id, guild_id, version)
+                SELECT OLD.discord_id, COALESCE(OLD.guild_id, 0), 1
+                WHERE OLD.discord_id IS NOT NEW.discord_id
+                   OR COALESCE(OLD.guild_id, 0) IS NOT COALESCE(NEW.guild_id, 0)
+                ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+            END
+            """
+        )
+        cursor.execute("DROP TRIGGER IF EXISTS trg_player_cache_versions_delete")
+        cursor.execute(
+            f"""
+            CREATE TRIGGER trg_player_cache_versions_delete
+            AFTER DELETE ON players
+            BEGIN
+                {bump.format(row="OLD")}
+            END
+            """
+        )
+
+    def _migration_create_gambling_aggregates(self, cursor) -> None:
+        """Store per-player gambling leaderboard/degen aggregates.
+
+        Settlement paths recompute the rows of the players they touch inside
+        their own transaction. Triggers mark players dirty in
+        ``gambling_aggregate_dirty`` whenever a settled bet, its match result or
+        its vanity tax changes, so writes from any other path are picked up on
+        the next read. Existing bettors are marked dirty here as the backfill.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS player_gambling_aggregates (
+                guild_id                   INTEGER NOT NULL DEFAULT 0,
+                discord_id                 INTEGER NOT NULL,
+                total_bets                 INTEGER NOT NULL DEFAULT 0,
+                wins                       INTEGER NOT NULL DEFAULT 0,
+                losses                     INTEGER NOT NULL DEFAULT 0,
+                total_wagered              INTEGER NOT NULL DEFAULT 0,
+                avg_leverage               REAL NOT NULL DEFAULT 1,
+                net_pnl                    INTEGER NOT NULL DEFAULT 0,
+                unique_matches             INTEGER NOT NULL DEFAULT 0,
+                leverage_2x_bets           INTEGER NOT NULL DEFAULT 0,
+                leverage_3x_bets           INTEGER NOT NULL DEFAULT 0,
+                five_x_bets                INTEGER NOT NULL DEFAULT 0,
+                sequences_analyzed         INTEGER NOT NULL DEFAULT 0,
+                times_increased_after_loss INTEGER NOT NULL DEFAULT 0,
+                updated_at                 INTEGER,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS gambling_aggregate_dirty (
+                guild_id   INTEGER NOT NULL DEFAULT 0,
+                discord_id INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+            """
+        )
+        mark = """
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE({row}.guild_id, 0), {row}.discord_id);
+        """
+        mark_bettors = """
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            SELECT COALESCE(guild_id, 0), discord_id
+            FROM bets
+            WHERE guild_id = COALESCE({row}.guild_id, 0) AND match_id = {row}.match_id;
+        """
+        triggers = {
+            "trg_gambling_aggregates_bet_insert": f"""
+                AFTER INSERT ON bets
+                WHEN NEW.match_id IS NOT NULL
+                BEGIN
+                    {mark.format(row="NEW")}
+                END
+            """,
+            "trg_gambling_aggregates_bet_update": f"""
+                AFTER UPDATE ON bets
+                WHEN OLD.match_id IS NOT NULL OR NEW.match_id IS NOT NULL
+                BEGIN
+                    {mark.format(row="NEW")}
+                    {mark.format(row="OLD")}
+                END
+            """,
+            "trg_gambling_aggregates_bet_delete": f"""
+                AFTER DELETE ON bets
+                WHEN OLD.match_id IS NOT NULL
+                BEGIN
+                    {mark.format(row="OLD")}
+                END
+            """,
+            "trg_gambling_aggregates_match_insert": f"""
+                AFTER INSERT ON matches
+                BEGIN
+                    {mark_bettors.format(row="NEW")}
+                END
+            """,
+            "trg_gambling_aggregates_match_result": f"""
+                AFTER UPDATE OF winning_team ON matches
+                WHEN OLD.winning_team IS NOT NEW.winning_team
+                BEGIN
+                    {mark_bettors.format(row="NEW")}
+                END
+            """,
+            "trg_gambling_aggregates_match_delete": f"""
+                AFTER DELETE ON matches
+                BEGIN
+                    {mark_bettors.format(row="OLD")}
+                END
+            """,
+            "trg_gambling_aggregates_tax_insert": f"""
+                AFTER INSERT ON bet_settlement_taxes
+                BEGIN
+                    {mark.format(row="NEW")}
+                END
+            """,
+            "trg_gambling_aggregates_tax_update": f"""
+                AFTER UPDATE ON bet_settlement_taxes
+                BEGIN
+                    {mark.format(row="NEW")}
+                    {mark.format(row="OLD")}
+                END
+            """,
+            "trg_gambling_aggregates_tax_delete": f"""
+                AFTER DELETE ON bet_settlement_taxes
+                BEGIN
+                    {mark.format(row="OLD")}
+                END
+            """,
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"CREATE TRIGGER {name} {body}")
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            SELECT DISTINCT COALESCE(guild_id, 0), discord_id
+            FROM bets
+            WHERE match_id IS NOT NULL
+            """
+        )
+
+    def _migration_create_prediction_book_versions(self, cursor) -> None:
+        """Stamp order-book changes so in-memory prediction books can validate.
+
+        Any write to a market's ``prediction_levels`` bumps ``version``; a
+        market with no stamp has implicit version 0.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS prediction_book_versions (
+                prediction_id INTEGER PRIMARY KEY,
+                version       INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+            """
+        )
+        bump = """
+            INSERT INTO prediction_book_versions (prediction_id, version)
+            VALUES ({row}.prediction_id, 1)
+            ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+        """
+        triggers = {
+            "trg_prediction_book_versions_level_insert": f"""
+                AFTER INSERT ON prediction_levels
+                BEGIN
+                    {bump.format(row="NEW")}
+                END
+            """,
+            "trg_prediction_book_versions_level_update": f"""
+                AFTER UPDATE ON prediction_levels
+                BEGIN
+                    {bump.format(row="NEW")}
+                    INSERT INTO prediction_book_versions (prediction_id, version)
+                    SELECT OLD.prediction_id, 1
+                    WHERE OLD.prediction_id IS NOT NEW.prediction_id
+                    ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+                END
+            """,
+            "trg_prediction_book_versions_level_delete": f"""
+                AFTER DELETE ON prediction_levels
+                BEGIN
+                    {bump.format(row="OLD")}
+                END
+            """,
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"CREATE TRIGGER {name} {body}")
+
+    def _migration_streamline_economy_ledger_triggers(self, cursor) -> None:
+        """Read ledger context once per trigger and let bulk writers opt out.
+
+        The original triggers ran six correlated subqueries against
+        ``economy_ledger_context`` for every balance change. They now join the
+        context row once. ``app_managed`` marks a context whose caller writes
+        its own player ledger rows in bulk, so the player update trigger skips
+        them instead of writing duplicates.
+        """
+        self._add_column_if_not_exists(
+            cursor, "economy_ledger_context", "app_managed", "INTEGER NOT NULL DEFAULT 0"
+        )
+        entry = """
+            INSERT INTO economy_ledger_entries (
+                guild_id, account_type, account_id, delta,
+                balance_before, balance_after, source, actor_id,
+                related_type, related_id, reason, metadata
+            )
+            SELECT
+                COALESCE(NEW.guild_id, 0), {account},
+                {delta}, {before}, {after},
+                COALESCE(c.source, '{default_source}'),
+                c.actor_id, c.related_type, c.related_id, c.reason, c.metadata
+            FROM (SELECT 1)
+            LEFT JOIN economy_ledger_context c ON c.id = 1
+            {where};
+        """
+        player = "'player', NEW.discord_id"
+        nonprofit = "'nonprofit', COALESCE(NEW.guild_id, 0)"
+        triggers = {
+            "trg_economy_ledger_players_insert": (
+                "AFTER INSERT ON players WHEN COALESCE(NEW.jopacoin_balance, 0) != 0",
+                entry.format(
+                    account=player,
+                    delta="COALESCE(NEW.jopacoin_balance, 0)",
+                    before="0",
+                    after="COALESCE(NEW.jopacoin_balance, 0)",
+                    default_source="player_insert",
+                    where="",
+                ),
+            ),
+            "trg_economy_ledger_players_update": (
+                "AFTER UPDATE OF jopacoin_balance ON players "
+                "WHEN COALESCE(OLD.jopacoin_balance, 0) != COALESCE(NEW.jopacoin_balance, 0)",
+                entry.format(
+                    account=player,
+                    delta="COALESCE(NEW.jopacoin_balance, 0) - COALESCE(OLD.jopacoin_balance, 0)",
+                    before="COALESCE(OLD.jopacoin_balance, 0)",
+                    after="COALESCE(NEW.jopacoin_balance, 0)",
+                    default_source="balance_update",
+                    where="WHERE COALESCE(c.app_managed, 0) = 0",
+                ),
+            ),
+            "trg_economy_ledger_nonprofit_insert": (
+                "AFTER INSERT ON nonprofit_fund WHEN COALESCE(NEW.total_collected, 0) != 0",
+                entry.format(
+                    account=nonprofit,
+                    delta="COALESCE(NEW.total_collected, 0)",
+                    before="0",
+                    after="COALESCE(NEW.total_collected, 0)",
+                    default_source="nonprofit_insert",
+                    where="",
+                ),
+            ),
+            "trg_economy_ledger_nonprofit_update": (
+                "AFTER UPDATE OF total_collected ON nonprofit_fund "
+                "WHEN COALESCE(OLD.total_collected, 0) != COALESCE(NEW.total_collected, 0)",
+                entry.format(
+                    account=nonprofit,
+                    delta="COALESCE(NEW.total_collected, 0) - COALESCE(OLD.total_collected, 0)",
+                    before="COALESCE(OLD.total_collected, 0)",
+                    after="COALESCE(NEW.total_collected, 0)",
+                    default_source="nonprofit_update",
+                    where="",
+                ),
+            ),
+        }
+        for name, (event, body) in triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"CREATE TRIGGER {name} {event} BEGIN {body} END")
+
+    def _migration_index_economy_ledger_account_timeline(self, cursor) -> None:
+        """Order each account's ledger rows by (created_at, ledger_id).
+
+        Balance-history series walk an account's rows in exactly this order,
+        so they become a single index range scan; read backwards, the same
+        index serves newest-first audit pages, which makes the older
+        ``created_at DESC`` account index redundant.
+        """
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_economy_ledger_account_timeline
+            ON economy_ledger_entries(guild_id, account_type, account_id, created_at, ledger_id)
+            """
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_economy_ledger_account")
+
+    def _migration_create_scheduled_jobs(self, cursor) -> None:
+        """Durable queue for the background job scheduler.
+
+        Each row is one recurring or one-shot job keyed by ``job_key``; the
+        scheduler sleeps until the smallest unclaimed ``next_due_at`` and keeps
+        per-job run, failure and latency counters alongside it.
+        """
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scheduled_jobs (
+                job_key TEXT PRIMARY KEY,
+                handler TEXT NOT NULL,
+                payload TEXT,
+                next_due_at INTEGER NOT NULL,
+                interval_seconds INTEGER,
+                running_since INTEGER,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                failure_count INTEGER NOT NULL DEFAULT 0,
+                last_started_at INTEGER,
+                last_finished_at INTEGER,
+                last_latency_ms INTEGER,
+                last_error TEXT,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            )
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due
+            ON scheduled_jobs(next_due_at)
+            WHERE running_since IS NULL
+            """
+        )
+
     def _migration_create_dig_system_tables(self, cursor) -> None:
         """Create all tables for the tunnel digging minigame."""
         cursor.execute(
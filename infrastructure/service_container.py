@@ -11,6 +11,7 @@ Usage:
 """
 
 import logging
+import time
 
 logger = logging.getLogger("cama_bot.infrastructure.container")
 
@@ -63,6 +64,9 @@ class ServiceContainer:
         self.ai_max_tokens = ai_max_tokens
 
         self._initialized = False
+        # Seconds spent in each initialization stage ("database" includes
+        # schema creation and migrations), for the startup profile.
+        self.init_timings: dict[str, float] = {}
 
         # All repos/services stored by name
         self._components: dict = {}
@@ -74,21 +78,28 @@ class ServiceContainer:
 
         logger.info("Initializing ServiceContainer...")
 
-        self._init_database()
-        self._init_repositories()
-        self._init_core_services()
-        self._init_economy_services()
-        self._init_match_services()
-        self._init_advanced_services()
-        self._init_ai_services()
-        self._init_duel_flavor_service()
-        self._init_mana_service()
-        self._init_pet_service()
-        self._init_dig_service()
-        self._init_mafia_service()
-        self._init_extras()
-        self._init_reminder_service()
-        self._init_curfew_service()
+        stages = (
+            ("database", self._init_database),
+            ("repositories", self._init_repositories),
+            ("core_services", self._init_core_services),
+            ("economy_services", self._init_economy_services),
+            ("match_services", self._init_match_services),
+            ("advanced_services", self._init_advanced_services),
+            ("ai_services", self._init_ai_services),
+            ("duel_flavor_service", self._init_duel_flavor_service),
+            ("mana_service", self._init_mana_service),
+            ("pet_service", self._init_pet_service),
+            ("dig_service", self._init_dig_service),
+            ("mafia_service", self._init_mafia_service),
+            ("extras", self._init_extras),
+            ("reminder_service", self._init_reminder_service),
+            ("curfew_service", self._init_curfew_service),
+            ("job_scheduler", self._init_job_scheduler),
+        )
+        for name, stage in stages:
+            started = time.perf_counter()
+            stage()
+            self.init_timings[name] = time.perf_counter() - started
 
         self._initialized = True
         logger.info("ServiceContainer initialization complete")
@@ -124,6 +135,7 @@ class ServiceContainer:
         from repositories.lobby_repository import LobbyRepository
         from repositories.low_priority_repository import LowPriorityRepository
         from repositories.mafia_repository import MafiaRepository
+        from repositories.maintenance_repository import MaintenanceRepository
         from repositories.mana_repository import ManaRepository
         from repositories.match_repository import MatchRepository
         from repositories.moderation_repository import ModerationRepository
@@ -139,6 +151,7 @@ class ServiceContainer:
         from repositories.prediction_repository import PredictionRepository
         from repositories.protection_repository import ProtectionRepository
         from repositories.recalibration_repository import RecalibrationRepository
+        from repositories.scheduled_job_repository import ScheduledJobRepository
         from repositories.slow_drip_repository import SlowDripRepository
         from repositories.soft_avoid_repository import SoftAvoidRepository
         from repositories.survey_repository import SurveyRepository
@@ -169,6 +182,8 @@ class ServiceContainer:
             "economy_event_repo": EconomyEventRepository(p),
             "tax_repo": TaxRepository(p),
             "recalibration_repo": RecalibrationRepository(p),
+            "scheduled_job_repo": ScheduledJobRepository(p),
+            "maintenance_repo": MaintenanceRepository(p),
             "soft_avoid_repo": SoftAvoidRepository(p),
             "survey_repo": SurveyRepository(p),
             "package_deal_repo": PackageDealRepository(p),
@@ -191,6 +206,7 @@ class ServiceContainer:
     def _init_core_services(self) -> None:
         """Services with no dependencies on other services."""
         from services.bankruptcy_service import BankruptcyService
+        from services.database_maintenance_service import DatabaseMaintenanceService
         from services.duel_service import DuelService
         from services.garnishment_service import GarnishmentService
         from services.guild_config_service import GuildConfigService
@@ -228,6 +244,7 @@ class ServiceContainer:
         c["opendota_player_service"] = OpenDotaPlayerService(c["player_repo"])
         c["match_state_service"] = MatchStateService(c["match_repo"])
         c["moderation_service"] = ModerationService(c["moderation_repo"])
+        c["database_maintenance_service"] = DatabaseMaintenanceService(c["maintenance_repo"])
 
     def _init_economy_services(self) -> None:
         """Services that depend on core services."""
@@ -287,6 +304,7 @@ class ServiceContainer:
             disburse_repo=c["disburse_repo"],
             tip_repo=c["tip_repo"],
             dig_repo=c["dig_repo"],
+            ledger_repo=c["economy_ledger_repo"],
         )
         c["tax_service"] = TaxService(
             tax_repo=c["tax_repo"],
@@ -302,6 +320,7 @@ class ServiceContainer:
         from services.lobby_service import LobbyService
         from services.match_service import MatchService
         from services.player_service import PlayerService
+        from services.shuffle_speculation_service import ShuffleSpeculationService
 
         c = self._components
         c["player_service"] = PlayerService(c["player_repo"])
@@ -331,6 +350,9 @@ class ServiceContainer:
             low_priority_repo=c["low_priority_repo"],
             state_service=c["match_state_service"],
         )
+        c["shuffle_speculation_service"] = ShuffleSpeculationService(
+            c["lobby_service"], c["match_service"]
+        )
         list_pending = getattr(
             c["match_repo"],
             "list_pending_openskill_replays",
@@ -674,6 +696,18 @@ class ServiceContainer:
             lobby_service=c["lobby_service"],
         )
 
+    def _init_job_scheduler(self) -> None:
+        import config
+        from services.job_scheduler_service import JobSchedulerService
+
+        c = self._components
+        c["job_scheduler"] = JobSchedulerService(
+            c["scheduled_job_repo"],
+            max_concurrency=config.JOB_SCHEDULER_MAX_CONCURRENCY,
+            retry_base_seconds=config.JOB_RETRY_BASE_SECONDS,
+            retry_max_seconds=config.JOB_RETRY_MAX_SECONDS,
+        )
+
     # ------------------------------------------------------------------
     # Bot exposure
     # ------------------------------------------------------------------
@@ -704,6 +738,7 @@ class ServiceContainer:
         bot.prediction_service = c["prediction_service"]
         bot.lobby_service = c["lobby_service"]
         bot.lobby_manager = c["lobby_manager"]
+        bot.shuffle_speculation_service = c["shuffle_speculation_service"]
         bot.gambling_stats_service = c["gambling_stats_service"]
         bot.balance_history_service = c["balance_history_service"]
         bot.guild_config_service = c["guild_config_service"]
@@ -734,6 +769,8 @@ class ServiceContainer:
         bot.duel_flavor_service = c["duel_flavor_service"]
         bot.reminder_service = c["reminder_service"]
         bot.curfew_service = c["curfew_service"]
+        bot.job_scheduler = c["job_scheduler"]
+        bot.database_maintenance_service = c["database_maintenance_service"]
         bot.mafia_service = c["mafia_service"]
         bot.mafia_flavor_service = c["mafia_flavor_service"]
         bot.pet_service = c["pet_service"]
@@ -2,18 +2,29 @@
 Base repository with common database operations.
 """
 
+import inspect
 import json
 import logging
 import sqlite3
 import threading
 from abc import ABC
+from collections.abc import Mapping
 from contextlib import contextmanager
 from typing import Any
 
 from infrastructure.schema_manager import SchemaManager
+from utils.perf_metrics import (
+    InstrumentedConnection,
+    current_sql_call_site,
+    get_perf_metrics,
+    label_sql_calls,
+)
 
 logger = logging.getLogger("cama_bot.repositories")
 
+# Keep balance reads below SQLite's traditional 999-parameter ceiling.
+_BALANCE_READ_CHUNK = 900
+
 
 def safe_json_loads(raw: Any, default: Any, *, context: str = "") -> Any:
     """Parse a JSON column value, falling back to ``default`` on corruption.
@@ -48,6 +59,18 @@ class BaseRepository(ABC):
     _schema_initialized_paths = set()
     _schema_init_lock = threading.Lock()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Name each public method once, here, so SQL metrics are attributed
+        # per method without inspecting the stack on every query.
+        for name, attribute in list(vars(cls).items()):
+            if (
+                not name.startswith("_")
+                and inspect.isfunction(attribute)
+                and not inspect.isgeneratorfunction(attribute)
+            ):
+                setattr(cls, name, label_sql_calls(attribute, f"{cls.__name__}.{name}"))
+
     def __init__(self, db_path: str):
         """
         Initialize repository with database path.
@@ -94,18 +117,23 @@ class BaseRepository(ABC):
         related_id: str | int | None = None,
         reason: str | None = None,
         metadata: Any | None = None,
+        app_managed: bool = False,
     ) -> None:
-        """Set trigger context for subsequent balance ledger entries."""
+        """Set trigger context for subsequent balance ledger entries.
+
+        ``app_managed`` tells the ledger triggers to stand down because the
+        caller writes the ledger rows itself (see ``_apply_balance_deltas``).
+        """
         metadata_json = None
         if metadata is not None:
             metadata_json = metadata if isinstance(metadata, str) else json.dumps(metadata)
-        cursor.execute("DELETE FROM economy_ledger_context")
         cursor.execute(
             """
-            INSERT INTO economy_ledger_context (
-                id, source, actor_id, related_type, related_id, reason, metadata
+            INSERT OR REPLACE INTO economy_ledger_context (
+                id, source, actor_id, related_type, related_id, reason, metadata,
+                app_managed
             )
-            VALUES (1, ?, ?, ?, ?, ?, ?)
+            VALUES (1, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 source,
@@ -114,6 +142,7 @@ class BaseRepository(ABC):
                 str(related_id) if related_id is not None else None,
                 reason,
                 metadata_json,
+                int(app_managed),
             ),
         )
 
@@ -121,14 +150,120 @@ class BaseRepository(ABC):
         """Clear trigger context after contextual ledger writes."""
         cursor.execute("DELETE FROM economy_ledger_context")
 
+    def _apply_balance_deltas(
+        self,
+        cursor: sqlite3.Cursor,
+        guild_id: int,
+        deltas_by_discord_id: Mapping[int, int],
+        *,
+        source: str,
+        actor_id: int | None = None,
+        related_type: str | None = None,
+        related_id: str | int | None = None,
+        reason: str | None = None,
+        metadata: Any | None = None,
+    ) -> dict[int, int]:
+        """Apply many player balance deltas and write their ledger rows in bulk.
+
+        Instead of one trigger-built ledger row per UPDATE (each re-reading
+        the context table), the context is set once, balances are read once,
+        and the balance updates and ledger rows are each written with a single
+        ``executemany``. The ledger triggers skip these rows and keep covering
+        every other balance write.
+
+        Must run inside the caller's write transaction. Returns the new balance
+        of every player that exists; unknown ids are ignored, as with a plain
+        ``UPDATE``.
+        """
+        if not deltas_by_discord_id:
+            return {}
+        # Setting the context is the first write, so the balance read below
+        # happens under the write lock and cannot go stale before the UPDATE.
+        self._set_economy_ledger_context(
+            cursor,
+            source=source,
+            actor_id=actor_id,
+            related_type=related_type,
+            related_id=related_id,
+            reason=reason,
+            metadata=metadata,
+            app_managed=True,
+        )
+        try:
+            discord_ids = list(deltas_by_discord_id)
+            balances: dict[int, int] = {}
+            for offset in range(0, len(discord_ids), _BALANCE_READ_CHUNK):
+                chunk = discord_ids[offset : offset + _BALANCE_READ_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    SELECT discord_id, COALESCE(jopacoin_balance, 0)
+                    FROM players
+                    WHERE guild_id = ? AND discord_id IN ({placeholders})
+                    """,
+                    (guild_id, *chunk),
+                )
+                balances.update((int(row[0]), int(row[1])) for row in cursor.fetchall())
+
+            cursor.executemany(
+                """
+                UPDATE players
+                SET jopacoin_balance = COALESCE(jopacoin_balance, 0) + ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE discord_id = ? AND guild_id = ?
+                """,
+                [
+                    (delta, discord_id, guild_id)
+                    for discord_id, delta in deltas_by_discord_id.items()
+                ],
+            )
+            context = cursor.execute(
+                """
+                SELECT source, actor_id, related_type, related_id, reason, metadata
+                FROM economy_ledger_context WHERE id = 1
+                """
+            ).fetchone()
+            entries = []
+            new_balances: dict[int, int] = {}
+            for discord_id, delta in deltas_by_discord_id.items():
+                before = balances.get(discord_id)
+                if before is None:
+                    continue
+                new_balances[discord_id] = before + delta
+                if delta:
+                    entries.append(
+                        (guild_id, discord_id, delta, before, before + delta, *context)
+                    )
+            cursor.executemany(
+                """
+                INSERT INTO economy_ledger_entries (
+                    guild_id, account_type, account_id, delta,
+                    balance_before, balance_after, source, actor_id,
+                    related_type, related_id, reason, metadata
+                )
+                VALUES (?, 'player', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                entries,
+            )
+        finally:
+            self._clear_economy_ledger_context(cursor)
+        return new_balances
+
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with row factory enabled."""
+        instrumented = get_perf_metrics().enabled
         conn = sqlite3.connect(
             self.db_path,
             uri=self.db_path.startswith("file:"),
             check_same_thread=not self.db_path.startswith("file:"),
             timeout=5.0,
+            factory=InstrumentedConnection if instrumented else sqlite3.Connection,
         )
+        if instrumented:
+            # One sample per connection (i.e. per repository call), labelled
+            # with the public method that opened it.
+            conn.metrics_label = current_sql_call_site() or type(self).__name__
+            conn.metrics_db_path = self.db_path
         conn.row_factory = sqlite3.Row
         # SchemaManager establishes WAL once before repositories open runtime
         # connections. WAL is persistent for file databases, and ``timeout``
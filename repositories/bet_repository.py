@@ -55,6 +55,121 @@ def split_bet_seed(amount: int, betting_mode: str) -> tuple[int, int, int]:
     return 0, 0, amount
 
 
+# Column order of ``player_gambling_aggregates`` as produced by
+# ``_gambling_metrics_sql``; the aggregate table is refreshed with
+# ``INSERT ... SELECT`` over exactly this projection.
+_GAMBLING_AGGREGATE_COLUMNS = (
+    "guild_id",
+    "discord_id",
+    "total_bets",
+    "wins",
+    "losses",
+    "total_wagered",
+    "avg_leverage",
+    "net_pnl",
+    "unique_matches",
+    "leverage_2x_bets",
+    "leverage_3x_bets",
+    "five_x_bets",
+    "sequences_analyzed",
+    "times_increased_after_loss",
+)
+
+# Keep each statement below SQLite's traditional 999-parameter ceiling.
+_GAMBLING_AGGREGATE_CHUNK = 900
+
+
+def _gambling_metrics_sql(player_clause: str = "") -> str:
+    """Per-player leaderboard/degen aggregates over settled bets in one guild.
+
+    The first parameter is the guild id; ``player_clause`` may add an
+    ``AND b.discord_id IN (...)`` filter with its own parameters. The window
+    ordering includes ``bet_id`` so loss-chasing sequences are deterministic
+    when several bets share a timestamp.
+    """
+    return f"""
+        WITH base AS (
+            SELECT
+                b.discord_id,
+                b.guild_id,
+                b.bet_id,
+                b.match_id,
+                b.bet_time,
+                b.amount * COALESCE(b.leverage, 1) AS effective_bet,
+                COALESCE(b.leverage, 1) AS leverage,
+                b.payout,
+                CASE
+                    WHEN (m.winning_team = 1 AND b.team_bet_on = 'radiant')
+                      OR (m.winning_team = 2 AND b.team_bet_on = 'dire')
+                    THEN 1 ELSE 0
+                END AS won
+            FROM bets b
+            JOIN matches m ON b.match_id = m.match_id
+            WHERE b.guild_id = ?
+              AND b.match_id IS NOT NULL
+              {player_clause}
+        ),
+        ordered AS (
+            SELECT
+                *,
+                LAG(won) OVER (
+                    PARTITION BY discord_id
+                    ORDER BY bet_time ASC, bet_id ASC
+                ) AS previous_won,
+                LAG(effective_bet) OVER (
+                    PARTITION BY discord_id
+                    ORDER BY bet_time ASC, bet_id ASC
+                ) AS previous_effective_bet
+            FROM base
+        )
+        SELECT
+            guild_id,
+            discord_id,
+            COUNT(*) AS total_bets,
+            SUM(won) AS wins,
+            SUM(1 - won) AS losses,
+            SUM(effective_bet) AS total_wagered,
+            AVG(leverage) AS avg_leverage,
+            SUM(
+                CASE
+                    WHEN won = 1
+                    THEN COALESCE(payout, effective_bet * 2) - effective_bet
+                    ELSE -effective_bet
+                END
+            ) - COALESCE((
+                SELECT SUM(bst.vanity_tax)
+                FROM bet_settlement_taxes bst
+                WHERE bst.guild_id = ordered.guild_id
+                  AND bst.discord_id = ordered.discord_id
+            ), 0) AS net_pnl,
+            COUNT(DISTINCT match_id) AS unique_matches,
+            SUM(CASE WHEN leverage = 2 THEN 1 ELSE 0 END) AS leverage_2x_bets,
+            SUM(CASE WHEN leverage = 3 THEN 1 ELSE 0 END) AS leverage_3x_bets,
+            SUM(CASE WHEN leverage = 5 THEN 1 ELSE 0 END) AS five_x_bets,
+            SUM(
+                CASE WHEN previous_won = 0 THEN 1 ELSE 0 END
+            ) AS sequences_analyzed,
+            SUM(
+                CASE
+                    WHEN previous_won = 0
+                     AND effective_bet > previous_effective_bet
+                    THEN 1 ELSE 0
+                END
+            ) AS times_increased_after_loss
+        FROM ordered
+        GROUP BY discord_id
+    """
+
+
+def _with_ratios(row) -> dict:
+    data = dict(row)
+    total_bets = int(data["total_bets"])
+    total_wagered = int(data["total_wagered"])
+    data["win_rate"] = data["wins"] / total_bets if total_bets else 0
+    data["roi"] = data["net_pnl"] / total_wagered if total_wagered else 0
+    return data
+
+
 class BetRepository(BaseRepository, IBetRepository):
     """
     Handles CRUD operations against the bets table.
@@ -1127,8 +1242,10 @@ class BetRepository(BaseRepository, IBetRepository):
                 )
 
             if balance_deltas:
-                self._set_economy_ledger_context(
+                self._apply_balance_deltas(
                     cursor,
+                    normalized_guild,
+                    balance_deltas,
                     source="bet_settlement",
                     related_type="pending_match" if pending_match_id is not None else "bet_window",
                     related_id=pending_match_id if pending_match_id is not None else since_ts,
@@ -1140,24 +1257,12 @@ class BetRepository(BaseRepository, IBetRepository):
                         "payout_multiplier": payout_multiplier,
                     },
                 )
-                try:
-                    cursor.executemany(
-                        """
-                        UPDATE players
-                        SET jopacoin_balance = COALESCE(jopacoin_balance, 0) + ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE discord_id = ? AND guild_id = ?
-                        """,
-                        [
-                            (delta, discord_id, normalized_guild)
-                            for discord_id, delta in balance_deltas.items()
-                        ],
-                    )
-                finally:
-                    self._clear_economy_ledger_context(cursor)
 
             if vanity_taxes:
-                self._set_economy_ledger_context(
+                self._apply_balance_deltas(
                     cursor,
+                    normalized_guild,
+                    {discord_id: -tax for discord_id, tax in vanity_taxes.items()},
                     source="vanity_tax",
                     related_type=(
                         "pending_match"
@@ -1175,21 +1280,6 @@ class BetRepository(BaseRepository, IBetRepository):
                         "betting_mode": betting_mode,
                     },
                 )
-                try:
-                    cursor.executemany(
-                        """
-                        UPDATE players
-                        SET jopacoin_balance = COALESCE(jopacoin_balance, 0) - ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE discord_id = ? AND guild_id = ?
-                        """,
-                        [
-                            (tax, discord_id, normalized_guild)
-                            for discord_id, tax in vanity_taxes.items()
-                        ],
-                    )
-                finally:
-                    self._clear_economy_ledger_context(cursor)
 
             loser_ids = list(
                 dict.fromkeys(entry["discord_id"] for entry in distributions.get("losers", []))
@@ -1269,6 +1359,8 @@ class BetRepository(BaseRepository, IBetRepository):
                     (json.dumps(jc_changes), match_id, normalized_guild),
                 )
 
+            self._refresh_gambling_aggregates_in_txn(cursor, normalized_guild)
+
         return distributions
 
     def _consume_pending_match_seed_in_txn(
@@ -1796,6 +1888,9 @@ class BetRepository(BaseRepository, IBetRepository):
                     related_id=pending_match_id if pending_match_id is not None else since_ts,
                     reason="aborted betting seed returned",
                 )
+            # Refunds only delete unsettled bets, which never reach the
+            # aggregates; this drains anything a racing writer left dirty.
+            self._refresh_gambling_aggregates_in_txn(cursor, normalized_guild)
             return len(bet_ids)
 
     def _release_first_game_pool_claim_in_txn(
@@ -2027,12 +2122,12 @@ class BetRepository(BaseRepository, IBetRepository):
         guild_id: int | None,
         discord_ids: list[int] | None = None,
     ) -> dict[int, dict]:
-        """Return leaderboard and degen inputs from one pass over settled bets.
+        """Return leaderboard and degen inputs from ``player_gambling_aggregates``.
 
-        ``discord_ids=None`` aggregates every bettor in the guild. An explicit
-        list scopes the scan to those players; missing players simply have no
-        result row. The window ordering includes ``bet_id`` so loss-chasing
-        sequences are deterministic when several bets share a timestamp.
+        ``discord_ids=None`` returns every bettor in the guild. An explicit
+        list scopes the read to those players; missing players simply have no
+        result row. Rows invalidated by writes outside the settlement paths
+        (see ``gambling_aggregate_dirty``) are recomputed before reading.
         """
         unique_ids = (
             None if discord_ids is None else list(dict.fromkeys(discord_ids))
@@ -2041,18 +2136,18 @@ class BetRepository(BaseRepository, IBetRepository):
             return {}
 
         normalized_guild = self.normalize_guild_id(guild_id)
+        self._refresh_dirty_gambling_aggregates(normalized_guild)
+
         chunks: list[list[int] | None]
         if unique_ids is None:
             chunks = [None]
         else:
-            # Keep each statement below SQLite's traditional 999-parameter
-            # ceiling. Players belong to exactly one chunk, so aggregate rows
-            # can be merged without another reduction pass.
             chunks = [
-                unique_ids[offset : offset + 900]
-                for offset in range(0, len(unique_ids), 900)
+                unique_ids[offset : offset + _GAMBLING_AGGREGATE_CHUNK]
+                for offset in range(0, len(unique_ids), _GAMBLING_AGGREGATE_CHUNK)
             ]
 
+        columns = ", ".join(_GAMBLING_AGGREGATE_COLUMNS)
         metrics: dict[int, dict] = {}
         with self.connection() as conn:
             for chunk in chunks:
@@ -2060,94 +2155,135 @@ class BetRepository(BaseRepository, IBetRepository):
                 params: list[int] = [normalized_guild]
                 if chunk is not None:
                     placeholders = ",".join("?" for _ in chunk)
-                    player_clause = f"AND b.discord_id IN ({placeholders})"
+                    player_clause = f"AND discord_id IN ({placeholders})"
                     params.extend(chunk)
-
                 rows = conn.execute(
                     f"""
-                    WITH base AS (
-                        SELECT
-                            b.discord_id,
-                            b.guild_id,
-                            b.bet_id,
-                            b.match_id,
-                            b.bet_time,
-                            b.amount * COALESCE(b.leverage, 1) AS effective_bet,
-                            COALESCE(b.leverage, 1) AS leverage,
-                            b.payout,
-                            CASE
-                                WHEN (m.winning_team = 1 AND b.team_bet_on = 'radiant')
-                                  OR (m.winning_team = 2 AND b.team_bet_on = 'dire')
-                                THEN 1 ELSE 0
-                            END AS won
-                        FROM bets b
-                        JOIN matches m ON b.match_id = m.match_id
-                        WHERE b.guild_id = ?
-                          AND b.match_id IS NOT NULL
-                          {player_clause}
-                    ),
-                    ordered AS (
-                        SELECT
-                            *,
-                            LAG(won) OVER (
-                                PARTITION BY discord_id
-                                ORDER BY bet_time ASC, bet_id ASC
-                            ) AS previous_won,
-                            LAG(effective_bet) OVER (
-                                PARTITION BY discord_id
-                                ORDER BY bet_time ASC, bet_id ASC
-                            ) AS previous_effective_bet
-                        FROM base
-                    )
-                    SELECT
-                        discord_id,
-                        COUNT(*) AS total_bets,
-                        SUM(won) AS wins,
-                        SUM(1 - won) AS losses,
-                        SUM(effective_bet) AS total_wagered,
-                        AVG(leverage) AS avg_leverage,
-                        SUM(
-                            CASE
-                                WHEN won = 1
-                                THEN COALESCE(payout, effective_bet * 2) - effective_bet
-                                ELSE -effective_bet
-                            END
-                        ) - COALESCE((
-                            SELECT SUM(bst.vanity_tax)
-                            FROM bet_settlement_taxes bst
-                            WHERE bst.guild_id = ordered.guild_id
-                              AND bst.discord_id = ordered.discord_id
-                        ), 0) AS net_pnl,
-                        COUNT(DISTINCT match_id) AS unique_matches,
-                        SUM(CASE WHEN leverage = 5 THEN 1 ELSE 0 END) AS five_x_bets,
-                        SUM(
-                            CASE WHEN previous_won = 0 THEN 1 ELSE 0 END
-                        ) AS sequences_analyzed,
-                        SUM(
-                            CASE
-                                WHEN previous_won = 0
-                                 AND effective_bet > previous_effective_bet
-                                THEN 1 ELSE 0
-                            END
-                        ) AS times_increased_after_loss
-                    FROM ordered
-                    GROUP BY discord_id
+                    SELECT {columns}
+                    FROM player_gambling_aggregates
+                    WHERE guild_id = ? {player_clause}
                     """,
                     params,
                 ).fetchall()
-
                 for row in rows:
-                    data = dict(row)
-                    total_bets = int(data["total_bets"])
-                    total_wagered = int(data["total_wagered"])
-                    data["win_rate"] = data["wins"] / total_bets if total_bets else 0
-                    data["roi"] = (
-                        data["net_pnl"] / total_wagered if total_wagered else 0
-                    )
-                    metrics[int(data["discord_id"])] = data
+                    metrics[int(row["discord_id"])] = _with_ratios(row)
 
         return metrics
 
+    def rebuild_gambling_aggregates(self, guild_id: int | None = None) -> int:
+        """Recompute aggregate rows from bet history; ``None`` rebuilds every guild.
+
+        Returns the number of aggregate rows written.
+        """
+        with self.atomic_transaction() as conn:
+            cursor = conn.cursor()
+            guild_clause = ""
+            params: tuple = ()
+            if guild_id is not None:
+                guild_clause = "AND guild_id = ?"
+                params = (self.normalize_guild_id(guild_id),)
+            cursor.execute(
+                f"DELETE FROM player_gambling_aggregates WHERE 1 = 1 {guild_clause}",
+                params,
+            )
+            cursor.execute(
+                f"""
+                INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+                SELECT DISTINCT guild_id, discord_id
+                FROM bets
+                WHERE match_id IS NOT NULL {guild_clause}
+                """,
+                params,
+            )
+            return self._refresh_gambling_aggregates_in_txn(
+                cursor,
+                None if guild_id is None else params[0],
+            )
+
+    def verify_gambling_aggregates(self, guild_id: int | None) -> list[int]:
+        """Compare stored aggregates with a full bet-history scan.
+
+        Returns the discord_ids whose stored row is missing, extra, or differs.
+        """
+        normalized_guild = self.normalize_guild_id(guild_id)
+        stored = self.get_bulk_gambling_metrics(normalized_guild)
+        with self.connection() as conn:
+            live = {
+                int(row["discord_id"]): _with_ratios(row)
+                for row in conn.execute(_gambling_metrics_sql(), (normalized_guild,))
+            }
+
+        mismatched = []
+        for discord_id in sorted(set(stored) | set(live)):
+            expected = live.get(discord_id)
+            actual = stored.get(discord_id)
+            if expected is None or actual is None or any(
+                not math.isclose(float(actual[key]), float(expected[key]), abs_tol=1e-9)
+                for key in _GAMBLING_AGGREGATE_COLUMNS
+            ):
+                mismatched.append(discord_id)
+        return mismatched
+
+    def _refresh_dirty_gambling_aggregates(self, guild_id: int) -> None:
+        with self.connection() as conn:
+            dirty = conn.execute(
+                "SELECT 1 FROM gambling_aggregate_dirty WHERE guild_id = ? LIMIT 1",
+                (guild_id,),
+            ).fetchone()
+        if dirty is None:
+            return
+        with self.atomic_transaction() as conn:
+            self._refresh_gambling_aggregates_in_txn(conn.cursor(), guild_id)
+
+    def _refresh_gambling_aggregates_in_txn(self, cursor, guild_id: int | None) -> int:
+        """Recompute the aggregate rows of players marked dirty by the triggers.
+
+        Called at the end of every settlement transaction, so only the bettors
+        touched by that settlement are rescanned (through the per-player bets
+        index) and the leaderboard never reads a half-applied settlement.
+        """
+        if guild_id is None:
+            cursor.execute("SELECT guild_id, discord_id FROM gambling_aggregate_dirty")
+        else:
+            cursor.execute(
+                "SELECT guild_id, discord_id FROM gambling_aggregate_dirty WHERE guild_id = ?",
+                (guild_id,),
+            )
+        dirty_by_guild: dict[int, list[int]] = {}
+        for row in cursor.fetchall():
+            dirty_by_guild.setdefault(int(row["guild_id"]), []).append(int(row["discord_id"]))
+
+        columns = ", ".join(_GAMBLING_AGGREGATE_COLUMNS)
+        written = 0
+        for dirty_guild, discord_ids in dirty_by_guild.items():
+            for offset in range(0, len(discord_ids), _GAMBLING_AGGREGATE_CHUNK):
+                chunk = discord_ids[offset : offset + _GAMBLING_AGGREGATE_CHUNK]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(
+                    f"""
+                    DELETE FROM player_gambling_aggregates
+                    WHERE guild_id = ? AND discord_id IN ({placeholders})
+                    """,
+                    (dirty_guild, *chunk),
+                )
+                cursor.execute(
+                    f"""
+                    INSERT INTO player_gambling_aggregates ({columns}, updated_at)
+                    SELECT {columns}, CAST(strftime('%s', 'now') AS INTEGER)
+                    FROM ({_gambling_metrics_sql(f"AND b.discord_id IN ({placeholders})")})
+                    """,
+                    (dirty_guild, *chunk),
+                )
+                written += max(cursor.rowcount, 0)
+                cursor.execute(
+                    f"""
+                    DELETE FROM gambling_aggregate_dirty
+                    WHERE guild_id = ? AND discord_id IN ({placeholders})
+                    """,
+                    (dirty_guild, *chunk),
+                )
+        return written
+
     def get_guild_gambling_summary(self, guild_id: int | None, min_bets: int = 3) -> list[dict]:
         """
         Get aggregated gambling stats for all players in a guild.
@@ -2930,6 +3066,10 @@ class BetRepository(BaseRepository, IBetRepository):
                     (match_id,),
                 )
 
+            # The correction flipped matches.winning_team and rewrote payouts
+            # and vanity taxes; every bettor on the match is marked dirty.
+            self._refresh_gambling_aggregates_in_txn(cursor, gid)
+
         return combined_deltas
 
     def get_bets_on_player_matches(self, target_discord_id: int, guild_id: int | None = None) -> list[dict]:
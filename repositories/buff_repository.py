@@ -12,11 +12,13 @@ import time
 from typing import Any
 
 from repositories.base_repository import BaseRepository, safe_json_loads
+from utils.effect_cache import EFFECT_NAMESPACE_BUFF, invalidates_request_effects
 
 
 class BuffRepository(BaseRepository):
     """Stores time-limited manashop buffs."""
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def grant(
         self,
         discord_id: int,
@@ -166,6 +168,7 @@ class BuffRepository(BaseRepository):
             )
             return {row["target_id"] for row in cursor.fetchall()}
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def refresh_atomic(
         self,
         discord_id: int,
@@ -201,6 +204,7 @@ class BuffRepository(BaseRepository):
             )
             return int(cursor.lastrowid or 0)
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def consume_atomic(self, buff_id: int) -> bool:
         """Atomically mark a buff as triggered. Returns True if the flag
         flipped (claim succeeded), False if it was already triggered or the
@@ -214,6 +218,7 @@ class BuffRepository(BaseRepository):
             )
             return cursor.rowcount > 0
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def consume_and_credit_atomic(
         self,
         buff_id: int,
@@ -379,6 +384,7 @@ class BuffRepository(BaseRepository):
             )
             return granted
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def consume_data_charge_atomic(
         self,
         discord_id: int,
@@ -432,6 +438,7 @@ class BuffRepository(BaseRepository):
                 )
             return True
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def settle_due_dark_bargains(
         self,
         *,
@@ -552,6 +559,7 @@ class BuffRepository(BaseRepository):
 
         return results
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def cleanup_expired(self, *, before: int | None = None) -> int:
         """Delete expired/triggered buff rows. Returns number of rows pruned.
 
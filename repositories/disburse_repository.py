@@ -449,8 +449,13 @@ class DisburseRepository(BaseRepository, IDisburseRepository):
                 finally:
                     self._clear_economy_ledger_context(cursor)
 
-                self._set_economy_ledger_context(
+                payouts: dict[int, int] = {}
+                for discord_id, amount in distributions:
+                    payouts[discord_id] = payouts.get(discord_id, 0) + amount
+                credited = self._apply_balance_deltas(
                     cursor,
+                    normalized_guild,
+                    payouts,
                     source="disburse",
                     related_type="disbursement",
                     reason="Jopacoin Reserve disbursement payout",
@@ -459,31 +464,17 @@ class DisburseRepository(BaseRepository, IDisburseRepository):
                         "distribution_total": total,
                     },
                 )
-                try:
-                    cursor.executemany(
-                        """
-                        UPDATE players
-                        SET jopacoin_balance = jopacoin_balance + ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE discord_id = ? AND guild_id = ?
-                        """,
-                        [
-                            (amount, discord_id, normalized_guild)
-                            for discord_id, amount in distributions
-                        ],
+                # Each distribution must land on exactly one player row. If a
+                # recipient's row is missing, the fund was already debited but
+                # the share is credited to nobody, silently destroying that JC.
+                # Raising here rolls the whole BEGIN IMMEDIATE back so the op
+                # stays all-or-nothing.
+                if len(credited) != len(payouts):
+                    raise ValueError(
+                        "Disbursement aborted: "
+                        f"{len(payouts)} recipients but {len(credited)} "
+                        "player rows updated (a recipient row is missing)."
                     )
-                    # Each distribution must land on exactly one player row. If a
-                    # recipient's row is missing, that UPDATE matches 0 rows: the
-                    # fund was already debited but the share is credited to nobody,
-                    # silently destroying that JC. Raising here rolls the whole
-                    # BEGIN IMMEDIATE back so the op stays all-or-nothing.
-                    if cursor.rowcount != len(distributions):
-                        raise ValueError(
-                            "Disbursement aborted: "
-                            f"{len(distributions)} recipients but {cursor.rowcount} "
-                            "player rows updated (a recipient row is missing)."
-                        )
-                finally:
-                    self._clear_economy_ledger_context(cursor)
 
             # 4) Record history in the same txn — no silent "completed but no log"
             #    state is possible if this fails, because it rolls the whole op back.
@@ -778,6 +778,26 @@ class DuelChallengeRepository(BaseRepository):
             (int(row["challenge_id"]), int(row["guild_id"])) for row in rows
         ]
 
+    def get_next_due_at(self) -> int | None:
+        """Earliest time ``get_due_challenge_ids`` will next return a challenge."""
+        with self.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT MIN(
+                    CASE
+                        WHEN status = 'pending' AND next_reminder_at IS NOT NULL
+                        THEN MIN(expires_at, next_reminder_at)
+                        WHEN status = 'pending' THEN expires_at
+                        ELSE next_reminder_at
+                    END
+                ) AS due_at
+                FROM duel_challenges
+                WHERE (status = 'pending' AND message_id IS NOT NULL)
+                   OR (status IN ('accepted', 'expired') AND next_reminder_at IS NOT NULL)
+                """
+            ).fetchone()
+        return None if row["due_at"] is None else int(row["due_at"])
+
     def claim_reminder_atomic(
         self, challenge_id: int, guild_id: int, now: int
     ) -> DuelDueResult | None:
@@ -13,6 +13,17 @@ from repositories.base_repository import BaseRepository, safe_json_loads
 class EconomyEventRepository(BaseRepository):
     """Guild-scoped policy state, snapshots, event cards, and direct actions."""
 
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        # Bumped whenever an event card is inserted so service-level effect
+        # caches notice cards written directly through this repository.
+        self._events_version = 0
+
+    @property
+    def events_version(self) -> int:
+        """Monotonic counter of event-card writes made through this instance."""
+        return self._events_version
+
     def ensure_policy_state(
         self,
         guild_id: int | None,
@@ -696,7 +707,10 @@ class EconomyEventRepository(BaseRepository):
             row = cursor.execute(
                 "SELECT * FROM economy_daily_events WHERE event_id = ?", (event_id,)
             ).fetchone()
-            return self._event_row(row), True
+        # Bump only after commit so a concurrent reader cannot cache the
+        # pre-insert state under the new version.
+        self._events_version += 1
+        return self._event_row(row), True
 
     def mark_event_announced(
         self, guild_id: int | None, event_id: int, *, now: int | None = None
@@ -95,3 +95,219 @@ class EconomyLedgerRepository(BaseRepository):
                 (gid, max(1, min(int(limit), 100))),
             )
             return [dict(row) for row in cursor.fetchall()]
+
+    def get_account_entries_page(
+        self,
+        guild_id: int | None,
+        account_type: str,
+        account_id: int,
+        *,
+        after: tuple[int, int] | None = None,
+        limit: int = 100,
+    ) -> tuple[list[dict], tuple[int, int] | None]:
+        """Oldest-first page of an account's entries, keyed on ``(created_at, ledger_id)``.
+
+        Pass the returned cursor as ``after`` to fetch the next page; it is
+        ``None`` once the history is exhausted. Unlike OFFSET paging, each page
+        costs the same however deep into a long history it starts.
+        """
+        gid = self.normalize_guild_id(guild_id)
+        limit = max(1, min(int(limit), 1000))
+        created_after, ledger_after = after if after is not None else (-1, -1)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT ledger_id, guild_id, account_type, account_id, delta,
+                       balance_before, balance_after, source, actor_id,
+                       related_type, related_id, reason, metadata, created_at
+                FROM economy_ledger_entries
+                WHERE guild_id = ? AND account_type = ? AND account_id = ?
+                  AND (created_at, ledger_id) > (?, ?)
+                ORDER BY created_at, ledger_id
+                LIMIT ?
+                """,
+                (gid, account_type, account_id, created_after, ledger_after, limit + 1),
+            )
+            entries = [dict(row) for row in cursor.fetchall()]
+        if len(entries) <= limit:
+            return entries, None
+        entries = entries[:limit]
+        return entries, (entries[-1]["created_at"], entries[-1]["ledger_id"])
+
+    def get_opening_backfill(
+        self, guild_id: int | None, account_type: str, account_id: int
+    ) -> dict | None:
+        """Return the account's ``ledger_backfill`` opening row, if it has one.
+
+        Accounts that held a balance when the ledger was created open with this
+        row; everything before it only exists in the per-feature history tables.
+        """
+        gid = self.normalize_guild_id(guild_id)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT ledger_id, created_at, delta, balance_after
+                FROM economy_ledger_entries
+                WHERE guild_id = ? AND account_type = ? AND account_id = ?
+                  AND source = 'ledger_backfill'
+                ORDER BY created_at DESC, ledger_id DESC
+                LIMIT 1
+                """,
+                (gid, account_type, account_id),
+            )
+            row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_account_series(
+        self,
+        guild_id: int | None,
+        account_type: str,
+        account_id: int,
+        *,
+        after: tuple[int, int] | None = None,
+        max_points: int = 600,
+    ) -> dict:
+        """Chart-resolution balance series for one account.
+
+        Rows are split into at most ``max_points`` equal-count buckets in SQL;
+        each bucket reports its last row's time, balance and source plus the
+        bucket's summed delta, so long histories never leave the database in
+        full. Returns ``{"opening_balance", "points", "source_totals"}``, where
+        ``opening_balance`` is the balance before the first row charted.
+
+        ``after`` is a ``(created_at, ledger_id)`` key: only later rows are
+        charted and totalled, and an account with none opens at its balance
+        as of that key.
+        """
+        gid = self.normalize_guild_id(guild_id)
+        max_points = max(2, int(max_points))
+        created_after, ledger_after = after if after is not None else (-1, -1)
+        params = (gid, account_type, account_id, created_after, ledger_after)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            # With a single max() aggregate SQLite takes the bare columns from
+            # the row holding that maximum, i.e. the bucket's last entry.
+            cursor.execute(
+                """
+                WITH numbered AS (
+                    SELECT ledger_id, created_at, delta, balance_before,
+                           balance_after, source,
+                           ROW_NUMBER() OVER timeline AS rn,
+                           FIRST_VALUE(balance_before) OVER timeline AS opening_balance,
+                           COUNT(*) OVER () AS total
+                    FROM economy_ledger_entries
+                    WHERE guild_id = ? AND account_type = ? AND account_id = ?
+                      AND (created_at, ledger_id) > (?, ?)
+                    WINDOW timeline AS (ORDER BY created_at, ledger_id)
+                )
+                SELECT MAX(rn) AS last_rn, ledger_id, created_at, balance_after,
+                       source, opening_balance, SUM(delta) AS delta,
+                       COUNT(*) AS entry_count
+                FROM numbered
+                GROUP BY CASE WHEN total <= ? THEN rn ELSE (rn - 1) * ? / total END
+                ORDER BY last_rn
+                """,
+                (*params, max_points, max_points),
+            )
+            rows = cursor.fetchall()
+            cursor.execute(
+                """
+                SELECT source, SUM(delta) AS net_delta
+                FROM economy_ledger_entries
+                WHERE guild_id = ? AND account_type = ? AND account_id = ?
+                  AND (created_at, ledger_id) > (?, ?)
+                GROUP BY source
+                """,
+                params,
+            )
+            source_totals = {row["source"]: int(row["net_delta"]) for row in cursor.fetchall()}
+            if rows:
+                opening = rows[0]["opening_balance"]
+            elif after is not None:
+                cursor.execute(
+                    """
+                    SELECT balance_after FROM economy_ledger_entries
+                    WHERE guild_id = ? AND account_type = ? AND account_id = ?
+                      AND (created_at, ledger_id) <= (?, ?)
+                    ORDER BY created_at DESC, ledger_id DESC
+                    LIMIT 1
+                    """,
+                    params,
+                )
+                row = cursor.fetchone()
+                opening = row["balance_after"] if row else 0
+            else:
+                opening = 0
+        points = [
+            {
+                "ledger_id": row["ledger_id"],
+                "time": row["created_at"],
+                "balance": row["balance_after"],
+                "delta": row["delta"],
+                "source": row["source"],
+                "entry_count": row["entry_count"],
+            }
+            for row in rows
+        ]
+        return {
+            "opening_balance": int(opening or 0),
+            "points": points,
+            "source_totals": source_totals,
+        }
+
+    def find_conservation_breaks(self, guild_id: int | None) -> list[dict]:
+        """Return ledger rows that break balance conservation for a guild.
+
+        Three checks, all of which hold whether a row was written by a trigger
+        or by the bulk writer: each row's ``balance_after - balance_before``
+        equals its ``delta``; each row starts where the account's previous row
+        ended; and each account's last row matches its live balance.
+        """
+        gid = self.normalize_guild_id(guild_id)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                WITH chained AS (
+                    SELECT ledger_id, account_type, account_id, delta,
+                           balance_before, balance_after,
+                           LAG(balance_after) OVER account_rows AS previous_after,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY account_type, account_id
+                               ORDER BY ledger_id DESC
+                           ) AS recency
+                    FROM economy_ledger_entries
+                    WHERE guild_id = ?
+                    WINDOW account_rows AS (
+                        PARTITION BY account_type, account_id ORDER BY ledger_id
+                    )
+                ),
+                live AS (
+                    SELECT 'player' AS account_type, discord_id AS account_id,
+                           COALESCE(jopacoin_balance, 0) AS balance
+                    FROM players WHERE guild_id = ?
+                    UNION ALL
+                    SELECT 'nonprofit', guild_id, COALESCE(total_collected, 0)
+                    FROM nonprofit_fund WHERE guild_id = ?
+                )
+                SELECT c.ledger_id, c.account_type, c.account_id,
+                       CASE
+                           WHEN c.balance_after - c.balance_before != c.delta THEN 'delta'
+                           WHEN c.previous_after IS NOT NULL
+                                AND c.previous_after != c.balance_before THEN 'chain'
+                           ELSE 'balance'
+                       END AS problem,
+                       c.balance_after, l.balance AS live_balance
+                FROM chained c
+                LEFT JOIN live l
+                  ON l.account_type = c.account_type AND l.account_id = c.account_id
+                WHERE c.balance_after - c.balance_before != c.delta
+                   OR (c.previous_after IS NOT NULL AND c.previous_after != c.balance_before)
+                   OR (c.recency = 1 AND l.balance IS NOT NULL AND l.balance != c.balance_after)
+                ORDER BY c.ledger_id
+                """,
+                (gid, gid, gid),
+            )
+            return [dict(row) for row in cursor.fetchall()]
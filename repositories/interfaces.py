@@ -5,7 +5,7 @@ These interfaces define the contracts implemented by concrete repositories.
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
 
 
@@ -842,6 +842,11 @@ class IMatchRepository(ABC):
         """Return the guild's optimistic-concurrency revision."""
         ...
 
+    @abstractmethod
+    def get_rating_backtest_history(self, guild_id: int) -> tuple[list, list, dict]:
+        """Read players, decided matches and participants for an offline backtest."""
+        ...
+
     @abstractmethod
     def replay_openskill_atomic(self, *, guild_id: int, system):
         """Load, compute, and persist a complete replay under one write lock."""
@@ -1355,6 +1360,21 @@ class IPredictionRepository(ABC):
         """Return open markets whose ``last_refresh_at`` is older than the cutoff."""
         ...
 
+    @abstractmethod
+    def get_next_refresh_due_at(self, refresh_interval_seconds: int) -> int | None:
+        """Return when the stalest open market comes due, or None with no open markets."""
+        ...
+
+    @abstractmethod
+    def get_refresh_inputs(self, prediction_ids: list[int]) -> dict[int, dict]:
+        """Return each market's row, book and fill anchors from one snapshot."""
+        ...
+
+    @abstractmethod
+    def apply_refreshes(self, refreshes: list[dict]) -> dict[int, dict]:
+        """Apply many refreshes in one transaction; return trade summaries by market."""
+        ...
+
     @abstractmethod
     def apply_refresh(
         self,
@@ -2851,6 +2871,9 @@ class ISurveyRepository(ABC):
         expected_attempt_count: int,
     ): ...
 
+    @abstractmethod
+    def renew_delivery_claims(self, claims: Sequence[tuple[int, int]]) -> set[int]: ...
+
     @abstractmethod
     def recover_stale_deliveries(self, stale_after_seconds: int) -> int: ...
 
@@ -2889,6 +2912,13 @@ class ISurveyRepository(ABC):
         dm_message_id: int,
     ): ...
 
+    @abstractmethod
+    def record_delivery_outcomes(
+        self,
+        sent: Sequence[tuple[int, int, int, int]],
+        failed: Sequence[tuple[int, int, str]],
+    ): ...
+
     @abstractmethod
     def mark_delivery_receipt_checked(
         self,
@@ -2908,6 +2938,9 @@ class ISurveyRepository(ABC):
     @abstractmethod
     def get_response_session(self, survey_id: int, discord_id: int): ...
 
+    @abstractmethod
+    def get_response_sessions(self, keys: Sequence[tuple[int, int]]) -> dict: ...
+
     @abstractmethod
     def list_recoverable_response_sessions(self) -> list: ...
 
@@ -0,0 +1,209 @@
+"""
+SQLite housekeeping: WAL checkpoints, planner statistics and free-page reclaim.
+
+Every statement here runs on its own autocommit connection whose busy
+timeout is the caller's lock budget, and every step that takes the write lock
+does a bounded amount of work (one table's sampled ANALYZE, one batch of
+incremental-vacuum pages), so a live writer never waits behind maintenance
+for much longer than that budget.
+"""
+
+import logging
+import os
+import sqlite3
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from repositories.base_repository import BaseRepository
+
+logger = logging.getLogger("cama_bot.repositories.maintenance")
+
+# PRAGMA auto_vacuum values.
+_AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+# Read queries shaped like the hottest player/match repository paths, timed
+# before and after maintenance. ``:guild_id``/``:discord_id`` are the busiest
+# guild and its most active player.
+_PROBES = {
+    "glicko_leaderboard": """
+        SELECT discord_id FROM players
+        WHERE guild_id = :guild_id
+        ORDER BY
+            CASE WHEN glicko_rating IS NULL THEN 1 ELSE 0 END,
+            glicko_rating DESC,
+            COALESCE(wins, 0) DESC,
+            discord_id ASC
+        LIMIT 20
+    """,
+    "player_match_history": """
+        SELECT m.match_id, mp.won
+        FROM match_participants mp
+        JOIN matches m ON mp.match_id = m.match_id
+        WHERE mp.discord_id = :discord_id AND mp.guild_id = :guild_id
+        ORDER BY m.match_date DESC
+        LIMIT 10
+    """,
+    "recent_matches": """
+        SELECT match_id FROM matches
+        WHERE guild_id = :guild_id
+        ORDER BY match_date DESC
+        LIMIT 20
+    """,
+}
+
+
+class MaintenanceRepository(BaseRepository):
+    """Storage statistics and bounded maintenance steps for the bot database."""
+
+    @contextmanager
+    def _maintenance_connection(self, busy_timeout_ms: int) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(
+            self.db_path,
+            uri=self.db_path.startswith("file:"),
+            timeout=max(0, busy_timeout_ms) / 1000,
+            isolation_level=None,
+        )
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def has_live_activity(self) -> bool:
+        """True while any guild has a pending match or a lobby with players."""
+        with self.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    EXISTS(SELECT 1 FROM pending_matches)
+                    OR EXISTS(
+                        SELECT 1 FROM lobby_state
+                        WHERE COALESCE(players, '[]') NOT IN ('', '[]')
+                           OR COALESCE(conditional_players, '[]') NOT IN ('', '[]')
+                    )
+                """
+            ).fetchone()
+        return bool(row[0])
+
+    def storage_stats(self) -> dict[str, int | str]:
+        """File sizes and page counts for the main database and its WAL."""
+        with self._maintenance_connection(0) as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        return {
+            "db_bytes": self._file_size(self.db_path),
+            "wal_bytes": self._file_size(f"{self.db_path}-wal"),
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_count": freelist_count,
+            "auto_vacuum": _AUTO_VACUUM_MODES.get(auto_vacuum, str(auto_vacuum)),
+        }
+
+    def _file_size(self, path: str) -> int:
+        if self.db_path.startswith("file:") or self.db_path == ":memory:":
+            return 0
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def checkpoint(self, mode: str, *, busy_timeout_ms: int) -> dict[str, int]:
+        """Run ``PRAGMA wal_checkpoint(mode)``.
+
+        PASSIVE copies whatever it can without taking any lock. TRUNCATE also
+        waits (up to ``busy_timeout_ms``) for readers to leave the WAL, then
+        resets it to zero bytes; ``busy`` is 1 when it gave up.
+        """
+        mode = mode.upper()
+        if mode not in {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}:
+            raise ValueError(f"Unknown checkpoint mode: {mode}")
+        with self._maintenance_connection(busy_timeout_ms) as conn:
+            busy, log_frames, checkpointed = conn.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+        return {"busy": busy, "log_frames": log_frames, "checkpointed_frames": checkpointed}
+
+    def list_tables(self) -> list[str]:
+        with self.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT name FROM sqlite_master
+                WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+                ORDER BY name
+                """
+            ).fetchall()
+        return [row["name"] for row in rows]
+
+    def analyze_table(self, table: str, *, analysis_limit: int, busy_timeout_ms: int) -> float:
+        """Refresh one table's planner statistics; returns seconds spent.
+
+        ``analysis_limit`` caps the rows sampled per index, which bounds how
+        long the statistics write holds the lock on large tables. Raises
+        ``sqlite3.OperationalError`` when the lock is not free in time.
+        """
+        quoted = '"' + table.replace('"', '""') + '"'
+        with self._maintenance_connection(busy_timeout_ms) as conn:
+            conn.execute(f"PRAGMA analysis_limit={int(analysis_limit)}")
+            started = time.perf_counter()
+            conn.execute(f"ANALYZE {quoted}")
+            return time.perf_counter() - started
+
+    def incremental_vacuum(self, pages: int, *, busy_timeout_ms: int) -> tuple[int, float]:
+        """Release up to ``pages`` free pages in one short write transaction.
+
+        Returns ``(pages_released, seconds_spent)``. A no-op unless the
+        database uses ``auto_vacuum=INCREMENTAL``.
+        """
+        with self._maintenance_connection(busy_timeout_ms) as conn:
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            started = time.perf_counter()
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+            elapsed = time.perf_counter() - started
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return before - after, elapsed
+
+    def enable_incremental_vacuum(self) -> None:
+        """Switch an existing database to incremental auto-vacuum.
+
+        This rewrites the whole file with ``VACUUM`` and blocks every reader
+        and writer while it runs, so it is only meant for offline use (see
+        ``scripts/db_maintenance.py``). New databases start in this mode.
+        """
+        with self._maintenance_connection(5000) as conn:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+
+    def probe_targets(self) -> dict[str, int]:
+        """The busiest guild and its most active player, for ``time_probes``."""
+        with self.connection() as conn:
+            guild = conn.execute(
+                "SELECT guild_id FROM players GROUP BY guild_id ORDER BY COUNT(*) DESC LIMIT 1"
+            ).fetchone()
+            guild_id = guild["guild_id"] if guild else 0
+            player = conn.execute(
+                """
+                SELECT discord_id FROM match_participants
+                WHERE guild_id = ?
+                GROUP BY discord_id
+                ORDER BY COUNT(*) DESC
+                LIMIT 1
+                """,
+                (guild_id,),
+            ).fetchone()
+        return {"guild_id": guild_id, "discord_id": player["discord_id"] if player else 0}
+
+    def time_probes(self, targets: dict[str, int], *, repeat: int = 5) -> dict[str, float]:
+        """Median milliseconds for each probe query on a fresh connection."""
+        timings: dict[str, float] = {}
+        with self._maintenance_connection(5000) as conn:
+            for name, sql in _PROBES.items():
+                samples = []
+                for _ in range(max(1, repeat)):
+                    started = time.perf_counter()
+                    conn.execute(sql, targets).fetchall()
+                    samples.append(time.perf_counter() - started)
+                timings[name] = round(statistics.median(samples) * 1000, 3)
+        return timings
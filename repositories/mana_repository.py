@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from repositories.base_repository import BaseRepository
 from repositories.interfaces import IManaRepository
+from utils.effect_cache import EFFECT_NAMESPACE_MANA, invalidates_request_effects
 
 _BANKRUPT_BUFF_COLUMNS = {
     "insurance": "bankrupt_insurance_used",
@@ -38,6 +39,7 @@ class ManaRepository(BaseRepository, IManaRepository):
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_MANA)
     def set_mana(self, discord_id: int, guild_id: int | None, land: str, assigned_date: str) -> None:
         """Upsert today's mana for the player (replaces any previous value)."""
         gid = self.normalize_guild_id(guild_id)
@@ -54,6 +56,7 @@ class ManaRepository(BaseRepository, IManaRepository):
                 (discord_id, gid, land, assigned_date),
             )
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_MANA)
     def claim_mana_atomic(
         self, discord_id: int, guild_id: int | None, land: str, assigned_date: str
     ) -> bool:
@@ -107,6 +110,7 @@ class ManaRepository(BaseRepository, IManaRepository):
             )
             return True
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_MANA)
     def claim_mana_batch_atomic(
         self,
         assignments: list[tuple[int, str]],
@@ -262,6 +266,7 @@ class ManaRepository(BaseRepository, IManaRepository):
             row = cursor.fetchone()
             return bool(row and row["consumed_today"])
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_MANA)
     def mark_mana_consumed_atomic(
         self, discord_id: int, guild_id: int | None
     ) -> bool:
@@ -2989,6 +2989,83 @@ class MatchRepository(BaseRepository, IMatchRepository):
             ).fetchone()
             return int(row["revision"]) if row else 0
 
+    @staticmethod
+    def _load_rating_replay_inputs(cursor, normalized_guild: int) -> tuple[list, list, dict]:
+        """Load a guild's players, decided matches and participants in replay order."""
+        players = cursor.execute(
+            """
+            SELECT discord_id, guild_id, initial_mmr, os_mu, os_sigma
+            FROM players
+            WHERE guild_id = ?
+            ORDER BY discord_id
+            """,
+            (normalized_guild,),
+        ).fetchall()
+        matches = cursor.execute(
+            """
+            SELECT m.match_id, m.guild_id, m.winning_team, m.match_date,
+                   m.team1_players, m.team2_players,
+                   (
+                       SELECT rh.streak_multiplier_per_game
+                       FROM rating_history rh
+                       WHERE rh.guild_id = m.guild_id
+                         AND rh.match_id = m.match_id
+                       ORDER BY rh.id
+                       LIMIT 1
+                   ) AS streak_multiplier_per_game,
+                   (
+                       SELECT rh.streak_threshold
+                       FROM rating_history rh
+                       WHERE rh.guild_id = m.guild_id
+                         AND rh.match_id = m.match_id
+                       ORDER BY rh.id
+                       LIMIT 1
+                   ) AS streak_threshold
+            FROM matches m
+            WHERE m.guild_id = ? AND m.winning_team IN (1, 2)
+            ORDER BY m.match_date, m.match_id
+            """,
+            (normalized_guild,),
+        ).fetchall()
+        participant_rows = cursor.execute(
+            """
+            SELECT mp.match_id, mp.discord_id, mp.team_number,
+                   mp.side, mp.fantasy_points,
+                   COALESCE((
+                       SELECT rh.low_priority_gain_multiplier
+                       FROM rating_history rh
+                       WHERE rh.guild_id = mp.guild_id
+                         AND rh.match_id = mp.match_id
+                         AND rh.discord_id = mp.discord_id
+                       ORDER BY rh.id
+                       LIMIT 1
+                   ), 1.0) AS low_priority_gain_multiplier
+            FROM match_participants mp
+            JOIN matches m
+              ON m.match_id = mp.match_id AND m.guild_id = mp.guild_id
+            WHERE m.guild_id = ? AND m.winning_team IN (1, 2)
+            ORDER BY mp.match_id, mp.discord_id
+            """,
+            (normalized_guild,),
+        ).fetchall()
+        participants_by_match: dict[int, list] = {
+            row["match_id"]: [] for row in matches
+        }
+        for row in participant_rows:
+            participants_by_match.setdefault(row["match_id"], []).append(row)
+        return list(players), list(matches), participants_by_match
+
+    def get_rating_backtest_history(self, guild_id: int) -> tuple[list, list, dict]:
+        """Read the inputs a rating backtest replays, without taking a write lock.
+
+        Same rows as :meth:`replay_openskill_atomic` minus the manual
+        OpenSkill events: a backtest compares parameter settings, and admin
+        corrections are not something a setting predicted.
+        """
+        normalized_guild = self.normalize_guild_id(guild_id)
+        with self.connection() as conn:
+            return self._load_rating_replay_inputs(conn.cursor(), normalized_guild)
+
     def replay_openskill_atomic(
         self,
         *,
@@ -3001,67 +3078,9 @@ class MatchRepository(BaseRepository, IMatchRepository):
         normalized_guild = self.normalize_guild_id(guild_id)
         with self.atomic_transaction() as conn:
             cursor = conn.cursor()
-            players = cursor.execute(
-                """
-                SELECT discord_id, guild_id, initial_mmr, os_mu, os_sigma
-                FROM players
-                WHERE guild_id = ?
-                ORDER BY discord_id
-                """,
-                (normalized_guild,),
-            ).fetchall()
-            matches = cursor.execute(
-                """
-                SELECT m.match_id, m.guild_id, m.winning_team, m.match_date,
-                       m.team1_players, m.team2_players,
-                       (
-                           SELECT rh.streak_multiplier_per_game
-                           FROM rating_history rh
-                           WHERE rh.guild_id = m.guild_id
-                             AND rh.match_id = m.match_id
-                           ORDER BY rh.id
-                           LIMIT 1
-                       ) AS streak_multiplier_per_game,
-                       (
-                           SELECT rh.streak_threshold
-                           FROM rating_history rh
-                           WHERE rh.guild_id = m.guild_id
-                             AND rh.match_id = m.match_id
-                           ORDER BY rh.id
-                           LIMIT 1
-                       ) AS streak_threshold
-                FROM matches m
-                WHERE m.guild_id = ? AND m.winning_team IN (1, 2)
-                ORDER BY m.match_date, m.match_id
-                """,
-                (normalized_guild,),
-            ).fetchall()
-            participant_rows = cursor.execute(
-                """
-                SELECT mp.match_id, mp.discord_id, mp.team_number,
-                       mp.side, mp.fantasy_points,
-                       COALESCE((
-                           SELECT rh.low_priority_gain_multiplier
-                           FROM rating_history rh
-                           WHERE rh.guild_id = mp.guild_id
-                             AND rh.match_id = mp.match_id
-                             AND rh.discord_id = mp.discord_id
-                           ORDER BY rh.id
-                           LIMIT 1
-                       ), 1.0) AS low_priority_gain_multiplier
-                FROM match_participants mp
-                JOIN matches m
-                  ON m.match_id = mp.match_id AND m.guild_id = mp.guild_id
-                WHERE m.guild_id = ? AND m.winning_team IN (1, 2)
-                ORDER BY mp.match_id, mp.discord_id
-                """,
-                (normalized_guild,),
-            ).fetchall()
-            participants_by_match: dict[int, list] = {
-                row["match_id"]: [] for row in matches
-            }
-            for row in participant_rows:
-                participants_by_match.setdefault(row["match_id"], []).append(row)
+            players, matches, participants_by_match = self._load_rating_replay_inputs(
+                cursor, normalized_guild
+            )
             rating_events = cursor.execute(
                 """
                 SELECT event_id, guild_id, discord_id, event_type, value, event_at
@@ -3072,8 +3091,8 @@ class MatchRepository(BaseRepository, IMatchRepository):
                 (normalized_guild,),
             ).fetchall()
             replay = replay_openskill(
-                players=list(players),
-                matches=list(matches),
+                players=players,
+                matches=matches,
                 participants_by_match=participants_by_match,
                 rating_events=list(rating_events),
                 system=system,
@@ -525,6 +525,17 @@ class PetBrawlRepository(BaseRepository):
                     voided += 1
         return {"expired": expired, "voided": voided}
 
+    def next_stale_at(self, *, active_ttl_seconds: int) -> int | None:
+        """When sweep_stale next has a challenge to expire or a battle to void."""
+        with self.connection() as conn:
+            row = conn.execute(
+                "SELECT MIN(CASE WHEN status = 'pending' THEN expires_at "
+                "ELSE created_at + ? + 1 END) AS due FROM pet_brawls "
+                "WHERE status IN ('pending', 'active')",
+                (active_ttl_seconds,),
+            ).fetchone()
+        return row["due"] if row is not None else None
+
     def _raise_transition_error(
         self,
         cursor: sqlite3.Cursor,
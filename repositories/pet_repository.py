@@ -68,10 +68,68 @@ def _week_params(week_key: str, consumed: int) -> tuple:
     return (week_key, week_key, week_key, consumed, consumed, week_key)
 
 
+# IN-list size for bulk sweep reads (well under SQLite's variable limit).
+_BULK_CHUNK = 500
+
+# Anchor-guarded death claim shared by claim_death and claim_deaths_many.
+_CLAIM_DEATH_SQL = (
+    "UPDATE pets SET died_at = ?, death_cause = ?, "
+    "dig_work_units = COALESCE(?, dig_work_units), "
+    "dig_work_at = COALESCE(?, dig_work_at) "
+    "WHERE pet_id = ? AND guild_id = ? AND died_at IS NULL "
+    "AND last_fed_at = ? AND hunger_at_last_fed = ? "
+    "AND (? IS NULL OR dig_work_units = ?) "
+    "AND (? IS NULL OR dig_work_at = ?)"
+)
+
+
+def _claim_death_params(
+    pet_id: int,
+    guild_id: int,
+    *,
+    died_at: int,
+    cause: str = "starvation",
+    expected_last_fed_at: int,
+    expected_hunger: int,
+    expected_dig_work_units: int | None = None,
+    expected_dig_work_at: int | None = None,
+    new_dig_work_units: int | None = None,
+    new_dig_work_at: int | None = None,
+) -> tuple:
+    return (
+        died_at,
+        cause,
+        new_dig_work_units,
+        new_dig_work_at,
+        pet_id,
+        guild_id,
+        expected_last_fed_at,
+        expected_hunger,
+        expected_dig_work_units,
+        expected_dig_work_units,
+        expected_dig_work_at,
+        expected_dig_work_at,
+    )
+
+
 def _row_to_pet(row: sqlite3.Row) -> Pet:
     return Pet.from_row(dict(row))
 
 
+def _eating_outcome_from_row(row: sqlite3.Row, pet_id: int) -> dict[str, int] | None:
+    metadata = safe_json_loads(
+        row["metadata"], {}, context=f"pet eating outcome {pet_id}"
+    )
+    if not isinstance(metadata, dict) or "penalty_games_remaining" not in metadata:
+        return None
+    return {
+        "reward": int(row["delta"]),
+        "penalty_games_added": int(metadata["penalty_games"]),
+        "penalty_games_remaining": int(metadata["penalty_games_remaining"]),
+        "new_balance": int(row["balance_after"]),
+    }
+
+
 def write_hunger_anchor(
     cursor: sqlite3.Cursor, pet_id: int, now: int, hunger: int
 ) -> None:
@@ -125,6 +183,24 @@ class PetRepository(BaseRepository):
             ).fetchone()
         return _row_to_pet(row) if row else None
 
+    def get_pets_by_ids(self, refs: list[tuple[int, int | None]]) -> list[Pet]:
+        """Bulk get_pet_by_id: one IN query per chunk, in ``refs`` order."""
+        wanted = {pet_id: self.normalize_guild_id(gid) for pet_id, gid in refs}
+        found: dict[int, Pet] = {}
+        ids = list(wanted)
+        with self.connection() as conn:
+            for start in range(0, len(ids), _BULK_CHUNK):
+                chunk = ids[start:start + _BULK_CHUNK]
+                rows = conn.execute(
+                    f"SELECT {_PET_COLUMNS} FROM pets "
+                    f"WHERE pet_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    if row["guild_id"] == wanted[row["pet_id"]]:
+                        found[row["pet_id"]] = _row_to_pet(row)
+        return [found[pet_id] for pet_id in ids if pet_id in found]
+
     def has_open_brawl(
         self, discord_id: int, guild_id: int | None, *, now: int
     ) -> bool:
@@ -456,6 +532,37 @@ class PetRepository(BaseRepository):
             ).fetchone()
             return _row_to_pet(resolved)
 
+    def resolve_hatch_species_many(
+        self, assignments: list[tuple[Pet, str]], *, now: int
+    ) -> list[Pet]:
+        """Bulk resolve_hatch_species for the sweep, under one write lock.
+
+        Eggs that already have a species, died, or are not yet due are left
+        untouched; every pet is returned re-read, in ``assignments`` order.
+        """
+        if not assignments:
+            return []
+        with self.atomic_transaction() as conn:
+            conn.executemany(
+                """
+                UPDATE pets
+                SET species = ?
+                WHERE pet_id = ? AND guild_id = ? AND died_at IS NULL
+                  AND species = ? AND hatched_at <= ?
+                """,
+                [
+                    (
+                        species,
+                        pet.pet_id,
+                        self.normalize_guild_id(pet.guild_id),
+                        UNHATCHED_SPECIES,
+                        now,
+                    )
+                    for pet, species in assignments
+                ],
+            )
+        return self.get_pets_by_ids([(pet.pet_id, pet.guild_id) for pet, _ in assignments])
+
     def sacrifice_and_adopt_atomic(
         self,
         discord_id: int,
@@ -769,19 +876,39 @@ class PetRepository(BaseRepository):
                 "AND related_id = ? ORDER BY ledger_id DESC LIMIT 1",
                 (gid, str(pet_id)),
             ).fetchone()
-        if row is None:
-            return None
-        metadata = safe_json_loads(
-            row["metadata"], {}, context=f"pet eating outcome {pet_id}"
-        )
-        if not isinstance(metadata, dict) or "penalty_games_remaining" not in metadata:
-            return None
-        return {
-            "reward": int(row["delta"]),
-            "penalty_games_added": int(metadata["penalty_games"]),
-            "penalty_games_remaining": int(metadata["penalty_games_remaining"]),
-            "new_balance": int(row["balance_after"]),
-        }
+        return _eating_outcome_from_row(row, pet_id) if row else None
+
+    def get_eating_outcomes(
+        self, refs: list[tuple[int, int | None]]
+    ) -> dict[int, dict[str, int]]:
+        """Bulk get_eating_outcome keyed by pet_id; pets without one are absent."""
+        by_guild: dict[int, list[str]] = {}
+        for pet_id, guild_id in refs:
+            by_guild.setdefault(self.normalize_guild_id(guild_id), []).append(str(pet_id))
+        outcomes: dict[int, dict[str, int]] = {}
+        with self.connection() as conn:
+            for gid, related_ids in by_guild.items():
+                for start in range(0, len(related_ids), _BULK_CHUNK):
+                    chunk = related_ids[start:start + _BULK_CHUNK]
+                    rows = conn.execute(
+                        "SELECT related_id, delta, balance_after, metadata "
+                        "FROM economy_ledger_entries "
+                        "WHERE guild_id = ? AND account_type = 'player' "
+                        "AND source = 'pet' AND related_type = 'pet_eating' "
+                        f"AND related_id IN ({','.join('?' * len(chunk))}) "
+                        "ORDER BY ledger_id DESC",
+                        (gid, *chunk),
+                    ).fetchall()
+                    seen: set[int] = set()
+                    for row in rows:
+                        pet_id = int(row["related_id"])
+                        if pet_id in seen:
+                            continue  # newest entry wins, as in get_eating_outcome
+                        seen.add(pet_id)
+                        outcome = _eating_outcome_from_row(row, pet_id)
+                        if outcome is not None:
+                            outcomes[pet_id] = outcome
+        return outcomes
 
     def buy_supplies(
         self,
@@ -1093,6 +1220,43 @@ class PetRepository(BaseRepository):
             ).fetchall()
         return [row["species"] for row in rows]
 
+    def recent_dead_species_many(
+        self, owners: list[tuple[int, int | None]], limit: int
+    ) -> dict[tuple[int, int], list[str]]:
+        """Bulk recent_dead_species keyed by (discord_id, normalized guild_id)."""
+        result: dict[tuple[int, int], list[str]] = {}
+        keys = list(dict.fromkeys(
+            (discord_id, self.normalize_guild_id(gid)) for discord_id, gid in owners
+        ))
+        with self.connection() as conn:
+            for start in range(0, len(keys), _BULK_CHUNK):
+                chunk = keys[start:start + _BULK_CHUNK]
+                rows = conn.execute(
+                    f"""
+                    SELECT discord_id, guild_id, species FROM (
+                        SELECT discord_id, guild_id, species,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY discord_id, guild_id
+                                   ORDER BY adopted_at DESC
+                               ) AS rn
+                        FROM pets
+                        WHERE (discord_id, guild_id) IN (
+                            VALUES {','.join('(?, ?)' for _ in chunk)}
+                        )
+                          AND died_at IS NOT NULL
+                          AND COALESCE(death_cause, '') NOT IN ('sacrifice', 'eaten')
+                    )
+                    WHERE rn <= ?
+                    ORDER BY discord_id, guild_id, rn
+                    """,
+                    (*[value for key in chunk for value in key], limit),
+                ).fetchall()
+                for row in rows:
+                    result.setdefault(
+                        (row["discord_id"], row["guild_id"]), []
+                    ).append(row["species"])
+        return {key: result.get(key, []) for key in keys}
+
     # --- feeding (no balance change: consumes stocked supplies) ---
 
     def feed_pet(
@@ -1263,30 +1427,44 @@ class PetRepository(BaseRepository):
         gid = self.normalize_guild_id(guild_id)
         with self.connection() as conn:
             cursor = conn.execute(
-                "UPDATE pets SET died_at = ?, death_cause = ?, "
-                "dig_work_units = COALESCE(?, dig_work_units), "
-                "dig_work_at = COALESCE(?, dig_work_at) "
-                "WHERE pet_id = ? AND guild_id = ? AND died_at IS NULL "
-                "AND last_fed_at = ? AND hunger_at_last_fed = ? "
-                "AND (? IS NULL OR dig_work_units = ?) "
-                "AND (? IS NULL OR dig_work_at = ?)",
-                (
-                    died_at,
-                    cause,
-                    new_dig_work_units,
-                    new_dig_work_at,
+                _CLAIM_DEATH_SQL,
+                _claim_death_params(
                     pet_id,
                     gid,
-                    expected_last_fed_at,
-                    expected_hunger,
-                    expected_dig_work_units,
-                    expected_dig_work_units,
-                    expected_dig_work_at,
-                    expected_dig_work_at,
+                    died_at=died_at,
+                    cause=cause,
+                    expected_last_fed_at=expected_last_fed_at,
+                    expected_hunger=expected_hunger,
+                    expected_dig_work_units=expected_dig_work_units,
+                    expected_dig_work_at=expected_dig_work_at,
+                    new_dig_work_units=new_dig_work_units,
+                    new_dig_work_at=new_dig_work_at,
                 ),
             )
             return cursor.rowcount == 1
 
+    def claim_deaths_many(self, claims: list[dict]) -> list[int]:
+        """Bulk claim_death under one transaction; returns pet_ids that lost.
+
+        Each claim carries claim_death's keyword arguments plus ``pet_id``
+        and ``guild_id``. Every row keeps its own anchor guard, so a pet fed
+        after the sweep's snapshot loses exactly as it would alone.
+        """
+        lost: list[int] = []
+        if not claims:
+            return lost
+        with self.atomic_transaction() as conn:
+            for claim in claims:
+                options = dict(claim)
+                pet_id = options.pop("pet_id")
+                gid = self.normalize_guild_id(options.pop("guild_id"))
+                cursor = conn.execute(
+                    _CLAIM_DEATH_SQL, _claim_death_params(pet_id, gid, **options)
+                )
+                if cursor.rowcount != 1:
+                    lost.append(claim["pet_id"])
+        return lost
+
     def revive_with_aegis(
         self,
         pet_id: int,
@@ -1353,16 +1531,71 @@ class PetRepository(BaseRepository):
             ).fetchall()
         return [_row_to_pet(row) for row in rows]
 
-    def find_unannounced_hatches(self, now: int, *, limit: int = 100) -> list[Pet]:
+    def next_sweep_due_at(
+        self,
+        *,
+        decay_per_day: int,
+        decay_pct_by_species: dict[str, int],
+        default_decay_pct: int,
+    ) -> int | None:
+        """Earliest moment the pet sweep has work, or None when it has none.
+
+        Covers pending hatch, death and evolution announcements, evolutions
+        coming due, and each living pet's exact starvation time (per-species
+        decay, the same ceil division as Pet.starvation_time). Work that is
+        already due comes back as a past timestamp.
+        """
+        when = " ".join("WHEN ? THEN ?" for _ in decay_pct_by_species)
+        decay_params = [v for item in decay_pct_by_species.items() for v in item]
+        rate = f"(? * CASE species {when} ELSE ? END)" if when else "(? * ?)"
+        rate_params = [decay_per_day, *decay_params, default_decay_pct]
+        with self.connection() as conn:
+            row = conn.execute(
+                f"""
+                SELECT MIN(due) AS due FROM (
+                    SELECT MIN(hatched_at) AS due FROM pets
+                    WHERE died_at IS NULL AND hatch_announced_at IS NULL
+                    UNION ALL
+                    SELECT MIN(died_at) FROM pets
+                    WHERE died_at IS NOT NULL AND death_announced_at IS NULL
+                    UNION ALL
+                    SELECT MIN(evolution_due_at) FROM pets
+                    WHERE died_at IS NULL AND evolved_at IS NULL
+                      AND evolution_due_at IS NOT NULL
+                    UNION ALL
+                    SELECT MIN(evolved_at) FROM pets
+                    WHERE evolved_at IS NOT NULL AND evolution_announced_at IS NULL
+                    UNION ALL
+                    SELECT MIN(
+                        last_fed_at
+                        + (hunger_at_last_fed * 8640000 + {rate} - 1) / {rate}
+                    ) FROM pets
+                    WHERE died_at IS NULL
+                )
+                """,
+                (*rate_params, *rate_params),
+            ).fetchone()
+        return row["due"] if row is not None and row["due"] is not None else None
+
+    def find_unannounced_hatches(
+        self,
+        now: int,
+        *,
+        limit: int = 100,
+        after: tuple[int, int] | None = None,
+    ) -> list[Pet]:
+        """Oldest unannounced hatches; ``after`` is a (hatched_at, pet_id) keyset."""
         if limit <= 0:
             return []
+        after_at, after_id = after if after is not None else (None, None)
         with self.connection() as conn:
             rows = conn.execute(
                 f"SELECT {_PET_COLUMNS} FROM pets "
                 "WHERE died_at IS NULL AND hatch_announced_at IS NULL "
                 "AND hatched_at <= ? "
+                "AND (? IS NULL OR (hatched_at, pet_id) > (?, ?)) "
                 "ORDER BY hatched_at, pet_id LIMIT ?",
-                (now, limit),
+                (now, after_at, after_at, after_id, limit),
             ).fetchall()
         return [_row_to_pet(row) for row in rows]
 
@@ -1377,15 +1610,20 @@ class PetRepository(BaseRepository):
                 (announced_at, pet_id, gid),
             )
 
-    def get_unannounced_deaths(self, *, limit: int = 100) -> list[Pet]:
+    def get_unannounced_deaths(
+        self, *, limit: int = 100, after: tuple[int, int] | None = None
+    ) -> list[Pet]:
+        """Oldest unannounced deaths; ``after`` is a (died_at, pet_id) keyset."""
         if limit <= 0:
             return []
+        after_at, after_id = after if after is not None else (None, None)
         with self.connection() as conn:
             rows = conn.execute(
                 f"SELECT {_PET_COLUMNS} FROM pets "
                 "WHERE died_at IS NOT NULL AND death_announced_at IS NULL "
+                "AND (? IS NULL OR (died_at, pet_id) > (?, ?)) "
                 "ORDER BY died_at, pet_id LIMIT ?",
-                (limit,),
+                (after_at, after_at, after_id, limit),
             ).fetchall()
         return [_row_to_pet(row) for row in rows]
 
@@ -0,0 +1,200 @@
+"""
+Read-through LRU cache for ``Player`` rows.
+
+``players`` is written by almost every feature (balances alone are updated by
+betting, digging, loans, taxes, mana, predictions...), so invalidation cannot
+rely on each write path remembering to clear an entry. Instead the schema keeps
+a per-player version stamp in ``player_cache_versions``: triggers on
+``players`` bump it on every INSERT, UPDATE and DELETE, including writes made by
+other repositories, raw SQL and maintenance scripts.
+
+A lookup reads the requested stamps through one long-lived probe connection,
+which is far cheaper than opening a repository connection (each new connection
+re-parses the full schema). Entries whose stamp still matches are served from
+memory, and only missing or stale players are loaded. The stamp is read
+*before* the row is loaded, so a write racing the load can only make the entry
+look stale, never make a stale row look current.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from domain.models.player import Player
+
+logger = logging.getLogger("cama_bot.repositories.player_cache")
+
+# Rows that have never been written since the version table was created have
+# no stamp; they all share this implicit version.
+_UNSTAMPED = 0
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is well above this; chunking
+# keeps very large roster lookups from building enormous IN lists.
+_PROBE_CHUNK = 500
+
+
+def clone_player(player: Player | None) -> Player | None:
+    """Copy a cached player so callers can mutate it without touching the cache."""
+    if player is None:
+        return None
+    clone = copy.copy(player)
+    if player.preferred_roles is not None:
+        clone.preferred_roles = list(player.preferred_roles)
+    if player.dota_play_hours is not None:
+        clone.dota_play_hours = list(player.dota_play_hours)
+    return clone
+
+
+class PlayerCache:
+    """Bounded, version-stamped cache of players keyed by ``(guild_id, discord_id)``."""
+
+    def __init__(self, db_path: str, max_entries: int = 2048) -> None:
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, int], tuple[int, Player | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._probe_conn: sqlite3.Connection | None = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        guild_id: int,
+        discord_id: int,
+        loader: Callable[[int, int], Player | None],
+    ) -> Player | None:
+        """Return one player (or ``None``), loading it only if missing or stale."""
+        found = self.get_many(
+            guild_id,
+            [discord_id],
+            lambda gid, ids: {discord_id: loader(discord_id, gid)},
+        )
+        return found.get(discord_id)
+
+    def get_many(
+        self,
+        guild_id: int,
+        discord_ids: Iterable[int],
+        loader: Callable[[int, list[int]], dict[int, Player]],
+    ) -> dict[int, Player | None]:
+        """Return ``{discord_id: player}`` for the requested ids.
+
+        ``loader(guild_id, missing_ids)`` is called once with only the ids that
+        are not cached at their current version. Ids it does not return are
+        cached as absent until their version changes (e.g. on registration).
+        """
+        ids = list(dict.fromkeys(discord_ids))
+        if not self.max_entries:
+            return dict(loader(guild_id, ids))
+        versions = self._read_versions(guild_id, ids)
+        if versions is None:
+            return dict(loader(guild_id, ids))
+
+        result: dict[int, Player | None] = {}
+        missing: list[int] = []
+        with self._lock:
+            for discord_id in ids:
+                key = (guild_id, discord_id)
+                entry = self._entries.get(key)
+                version = versions.get(discord_id, _UNSTAMPED)
+                if entry is not None and entry[0] == version:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    result[discord_id] = clone_player(entry[1])
+                    continue
+                if entry is not None:
+                    self._invalidations += 1
+                self._misses += 1
+                missing.append(discord_id)
+
+        if not missing:
+            return result
+
+        loaded = loader(guild_id, missing)
+        with self._lock:
+            for discord_id in missing:
+                player = loaded.get(discord_id)
+                self._entries[(guild_id, discord_id)] = (
+                    versions.get(discord_id, _UNSTAMPED),
+                    player,
+                )
+                self._entries.move_to_end((guild_id, discord_id))
+                result[discord_id] = clone_player(player)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def invalidate(self, guild_id: int, discord_ids: Iterable[int] | None = None) -> None:
+        """Drop entries eagerly (the version check already catches stale rows)."""
+        with self._lock:
+            if discord_ids is None:
+                keys = [key for key in self._entries if key[0] == guild_id]
+            else:
+                keys = [(guild_id, discord_id) for discord_id in discord_ids]
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        with self._probe_lock:
+            if self._probe_conn is not None:
+                self._probe_conn.close()
+                self._probe_conn = None
+
+    def _read_versions(self, guild_id: int, discord_ids: list[int]) -> dict[int, int] | None:
+        versions: dict[int, int] = {}
+        try:
+            with self._probe_lock:
+                conn = self._probe()
+                for start in range(0, len(discord_ids), _PROBE_CHUNK):
+                    chunk = discord_ids[start : start + _PROBE_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"""
+                        SELECT discord_id, version FROM player_cache_versions
+                        WHERE guild_id = ? AND discord_id IN ({placeholders})
+                        """,
+                        [guild_id, *chunk],
+                    ).fetchall()
+                    versions.update(rows)
+        except sqlite3.Error as exc:
+            # Serve correct data uncached rather than failing the read path.
+            logger.warning("Player cache version probe failed: %s", exc)
+            self.close()
+            return None
+        return versions
+
+    def _probe(self) -> sqlite3.Connection:
+        if self._probe_conn is None:
+            # Autocommit, so each probe reads the latest committed stamps.
+            self._probe_conn = sqlite3.connect(
+                self.db_path,
+                uri=self.db_path.startswith("file:"),
+                check_same_thread=False,
+                timeout=5.0,
+                isolation_level=None,
+            )
+        return self._probe_conn
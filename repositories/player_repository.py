@@ -5,12 +5,15 @@ Repository for player data access.
 import json
 import logging
 import sqlite3
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import lru_cache
 
-from config import NEW_PLAYER_EXCLUSION_BOOST
+from config import NEW_PLAYER_EXCLUSION_BOOST, PLAYER_CACHE_MAX_ENTRIES
 from domain.models.player import Player
 from repositories.base_repository import BaseRepository
 from repositories.interfaces import IPlayerRepository
+from repositories.player_cache import PlayerCache
 from utils.wrapped_enrichment import extract_wrapped_enrichment_facts
 
 logger = logging.getLogger("cama_bot.repositories.player")
@@ -136,6 +139,92 @@ def _refresh_wrapped_enrichment_facts(
         )
 
 
+# Role and play-hour lists repeat across a guild (a few dozen distinct role
+# sets), so decoded values are memoized by their JSON text. Callers always get
+# a fresh list: the cached one never escapes.
+_decode_json_text = lru_cache(maxsize=1024)(json.loads)
+
+
+def _json_list(raw: str | None) -> list | None:
+    if not raw:
+        return None
+    value = _decode_json_text(raw)
+    return list(value) if isinstance(value, list) else value
+
+
+@lru_cache(maxsize=64)
+def _player_row_reader(columns: tuple[str, ...]) -> Callable[[sqlite3.Row], Player]:
+    """Build a row -> Player converter for one result-column layout.
+
+    ``sqlite3.Row`` resolves names with a case-insensitive scan of every
+    column, which dominated loading a whole guild. Queries produce a handful
+    of layouts, so positions are resolved once per layout and rows are read
+    by index. Columns added by later migrations may be absent from older
+    schemas and fall back to the model defaults.
+    """
+    at = {name: position for position, name in enumerate(columns)}
+    name_at = at["discord_username"]
+    mmr_at = at["current_mmr"]
+    initial_mmr_at = at["initial_mmr"]
+    wins_at = at["wins"]
+    losses_at = at["losses"]
+    roles_at = at["preferred_roles"]
+    main_role_at = at["main_role"]
+    glicko_rating_at = at["glicko_rating"]
+    glicko_rd_at = at["glicko_rd"]
+    glicko_volatility_at = at["glicko_volatility"]
+    discord_id_at = at["discord_id"]
+    balance_at = at["jopacoin_balance"]
+    os_mu_at = at.get("os_mu")
+    os_sigma_at = at.get("os_sigma")
+    guild_id_at = at.get("guild_id")
+    steam_id_at = at.get("steam_id")
+    win_streak_at = at.get("personal_best_win_streak")
+    bets_placed_at = at.get("total_bets_placed")
+    leverage_at = at.get("first_leverage_used")
+    solo_grinder_at = at.get("is_solo_grinder")
+    solo_checked_at = at.get("solo_grinder_checked_at")
+    preferred_region_at = at.get("preferred_region")
+    inferred_region_at = at.get("inferred_region")
+    timezone_at = at.get("timezone")
+    play_hours_at = at.get("dota_play_hours")
+
+    def read(row) -> Player:
+        mmr = row[mmr_at]
+        initial_mmr = row[initial_mmr_at]
+        return Player(
+            name=row[name_at],
+            mmr=int(mmr) if mmr else None,
+            initial_mmr=int(initial_mmr) if initial_mmr else None,
+            wins=row[wins_at],
+            losses=row[losses_at],
+            preferred_roles=_json_list(row[roles_at]),
+            main_role=row[main_role_at],
+            glicko_rating=row[glicko_rating_at],
+            glicko_rd=row[glicko_rd_at],
+            glicko_volatility=row[glicko_volatility_at],
+            os_mu=row[os_mu_at] if os_mu_at is not None else None,
+            os_sigma=row[os_sigma_at] if os_sigma_at is not None else None,
+            discord_id=row[discord_id_at],
+            guild_id=row[guild_id_at] if guild_id_at is not None else None,
+            jopacoin_balance=row[balance_at] or 0,
+            steam_id=row[steam_id_at] if steam_id_at is not None else None,
+            personal_best_win_streak=(row[win_streak_at] or 0) if win_streak_at is not None else 0,
+            total_bets_placed=(row[bets_placed_at] or 0) if bets_placed_at is not None else 0,
+            first_leverage_used=bool(row[leverage_at]) if leverage_at is not None else False,
+            is_solo_grinder=bool(row[solo_grinder_at]) if solo_grinder_at is not None else False,
+            solo_grinder_checked_at=row[solo_checked_at] if solo_checked_at is not None else None,
+            preferred_region=(
+                row[preferred_region_at] if preferred_region_at is not None else None
+            ),
+            inferred_region=row[inferred_region_at] if inferred_region_at is not None else None,
+            timezone=row[timezone_at] if timezone_at is not None else None,
+            dota_play_hours=_json_list(row[play_hours_at]) if play_hours_at is not None else None,
+        )
+
+    return read
+
+
 class PlayerRepository(BaseRepository, IPlayerRepository):
     """
     Handles all player-related database operations.
@@ -147,6 +236,10 @@ class PlayerRepository(BaseRepository, IPlayerRepository):
     - Exclusion count tracking
     """
 
+    def __init__(self, db_path: str, *, cache_max_entries: int = PLAYER_CACHE_MAX_ENTRIES):
+        super().__init__(db_path)
+        self._player_cache = PlayerCache(db_path, max_entries=cache_max_entries)
+
     def add(
         self,
         discord_id: int,
@@ -275,10 +368,15 @@ class PlayerRepository(BaseRepository, IPlayerRepository):
         """
         Get player by Discord ID and Guild ID.
 
+        Served from the player cache while the row's version stamp is unchanged.
+
         Returns:
             Player object or None if not found
         """
         guild_id = self.normalize_guild_id(guild_id)
+        return self._player_cache.get(guild_id, discord_id, self._load_by_id)
+
+    def _load_by_id(self, discord_id: int, guild_id: int) -> Player | None:
         with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -296,41 +394,50 @@ class PlayerRepository(BaseRepository, IPlayerRepository):
         """
         Get multiple players by Discord IDs within a guild.
 
+        Only players missing from the cache (or changed since cached) are read
+        from the database.
+
         IMPORTANT: Returns players in the SAME ORDER as the input discord_ids.
         """
         if not discord_ids:
             return []
 
         guild_id = self.normalize_guild_id(guild_id)
+        found = self._player_cache.get_many(guild_id, discord_ids, self._load_by_ids)
 
+        # Return in same order as input
+        players = []
+        for discord_id in discord_ids:
+            player = found.get(discord_id)
+            if player is None:
+                logger.warning(f"Player not found: discord_id={discord_id}")
+                continue
+            players.append(player)
+        return players
+
+    def _load_by_ids(self, guild_id: int, discord_ids: list[int]) -> dict[int, Player]:
         with self.connection() as conn:
             cursor = conn.cursor()
 
             placeholders = ",".join("?" * len(discord_ids))
             cursor.execute(
                 f"SELECT * FROM players WHERE discord_id IN ({placeholders}) AND guild_id = ?",
-                discord_ids + [guild_id],
+                list(discord_ids) + [guild_id],
             )
             rows = cursor.fetchall()
 
-            # Create mapping for order preservation
-            id_to_row = {}
+            id_to_player = {}
             for row in rows:
                 discord_id = row["discord_id"]
-                if discord_id in id_to_row:
+                if discord_id in id_to_player:
                     logger.warning(f"Duplicate player entry: discord_id={discord_id}")
                     continue
-                id_to_row[discord_id] = row
+                id_to_player[discord_id] = self._row_to_player(row)
+            return id_to_player
 
-            # Return in same order as input
-            players = []
-            for discord_id in discord_ids:
-                if discord_id not in id_to_row:
-                    logger.warning(f"Player not found: discord_id={discord_id}")
-                    continue
-                players.append(self._row_to_player(id_to_row[discord_id]))
-
-            return players
+    def get_cache_stats(self) -> dict[str, int]:
+        """Hit/miss/invalidation counters for the player cache."""
+        return self._player_cache.stats()
 
     def get_reminder_timestamps_bulk(
         self,
@@ -1253,55 +1360,30 @@ class PlayerRepository(BaseRepository, IPlayerRepository):
             return
         with self.connection() as conn:
             cursor = conn.cursor()
-            has_context = any(
-                value is not None
-                for value in (
-                    source,
-                    actor_id,
-                    related_type,
-                    related_id,
-                    reason,
-                    metadata,
-                )
+            self._apply_balance_deltas(
+                cursor,
+                guild_id,
+                deltas_by_discord_id,
+                source=source or "balance_update",
+                actor_id=actor_id,
+                related_type=related_type,
+                related_id=related_id,
+                reason=reason,
+                metadata=metadata,
             )
-            if has_context:
-                self._set_economy_ledger_context(
-                    cursor,
-                    source=source,
-                    actor_id=actor_id,
-                    related_type=related_type,
-                    related_id=related_id,
-                    reason=reason,
-                    metadata=metadata,
-                )
-            try:
-                cursor.executemany(
-                    """
+            # Track lowest balance for players who had negative deltas
+            negative_ids = [did for did, delta in deltas_by_discord_id.items() if delta < 0]
+            if negative_ids:
+                placeholders = ",".join("?" * len(negative_ids))
+                cursor.execute(
+                    f"""
                     UPDATE players
-                    SET jopacoin_balance = COALESCE(jopacoin_balance, 0) + ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE discord_id = ? AND guild_id = ?
+                    SET lowest_balance_ever = jopacoin_balance
+                    WHERE discord_id IN ({placeholders}) AND guild_id = ?
+                    AND (lowest_balance_ever IS NULL OR jopacoin_balance < lowest_balance_ever)
                     """,
-                    [
-                        (delta, discord_id, guild_id)
-                        for discord_id, delta in deltas_by_discord_id.items()
-                    ],
+                    negative_ids + [guild_id],
                 )
-                # Track lowest balance for players who had negative deltas
-                negative_ids = [did for did, delta in deltas_by_discord_id.items() if delta < 0]
-                if negative_ids:
-                    placeholders = ",".join("?" * len(negative_ids))
-                    cursor.execute(
-                        f"""
-                        UPDATE players
-                        SET lowest_balance_ever = jopacoin_balance
-                        WHERE discord_id IN ({placeholders}) AND guild_id = ?
-                        AND (lowest_balance_ever IS NULL OR jopacoin_balance < lowest_balance_ever)
-                        """,
-                        negative_ids + [guild_id],
-                    )
-            finally:
-                if has_context:
-                    self._clear_economy_ledger_context(cursor)
 
     def add_balance_batch(
         self,
@@ -4613,71 +4695,7 @@ class PlayerRepository(BaseRepository, IPlayerRepository):
 
     def _row_to_player(self, row) -> Player:
         """Convert database row to Player object."""
-        preferred_roles = json.loads(row["preferred_roles"]) if row["preferred_roles"] else None
-
-        # Handle os_mu and os_sigma which may not exist in older schemas
-        keys = row.keys()
-        os_mu = row["os_mu"] if "os_mu" in keys else None
-        os_sigma = row["os_sigma"] if "os_sigma" in keys else None
-        steam_id = row["steam_id"] if "steam_id" in keys else None
-        guild_id = row["guild_id"] if "guild_id" in keys else None
-
-        # Easter egg tracking fields (may not exist in older schemas)
-        personal_best_win_streak = (
-            row["personal_best_win_streak"] if "personal_best_win_streak" in keys else 0
-        )
-        total_bets_placed = row["total_bets_placed"] if "total_bets_placed" in keys else 0
-        first_leverage_used = (
-            bool(row["first_leverage_used"]) if "first_leverage_used" in keys else False
-        )
-
-        # Solo grinder detection fields (may not exist in older schemas)
-        is_solo_grinder = bool(row["is_solo_grinder"]) if "is_solo_grinder" in keys else False
-        solo_grinder_checked_at = (
-            row["solo_grinder_checked_at"] if "solo_grinder_checked_at" in keys else None
-        )
-
-        # Server-region preference fields (may not exist in older schemas)
-        preferred_region = row["preferred_region"] if "preferred_region" in keys else None
-        inferred_region = row["inferred_region"] if "inferred_region" in keys else None
-
-        # General timezone preference (may not exist in older schemas)
-        timezone = row["timezone"] if "timezone" in keys else None
-
-        # Informational preferred play hours (may not exist in older schemas)
-        dota_play_hours = (
-            json.loads(row["dota_play_hours"])
-            if "dota_play_hours" in keys and row["dota_play_hours"]
-            else None
-        )
-
-        return Player(
-            name=row["discord_username"],
-            mmr=int(row["current_mmr"]) if row["current_mmr"] else None,
-            initial_mmr=int(row["initial_mmr"]) if row["initial_mmr"] else None,
-            wins=row["wins"],
-            losses=row["losses"],
-            preferred_roles=preferred_roles,
-            main_role=row["main_role"],
-            glicko_rating=row["glicko_rating"],
-            glicko_rd=row["glicko_rd"],
-            glicko_volatility=row["glicko_volatility"],
-            os_mu=os_mu,
-            os_sigma=os_sigma,
-            discord_id=row["discord_id"],
-            guild_id=guild_id,
-            jopacoin_balance=row["jopacoin_balance"] if row["jopacoin_balance"] else 0,
-            steam_id=steam_id,
-            personal_best_win_streak=personal_best_win_streak or 0,
-            total_bets_placed=total_bets_placed or 0,
-            first_leverage_used=first_leverage_used,
-            is_solo_grinder=is_solo_grinder,
-            solo_grinder_checked_at=solo_grinder_checked_at,
-            preferred_region=preferred_region,
-            inferred_region=inferred_region,
-            timezone=timezone,
-            dota_play_hours=dota_play_hours,
-        )
+        return _player_row_reader(tuple(row.keys()))(row)
 
     # --- Trivia cooldown ---
 
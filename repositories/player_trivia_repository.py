@@ -4,17 +4,39 @@ from __future__ import annotations
 
 import json
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from repositories.base_repository import BaseRepository
 
+# Append-only snapshot datasets and the monotonically increasing row key each
+# can be tailed by. New rows always carry a larger key, so a cached snapshot
+# can be extended with just the rows past its watermark.
+SNAPSHOT_TAIL_KEYS: Mapping[str, str] = MappingProxyType(
+    {
+        "participants": "match_id",
+        "ratings": "id",
+        "bets": "match_id",
+        "wheel_spins": "spin_id",
+        "double_spins": "spin_id",
+        "tips": "id",
+        "dig_actions": "id",
+    }
+)
+
 
 class PlayerTriviaRepository(BaseRepository):
     """Store immutable trivia rounds and expose a safe guild data snapshot."""
 
     _FINISH_STATUSES = frozenset({"completed", "timed_out", "error"})
 
-    def load_snapshot(self, guild_id: int | None) -> dict[str, list[dict]]:
+    def load_snapshot(
+        self,
+        guild_id: int | None,
+        *,
+        since: Mapping[str, int] | None = None,
+    ) -> dict[str, list[dict]]:
         """Load deterministic, guild-scoped rows used to generate trivia.
 
         The snapshot deliberately omits private/free-text fields such as match
@@ -23,6 +45,10 @@ class PlayerTriviaRepository(BaseRepository):
         market without exposing creator IDs. Filtering to current Discord guild
         members is a service-layer concern because repositories do not have
         Discord state.
+
+        ``since`` maps datasets in SNAPSHOT_TAIL_KEYS to the highest key the
+        caller already holds; those datasets return only newer rows. Every
+        other dataset is loaded in full.
         """
         guild_id = self.normalize_guild_id(guild_id)
 
@@ -101,6 +127,7 @@ class PlayerTriviaRepository(BaseRepository):
                   ON m.match_id = mp.match_id
                  AND m.guild_id = mp.guild_id
                 WHERE mp.guild_id = ?
+                  AND (? IS NULL OR mp.match_id > ?)
                 ORDER BY m.match_date ASC, mp.match_id ASC, mp.discord_id ASC
                 """,
             ),
@@ -136,6 +163,7 @@ class PlayerTriviaRepository(BaseRepository):
                   ON m.match_id = rh.match_id
                  AND m.guild_id = rh.guild_id
                 WHERE rh.guild_id = ?
+                  AND (? IS NULL OR rh.id > ?)
                 ORDER BY m.match_date ASC, rh.match_id ASC, rh.id ASC
                 """,
             ),
@@ -187,6 +215,7 @@ class PlayerTriviaRepository(BaseRepository):
                     outcome_metadata
                 FROM wheel_spins
                 WHERE guild_id = ?
+                  AND (? IS NULL OR spin_id > ?)
                 ORDER BY spin_time ASC, spin_id ASC
                 """,
             ),
@@ -204,6 +233,7 @@ class PlayerTriviaRepository(BaseRepository):
                     spin_time
                 FROM double_or_nothing_spins
                 WHERE guild_id = ?
+                  AND (? IS NULL OR spin_id > ?)
                 ORDER BY spin_time ASC, spin_id ASC
                 """,
             ),
@@ -220,6 +250,7 @@ class PlayerTriviaRepository(BaseRepository):
                     timestamp
                 FROM tip_transactions
                 WHERE guild_id = ?
+                  AND (? IS NULL OR id > ?)
                 ORDER BY timestamp ASC, id ASC
                 """,
             ),
@@ -254,6 +285,7 @@ class PlayerTriviaRepository(BaseRepository):
                  AND bst.discord_id = b.discord_id
                 WHERE b.guild_id = ?
                   AND m.winning_team IN (1, 2)
+                  AND (? IS NULL OR m.match_id > ?)
                 ORDER BY b.bet_time ASC, b.bet_id ASC
                 """,
             ),
@@ -377,6 +409,7 @@ class PlayerTriviaRepository(BaseRepository):
                     created_at
                 FROM dig_actions
                 WHERE guild_id = ?
+                  AND (? IS NULL OR id > ?)
                 ORDER BY created_at ASC, id ASC
                 """,
             ),
@@ -499,7 +532,11 @@ class PlayerTriviaRepository(BaseRepository):
             conn.execute("BEGIN")
             cursor = conn.cursor()
             for name, query in queries:
-                cursor.execute(query, (guild_id,))
+                if name in SNAPSHOT_TAIL_KEYS:
+                    watermark = (since or {}).get(name)
+                    cursor.execute(query, (guild_id, watermark, watermark))
+                else:
+                    cursor.execute(query, (guild_id,))
                 snapshot[name] = [dict(row) for row in cursor.fetchall()]
         return snapshot
 
@@ -0,0 +1,252 @@
+"""
+In-memory order books for the prediction market.
+
+Quotes and trades used to re-read and re-sort a market's whole
+``prediction_levels`` ladder on every call. ``OrderBookStore`` keeps one
+``OrderBook`` per market instead: each side is a price-indexed ladder whose
+sorted price list gives the best level by bisection, and a sweep only touches
+the levels it fills.
+
+SQLite stays the durable record. Trades persist their level changes in the
+same transaction as the balance and position writes, and any book is rebuilt
+from SQLite the first time it is needed (e.g. after a restart). Triggers bump
+``prediction_book_versions`` whenever a market's levels change, no matter
+which path wrote them (LP refresh, resolution, rollback, raw SQL). A book is
+only used while its stamp matches; otherwise it is reloaded. The market status
+is read together with the stamp, so it is never served from memory.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger("cama_bot.repositories.prediction_order_book")
+
+# Markets whose book has never been stamped share this implicit version.
+_UNSTAMPED = 0
+
+# (level_id, price, take) — one planned or applied fill against a level.
+Fill = tuple[int, int, int]
+
+
+class PriceLadder:
+    """One side of a book: resting levels indexed by price, best price first."""
+
+    __slots__ = ("_depth", "_descending", "_levels", "_prices")
+
+    def __init__(self, descending: bool) -> None:
+        self._descending = descending
+        self._prices: list[int] = []
+        # price -> [[level_id, remaining_size], ...] in posting (level_id) order.
+        self._levels: dict[int, list[list[int]]] = {}
+        self._depth: list[tuple[int, int]] | None = None
+
+    def add(self, level_id: int, price: int, size: int) -> None:
+        if size <= 0:
+            return
+        levels = self._levels.get(price)
+        if levels is None:
+            bisect.insort(self._prices, price)
+            levels = self._levels[price] = []
+        levels.append([level_id, size])
+        self._depth = None
+
+    def best(self) -> int | None:
+        if not self._prices:
+            return None
+        return self._prices[-1] if self._descending else self._prices[0]
+
+    def plan(self, contracts: int) -> tuple[list[Fill], int]:
+        """Walk levels best-first; return the fills and the contracts left unfilled."""
+        remaining = contracts
+        fills: list[Fill] = []
+        prices = reversed(self._prices) if self._descending else iter(self._prices)
+        for price in prices:
+            for level_id, size in self._levels[price]:
+                if remaining <= 0:
+                    return fills, 0
+                take = min(remaining, size)
+                fills.append((level_id, price, take))
+                remaining -= take
+            if remaining <= 0:
+                break
+        return fills, remaining
+
+    def apply(self, fills: list[Fill]) -> list[int]:
+        """Consume planned fills; return the level_ids that are now empty."""
+        exhausted: list[int] = []
+        for level_id, price, take in fills:
+            levels = self._levels.get(price)
+            if not levels:
+                continue
+            for index, level in enumerate(levels):
+                if level[0] != level_id:
+                    continue
+                level[1] -= take
+                if level[1] <= 0:
+                    exhausted.append(level_id)
+                    del levels[index]
+                break
+            if not levels:
+                del self._levels[price]
+                del self._prices[bisect.bisect_left(self._prices, price)]
+        self._depth = None
+        return exhausted
+
+    def depth(self) -> list[tuple[int, int]]:
+        """Resting ``(price, size)`` levels, best price first."""
+        if self._depth is None:
+            prices = reversed(self._prices) if self._descending else self._prices
+            self._depth = [
+                (price, size) for price in prices for _, size in self._levels[price]
+            ]
+        return list(self._depth)
+
+
+class OrderBook:
+    """Both ladders of one market, plus the status read alongside its stamp."""
+
+    __slots__ = ("asks", "bids", "prediction_id", "status", "version")
+
+    def __init__(self, prediction_id: int, version: int, status: str | None) -> None:
+        self.prediction_id = prediction_id
+        self.version = version
+        self.status = status
+        self.asks = PriceLadder(descending=False)
+        self.bids = PriceLadder(descending=True)
+
+    def ladder(self, book_side: str) -> PriceLadder:
+        return self.asks if book_side == "yes_ask" else self.bids
+
+
+class OrderBookStore:
+    """Version-checked cache of ``OrderBook`` objects keyed by prediction_id."""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._books: dict[int, OrderBook] = {}
+        self.lock = threading.RLock()
+        self._probe_lock = threading.Lock()
+        self._probe_conn: sqlite3.Connection | None = None
+        self._hits = 0
+        self._misses = 0
+
+    def book(self, cursor, prediction_id: int) -> OrderBook:
+        """Return the current book as seen by ``cursor``'s transaction.
+
+        Callers must hold ``lock`` while they read or mutate the returned book.
+        """
+        status, version = self._read_stamp(cursor, prediction_id)
+        with self.lock:
+            book = self._books.get(prediction_id)
+            if book is not None and book.version == version:
+                self._hits += 1
+            else:
+                book = self._load(cursor, prediction_id, version)
+                if status is not None:
+                    self._books[prediction_id] = book
+            book.status = status
+            return book
+
+    def quote_book(self, prediction_id: int) -> OrderBook | None:
+        """Book for read-only quoting, validated on the long-lived probe connection.
+
+        Returns ``None`` when the probe fails so callers can fall back to a
+        normal repository connection.
+        """
+        try:
+            with self.lock, self._probe_lock:
+                return self.book(self._probe().cursor(), prediction_id)
+        except sqlite3.Error as exc:
+            logger.warning("Order book probe failed: %s", exc)
+            self.close()
+            return None
+
+    def commit_fills(
+        self, book: OrderBook, book_side: str, fills: list[Fill], version: int
+    ) -> None:
+        """Apply fills that were just committed, stamping the book with ``version``.
+
+        If another trade has replaced or advanced the book in the meantime it
+        is left alone; the next read notices the stamp mismatch and reloads.
+        """
+        with self.lock:
+            if self._books.get(book.prediction_id) is not book:
+                return
+            book.ladder(book_side).apply(fills)
+            book.version = version
+
+    def discard(self, prediction_id: int) -> None:
+        with self.lock:
+            self._books.pop(prediction_id, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._books.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {"entries": len(self._books), "hits": self._hits, "misses": self._misses}
+
+    def close(self) -> None:
+        with self._probe_lock:
+            if self._probe_conn is not None:
+                self._probe_conn.close()
+                self._probe_conn = None
+
+    @staticmethod
+    def read_version(cursor, prediction_id: int) -> int:
+        cursor.execute(
+            "SELECT version FROM prediction_book_versions WHERE prediction_id = ?",
+            (prediction_id,),
+        )
+        row = cursor.fetchone()
+        return int(row[0]) if row else _UNSTAMPED
+
+    @staticmethod
+    def _read_stamp(cursor, prediction_id: int) -> tuple[str | None, int]:
+        cursor.execute(
+            """
+            SELECT p.status, v.version
+            FROM predictions p
+            LEFT JOIN prediction_book_versions v ON v.prediction_id = p.prediction_id
+            WHERE p.prediction_id = ?
+            """,
+            (prediction_id,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None, _UNSTAMPED
+        return row[0], _UNSTAMPED if row[1] is None else int(row[1])
+
+    def _load(self, cursor, prediction_id: int, version: int) -> OrderBook:
+        self._misses += 1
+        book = OrderBook(prediction_id, version, None)
+        cursor.execute(
+            """
+            SELECT side, price, remaining_size, level_id
+            FROM prediction_levels
+            WHERE prediction_id = ? AND remaining_size > 0
+            ORDER BY level_id
+            """,
+            (prediction_id,),
+        )
+        for side, price, size, level_id in cursor.fetchall():
+            if side in ("yes_ask", "yes_bid"):
+                book.ladder(side).add(int(level_id), int(price), int(size))
+        return book
+
+    def _probe(self) -> sqlite3.Connection:
+        if self._probe_conn is None:
+            # Autocommit, so each probe sees the latest committed book.
+            self._probe_conn = sqlite3.connect(
+                self.db_path,
+                uri=self.db_path.startswith("file:"),
+                check_same_thread=False,
+                timeout=5.0,
+                isolation_level=None,
+            )
+        return self._probe_conn
@@ -10,6 +10,7 @@ import time
 
 from repositories.base_repository import BaseRepository, safe_json_loads
 from repositories.interfaces import IPredictionRepository
+from repositories.prediction_order_book import OrderBookStore, PriceLadder
 
 
 def _quote_total(raw_jopa_x10: int, kind: str) -> int:
@@ -38,6 +39,14 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
     VALID_POSITIONS = {"yes", "no"}
     VALID_STATUSES = {"open", "locked", "resolved", "cancelled"}
 
+    def __init__(self, db_path: str):
+        super().__init__(db_path)
+        self._order_books = OrderBookStore(db_path)
+
+    def get_order_book_stats(self) -> dict[str, int]:
+        """Hit/miss counters for the in-memory order books."""
+        return self._order_books.stats()
+
     def create_prediction(
         self,
         guild_id: int,
@@ -201,24 +210,14 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
             )
 
     @staticmethod
-    def _buy_book_order(side: str) -> tuple[str, str]:
-        if side == "yes":
-            return "yes_ask", "price ASC"
-        return "yes_bid", "price DESC"
+    def _buy_book_side(side: str) -> str:
+        return "yes_ask" if side == "yes" else "yes_bid"
 
     @staticmethod
     def _plan_buy_fills(
-        levels: list[dict], side: str, contracts: int
+        ladder: PriceLadder, side: str, contracts: int
     ) -> tuple[list[tuple[int, int, int]], int, int]:
-        remaining = contracts
-        fills: list[tuple[int, int, int]] = []
-        for level in levels:
-            if remaining <= 0:
-                break
-            take = min(remaining, int(level["remaining_size"]))
-            fills.append((int(level["level_id"]), int(level["price"]), take))
-            remaining -= take
-
+        fills, remaining = ladder.plan(contracts)
         if remaining > 0:
             available = contracts - remaining
             raise ValueError(
@@ -237,28 +236,18 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
     ) -> dict:
         """Quote a buy against the live ladder without mutating it."""
         self._validate_buy_request(side, contracts)
-        book_side, order_clause = self._buy_book_order(side)
-        with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT status FROM predictions WHERE prediction_id = ?",
-                (prediction_id,),
-            )
-            pred = cursor.fetchone()
-            if not pred:
+        with self._order_books.lock:
+            book = self._order_books.quote_book(prediction_id)
+            if book is None:
+                with self.connection() as conn:
+                    book = self._order_books.book(conn.cursor(), prediction_id)
+            if book.status is None:
                 raise ValueError("Prediction not found.")
-            if pred["status"] != "open":
+            if book.status != "open":
                 raise ValueError("Market is not open for trading.")
-            cursor.execute(
-                f"""
-                SELECT level_id, price, remaining_size FROM prediction_levels
-                WHERE prediction_id = ? AND side = ? AND remaining_size > 0
-                ORDER BY {order_clause}
-                """,
-                (prediction_id, book_side),
+            fills, _, total_cost = self._plan_buy_fills(
+                book.ladder(self._buy_book_side(side)), side, contracts
             )
-            levels = [dict(row) for row in cursor.fetchall()]
-            fills, _, total_cost = self._plan_buy_fills(levels, side, contracts)
             return {
                 "contracts": contracts,
                 "total_cost": total_cost,
@@ -367,27 +356,13 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
             row = cursor.fetchone()
             current_price = row["current_price"] if row else None
 
-            cursor.execute(
-                """
-                SELECT side, price, remaining_size FROM prediction_levels
-                WHERE prediction_id = ? AND remaining_size > 0
-                """,
-                (prediction_id,),
-            )
-            asks: list[tuple[int, int]] = []
-            bids: list[tuple[int, int]] = []
-            for r in cursor.fetchall():
-                if r["side"] == "yes_ask":
-                    asks.append((int(r["price"]), int(r["remaining_size"])))
-                elif r["side"] == "yes_bid":
-                    bids.append((int(r["price"]), int(r["remaining_size"])))
-            asks.sort(key=lambda x: x[0])           # ascending price
-            bids.sort(key=lambda x: x[0], reverse=True)  # descending price
-            return {
-                "current_price": current_price,
-                "yes_asks": asks,
-                "yes_bids": bids,
-            }
+            with self._order_books.lock:
+                book = self._order_books.book(cursor, prediction_id)
+                return {
+                    "current_price": current_price,
+                    "yes_asks": book.asks.depth(),
+                    "yes_bids": book.bids.depth(),
+                }
 
     def get_market_snapshot(
         self,
@@ -411,24 +386,10 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
                 return None
             prediction = dict(prediction_row)
 
-            cursor.execute(
-                """
-                SELECT side, price, remaining_size
-                FROM prediction_levels
-                WHERE prediction_id = ? AND remaining_size > 0
-                """,
-                (prediction_id,),
-            )
-            asks: list[tuple[int, int]] = []
-            bids: list[tuple[int, int]] = []
-            for row in cursor.fetchall():
-                level = (int(row["price"]), int(row["remaining_size"]))
-                if row["side"] == "yes_ask":
-                    asks.append(level)
-                elif row["side"] == "yes_bid":
-                    bids.append(level)
-            asks.sort(key=lambda level: level[0])
-            bids.sort(key=lambda level: level[0], reverse=True)
+            with self._order_books.lock:
+                book = self._order_books.book(cursor, prediction_id)
+                asks = book.asks.depth()
+                bids = book.bids.depth()
 
             cursor.execute(
                 """
@@ -487,7 +448,7 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
         self._validate_buy_request(side, contracts)
 
         now = int(time.time())
-        book_side, order_clause = self._buy_book_order(side)
+        book_side = self._buy_book_side(side)
 
         with self.atomic_transaction() as conn:
             cursor = conn.cursor()
@@ -503,19 +464,13 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
                 raise ValueError("Market is not open for trading.")
             guild_id = pred["guild_id"]
 
-            cursor.execute(
-                f"""
-                SELECT level_id, price, remaining_size FROM prediction_levels
-                WHERE prediction_id = ? AND side = ? AND remaining_size > 0
-                ORDER BY {order_clause}
-                """,
-                (prediction_id, book_side),
-            )
-            levels = [dict(r) for r in cursor.fetchall()]
-
-            fills, weighted_pct, total_cost = self._plan_buy_fills(
-                levels, side, contracts
-            )
+            # The write lock is held, so no other trade can move the book
+            # between planning here and applying the fills after commit.
+            with self._order_books.lock:
+                book = self._order_books.book(cursor, prediction_id)
+                fills, weighted_pct, total_cost = self._plan_buy_fills(
+                    book.ladder(book_side), side, contracts
+                )
 
             cursor.execute(
                 """
@@ -562,15 +517,7 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
             finally:
                 self._clear_economy_ledger_context(cursor)
 
-            for level_id, _, take in fills:
-                cursor.execute(
-                    "UPDATE prediction_levels SET remaining_size = remaining_size - ? WHERE level_id = ?",
-                    (take, level_id),
-                )
-            cursor.execute(
-                "DELETE FROM prediction_levels WHERE prediction_id = ? AND remaining_size <= 0",
-                (prediction_id,),
-            )
+            self._persist_fills(cursor, fills)
 
             yes_c, yes_t, no_c, no_t = self._read_position(cursor, prediction_id, discord_id)
             if side == "yes":
@@ -612,19 +559,22 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
                 (total_cost, prediction_id),
             )
 
-            return {
-                "guild_id": int(guild_id),
-                "trade_id": trade_id,
-                "trade_time": now,
-                "side": side,
-                "contracts": contracts,
-                "total_cost": total_cost,
-                "vwap_x100": vwap_x100,
-                "fills": [(price, take) for _, price, take in fills],
-                "new_balance": balance - total_cost,
-                "yes_contracts": yes_c,
-                "no_contracts": no_c,
-            }
+            book_version = OrderBookStore.read_version(cursor, prediction_id)
+
+        self._order_books.commit_fills(book, book_side, fills, book_version)
+        return {
+            "guild_id": int(guild_id),
+            "trade_id": trade_id,
+            "trade_time": now,
+            "side": side,
+            "contracts": contracts,
+            "total_cost": total_cost,
+            "vwap_x100": vwap_x100,
+            "fills": [(price, take) for _, price, take in fills],
+            "new_balance": balance - total_cost,
+            "yes_contracts": yes_c,
+            "no_contracts": no_c,
+        }
 
     def sell_contracts_atomic(
         self, prediction_id: int, discord_id: int, side: str, contracts: int
@@ -643,12 +593,7 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
         now = int(time.time())
         # SELL YES consumes yes_bids (highest first; best price for seller).
         # SELL NO  consumes yes_asks (lowest first => highest NO bid).
-        if side == "yes":
-            book_side = "yes_bid"
-            order_clause = "price DESC"
-        else:
-            book_side = "yes_ask"
-            order_clause = "price ASC"
+        book_side = "yes_bid" if side == "yes" else "yes_ask"
 
         with self.atomic_transaction() as conn:
             cursor = conn.cursor()
@@ -680,24 +625,9 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
                 old_qty = no_c
                 old_basis = no_t
 
-            cursor.execute(
-                f"""
-                SELECT level_id, price, remaining_size FROM prediction_levels
-                WHERE prediction_id = ? AND side = ? AND remaining_size > 0
-                ORDER BY {order_clause}
-                """,
-                (prediction_id, book_side),
-            )
-            levels = [dict(r) for r in cursor.fetchall()]
-
-            remaining = contracts
-            fills: list[tuple[int, int, int]] = []
-            for level in levels:
-                if remaining <= 0:
-                    break
-                take = min(remaining, int(level["remaining_size"]))
-                fills.append((int(level["level_id"]), int(level["price"]), take))
-                remaining -= take
+            with self._order_books.lock:
+                book = self._order_books.book(cursor, prediction_id)
+                fills, remaining = book.ladder(book_side).plan(contracts)
 
             if remaining > 0:
                 available = contracts - remaining
@@ -739,15 +669,7 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
             finally:
                 self._clear_economy_ledger_context(cursor)
 
-            for level_id, _, take in fills:
-                cursor.execute(
-                    "UPDATE prediction_levels SET remaining_size = remaining_size - ? WHERE level_id = ?",
-                    (take, level_id),
-                )
-            cursor.execute(
-                "DELETE FROM prediction_levels WHERE prediction_id = ? AND remaining_size <= 0",
-                (prediction_id,),
-            )
+            self._persist_fills(cursor, fills)
 
             # Reduce cost basis proportionally; integer floor.
             basis_reduction = (old_basis * contracts) // old_qty if old_qty > 0 else 0
@@ -795,20 +717,35 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
                 (discord_id, guild_id),
             )
             new_balance = int(cursor.fetchone()["balance"])
+            book_version = OrderBookStore.read_version(cursor, prediction_id)
 
-            return {
-                "guild_id": int(guild_id),
-                "trade_id": trade_id,
-                "trade_time": now,
-                "side": side,
-                "contracts": contracts,
-                "total_proceeds": total_proceeds,
-                "vwap_x100": vwap_x100,
-                "fills": [(price, take) for _, price, take in fills],
-                "new_balance": new_balance,
-                "yes_contracts": yes_c,
-                "no_contracts": no_c,
-            }
+        self._order_books.commit_fills(book, book_side, fills, book_version)
+        return {
+            "guild_id": int(guild_id),
+            "trade_id": trade_id,
+            "trade_time": now,
+            "side": side,
+            "contracts": contracts,
+            "total_proceeds": total_proceeds,
+            "vwap_x100": vwap_x100,
+            "fills": [(price, take) for _, price, take in fills],
+            "new_balance": new_balance,
+            "yes_contracts": yes_c,
+            "no_contracts": no_c,
+        }
+
+    @staticmethod
+    def _persist_fills(cursor, fills: list[tuple[int, int, int]]) -> None:
+        """Write planned fills to their level rows, deleting levels they empty."""
+        cursor.executemany(
+            "UPDATE prediction_levels SET remaining_size = remaining_size - ? WHERE level_id = ?",
+            [(take, level_id) for level_id, _, take in fills],
+        )
+        placeholders = ",".join("?" for _ in fills)
+        cursor.execute(
+            f"DELETE FROM prediction_levels WHERE level_id IN ({placeholders}) AND remaining_size <= 0",
+            [level_id for level_id, _, _ in fills],
+        )
 
     def _read_position(self, cursor, prediction_id: int, discord_id: int) -> tuple[int, int, int, int]:
         """Return (yes_contracts, yes_cost_basis_total, no_contracts, no_cost_basis_total)."""
@@ -1277,39 +1214,42 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
     def get_trade_summary_since(self, prediction_id: int, since_ts: int) -> dict:
         """Aggregate trades since ``since_ts`` for the daily summary message."""
         with self.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT action, contracts, jopacoins, vwap_x100, trade_time, discord_id
-                FROM prediction_trades
-                WHERE prediction_id = ? AND trade_time >= ?
-                ORDER BY trade_id ASC
-                """,
-                (prediction_id, since_ts),
-            )
-            rows = [dict(r) for r in cursor.fetchall()]
-
-            total_volume = 0
-            yes_volume = 0
-            no_volume = 0
-            biggest = None
-            for r in rows:
-                qty = int(r["contracts"])
-                cash = int(r["jopacoins"])
-                total_volume += qty
-                if r["action"] in ("buy_yes", "sell_yes"):
-                    yes_volume += qty
-                else:
-                    no_volume += qty
-                if biggest is None or abs(cash) > abs(int(biggest["jopacoins"])):
-                    biggest = r
-            return {
-                "trade_count": len(rows),
-                "total_volume": total_volume,
-                "yes_volume": yes_volume,
-                "no_volume": no_volume,
-                "biggest_trade": biggest,
-            }
+            return self._trade_summary(conn.cursor(), prediction_id, since_ts)
+
+    @staticmethod
+    def _trade_summary(cursor, prediction_id: int, since_ts: int) -> dict:
+        cursor.execute(
+            """
+            SELECT action, contracts, jopacoins, vwap_x100, trade_time, discord_id
+            FROM prediction_trades
+            WHERE prediction_id = ? AND trade_time >= ?
+            ORDER BY trade_id ASC
+            """,
+            (prediction_id, since_ts),
+        )
+        rows = [dict(r) for r in cursor.fetchall()]
+
+        total_volume = 0
+        yes_volume = 0
+        no_volume = 0
+        biggest = None
+        for r in rows:
+            qty = int(r["contracts"])
+            cash = int(r["jopacoins"])
+            total_volume += qty
+            if r["action"] in ("buy_yes", "sell_yes"):
+                yes_volume += qty
+            else:
+                no_volume += qty
+            if biggest is None or abs(cash) > abs(int(biggest["jopacoins"])):
+                biggest = r
+        return {
+            "trade_count": len(rows),
+            "total_volume": total_volume,
+            "yes_volume": yes_volume,
+            "no_volume": no_volume,
+            "biggest_trade": biggest,
+        }
 
     def get_last_fill_price_since(
         self, prediction_id: int, actions: list[str], since_ts: int
@@ -1354,6 +1294,102 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
             )
             return [dict(r) for r in cursor.fetchall()]
 
+    def get_next_refresh_due_at(self, refresh_interval_seconds: int) -> int | None:
+        """When the stalest open market comes due for refresh (None if no open markets)."""
+        with self.connection() as conn:
+            row = conn.execute(
+                "SELECT MIN(COALESCE(last_refresh_at, 0)) FROM predictions WHERE status = 'open'"
+            ).fetchone()
+        return None if row[0] is None else int(row[0]) + refresh_interval_seconds
+
+    def get_refresh_inputs(self, prediction_ids: list[int]) -> dict[int, dict]:
+        """Read everything a refresh needs for many markets in one snapshot.
+
+        Returns ``{prediction_id: {...prediction row, "book", "last_lifted_ask",
+        "last_hit_bid"}}`` for the markets that exist. The fill anchors are the
+        latest terminal fill prices since each market's last refresh.
+        """
+        unique_ids = list(dict.fromkeys(prediction_ids))
+        if not unique_ids:
+            return {}
+        placeholders = ",".join("?" for _ in unique_ids)
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute(
+                f"""
+                SELECT prediction_id, guild_id, status, current_price, last_refresh_at
+                FROM predictions
+                WHERE prediction_id IN ({placeholders})
+                """,
+                unique_ids,
+            )
+            inputs = {
+                int(row["prediction_id"]): {
+                    **dict(row),
+                    "last_lifted_ask": None,
+                    "last_hit_bid": None,
+                }
+                for row in cursor.fetchall()
+            }
+            # SQLite returns the bare last_fill_price from the MAX(trade_id) row.
+            cursor.execute(
+                f"""
+                SELECT t.prediction_id,
+                       t.action IN ('buy_yes', 'sell_no') AS lifted_ask,
+                       t.last_fill_price,
+                       MAX(t.trade_id) AS trade_id
+                FROM prediction_trades t
+                JOIN predictions p ON p.prediction_id = t.prediction_id
+                WHERE t.prediction_id IN ({placeholders})
+                  AND t.trade_time >= COALESCE(p.last_refresh_at, 0)
+                  AND t.last_fill_price IS NOT NULL
+                GROUP BY t.prediction_id, lifted_ask
+                """,
+                unique_ids,
+            )
+            for row in cursor.fetchall():
+                key = "last_lifted_ask" if row["lifted_ask"] else "last_hit_bid"
+                inputs[int(row["prediction_id"])][key] = int(row["last_fill_price"])
+
+            with self._order_books.lock:
+                for prediction_id, market in inputs.items():
+                    book = self._order_books.book(cursor, prediction_id)
+                    market["book"] = {
+                        "current_price": market["current_price"],
+                        "yes_asks": book.asks.depth(),
+                        "yes_bids": book.bids.depth(),
+                    }
+            return inputs
+
+    def apply_refreshes(self, refreshes: list[dict]) -> dict[int, dict]:
+        """Apply many ladder refreshes in one write transaction.
+
+        Each entry carries ``apply_refresh`` keyword arguments plus
+        ``prediction_id`` and ``since_ts``. Markets that are no longer open are
+        skipped; the rest map to their trade summary since ``since_ts``, read
+        under the same lock so it matches the refresh that was applied.
+        """
+        summaries: dict[int, dict] = {}
+        with self.atomic_transaction() as conn:
+            cursor = conn.cursor()
+            for refresh in refreshes:
+                prediction_id = refresh["prediction_id"]
+                applied = self._apply_refresh_in_txn(
+                    cursor,
+                    prediction_id,
+                    refresh["new_price"],
+                    refresh["levels"],
+                    refresh["now_ts"],
+                    refresh.get("reason", "refresh"),
+                    refresh.get("min_quote_offset", 0),
+                )
+                if applied:
+                    summaries[prediction_id] = self._trade_summary(
+                        cursor, prediction_id, refresh["since_ts"]
+                    )
+        return summaries
+
     def apply_refresh(
         self,
         prediction_id: int,
@@ -1378,87 +1414,108 @@ class PredictionRepository(BaseRepository, IPredictionRepository):
         or /predict cancel can't be clobbered by a stale refresh.
         """
         with self.atomic_transaction() as conn:
-            cursor = conn.cursor()
+            self._apply_refresh_in_txn(
+                conn.cursor(),
+                prediction_id,
+                new_price,
+                levels,
+                now_ts,
+                reason,
+                min_quote_offset,
+            )
+
+    def _apply_refresh_in_txn(
+        self,
+        cursor,
+        prediction_id: int,
+        new_price: int,
+        levels: list[tuple[str, int, int]],
+        now_ts: int,
+        reason: str,
+        min_quote_offset: int,
+    ) -> bool:
+        """``apply_refresh`` body; returns False if the market is no longer open."""
+        cursor.execute(
+            "SELECT status, guild_id FROM predictions WHERE prediction_id = ?",
+            (prediction_id,),
+        )
+        row = cursor.fetchone()
+        if not row or row["status"] != "open":
+            return False  # market was resolved/cancelled while we were processing
+        guild_id = int(row["guild_id"])
+
+        # Crossing levels from earlier flow are left in place on purpose:
+        # they're the arb pockets that drive engagement.
+        if min_quote_offset > 0:
             cursor.execute(
-                "SELECT status, guild_id FROM predictions WHERE prediction_id = ?",
-                (prediction_id,),
+                """
+                DELETE FROM prediction_levels
+                WHERE prediction_id = ? AND (
+                    (side = 'yes_ask' AND price > ? AND price < ?)
+                    OR (side = 'yes_bid' AND price < ? AND price > ?)
+                )
+                """,
+                (
+                    prediction_id,
+                    new_price,
+                    new_price + min_quote_offset,
+                    new_price,
+                    new_price - min_quote_offset,
+                ),
             )
-            row = cursor.fetchone()
-            if not row or row["status"] != "open":
-                return  # market was resolved/cancelled while we were processing
-            guild_id = int(row["guild_id"])
 
-            # Crossing levels from earlier flow are left in place on purpose:
-            # they're the arb pockets that drive engagement.
-            if min_quote_offset > 0:
+        for side, price, size in levels:
+            if side not in self.VALID_BOOK_SIDES:
+                raise ValueError(f"Invalid book side: {side}")
+            cursor.execute(
+                """
+                SELECT level_id, remaining_size FROM prediction_levels
+                WHERE prediction_id = ? AND side = ? AND price = ?
+                """,
+                (prediction_id, side, price),
+            )
+            existing = cursor.fetchone()
+            if existing:
                 cursor.execute(
                     """
-                    DELETE FROM prediction_levels
-                    WHERE prediction_id = ? AND (
-                        (side = 'yes_ask' AND price > ? AND price < ?)
-                        OR (side = 'yes_bid' AND price < ? AND price > ?)
-                    )
+                    UPDATE prediction_levels
+                    SET remaining_size = remaining_size + ?, posted_at = ?
+                    WHERE level_id = ?
                     """,
-                    (
-                        prediction_id,
-                        new_price,
-                        new_price + min_quote_offset,
-                        new_price,
-                        new_price - min_quote_offset,
-                    ),
+                    (size, now_ts, existing["level_id"]),
                 )
-
-            for side, price, size in levels:
-                if side not in self.VALID_BOOK_SIDES:
-                    raise ValueError(f"Invalid book side: {side}")
+            else:
                 cursor.execute(
                     """
-                    SELECT level_id, remaining_size FROM prediction_levels
-                    WHERE prediction_id = ? AND side = ? AND price = ?
+                    INSERT INTO prediction_levels
+                        (prediction_id, side, price, remaining_size, posted_at)
+                    VALUES (?, ?, ?, ?, ?)
                     """,
-                    (prediction_id, side, price),
+                    (prediction_id, side, price, size, now_ts),
                 )
-                existing = cursor.fetchone()
-                if existing:
-                    cursor.execute(
-                        """
-                        UPDATE prediction_levels
-                        SET remaining_size = remaining_size + ?, posted_at = ?
-                        WHERE level_id = ?
-                        """,
-                        (size, now_ts, existing["level_id"]),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        INSERT INTO prediction_levels
-                            (prediction_id, side, price, remaining_size, posted_at)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (prediction_id, side, price, size, now_ts),
-                    )
 
-            # Stamp prev_price with the OLD current_price so the digest can
-            # render a price-change arrow on the next render.
-            cursor.execute(
-                """
-                UPDATE predictions
-                SET prev_price = current_price,
-                    current_price = ?,
-                    last_refresh_at = ?
-                WHERE prediction_id = ?
-                """,
-                (new_price, now_ts, prediction_id),
-            )
+        # Stamp prev_price with the OLD current_price so the digest can
+        # render a price-change arrow on the next render.
+        cursor.execute(
+            """
+            UPDATE predictions
+            SET prev_price = current_price,
+                current_price = ?,
+                last_refresh_at = ?
+            WHERE prediction_id = ?
+            """,
+            (new_price, now_ts, prediction_id),
+        )
 
-            cursor.execute(
-                """
-                INSERT INTO prediction_fair_snapshots
-                    (market_id, guild_id, snapshot_at, fair_pct, reason)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (prediction_id, guild_id, now_ts, new_price, reason),
-            )
+        cursor.execute(
+            """
+            INSERT INTO prediction_fair_snapshots
+                (market_id, guild_id, snapshot_at, fair_pct, reason)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (prediction_id, guild_id, now_ts, new_price, reason),
+        )
+        return True
 
     def pop_one_shot_flag(self, guild_id: int, key: str) -> bool:
         """Return True if ``app_kv[(guild, key)]`` was '0' (and atomically flip to '1').
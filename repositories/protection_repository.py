@@ -16,6 +16,7 @@ from domain.models.hostile_loss import (
     ProtectionDetail,
 )
 from repositories.base_repository import BaseRepository, safe_json_loads
+from utils.effect_cache import EFFECT_NAMESPACE_BUFF, invalidates_request_effects
 
 _POOL_DEFAULTS: dict[str, tuple[int, float]] = {
     "reprieve": (25, 0.5),
@@ -211,6 +212,7 @@ class ProtectionRepository(BaseRepository):
             ),
         )
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def apply_hostile_loss(
         self,
         *,
@@ -252,6 +254,7 @@ class ProtectionRepository(BaseRepository):
                 now=now,
             )
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def apply_hostile_losses(
         self, losses: list[dict[str, Any]]
     ) -> list[HostileLossResult | Exception]:
@@ -811,6 +814,7 @@ class ProtectionRepository(BaseRepository):
                     cursor.execute("RELEASE SAVEPOINT guardian_recipient")
         return results
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def reconcile_purchased_pool(
         self,
         *,
@@ -888,6 +892,7 @@ class ProtectionRepository(BaseRepository):
             self._persist_pool(cursor, row, data, capacity)
             return refunded
 
+    @invalidates_request_effects(EFFECT_NAMESPACE_BUFF)
     def block_non_jc_attack(
         self,
         *,
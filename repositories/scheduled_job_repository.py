@@ -0,0 +1,204 @@
+"""Durable rows behind the background job scheduler.
+
+One ``scheduled_jobs`` row per job. ``next_due_at`` is indexed over the
+unclaimed rows, so finding the next wake-up and claiming due work are both
+single index range reads rather than per-feature polling queries.
+
+Claiming a job parks its ``next_due_at`` at ``_NOT_DUE``. A schedule request
+that arrives while the job runs lowers it as usual, and completing, failing
+or releasing the claim keeps the sooner of that request and the run's own
+next time, so a run asked for mid-flight is never overwritten.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from repositories.base_repository import BaseRepository, safe_json_loads
+
+# ``next_due_at`` of a claimed job that nothing has asked to run again.
+_NOT_DUE = 2**62
+
+
+class ScheduledJobRepository(BaseRepository):
+    """Claim, complete and reschedule rows in ``scheduled_jobs``."""
+
+    def upsert_job(
+        self,
+        job_key: str,
+        handler: str,
+        *,
+        next_due_at: int,
+        interval_seconds: int | None = None,
+        payload: Any = None,
+        keep_stored_due: bool = False,
+    ) -> None:
+        """Create a job, or pull an existing one's due time earlier.
+
+        An existing job keeps the sooner of its stored and requested due
+        times, so a schedule request never postpones work that is already
+        due. With ``keep_stored_due`` an existing job keeps its stored time
+        as is: registration on startup resumes the schedule the last run left
+        rather than running every job again.
+        """
+        now = int(time.time())
+        with self.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO scheduled_jobs (
+                    job_key, handler, payload, next_due_at, interval_seconds,
+                    created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_key) DO UPDATE SET
+                    handler = excluded.handler,
+                    payload = excluded.payload,
+                    interval_seconds = excluded.interval_seconds,
+                    next_due_at = CASE
+                        WHEN ? THEN scheduled_jobs.next_due_at
+                        ELSE MIN(scheduled_jobs.next_due_at, excluded.next_due_at)
+                    END,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    job_key,
+                    handler,
+                    None if payload is None else json.dumps(payload),
+                    int(next_due_at),
+                    interval_seconds,
+                    now,
+                    now,
+                    bool(keep_stored_due),
+                ),
+            )
+
+    def claim_due_jobs(
+        self, now: int, handlers: list[str], limit: int
+    ) -> list[dict[str, Any]]:
+        """Atomically mark up to ``limit`` due jobs as running and return them."""
+        if limit <= 0 or not handlers:
+            return []
+        placeholders = ",".join("?" * len(handlers))
+        with self.atomic_transaction() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT job_key, handler, payload, next_due_at, interval_seconds, attempts
+                FROM scheduled_jobs
+                WHERE running_since IS NULL
+                  AND next_due_at <= ?
+                  AND handler IN ({placeholders})
+                ORDER BY next_due_at, job_key
+                LIMIT ?
+                """,
+                (int(now), *handlers, int(limit)),
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    """
+                    UPDATE scheduled_jobs
+                    SET running_since = ?, last_started_at = ?, updated_at = ?,
+                        next_due_at = ?
+                    WHERE job_key = ?
+                    """,
+                    [(int(now), int(now), int(now), _NOT_DUE, row["job_key"]) for row in rows],
+                )
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            job["payload"] = safe_json_loads(row["payload"], default=None)
+            jobs.append(job)
+        return jobs
+
+    def complete_job(
+        self,
+        job_key: str,
+        *,
+        next_due_at: int | None,
+        finished_at: int,
+        latency_ms: int,
+    ) -> None:
+        """Record a successful run and release its claim.
+
+        The job next runs at the sooner of ``next_due_at`` and any run
+        scheduled while it was running; with neither it is retired.
+        """
+        due_at = _NOT_DUE if next_due_at is None else int(next_due_at)
+        with self.atomic_transaction() as conn:
+            conn.execute(
+                """
+                UPDATE scheduled_jobs
+                SET next_due_at = MIN(next_due_at, ?), running_since = NULL, attempts = 0,
+                    run_count = run_count + 1, last_finished_at = ?,
+                    last_latency_ms = ?, last_error = NULL, updated_at = ?
+                WHERE job_key = ?
+                """,
+                (due_at, finished_at, latency_ms, finished_at, job_key),
+            )
+            conn.execute(
+                "DELETE FROM scheduled_jobs WHERE job_key = ? AND next_due_at >= ?",
+                (job_key, _NOT_DUE),
+            )
+
+    def fail_job(
+        self,
+        job_key: str,
+        *,
+        retry_at: int,
+        finished_at: int,
+        latency_ms: int,
+        error: str,
+    ) -> None:
+        """Record a failed run and release the claim until ``retry_at``."""
+        with self.connection() as conn:
+            conn.execute(
+                """
+                UPDATE scheduled_jobs
+                SET next_due_at = MIN(next_due_at, ?), running_since = NULL,
+                    attempts = attempts + 1,
+                    failure_count = failure_count + 1, last_finished_at = ?,
+                    last_latency_ms = ?, last_error = ?, updated_at = ?
+                WHERE job_key = ?
+                """,
+                (int(retry_at), finished_at, latency_ms, error[:500], finished_at, job_key),
+            )
+
+    def get_next_due_at(self, handlers: list[str]) -> int | None:
+        """Earliest due time among unclaimed jobs for ``handlers``."""
+        if not handlers:
+            return None
+        placeholders = ",".join("?" * len(handlers))
+        with self.connection() as conn:
+            row = conn.execute(
+                f"""
+                SELECT MIN(next_due_at) FROM scheduled_jobs
+                WHERE running_since IS NULL AND handler IN ({placeholders})
+                """,
+                tuple(handlers),
+            ).fetchone()
+        return None if row[0] is None else int(row[0])
+
+    def release_claims(self) -> int:
+        """Unclaim jobs left running by a previous process; return how many."""
+        with self.connection() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE scheduled_jobs
+                SET next_due_at = MIN(next_due_at, running_since), running_since = NULL
+                WHERE running_since IS NOT NULL
+                """
+            )
+            return cursor.rowcount
+
+    def delete_job(self, job_key: str) -> bool:
+        with self.connection() as conn:
+            cursor = conn.execute("DELETE FROM scheduled_jobs WHERE job_key = ?", (job_key,))
+            return cursor.rowcount > 0
+
+    def get_jobs(self) -> list[dict[str, Any]]:
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM scheduled_jobs ORDER BY next_due_at, job_key"
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -8,6 +8,7 @@ from collections.abc import Sequence
 from domain.models.survey import (
     MAX_SURVEY_QUESTIONS,
     Survey,
+    SurveyDeliveryOutcomes,
     SurveyDeliveryStatus,
     SurveyDraftAnswer,
     SurveyNotFoundError,
@@ -655,6 +656,29 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
             ).fetchall()
         return [self._recipient_from_row(row) for row in claimed]
 
+    @staticmethod
+    def _renew_claim_with_cursor(
+        cursor, recipient_id: int, expected_attempt_count: int, now: int
+    ) -> bool:
+        cursor.execute(
+            """
+            UPDATE survey_recipients
+            SET claimed_at = ?, updated_at = ?
+            WHERE recipient_id = ?
+              AND delivery_status = 'sending'
+              AND attempt_count = ?
+              AND receipt_checked_attempt < attempt_count
+              AND EXISTS (
+                  SELECT 1 FROM surveys
+                  WHERE surveys.survey_id = survey_recipients.survey_id
+                    AND surveys.guild_id = survey_recipients.guild_id
+                    AND surveys.status = 'open'
+              )
+            """,
+            (now, now, recipient_id, expected_attempt_count),
+        )
+        return cursor.rowcount == 1
+
     def renew_delivery_claim(
         self,
         recipient_id: int,
@@ -664,28 +688,90 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
         now = self._now()
         with self.atomic_transaction() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE survey_recipients
-                SET claimed_at = ?, updated_at = ?
-                WHERE recipient_id = ?
-                  AND delivery_status = 'sending'
-                  AND attempt_count = ?
-                  AND receipt_checked_attempt < attempt_count
-                  AND EXISTS (
-                      SELECT 1 FROM surveys
-                      WHERE surveys.survey_id = survey_recipients.survey_id
-                        AND surveys.guild_id = survey_recipients.guild_id
-                        AND surveys.status = 'open'
-                  )
-                """,
-                (now, now, recipient_id, expected_attempt_count),
-            )
-            if cursor.rowcount != 1:
+            if not self._renew_claim_with_cursor(
+                cursor, recipient_id, expected_attempt_count, now
+            ):
                 raise SurveyStateError("Survey delivery claim is no longer active")
             updated = self._get_recipient_by_id(cursor, recipient_id)
         return self._recipient_from_row(updated)
 
+    def renew_delivery_claims(self, claims: Sequence[tuple[int, int]]) -> set[int]:
+        """Renew many ``(recipient_id, attempt_count)`` leases in one transaction.
+
+        Returns the recipient IDs whose lease is still active; the rest must
+        not be sent.
+        """
+        now = self._now()
+        renewed: set[int] = set()
+        with self.atomic_transaction() as conn:
+            cursor = conn.cursor()
+            for recipient_id, expected_attempt_count in claims:
+                if self._renew_claim_with_cursor(
+                    cursor, recipient_id, expected_attempt_count, now
+                ):
+                    renewed.add(recipient_id)
+        return renewed
+
+    def _mark_delivery_sent_with_cursor(
+        self,
+        cursor,
+        recipient_id: int,
+        expected_attempt_count: int,
+        dm_channel_id: int,
+        dm_message_id: int,
+        now: int,
+    ):
+        row = self._get_recipient_by_id(cursor, recipient_id)
+        if row is None:
+            raise SurveyNotFoundError("Survey recipient not found")
+        row_attempt = int(row["attempt_count"])
+        if (
+            row["delivery_status"] == SurveyDeliveryStatus.SENT.value
+            and row_attempt == expected_attempt_count
+        ):
+            return row
+        if (
+            row["delivery_status"] != SurveyDeliveryStatus.SENDING.value
+            or row_attempt != expected_attempt_count
+        ):
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        survey = cursor.execute(
+            """
+            SELECT status FROM surveys
+            WHERE survey_id = ? AND guild_id = ?
+            """,
+            (row["survey_id"], row["guild_id"]),
+        ).fetchone()
+        if survey is None or survey["status"] != SurveyStatus.OPEN.value:
+            raise SurveyStateError("Cannot complete delivery for a closed survey")
+        if row["delivery_status"] != SurveyDeliveryStatus.SENDING.value:
+            raise SurveyStateError("Survey delivery is not currently claimed")
+        cursor.execute(
+            """
+            UPDATE survey_recipients
+            SET delivery_status = 'sent', claimed_at = NULL,
+                dm_channel_id = ?, dm_message_id = ?,
+                ui_channel_id = ?, ui_message_id = ?,
+                controls_finalized = 0,
+                receipt_checked_attempt = attempt_count,
+                retry_requested = 0, last_error = NULL, updated_at = ?
+            WHERE recipient_id = ? AND delivery_status = 'sending'
+              AND attempt_count = ?
+            """,
+            (
+                dm_channel_id,
+                dm_message_id,
+                dm_channel_id,
+                dm_message_id,
+                now,
+                recipient_id,
+                expected_attempt_count,
+            ),
+        )
+        if cursor.rowcount != 1:
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        return self._get_recipient_by_id(cursor, recipient_id)
+
     def mark_delivery_sent(
         self,
         recipient_id: int,
@@ -695,58 +781,55 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
     ) -> SurveyRecipient:
         now = self._now()
         with self.atomic_transaction() as conn:
-            cursor = conn.cursor()
-            row = self._get_recipient_by_id(cursor, recipient_id)
-            if row is None:
-                raise SurveyNotFoundError("Survey recipient not found")
-            row_attempt = int(row["attempt_count"])
-            if (
-                row["delivery_status"] == SurveyDeliveryStatus.SENT.value
-                and row_attempt == expected_attempt_count
-            ):
-                return self._recipient_from_row(row)
-            if (
-                row["delivery_status"] != SurveyDeliveryStatus.SENDING.value
-                or row_attempt != expected_attempt_count
-            ):
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            survey = cursor.execute(
-                """
-                SELECT status FROM surveys
-                WHERE survey_id = ? AND guild_id = ?
-                """,
-                (row["survey_id"], row["guild_id"]),
-            ).fetchone()
-            if survey is None or survey["status"] != SurveyStatus.OPEN.value:
-                raise SurveyStateError("Cannot complete delivery for a closed survey")
-            if row["delivery_status"] != SurveyDeliveryStatus.SENDING.value:
-                raise SurveyStateError("Survey delivery is not currently claimed")
-            cursor.execute(
-                """
-                UPDATE survey_recipients
-                SET delivery_status = 'sent', claimed_at = NULL,
-                    dm_channel_id = ?, dm_message_id = ?,
-                    ui_channel_id = ?, ui_message_id = ?,
-                    controls_finalized = 0,
-                    receipt_checked_attempt = attempt_count,
-                    retry_requested = 0, last_error = NULL, updated_at = ?
-                WHERE recipient_id = ? AND delivery_status = 'sending'
-                  AND attempt_count = ?
-                """,
-                (
-                    dm_channel_id,
-                    dm_message_id,
-                    dm_channel_id,
-                    dm_message_id,
-                    now,
-                    recipient_id,
-                    expected_attempt_count,
-                ),
+            row = self._mark_delivery_sent_with_cursor(
+                conn.cursor(),
+                recipient_id,
+                expected_attempt_count,
+                dm_channel_id,
+                dm_message_id,
+                now,
             )
-            if cursor.rowcount != 1:
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            updated = self._get_recipient_by_id(cursor, recipient_id)
-        return self._recipient_from_row(updated)
+        return self._recipient_from_row(row)
+
+    def _mark_delivery_failed_with_cursor(
+        self,
+        cursor,
+        recipient_id: int,
+        expected_attempt_count: int,
+        clean_error: str,
+        now: int,
+    ):
+        row = self._get_recipient_by_id(cursor, recipient_id)
+        if row is None:
+            raise SurveyNotFoundError("Survey recipient not found")
+        row_attempt = int(row["attempt_count"])
+        if (
+            row["delivery_status"]
+            in (
+                SurveyDeliveryStatus.SENT.value,
+                SurveyDeliveryStatus.FAILED.value,
+            )
+            and row_attempt == expected_attempt_count
+        ):
+            return row
+        if (
+            row["delivery_status"] != SurveyDeliveryStatus.SENDING.value
+            or row_attempt != expected_attempt_count
+        ):
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        cursor.execute(
+            """
+            UPDATE survey_recipients
+            SET delivery_status = 'failed',
+                last_error = ?, updated_at = ?
+            WHERE recipient_id = ? AND delivery_status = 'sending'
+              AND attempt_count = ?
+            """,
+            (clean_error, now, recipient_id, expected_attempt_count),
+        )
+        if cursor.rowcount != 1:
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        return self._get_recipient_by_id(cursor, recipient_id)
 
     def mark_delivery_failed(
         self,
@@ -757,39 +840,74 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
         now = self._now()
         clean_error = str(error).strip()[:500] or "DM delivery failed"
         with self.atomic_transaction() as conn:
-            cursor = conn.cursor()
-            row = self._get_recipient_by_id(cursor, recipient_id)
-            if row is None:
-                raise SurveyNotFoundError("Survey recipient not found")
-            row_attempt = int(row["attempt_count"])
-            if (
-                row["delivery_status"]
-                in (
-                    SurveyDeliveryStatus.SENT.value,
-                    SurveyDeliveryStatus.FAILED.value,
-                )
-                and row_attempt == expected_attempt_count
-            ):
-                return self._recipient_from_row(row)
-            if (
-                row["delivery_status"] != SurveyDeliveryStatus.SENDING.value
-                or row_attempt != expected_attempt_count
-            ):
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            cursor.execute(
-                """
-                UPDATE survey_recipients
-                SET delivery_status = 'failed',
-                    last_error = ?, updated_at = ?
-                WHERE recipient_id = ? AND delivery_status = 'sending'
-                  AND attempt_count = ?
-                """,
-                (clean_error, now, recipient_id, expected_attempt_count),
+            row = self._mark_delivery_failed_with_cursor(
+                conn.cursor(), recipient_id, expected_attempt_count, clean_error, now
             )
-            if cursor.rowcount != 1:
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            updated = self._get_recipient_by_id(cursor, recipient_id)
-        return self._recipient_from_row(updated)
+        return self._recipient_from_row(row)
+
+    def _reconcile_delivery_sent_with_cursor(
+        self,
+        cursor,
+        recipient_id: int,
+        expected_attempt_count: int,
+        dm_channel_id: int,
+        dm_message_id: int,
+        now: int,
+    ):
+        row = self._get_recipient_by_id(cursor, recipient_id)
+        if row is None:
+            raise SurveyNotFoundError("Survey recipient not found")
+        row_attempt = int(row["attempt_count"])
+        if (
+            row["delivery_status"] == SurveyDeliveryStatus.SENT.value
+            and row_attempt == expected_attempt_count
+        ):
+            return row
+        if (
+            row["delivery_status"]
+            not in (
+                SurveyDeliveryStatus.PENDING.value,
+                SurveyDeliveryStatus.SENDING.value,
+                SurveyDeliveryStatus.FAILED.value,
+            )
+            or row_attempt != expected_attempt_count
+        ):
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        survey = cursor.execute(
+            """
+            SELECT status FROM surveys
+            WHERE survey_id = ? AND guild_id = ?
+            """,
+            (row["survey_id"], row["guild_id"]),
+        ).fetchone()
+        if survey is None or survey["status"] == SurveyStatus.DRAFT.value:
+            raise SurveyStateError("Survey delivery campaign is unavailable")
+        cursor.execute(
+            """
+            UPDATE survey_recipients
+            SET delivery_status = 'sent', claimed_at = NULL,
+                dm_channel_id = ?, dm_message_id = ?,
+                ui_channel_id = ?, ui_message_id = ?,
+                controls_finalized = 0,
+                receipt_checked_attempt = attempt_count,
+                retry_requested = 0, last_error = NULL, updated_at = ?
+            WHERE recipient_id = ?
+              AND delivery_status IN ('pending', 'sending', 'failed')
+              AND attempt_count = ?
+            """,
+            (
+                dm_channel_id,
+                dm_message_id,
+                dm_channel_id,
+                dm_message_id,
+                now,
+                recipient_id,
+                expected_attempt_count,
+            ),
+        )
+        if cursor.rowcount != 1:
+            raise SurveyStateError("Survey delivery claim is no longer active")
+        return self._get_recipient_by_id(cursor, recipient_id)
 
     def reconcile_delivery_sent(
         self,
@@ -801,62 +919,69 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
         """Attach a DM receipt found in history, including after campaign close."""
         now = self._now()
         with self.atomic_transaction() as conn:
-            cursor = conn.cursor()
-            row = self._get_recipient_by_id(cursor, recipient_id)
-            if row is None:
-                raise SurveyNotFoundError("Survey recipient not found")
-            row_attempt = int(row["attempt_count"])
-            if (
-                row["delivery_status"] == SurveyDeliveryStatus.SENT.value
-                and row_attempt == expected_attempt_count
-            ):
-                return self._recipient_from_row(row)
-            if (
-                row["delivery_status"]
-                not in (
-                    SurveyDeliveryStatus.PENDING.value,
-                    SurveyDeliveryStatus.SENDING.value,
-                    SurveyDeliveryStatus.FAILED.value,
-                )
-                or row_attempt != expected_attempt_count
-            ):
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            survey = cursor.execute(
-                """
-                SELECT status FROM surveys
-                WHERE survey_id = ? AND guild_id = ?
-                """,
-                (row["survey_id"], row["guild_id"]),
-            ).fetchone()
-            if survey is None or survey["status"] == SurveyStatus.DRAFT.value:
-                raise SurveyStateError("Survey delivery campaign is unavailable")
-            cursor.execute(
-                """
-                UPDATE survey_recipients
-                SET delivery_status = 'sent', claimed_at = NULL,
-                    dm_channel_id = ?, dm_message_id = ?,
-                    ui_channel_id = ?, ui_message_id = ?,
-                    controls_finalized = 0,
-                    receipt_checked_attempt = attempt_count,
-                    retry_requested = 0, last_error = NULL, updated_at = ?
-                WHERE recipient_id = ?
-                  AND delivery_status IN ('pending', 'sending', 'failed')
-                  AND attempt_count = ?
-                """,
-                (
-                    dm_channel_id,
-                    dm_message_id,
-                    dm_channel_id,
-                    dm_message_id,
-                    now,
-                    recipient_id,
-                    expected_attempt_count,
-                ),
+            row = self._reconcile_delivery_sent_with_cursor(
+                conn.cursor(),
+                recipient_id,
+                expected_attempt_count,
+                dm_channel_id,
+                dm_message_id,
+                now,
             )
-            if cursor.rowcount != 1:
-                raise SurveyStateError("Survey delivery claim is no longer active")
-            updated = self._get_recipient_by_id(cursor, recipient_id)
-        return self._recipient_from_row(updated)
+        return self._recipient_from_row(row)
+
+    def record_delivery_outcomes(
+        self,
+        sent: Sequence[tuple[int, int, int, int]],
+        failed: Sequence[tuple[int, int, str]],
+    ) -> SurveyDeliveryOutcomes:
+        """Commit many delivery results in one transaction.
+
+        ``sent`` holds ``(recipient_id, attempt_count, dm_channel_id,
+        dm_message_id)`` and ``failed`` holds ``(recipient_id, attempt_count,
+        error)``. Each row gets the same compare-and-set as
+        ``mark_delivery_sent``/``mark_delivery_failed``; a sent row that can
+        no longer be marked (its survey closed) falls back to
+        ``reconcile_delivery_sent``. A row whose claim is gone is reported in
+        ``rejected`` instead of aborting the group.
+        """
+        now = self._now()
+        sent_ids: list[int] = []
+        reconciled_ids: list[int] = []
+        failed_ids: list[int] = []
+        rejected_ids: list[int] = []
+        with self.atomic_transaction() as conn:
+            cursor = conn.cursor()
+            for recipient_id, attempt_count, dm_channel_id, dm_message_id in sent:
+                try:
+                    self._mark_delivery_sent_with_cursor(
+                        cursor, recipient_id, attempt_count, dm_channel_id, dm_message_id, now
+                    )
+                    sent_ids.append(recipient_id)
+                    continue
+                except (SurveyNotFoundError, SurveyStateError):
+                    pass
+                try:
+                    self._reconcile_delivery_sent_with_cursor(
+                        cursor, recipient_id, attempt_count, dm_channel_id, dm_message_id, now
+                    )
+                    reconciled_ids.append(recipient_id)
+                except (SurveyNotFoundError, SurveyStateError):
+                    rejected_ids.append(recipient_id)
+            for recipient_id, attempt_count, error in failed:
+                clean_error = str(error).strip()[:500] or "DM delivery failed"
+                try:
+                    self._mark_delivery_failed_with_cursor(
+                        cursor, recipient_id, attempt_count, clean_error, now
+                    )
+                    failed_ids.append(recipient_id)
+                except (SurveyNotFoundError, SurveyStateError):
+                    rejected_ids.append(recipient_id)
+        return SurveyDeliveryOutcomes(
+            sent=tuple(sent_ids),
+            reconciled=tuple(reconciled_ids),
+            failed=tuple(failed_ids),
+            rejected=tuple(rejected_ids),
+        )
 
     def mark_delivery_receipt_checked(
         self,
@@ -1028,6 +1153,24 @@ class SurveyRepository(BaseRepository, ISurveyRepository):
             conn.execute("BEGIN")
             return self._session_with_cursor(conn.cursor(), survey_id, discord_id)
 
+    def get_response_sessions(
+        self,
+        keys: Sequence[tuple[int, int]],
+    ) -> dict[tuple[int, int], SurveySession]:
+        """Load many ``(survey_id, discord_id)`` sessions from one snapshot.
+
+        Keys without a session are omitted from the result.
+        """
+        sessions: dict[tuple[int, int], SurveySession] = {}
+        with self.connection() as conn:
+            conn.execute("BEGIN")
+            cursor = conn.cursor()
+            for survey_id, discord_id in dict.fromkeys(keys):
+                session = self._session_with_cursor(cursor, survey_id, discord_id)
+                if session is not None:
+                    sessions[(survey_id, discord_id)] = session
+        return sessions
+
     def list_recoverable_response_sessions(self) -> list[SurveySession]:
         """Return DM sessions whose stored message needs reconciliation.
 
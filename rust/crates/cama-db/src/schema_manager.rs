@@ -142,6 +142,7 @@ const RETIRED_TABLES: &[&str] = &[
 const RETIRED_INDEXES: &[&str] = &[
     "idx_dig_actions_guild_actor",
     "idx_dig_actions_guild_target",
+    "idx_economy_ledger_account",
 ];
 
 /// Result of one startup initialization/migration pass.
@@ -1127,6 +1128,14 @@ fn run_consolidated_backfills(
              WHERE retry_requested IS NULL;",
         )?;
     }
+    if pending(pending_migrations, "create_gambling_aggregates") {
+        transaction.execute_batch(
+            "INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+             SELECT DISTINCT COALESCE(guild_id, 0), discord_id
+             FROM bets
+             WHERE match_id IS NOT NULL;",
+        )?;
+    }
     let openskill_replay_count = [
         "openskill_v3_durable_native_replay",
         "openskill_v4_streak_replay",
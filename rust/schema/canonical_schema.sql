@@ -414,7 +414,7 @@ CREATE TABLE economy_ledger_context (
                 related_id TEXT,
                 reason TEXT,
                 metadata TEXT
-            );
+            , app_managed INTEGER NOT NULL DEFAULT 0);
 
 -- table: economy_ledger_entries
 CREATE TABLE economy_ledger_entries (
@@ -469,6 +469,14 @@ CREATE TABLE first_game_pool_funding_days (
                 PRIMARY KEY (guild_id, game_date)
             );
 
+-- table: gambling_aggregate_dirty
+CREATE TABLE gambling_aggregate_dirty (
+                guild_id   INTEGER NOT NULL DEFAULT 0,
+                discord_id INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+;
+
 -- table: guild_config
 CREATE TABLE guild_config (
                 guild_id INTEGER PRIMARY KEY,
@@ -1097,6 +1105,15 @@ CREATE TABLE pets (
                 CHECK (death_announced_at IS NULL OR died_at IS NOT NULL)
             );
 
+-- table: player_cache_versions
+CREATE TABLE player_cache_versions (
+                discord_id INTEGER NOT NULL,
+                guild_id   INTEGER NOT NULL DEFAULT 0,
+                version    INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+;
+
 -- table: player_curfew_windows
 CREATE TABLE player_curfew_windows (
                 discord_id   INTEGER NOT NULL,
@@ -1112,6 +1129,27 @@ CREATE TABLE player_curfew_windows (
                 PRIMARY KEY (discord_id, guild_id, name)
             );
 
+-- table: player_gambling_aggregates
+CREATE TABLE player_gambling_aggregates (
+                guild_id                   INTEGER NOT NULL DEFAULT 0,
+                discord_id                 INTEGER NOT NULL,
+                total_bets                 INTEGER NOT NULL DEFAULT 0,
+                wins                       INTEGER NOT NULL DEFAULT 0,
+                losses                     INTEGER NOT NULL DEFAULT 0,
+                total_wagered              INTEGER NOT NULL DEFAULT 0,
+                avg_leverage               REAL NOT NULL DEFAULT 1,
+                net_pnl                    INTEGER NOT NULL DEFAULT 0,
+                unique_matches             INTEGER NOT NULL DEFAULT 0,
+                leverage_2x_bets           INTEGER NOT NULL DEFAULT 0,
+                leverage_3x_bets           INTEGER NOT NULL DEFAULT 0,
+                five_x_bets                INTEGER NOT NULL DEFAULT 0,
+                sequences_analyzed         INTEGER NOT NULL DEFAULT 0,
+                times_increased_after_loss INTEGER NOT NULL DEFAULT 0,
+                updated_at                 INTEGER,
+                PRIMARY KEY (guild_id, discord_id)
+            ) WITHOUT ROWID
+;
+
 -- table: player_mana
 CREATE TABLE player_mana (
                 discord_id   INTEGER NOT NULL,
@@ -1245,6 +1283,13 @@ CREATE TABLE "players" (
                 PRIMARY KEY (discord_id, guild_id)
             );
 
+-- table: prediction_book_versions
+CREATE TABLE prediction_book_versions (
+                prediction_id INTEGER PRIMARY KEY,
+                version       INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+;
+
 -- table: prediction_fair_snapshots
 CREATE TABLE prediction_fair_snapshots (
                 snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1367,6 +1412,25 @@ CREATE TABLE reminder_preferences (
                 PRIMARY KEY (discord_id, guild_id)
             );
 
+-- table: scheduled_jobs
+CREATE TABLE scheduled_jobs (
+                job_key TEXT PRIMARY KEY,
+                handler TEXT NOT NULL,
+                payload TEXT,
+                next_due_at INTEGER NOT NULL,
+                interval_seconds INTEGER,
+                running_since INTEGER,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                run_count INTEGER NOT NULL DEFAULT 0,
+                failure_count INTEGER NOT NULL DEFAULT 0,
+                last_started_at INTEGER,
+                last_finished_at INTEGER,
+                last_latency_ms INTEGER,
+                last_error TEXT,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            );
+
 -- table: schema_migrations
 CREATE TABLE schema_migrations (
                 name TEXT PRIMARY KEY,
@@ -1747,10 +1811,10 @@ CREATE INDEX idx_economy_events_active
             ON economy_daily_events(guild_id, starts_at, ends_at)
             ;
 
--- index: idx_economy_ledger_account
-CREATE INDEX idx_economy_ledger_account
-            ON economy_ledger_entries(guild_id, account_type, account_id, created_at DESC)
-            ;
+-- index: idx_economy_ledger_account_timeline
+CREATE INDEX idx_economy_ledger_account_timeline
+            ON economy_ledger_entries(guild_id, account_type, account_id, created_at, ledger_id)
+;
 
 -- index: idx_economy_ledger_guild_created
 CREATE INDEX idx_economy_ledger_guild_created
@@ -2070,6 +2134,12 @@ CREATE INDEX idx_reminder_prefs_trivia ON reminder_preferences(guild_id, trivia_
 -- index: idx_reminder_prefs_wheel
 CREATE INDEX idx_reminder_prefs_wheel ON reminder_preferences(guild_id, wheel_enabled);
 
+-- index: idx_scheduled_jobs_due
+CREATE INDEX idx_scheduled_jobs_due
+            ON scheduled_jobs(next_due_at)
+            WHERE running_since IS NULL
+;
+
 -- index: idx_soft_avoids_avoided
 CREATE INDEX idx_soft_avoids_avoided ON soft_avoids(guild_id, avoided_discord_id);
 
@@ -2195,98 +2265,180 @@ CREATE TRIGGER moderation_events_no_update
             END;
 
 -- trigger: trg_economy_ledger_nonprofit_insert
-CREATE TRIGGER trg_economy_ledger_nonprofit_insert
-            AFTER INSERT ON nonprofit_fund
-            WHEN COALESCE(NEW.total_collected, 0) != 0
-            BEGIN
-                INSERT INTO economy_ledger_entries (
-                    guild_id, account_type, account_id, delta,
-                    balance_before, balance_after, source, actor_id,
-                    related_type, related_id, reason, metadata
-                )
-                VALUES (
-                    COALESCE(NEW.guild_id, 0), 'nonprofit', COALESCE(NEW.guild_id, 0),
-                    COALESCE(NEW.total_collected, 0), 0,
-                    COALESCE(NEW.total_collected, 0),
-                    COALESCE((SELECT source FROM economy_ledger_context WHERE id = 1), 'nonprofit_insert'),
-                    (SELECT actor_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_type FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT reason FROM economy_ledger_context WHERE id = 1),
-                    (SELECT metadata FROM economy_ledger_context WHERE id = 1)
-                );
-            END;
+CREATE TRIGGER trg_economy_ledger_nonprofit_insert AFTER INSERT ON nonprofit_fund WHEN COALESCE(NEW.total_collected, 0) != 0 BEGIN
+            INSERT INTO economy_ledger_entries (
+                guild_id, account_type, account_id, delta,
+                balance_before, balance_after, source, actor_id,
+                related_type, related_id, reason, metadata
+            )
+            SELECT
+                COALESCE(NEW.guild_id, 0), 'nonprofit', COALESCE(NEW.guild_id, 0),
+                COALESCE(NEW.total_collected, 0), 0, COALESCE(NEW.total_collected, 0),
+                COALESCE(c.source, 'nonprofit_insert'),
+                c.actor_id, c.related_type, c.related_id, c.reason, c.metadata
+            FROM (SELECT 1)
+            LEFT JOIN economy_ledger_context c ON c.id = 1
+            ;
+         END;
 
 -- trigger: trg_economy_ledger_nonprofit_update
-CREATE TRIGGER trg_economy_ledger_nonprofit_update
-            AFTER UPDATE OF total_collected ON nonprofit_fund
-            WHEN COALESCE(OLD.total_collected, 0) != COALESCE(NEW.total_collected, 0)
-            BEGIN
-                INSERT INTO economy_ledger_entries (
-                    guild_id, account_type, account_id, delta,
-                    balance_before, balance_after, source, actor_id,
-                    related_type, related_id, reason, metadata
-                )
-                VALUES (
-                    COALESCE(NEW.guild_id, 0), 'nonprofit', COALESCE(NEW.guild_id, 0),
-                    COALESCE(NEW.total_collected, 0) - COALESCE(OLD.total_collected, 0),
-                    COALESCE(OLD.total_collected, 0),
-                    COALESCE(NEW.total_collected, 0),
-                    COALESCE((SELECT source FROM economy_ledger_context WHERE id = 1), 'nonprofit_update'),
-                    (SELECT actor_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_type FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT reason FROM economy_ledger_context WHERE id = 1),
-                    (SELECT metadata FROM economy_ledger_context WHERE id = 1)
-                );
-            END;
+CREATE TRIGGER trg_economy_ledger_nonprofit_update AFTER UPDATE OF total_collected ON nonprofit_fund WHEN COALESCE(OLD.total_collected, 0) != COALESCE(NEW.total_collected, 0) BEGIN
+            INSERT INTO economy_ledger_entries (
+                guild_id, account_type, account_id, delta,
+                balance_before, balance_after, source, actor_id,
+                related_type, related_id, reason, metadata
+            )
+            SELECT
+                COALESCE(NEW.guild_id, 0), 'nonprofit', COALESCE(NEW.guild_id, 0),
+                COALESCE(NEW.total_collected, 0) - COALESCE(OLD.total_collected, 0), COALESCE(OLD.total_collected, 0), COALESCE(NEW.total_collected, 0),
+                COALESCE(c.source, 'nonprofit_update'),
+                c.actor_id, c.related_type, c.related_id, c.reason, c.metadata
+            FROM (SELECT 1)
+            LEFT JOIN economy_ledger_context c ON c.id = 1
+            ;
+         END;
 
 -- trigger: trg_economy_ledger_players_insert
-CREATE TRIGGER trg_economy_ledger_players_insert
-            AFTER INSERT ON players
-            WHEN COALESCE(NEW.jopacoin_balance, 0) != 0
-            BEGIN
-                INSERT INTO economy_ledger_entries (
-                    guild_id, account_type, account_id, delta,
-                    balance_before, balance_after, source, actor_id,
-                    related_type, related_id, reason, metadata
-                )
-                VALUES (
-                    COALESCE(NEW.guild_id, 0), 'player', NEW.discord_id,
-                    COALESCE(NEW.jopacoin_balance, 0), 0,
-                    COALESCE(NEW.jopacoin_balance, 0),
-                    COALESCE((SELECT source FROM economy_ledger_context WHERE id = 1), 'player_insert'),
-                    (SELECT actor_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_type FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT reason FROM economy_ledger_context WHERE id = 1),
-                    (SELECT metadata FROM economy_ledger_context WHERE id = 1)
-                );
-            END;
+CREATE TRIGGER trg_economy_ledger_players_insert AFTER INSERT ON players WHEN COALESCE(NEW.jopacoin_balance, 0) != 0 BEGIN
+            INSERT INTO economy_ledger_entries (
+                guild_id, account_type, account_id, delta,
+                balance_before, balance_after, source, actor_id,
+                related_type, related_id, reason, metadata
+            )
+            SELECT
+                COALESCE(NEW.guild_id, 0), 'player', NEW.discord_id,
+                COALESCE(NEW.jopacoin_balance, 0), 0, COALESCE(NEW.jopacoin_balance, 0),
+                COALESCE(c.source, 'player_insert'),
+                c.actor_id, c.related_type, c.related_id, c.reason, c.metadata
+            FROM (SELECT 1)
+            LEFT JOIN economy_ledger_context c ON c.id = 1
+            ;
+         END;
 
 -- trigger: trg_economy_ledger_players_update
-CREATE TRIGGER trg_economy_ledger_players_update
-            AFTER UPDATE OF jopacoin_balance ON players
-            WHEN COALESCE(OLD.jopacoin_balance, 0) != COALESCE(NEW.jopacoin_balance, 0)
-            BEGIN
-                INSERT INTO economy_ledger_entries (
-                    guild_id, account_type, account_id, delta,
-                    balance_before, balance_after, source, actor_id,
-                    related_type, related_id, reason, metadata
-                )
-                VALUES (
-                    COALESCE(NEW.guild_id, 0), 'player', NEW.discord_id,
-                    COALESCE(NEW.jopacoin_balance, 0) - COALESCE(OLD.jopacoin_balance, 0),
-                    COALESCE(OLD.jopacoin_balance, 0),
-                    COALESCE(NEW.jopacoin_balance, 0),
-                    COALESCE((SELECT source FROM economy_ledger_context WHERE id = 1), 'balance_update'),
-                    (SELECT actor_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_type FROM economy_ledger_context WHERE id = 1),
-                    (SELECT related_id FROM economy_ledger_context WHERE id = 1),
-                    (SELECT reason FROM economy_ledger_context WHERE id = 1),
-                    (SELECT metadata FROM economy_ledger_context WHERE id = 1)
-                );
-            END;
+CREATE TRIGGER trg_economy_ledger_players_update AFTER UPDATE OF jopacoin_balance ON players WHEN COALESCE(OLD.jopacoin_balance, 0) != COALESCE(NEW.jopacoin_balance, 0) BEGIN
+            INSERT INTO economy_ledger_entries (
+                guild_id, account_type, account_id, delta,
+                balance_before, balance_after, source, actor_id,
+                related_type, related_id, reason, metadata
+            )
+            SELECT
+                COALESCE(NEW.guild_id, 0), 'player', NEW.discord_id,
+                COALESCE(NEW.jopacoin_balance, 0) - COALESCE(OLD.jopacoin_balance, 0), COALESCE(OLD.jopacoin_balance, 0), COALESCE(NEW.jopacoin_balance, 0),
+                COALESCE(c.source, 'balance_update'),
+                c.actor_id, c.related_type, c.related_id, c.reason, c.metadata
+            FROM (SELECT 1)
+            LEFT JOIN economy_ledger_context c ON c.id = 1
+            WHERE COALESCE(c.app_managed, 0) = 0;
+         END;
+
+-- trigger: trg_gambling_aggregates_bet_delete
+CREATE TRIGGER trg_gambling_aggregates_bet_delete
+                AFTER DELETE ON bets
+                WHEN OLD.match_id IS NOT NULL
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(OLD.guild_id, 0), OLD.discord_id);
+
+                END;
+
+-- trigger: trg_gambling_aggregates_bet_insert
+CREATE TRIGGER trg_gambling_aggregates_bet_insert
+                AFTER INSERT ON bets
+                WHEN NEW.match_id IS NOT NULL
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(NEW.guild_id, 0), NEW.discord_id);
+
+                END;
+
+-- trigger: trg_gambling_aggregates_bet_update
+CREATE TRIGGER trg_gambling_aggregates_bet_update
+                AFTER UPDATE ON bets
+                WHEN OLD.match_id IS NOT NULL OR NEW.match_id IS NOT NULL
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(NEW.guild_id, 0), NEW.discord_id);
+
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(OLD.guild_id, 0), OLD.discord_id);
+
+                END;
+
+-- trigger: trg_gambling_aggregates_match_delete
+CREATE TRIGGER trg_gambling_aggregates_match_delete
+                AFTER DELETE ON matches
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            SELECT COALESCE(guild_id, 0), discord_id
+            FROM bets
+            WHERE guild_id = COALESCE(OLD.guild_id, 0) AND match_id = OLD.match_id;
+
+                END;
+
+-- trigger: trg_gambling_aggregates_match_insert
+CREATE TRIGGER trg_gambling_aggregates_match_insert
+                AFTER INSERT ON matches
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            SELECT COALESCE(guild_id, 0), discord_id
+            FROM bets
+            WHERE guild_id = COALESCE(NEW.guild_id, 0) AND match_id = NEW.match_id;
+
+                END;
+
+-- trigger: trg_gambling_aggregates_match_result
+CREATE TRIGGER trg_gambling_aggregates_match_result
+                AFTER UPDATE OF winning_team ON matches
+                WHEN OLD.winning_team IS NOT NEW.winning_team
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            SELECT COALESCE(guild_id, 0), discord_id
+            FROM bets
+            WHERE guild_id = COALESCE(NEW.guild_id, 0) AND match_id = NEW.match_id;
+
+                END;
+
+-- trigger: trg_gambling_aggregates_tax_delete
+CREATE TRIGGER trg_gambling_aggregates_tax_delete
+                AFTER DELETE ON bet_settlement_taxes
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(OLD.guild_id, 0), OLD.discord_id);
+
+                END;
+
+-- trigger: trg_gambling_aggregates_tax_insert
+CREATE TRIGGER trg_gambling_aggregates_tax_insert
+                AFTER INSERT ON bet_settlement_taxes
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(NEW.guild_id, 0), NEW.discord_id);
+
+                END;
+
+-- trigger: trg_gambling_aggregates_tax_update
+CREATE TRIGGER trg_gambling_aggregates_tax_update
+                AFTER UPDATE ON bet_settlement_taxes
+                BEGIN
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(NEW.guild_id, 0), NEW.discord_id);
+
+
+            INSERT OR IGNORE INTO gambling_aggregate_dirty (guild_id, discord_id)
+            VALUES (COALESCE(OLD.guild_id, 0), OLD.discord_id);
+
+                END;
 
 -- trigger: trg_package_deals_games_remaining_insert_cap
 CREATE TRIGGER trg_package_deals_games_remaining_insert_cap
@@ -2303,3 +2455,78 @@ CREATE TRIGGER trg_package_deals_games_remaining_update_cap
             BEGIN
                 SELECT RAISE(ABORT, 'package deal games_remaining cannot exceed 10');
             END;
+
+-- trigger: trg_player_cache_versions_delete
+CREATE TRIGGER trg_player_cache_versions_delete
+            AFTER DELETE ON players
+            BEGIN
+
+            INSERT INTO player_cache_versions (discord_id, guild_id, version)
+            VALUES (OLD.discord_id, COALESCE(OLD.guild_id, 0), 1)
+            ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+
+            END;
+
+-- trigger: trg_player_cache_versions_insert
+CREATE TRIGGER trg_player_cache_versions_insert
+            AFTER INSERT ON players
+            BEGIN
+
+            INSERT INTO player_cache_versions (discord_id, guild_id, version)
+            VALUES (NEW.discord_id, COALESCE(NEW.guild_id, 0), 1)
+            ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+
+            END;
+
+-- trigger: trg_player_cache_versions_update
+CREATE TRIGGER trg_player_cache_versions_update
+            AFTER UPDATE ON players
+            BEGIN
+
+            INSERT INTO player_cache_versions (discord_id, guild_id, version)
+            VALUES (NEW.discord_id, COALESCE(NEW.guild_id, 0), 1)
+            ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+
+                INSERT INTO player_cache_versions (discord_id, guild_id, version)
+                SELECT OLD.discord_id, COALESCE(OLD.guild_id, 0), 1
+                WHERE OLD.discord_id IS NOT NEW.discord_id
+                   OR COALESCE(OLD.guild_id, 0) IS NOT COALESCE(NEW.guild_id, 0)
+                ON CONFLICT(guild_id, discord_id) DO UPDATE SET version = version + 1;
+            END;
+
+-- trigger: trg_prediction_book_versions_level_delete
+CREATE TRIGGER trg_prediction_book_versions_level_delete
+                AFTER DELETE ON prediction_levels
+                BEGIN
+
+            INSERT INTO prediction_book_versions (prediction_id, version)
+            VALUES (OLD.prediction_id, 1)
+            ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+
+                END;
+
+-- trigger: trg_prediction_book_versions_level_insert
+CREATE TRIGGER trg_prediction_book_versions_level_insert
+                AFTER INSERT ON prediction_levels
+                BEGIN
+
+            INSERT INTO prediction_book_versions (prediction_id, version)
+            VALUES (NEW.prediction_id, 1)
+            ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+
+                END;
+
+-- trigger: trg_prediction_book_versions_level_update
+CREATE TRIGGER trg_prediction_book_versions_level_update
+                AFTER UPDATE ON prediction_levels
+                BEGIN
+
+            INSERT INTO prediction_book_versions (prediction_id, version)
+            VALUES (NEW.prediction_id, 1)
+            ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+
+                    INSERT INTO prediction_book_versions (prediction_id, version)
+                    SELECT OLD.prediction_id, 1
+                    WHERE OLD.prediction_id IS NOT NEW.prediction_id
+                    ON CONFLICT(prediction_id) DO UPDATE SET version = version + 1;
+                END;
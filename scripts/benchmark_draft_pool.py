@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Compare the exact draft pool search with the beam search per lobby size.
+
+Each lobby is seeded: random ratings, RDs, role preferences, exclusion
+counts and last-match players. Both selectors run on it, and the beam's pool
+is rescored in lobby order (the order exhaustive and exact scoring use), so
+the gap is measured under one objective. The script fails if the exact pool
+ever scores worse than the beam's.
+
+    uv run python scripts/benchmark_draft_pool.py --sizes 13 16 20 24 --lobbies 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from domain.models.player import Player
+from shuffler import BalancedShuffler
+
+ROLES = ["1", "2", "3", "4", "5"]
+
+
+def _lobby(count: int, seed: int) -> tuple[Player, Player, list[Player], dict, set]:
+    rng = random.Random(seed)
+
+    def player(name: str) -> Player:
+        return Player(
+            name=name,
+            glicko_rating=rng.gauss(1500, 250),
+            glicko_rd=rng.uniform(50, 300),
+            preferred_roles=rng.sample(ROLES, rng.randint(1, 3)),
+            discord_id=rng.randrange(10**9),
+        )
+
+    candidates = [player(f"P{i}") for i in range(count)]
+    exclusion_counts = {p.name: rng.randint(0, 4) for p in candidates}
+    recent_match_names = {p.name for p in candidates if rng.random() < 0.4}
+    return player("CaptA"), player("CaptB"), candidates, exclusion_counts, recent_match_names
+
+
+def _timed(selector, *args, **kwargs):
+    started = time.perf_counter()
+    result = selector(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def run(sizes: list[int], lobbies: int, seed: int, workers: int | None) -> list[dict]:
+    report = []
+    for size in sizes:
+        beam_seconds, exact_seconds, gaps = [], [], []
+        for index in range(lobbies):
+            shuffler = BalancedShuffler()
+            captain_a, captain_b, candidates, exclusion_counts, recent = _lobby(
+                size, seed + 1000 * size + index
+            )
+            beam, beam_time = _timed(
+                shuffler.select_draft_pool_beam,
+                captain_a,
+                captain_b,
+                candidates,
+                exclusion_counts,
+                recent,
+            )
+            exact, exact_time = _timed(
+                shuffler.select_draft_pool_exact,
+                captain_a,
+                captain_b,
+                candidates,
+                exclusion_counts,
+                recent,
+                workers=workers,
+            )
+            beam_names = {p.name for p in beam.selected_players}
+            beam_score = shuffler._score_full_pool(
+                captain_a,
+                captain_b,
+                [p for p in candidates if p.name in beam_names],
+                [p for p in candidates if p.name not in beam_names],
+                exclusion_counts,
+                recent,
+            )
+            beam_seconds.append(beam_time)
+            exact_seconds.append(exact_time)
+            gaps.append(beam_score - exact.pool_score)
+
+        report.append(
+            {
+                "candidates": size,
+                "lobbies": lobbies,
+                "beam_seconds": round(statistics.mean(beam_seconds), 3),
+                "exact_seconds": round(statistics.mean(exact_seconds), 3),
+                "exact_seconds_max": round(max(exact_seconds), 3),
+                "beam_gap_mean": round(statistics.mean(gaps), 2),
+                "beam_gap_max": round(max(gaps), 2),
+                "beam_optimal": sum(gap <= 1e-6 for gap in gaps),
+                "exact_never_worse": min(gaps) >= -1e-6,
+            }
+        )
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[13, 16, 20, 24])
+    parser.add_argument("--lobbies", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    arguments = parser.parse_args()
+    report = run(
+        [max(8, size) for size in arguments.sizes],
+        max(1, arguments.lobbies),
+        arguments.seed,
+        arguments.workers,
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if all(row["exact_never_worse"] for row in report) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
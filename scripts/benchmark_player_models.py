@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Time and size the Player/Team hot paths for one large guild.
+
+Seeds a throwaway database with ``--players`` registered players (ratings,
+role preferences, some play-hour preferences) and reports:
+
+* ``load``: ``PlayerRepository.get_all`` wall time and the memory the
+  returned players retain;
+* ``leaderboard``: paging the Glicko leaderboard 20 rows at a time;
+* ``shuffle``: ``BalancedShuffler.shuffle`` on random 10-player lobbies drawn
+  from the loaded guild, plus the memory of the ``Team`` objects it returns.
+
+    uv run python scripts/benchmark_player_models.py --players 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from repositories.player_repository import PlayerRepository
+from shuffler import BalancedShuffler
+
+GUILD_ID = 4242
+ROLES = ["1", "2", "3", "4", "5"]
+
+
+def _seed(repo: PlayerRepository, count: int, rng: random.Random) -> None:
+    rows = []
+    for index in range(count):
+        hours = json.dumps(sorted(rng.sample(range(24), 4))) if rng.random() < 0.2 else None
+        rows.append(
+            (
+                10**15 + index,
+                GUILD_ID,
+                f"player{index}",
+                rng.randint(1000, 6000),
+                rng.randint(1000, 6000),
+                rng.randint(0, 200),
+                rng.randint(0, 200),
+                json.dumps(rng.sample(ROLES, rng.randint(1, 3))),
+                rng.choice(ROLES),
+                rng.gauss(1500, 250),
+                rng.uniform(50, 300),
+                0.06,
+                rng.gauss(25, 4),
+                rng.uniform(2, 8),
+                rng.randint(0, 500),
+                hours,
+            )
+        )
+    with repo.connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO players (
+                discord_id, guild_id, discord_username, initial_mmr, current_mmr,
+                wins, losses, preferred_roles, main_role, glicko_rating, glicko_rd,
+                glicko_volatility, os_mu, os_sigma, jopacoin_balance, dota_play_hours
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+
+def _median_seconds(action, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def _retained_bytes(factory) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    value = factory()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, retained
+
+
+def run(players: int, repeat: int, lobbies: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix="cama-player-bench-") as tmp:
+        repo = PlayerRepository(str(Path(tmp) / "bench.db"))
+        _seed(repo, players, rng)
+
+        load_seconds = _median_seconds(lambda: repo.get_all(GUILD_ID), repeat)
+        loaded, load_bytes = _retained_bytes(lambda: repo.get_all(GUILD_ID))
+
+        pages = range(0, min(players, 2000), 20)
+        leaderboard_seconds = _median_seconds(
+            lambda: [repo.get_leaderboard_by_glicko(GUILD_ID, limit=20, offset=o) for o in pages],
+            repeat,
+        )
+
+        shuffler = BalancedShuffler()
+        draws = [rng.sample(loaded, 10) for _ in range(lobbies)]
+        shuffle_seconds = _median_seconds(
+            lambda: [shuffler.shuffle(lobby) for lobby in draws], repeat
+        )
+        _teams, team_bytes = _retained_bytes(lambda: [shuffler.shuffle(lobby) for lobby in draws])
+
+    return {
+        "players": players,
+        "load": {
+            "ms": round(load_seconds * 1000, 2),
+            "retained_kib": round(load_bytes / 1024, 1),
+            "bytes_per_player": round(load_bytes / players, 1),
+        },
+        "leaderboard": {
+            "pages": len(pages),
+            "ms": round(leaderboard_seconds * 1000, 2),
+        },
+        "shuffle": {
+            "lobbies": lobbies,
+            "ms_per_lobby": round(shuffle_seconds / lobbies * 1000, 3),
+            "team_bytes_per_lobby": round(team_bytes / lobbies, 1),
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs; medians reported")
+    parser.add_argument("--lobbies", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    arguments = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    report = run(arguments.players, arguments.repeat, arguments.lobbies, arguments.seed)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
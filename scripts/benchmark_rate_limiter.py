@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare the old sliding-window rate limiter with the GCRA one.
+
+The sliding-window reference is the limiter this module used to ship: it
+keeps one timestamp per admitted event in a per-key list. Both are driven
+with the same workload (many distinct keys, several checks each) and the
+script reports microseconds per check and the memory held by the limiter.
+
+    uv run python scripts/benchmark_rate_limiter.py --keys 100000 --checks-per-key 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.rate_limiter import RateLimiter, RateLimitResult
+
+
+class SlidingWindowRateLimiter:
+    """Reference copy of the previous list-of-timestamps implementation."""
+
+    def __init__(self) -> None:
+        self._hits: dict[tuple[str, int, int], list[float]] = {}
+
+    def check(
+        self, *, scope: str, guild_id: int, user_id: int, limit: int, per_seconds: int
+    ) -> RateLimitResult:
+        now = time.monotonic()
+        key = (scope, guild_id, user_id)
+        window_start = now - per_seconds
+
+        hits = self._hits.get(key, [])
+        hits = [t for t in hits if t >= window_start]
+
+        if len(hits) >= limit:
+            oldest = min(hits)
+            retry_after = math.ceil(max(0.0, (oldest + per_seconds) - now))
+            self._hits[key] = hits
+            return RateLimitResult(allowed=False, retry_after_seconds=retry_after)
+
+        hits.append(now)
+        self._hits[key] = hits
+        return RateLimitResult(allowed=True, retry_after_seconds=0)
+
+
+def _drive(limiter, keys: int, checks_per_key: int, limit: int) -> int:
+    allowed = 0
+    for _round in range(checks_per_key):
+        for user_id in range(keys):
+            result = limiter.check(
+                scope="bench", guild_id=1, user_id=user_id, limit=limit, per_seconds=60
+            )
+            allowed += result.allowed
+    return allowed
+
+
+def _measure(factory, keys: int, checks_per_key: int, limit: int) -> dict:
+    # Timing and memory are taken in separate runs: tracemalloc's per-allocation
+    # hook would otherwise dominate the timings.
+    gc.collect()
+    started = time.perf_counter()
+    allowed = _drive(factory(), keys, checks_per_key, limit)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    limiter = factory()
+    _drive(limiter, keys, checks_per_key, limit)
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    checks = keys * checks_per_key
+    return {
+        "checks": checks,
+        "allowed": allowed,
+        "us_per_check": round(elapsed / checks * 1e6, 3),
+        "retained_mib": round(retained / 2**20, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--checks-per-key", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=5, help="events allowed per key per window")
+    arguments = parser.parse_args()
+
+    args = (arguments.keys, arguments.checks_per_key, arguments.limit)
+    print(
+        json.dumps(
+            {
+                "sliding_window": _measure(SlidingWindowRateLimiter, *args),
+                "gcra": _measure(RateLimiter, *args),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Run one SQLite maintenance pass and print its report.
+
+The bot runs the same pass on its own schedule (``DB_MAINTENANCE_*`` in
+config). Run this by hand to see what a pass would do to a database, or with
+``--enable-incremental-vacuum`` to convert a database created before
+incremental auto-vacuum was the default. The conversion rewrites the whole
+file with ``VACUUM`` and blocks the bot for its duration: stop the bot first.
+
+    uv run python scripts/db_maintenance.py data/cama_shuffle.db
+    uv run python scripts/db_maintenance.py data/cama_shuffle.db --enable-incremental-vacuum
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from repositories.maintenance_repository import MaintenanceRepository
+from services.database_maintenance_service import DatabaseMaintenanceService
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", type=Path)
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="convert to auto_vacuum=INCREMENTAL (full VACUUM; bot must be stopped)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="run even while a lobby or match is live"
+    )
+    parser.add_argument("--max-lock-ms", type=int, default=None)
+    arguments = parser.parse_args()
+
+    if not arguments.database.exists():
+        parser.error(f"{arguments.database} does not exist")
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    repo = MaintenanceRepository(str(arguments.database))
+    if arguments.enable_incremental_vacuum:
+        repo.enable_incremental_vacuum()
+
+    options = {}
+    if arguments.max_lock_ms is not None:
+        options["max_lock_ms"] = arguments.max_lock_ms
+    report = DatabaseMaintenanceService(repo, **options).run(force=arguments.force)
+    if report is None:
+        print(json.dumps({"skipped": "a lobby or match is live; use --force to run anyway"}))
+        return 1
+    print(json.dumps(report.as_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
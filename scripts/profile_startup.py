@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Measure bot cold start against a copy of a production-shaped snapshot.
+
+Each run starts a fresh interpreter on a disposable copy of the snapshot and
+performs the bot's startup work without connecting to Discord:
+
+* ``eager`` loads every extension before the gateway could connect (the
+  startup this bot used to have);
+* ``deferred`` runs the real ``setup_hook``: core extensions first, the rest
+  in the background.
+
+``time_to_first_command_ms`` is the later of ``core_commands_loaded`` and
+``gateway_ready``, the bot's ``commands_available`` milestone. The gateway
+connect is stood in for by ``--gateway-connect-ms`` of sleep that starts
+when the gateway would (after ``setup_hook``, or after every extension in
+eager mode), so a background load that stalls the loop also delays READY.
+The deferred mode also reports the longest event-loop stall while the
+background load runs, which bounds how long a core command could wait
+behind it. ``--cold-bytecode``
+hides every cached ``.pyc`` so each run compiles from source, like the first
+start of a freshly built image.
+
+    uv run python scripts/profile_startup.py data/cama_shuffle.db --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+MODES = ("eager", "deferred")
+
+
+async def _watch_loop(stalls: list[float], interval: float = 0.005) -> None:
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(time.perf_counter() - started - interval)
+
+
+async def _child(mode: str, gateway_connect_ms: float) -> dict:
+    import bot
+
+    profile = bot.startup_profile
+    stalls: list[float] = []
+
+    async def connect_gateway() -> None:
+        await asyncio.sleep(gateway_connect_ms / 1000)
+        profile.mark("gateway_ready")
+        bot._mark_commands_available()
+
+    try:
+        if mode == "eager":
+            with profile.phase("services"):
+                bot._init_services()
+            with profile.phase("extensions"):
+                await bot._load_extensions()
+            profile.mark("core_commands_loaded")
+            profile.mark("all_commands_loaded")
+            await connect_gateway()
+        else:
+            await bot.setup_hook()
+            watcher = asyncio.create_task(_watch_loop(stalls))
+            await asyncio.gather(connect_gateway(), bot._deferred_extensions_task)
+            watcher.cancel()
+        snapshot = profile.snapshot()
+        return {
+            "time_to_first_command_ms": snapshot["milestones_ms"]["commands_available"],
+            "all_commands_loaded_ms": snapshot["milestones_ms"]["all_commands_loaded"],
+            "max_loop_stall_ms": round(max(stalls, default=0.0) * 1000, 1),
+            "commands": len(bot.bot.tree.get_commands()),
+            **snapshot,
+        }
+    finally:
+        await bot.bot.close()
+
+
+def _copy_snapshot(source: Path, destination: Path) -> None:
+    with sqlite3.connect(f"file:{quote(str(source.resolve()))}?mode=ro", uri=True) as src:
+        with sqlite3.connect(destination) as dst:
+            src.backup(dst)
+
+
+def _run(
+    mode: str,
+    snapshot: Path,
+    workdir: Path,
+    index: int,
+    *,
+    cold_bytecode: bool,
+    gateway_connect_ms: float,
+) -> dict:
+    db_path = workdir / f"{mode}-{index}.db"
+    _copy_snapshot(snapshot, db_path)
+    env = {**os.environ, "DB_PATH": str(db_path)}
+    if cold_bytecode:
+        # An empty cache prefix that is never written to.
+        env["PYTHONPYCACHEPREFIX"] = str(workdir / f"pycache-{mode}-{index}")
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            mode,
+            "--gateway-connect-ms",
+            str(gateway_connect_ms),
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{mode} run failed:\n{completed.stderr[-4000:]}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _summarize(runs: list[dict]) -> dict:
+    keys = ("time_to_first_command_ms", "all_commands_loaded_ms", "max_loop_stall_ms")
+    summary = {key: round(statistics.median(run[key] for run in runs), 1) for key in keys}
+    summary["commands"] = runs[-1]["commands"]
+    summary["phases_ms"] = runs[-1]["phases_ms"]
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("snapshot", nargs="?", type=Path, help="SQLite snapshot (read-only)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode; medians reported")
+    parser.add_argument(
+        "--cold-bytecode", action="store_true", help="compile every module from source"
+    )
+    parser.add_argument(
+        "--gateway-connect-ms",
+        type=float,
+        default=300.0,
+        help="simulated Discord gateway connect time",
+    )
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.child:
+        # Logging goes to stderr; the last stdout line is the result.
+        print(json.dumps(asyncio.run(_child(arguments.child, arguments.gateway_connect_ms))))
+        return 0
+    if arguments.snapshot is None:
+        parser.error("snapshot is required")
+
+    with tempfile.TemporaryDirectory(prefix="cama-startup-") as tmp:
+        workdir = Path(tmp)
+        runs: dict[str, list[dict]] = {mode: [] for mode in MODES}
+        # Interleave modes so drift (page cache, CPU frequency) hits both alike.
+        for index in range(arguments.repeat):
+            for mode in MODES:
+                runs[mode].append(
+                    _run(
+                        mode,
+                        arguments.snapshot,
+                        workdir,
+                        index,
+                        cold_bytecode=arguments.cold_bytecode,
+                        gateway_connect_ms=arguments.gateway_connect_ms,
+                    )
+                )
+
+    report = {mode: _summarize(mode_runs) for mode, mode_runs in runs.items()}
+    report["time_to_first_command_saved_ms"] = round(
+        report["eager"]["time_to_first_command_ms"]
+        - report["deferred"]["time_to_first_command_ms"],
+        1,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
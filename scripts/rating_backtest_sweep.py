@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Sweep Glicko-2 / OpenSkill parameters over a database's full match history.
+
+Every combination of the given values is replayed from the MMR seeds and
+scored on its own pre-match predictions (Brier, log-loss, accuracy,
+calibration). Opening the database runs pending schema migrations, so point
+the script at a copy of the production snapshot, not the live file.
+
+    uv run python scripts/rating_backtest_sweep.py --db snapshot.db \\
+        --initial-rd 250 300 350 --rd-decay 50 100 150 \\
+        --os-beta 3 4.1667 5 --os-tau 0.05 0.0833 0.15 --top 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Running a script by path puts ``scripts/`` on sys.path, not the project root.
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from repositories.match_repository import MatchRepository
+from services.rating_backtest_service import (
+    GLICKO_FIELDS,
+    OPENSKILL_FIELDS,
+    RatingBacktestService,
+    parameter_grid,
+    run_backtest,
+)
+
+# CLI flag -> BacktestParams field.
+AXES = {
+    "initial_rd": "initial_rd",
+    "volatility": "volatility",
+    "rd_decay": "rd_decay_constant",
+    "rd_grace_days": "rd_decay_grace_days",
+    "base_delta": "base_delta_multiplier",
+    "os_beta": "os_beta",
+    "os_tau": "os_tau",
+    "os_sigma_decay": "os_sigma_decay_per_week",
+    "os_grace_days": "os_sigma_decay_grace_days",
+    "os_performance_strength": "os_performance_strength",
+    "os_temperature": "os_temperature",
+}
+
+
+def _ranked(results, system: str, keys: tuple[str, ...], top: int) -> list[dict]:
+    best: dict[tuple, dict] = {}
+    for result in results:
+        stats = getattr(result, system)
+        setting = result.params.as_dict()
+        key = tuple(setting[name] for name in keys)
+        best[key] = {
+            "params": {name: setting[name] for name in keys},
+            "brier_score": round(stats.brier_score, 6),
+            "log_loss": round(stats.log_loss, 6),
+            "accuracy": round(stats.accuracy, 4),
+            "calibration": {
+                label: [
+                    round(bucket["avg_predicted"], 3),
+                    round(bucket["actual_rate"], 3),
+                    bucket["count"],
+                ]
+                for label, bucket in stats.calibration_buckets.items()
+                if bucket["count"]
+            },
+        }
+    return sorted(best.values(), key=lambda row: (row["brier_score"], row["log_loss"]))[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", required=True, help="path to a copy of the bot database")
+    parser.add_argument("--guild-id", type=int, default=None)
+    for flag in AXES:
+        parser.add_argument(f"--{flag.replace('_', '-')}", type=float, nargs="+")
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--top", type=int, default=10)
+    arguments = parser.parse_args()
+
+    axes = {
+        field: getattr(arguments, flag)
+        for flag, field in AXES.items()
+        if getattr(arguments, flag) is not None
+    }
+    grid = parameter_grid(**axes)
+
+    started = time.perf_counter()
+    history = RatingBacktestService(MatchRepository(arguments.db)).load_history(
+        arguments.guild_id
+    )
+    loaded = time.perf_counter()
+    results = run_backtest(history, grid, workers=arguments.workers)
+    finished = time.perf_counter()
+
+    top = max(1, arguments.top)
+    print(
+        json.dumps(
+            {
+                "matches": history.match_count,
+                "skipped": len(history.skipped),
+                "settings": len(grid),
+                "load_seconds": round(loaded - started, 3),
+                "sweep_seconds": round(finished - loaded, 3),
+                "glicko": _ranked(results, "glicko", GLICKO_FIELDS, top),
+                "openskill": _ranked(results, "openskill", OPENSKILL_FIELDS, top),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
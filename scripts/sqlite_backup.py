@@ -1,5 +1,12 @@
 #!/usr/bin/env python3
-"""Create and verify an atomic SQLite online backup for deployment."""
+"""Create and verify an atomic SQLite online backup for deployment.
+
+``backup`` writes one self-contained database file. ``backup_chunked`` copies
+the database in small paced steps so the bot's writers are never locked out
+for long, then stores the snapshot as content-addressed chunks beside a JSON
+manifest; consecutive backups into the same directory only write the chunks
+whose pages changed. ``sqlite_restore.restore_chunked`` reassembles one.
+"""
 
 from __future__ import annotations
 
@@ -102,13 +109,241 @@ def backup(source_path: Path, destination_path: Path) -> dict[str, object]:
         raise
 
 
+CHUNK_DIRECTORY = "chunks"
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_PAGES_PER_STEP = 256
+DEFAULT_STEP_PAUSE_SECONDS = 0.01
+# Paced copies restarted by source writes before falling back to one
+# unpaced copy, which holds the read lock until it finishes.
+DEFAULT_MAX_RESTARTS = 3
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+def chunk_path(store: Path, digest: str) -> Path:
+    return store / digest[:2] / digest
+
+
+def _paced_snapshot(
+    source_path: Path,
+    snapshot_path: Path,
+    pages_per_step: int,
+    step_pause_seconds: float,
+    max_restarts: int = DEFAULT_MAX_RESTARTS,
+) -> tuple[int, int]:
+    """Copy the database to ``snapshot_path`` ``pages_per_step`` pages at a time.
+
+    Each step holds the source's read lock only briefly, and the pause between
+    steps lets writers in. SQLite restarts the copy if the source changes
+    mid-way, so the result is always one consistent snapshot. Under constant
+    writes that could go on forever: after ``max_restarts`` restarts the copy
+    is redone in a single step. Returns ``(page_size, migration_count)``.
+    """
+    source = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True, timeout=30)
+    snapshot = sqlite3.connect(snapshot_path)
+    try:
+        # The snapshot is scratch space; a rollback journal would only be
+        # one more file to clean up.
+        snapshot.execute("PRAGMA journal_mode = OFF")
+        restarts = 0
+        last_remaining = None
+
+        def pace(_status: int, remaining: int, _total: int) -> None:
+            nonlocal restarts, last_remaining
+            if last_remaining is not None and remaining >= last_remaining:
+                restarts += 1
+                if restarts > max_restarts:
+                    raise _TooManyRestarts
+            last_remaining = remaining
+            if remaining and step_pause_seconds > 0:
+                time.sleep(step_pause_seconds)
+
+        try:
+            source.backup(snapshot, pages=max(1, pages_per_step), progress=pace)
+        except _TooManyRestarts:
+            source.backup(snapshot)
+
+        page_size = int(snapshot.execute("PRAGMA page_size").fetchone()[0])
+        quick_check = snapshot.execute("PRAGMA quick_check").fetchone()
+        if quick_check != ("ok",):
+            raise RuntimeError(f"backup quick_check failed: {quick_check!r}")
+        migration_count = snapshot.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0]
+        return page_size, migration_count
+    finally:
+        snapshot.close()
+        source.close()
+
+
+def _store_chunk(store: Path, digest: str, data: bytes) -> bool:
+    """Write one chunk unless the store already has it; return whether it wrote."""
+    path = chunk_path(store, digest)
+    if path.exists():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(f".{digest}.{os.getpid()}.partial")
+    try:
+        with partial_path.open("xb") as output:
+            output.write(data)
+        try:
+            os.link(partial_path, path)
+        except FileExistsError:
+            # A concurrent backup stored the same content first.
+            return False
+        return True
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+
+def backup_chunked(
+    source_path: Path,
+    manifest_path: Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+    step_pause_seconds: float = DEFAULT_STEP_PAUSE_SECONDS,
+    max_restarts: int = DEFAULT_MAX_RESTARTS,
+) -> dict[str, object]:
+    """Back up ``source_path`` as chunks under ``manifest_path.parent / "chunks"``.
+
+    The snapshot goes to a temporary file beside the manifest and is read
+    back one chunk at a time, so memory stays at one chunk whatever the
+    database size; only chunks not already in the store are written. Chunks
+    are page aligned, so an unchanged page range maps to the same chunk in
+    every backup.
+    """
+    source_path = source_path.resolve(strict=True)
+    manifest_path = manifest_path.resolve(strict=False)
+    if manifest_path.exists():
+        raise FileExistsError(f"refusing to overwrite backup manifest: {manifest_path}")
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.partial")
+    if partial_path.exists():
+        raise FileExistsError(f"partial backup manifest already exists: {partial_path}")
+    snapshot_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.snapshot")
+    if snapshot_path.exists():
+        raise FileExistsError(f"backup snapshot already exists: {snapshot_path}")
+
+    started_at = int(time.time())
+    store = manifest_path.parent / CHUNK_DIRECTORY
+    digests = []
+    chunks_written = 0
+    bytes_written = 0
+    size_bytes = 0
+    image_digest = hashlib.sha256()
+    try:
+        page_size, migration_count = _paced_snapshot(
+            source_path, snapshot_path, pages_per_step, step_pause_seconds, max_restarts
+        )
+        chunk_size = max(page_size, chunk_size // page_size * page_size)
+        with snapshot_path.open("rb") as snapshot:
+            for data in iter(lambda: snapshot.read(chunk_size), b""):
+                image_digest.update(data)
+                size_bytes += len(data)
+                digest = hashlib.sha256(data).hexdigest()
+                if _store_chunk(store, digest, data):
+                    chunks_written += 1
+                    bytes_written += len(data)
+                digests.append(digest)
+    finally:
+        snapshot_path.unlink(missing_ok=True)
+
+    metadata = {
+        "format_version": 2,
+        "source": str(source_path),
+        "backup": str(manifest_path),
+        "created_at_unix": started_at,
+        "size_bytes": size_bytes,
+        "sha256": image_digest.hexdigest(),
+        "quick_check": "ok",
+        "schema_migration_count": migration_count,
+        "page_size": page_size,
+        "chunk_size": chunk_size,
+        "chunk_directory": CHUNK_DIRECTORY,
+        "chunks": digests,
+    }
+    try:
+        with partial_path.open("x", encoding="utf-8") as output:
+            json.dump(metadata, output, sort_keys=True)
+            output.write("\n")
+        # Same no-overwrite publication as ``backup``.
+        os.link(partial_path, manifest_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+    return {**metadata, "chunks_written": chunks_written, "bytes_written": bytes_written}
+
+
+def prune_chunked_backups(directory: Path, keep: int) -> dict[str, int]:
+    """Keep the newest ``keep`` manifests in ``directory`` and drop orphaned chunks.
+
+    Must not run while another backup is writing into the same directory: a
+    chunk it is about to reference could be collected first.
+    """
+    manifests = []
+    for path in directory.glob("*.json"):
+        try:
+            metadata = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(metadata, dict) and metadata.get("format_version") == 2:
+            manifests.append((int(metadata["created_at_unix"]), path.name, path, metadata))
+    manifests.sort(reverse=True)
+
+    retained: set[str] = set()
+    removed_manifests = 0
+    for index, (_created, _name, path, metadata) in enumerate(manifests):
+        if index < max(keep, 1):
+            retained.update(metadata["chunks"])
+        else:
+            path.unlink()
+            removed_manifests += 1
+
+    removed_chunks = 0
+    store = directory / CHUNK_DIRECTORY
+    if store.is_dir():
+        for path in store.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            if path.name not in retained:
+                path.unlink()
+                removed_chunks += 1
+    return {"removed_manifests": removed_manifests, "removed_chunks": removed_chunks}
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("source", type=Path)
-    parser.add_argument("destination", type=Path)
+    parser.add_argument(
+        "destination",
+        type=Path,
+        help="backup file, or with --chunked the manifest to write (chunks go beside it)",
+    )
+    parser.add_argument("--chunked", action="store_true", help="paced, deduplicated backup")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--pages-per-step", type=int, default=DEFAULT_PAGES_PER_STEP)
+    parser.add_argument("--step-pause", type=float, default=DEFAULT_STEP_PAUSE_SECONDS)
+    parser.add_argument("--max-restarts", type=int, default=DEFAULT_MAX_RESTARTS)
+    parser.add_argument(
+        "--keep", type=int, default=None, help="with --chunked, manifests to retain"
+    )
     arguments = parser.parse_args()
     try:
-        metadata = backup(arguments.source, arguments.destination)
+        if arguments.chunked:
+            metadata = backup_chunked(
+                arguments.source,
+                arguments.destination,
+                chunk_size=arguments.chunk_size,
+                pages_per_step=arguments.pages_per_step,
+                step_pause_seconds=arguments.step_pause,
+                max_restarts=arguments.max_restarts,
+            )
+            if arguments.keep is not None:
+                metadata["pruned"] = prune_chunked_backups(
+                    arguments.destination.resolve().parent, arguments.keep
+                )
+        else:
+            metadata = backup(arguments.source, arguments.destination)
     except (OSError, RuntimeError, sqlite3.Error) as error:
         print(f"backup failed: {error}", file=sys.stderr)
         return 1
@@ -17,10 +17,13 @@ import json
 import os
 import sqlite3
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import BinaryIO
 from urllib.parse import quote
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
 
 def sha256(path: Path) -> str:
     digest = hashlib.sha256()
@@ -75,6 +78,53 @@ def _load_metadata(backup_path: Path, destination_path: Path) -> dict[str, objec
     return metadata
 
 
+def _load_chunked_manifest(manifest_path: Path, destination_path: Path) -> dict[str, object]:
+    metadata = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if not isinstance(metadata, dict) or metadata.get("format_version") != 2:
+        raise RuntimeError("unsupported or malformed chunked backup manifest")
+    if metadata.get("backup") != str(manifest_path):
+        raise RuntimeError("backup manifest path does not match the restore source")
+    if metadata.get("source") != str(destination_path):
+        raise RuntimeError("backup metadata source does not match the restore destination")
+    if metadata.get("quick_check") != "ok":
+        raise RuntimeError("backup metadata does not contain a successful quick_check")
+    expected_size = metadata.get("size_bytes")
+    expected_digest = metadata.get("sha256")
+    expected_migrations = metadata.get("schema_migration_count")
+    chunks = metadata.get("chunks")
+    chunk_directory = metadata.get("chunk_directory")
+    if not isinstance(expected_size, int) or expected_size <= 0:
+        raise RuntimeError("backup metadata has an invalid size")
+    if not isinstance(expected_digest, str) or len(expected_digest) != 64:
+        raise RuntimeError("backup metadata has an invalid SHA-256 digest")
+    if not isinstance(expected_migrations, int) or expected_migrations < 0:
+        raise RuntimeError("backup metadata has an invalid migration count")
+    if not isinstance(chunks, list) or not all(
+        isinstance(digest, str) and len(digest) == 64 and set(digest) <= _HEX_DIGITS
+        for digest in chunks
+    ):
+        raise RuntimeError("backup manifest has an invalid chunk list")
+    if not isinstance(chunk_directory, str) or Path(chunk_directory).name != chunk_directory:
+        raise RuntimeError("backup manifest has an invalid chunk directory")
+    return metadata
+
+
+def _materialize_chunks(
+    manifest_path: Path, destination: Path, metadata: dict[str, object]
+) -> None:
+    store = manifest_path.parent / str(metadata["chunk_directory"])
+    with destination.open("xb") as output_file:
+        for digest in metadata["chunks"]:
+            data = (store / digest[:2] / digest).read_bytes()
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise RuntimeError(f"backup chunk {digest} does not match its digest")
+            output_file.write(data)
+        output_file.flush()
+        os.fsync(output_file.fileno())
+    if destination.stat().st_size != metadata["size_bytes"]:
+        raise RuntimeError("reassembled backup size does not match its metadata")
+
+
 def _copy_and_sync(source: Path, destination: Path) -> None:
     with source.open("rb") as input_file, destination.open("xb") as output_file:
         for chunk in iter(lambda: input_file.read(1024 * 1024), b""):
@@ -91,6 +141,25 @@ def _acquire_runtime_lock(lock_file: BinaryIO) -> None:
 
 
 def restore(backup: Path, destination: Path) -> dict[str, object]:
+    return _restore(
+        backup,
+        destination,
+        _load_metadata,
+        lambda backup_path, partial_path, _metadata: _copy_and_sync(backup_path, partial_path),
+    )
+
+
+def restore_chunked(manifest: Path, destination: Path) -> dict[str, object]:
+    """Restore a ``sqlite_backup.backup_chunked`` manifest byte for byte."""
+    return _restore(manifest, destination, _load_chunked_manifest, _materialize_chunks)
+
+
+def _restore(
+    backup: Path,
+    destination: Path,
+    load_metadata: Callable[[Path, Path], dict[str, object]],
+    materialize: Callable[[Path, Path, dict[str, object]], None],
+) -> dict[str, object]:
     if backup.is_symlink() or destination.is_symlink():
         raise RuntimeError("backup and destination must not be symbolic links")
     backup_path = backup.resolve(strict=True)
@@ -117,10 +186,10 @@ def restore(backup: Path, destination: Path) -> dict[str, object]:
     with lock_path.open("a+b") as lock_file:
         _acquire_runtime_lock(lock_file)
         try:
-            metadata = _load_metadata(backup_path, destination_path)
+            metadata = load_metadata(backup_path, destination_path)
             expected_digest = str(metadata["sha256"])
             expected_migrations = int(metadata["schema_migration_count"])
-            _copy_and_sync(backup_path, partial_path)
+            materialize(backup_path, partial_path, metadata)
             if sha256(partial_path) != expected_digest:
                 raise RuntimeError("copied restore candidate does not match backup SHA-256")
             _verify_sqlite(partial_path, expected_migrations)
@@ -156,9 +225,15 @@ def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("backup", type=Path)
     parser.add_argument("destination", type=Path)
+    parser.add_argument(
+        "--chunked", action="store_true", help="backup is a chunked backup manifest"
+    )
     arguments = parser.parse_args()
     try:
-        report = restore(arguments.backup, arguments.destination)
+        if arguments.chunked:
+            report = restore_chunked(arguments.backup, arguments.destination)
+        else:
+            report = restore(arguments.backup, arguments.destination)
     except (OSError, RuntimeError, ValueError, json.JSONDecodeError, sqlite3.Error) as error:
         print(f"restore failed: {error}", file=sys.stderr)
         return 1
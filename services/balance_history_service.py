@@ -17,6 +17,33 @@ SOURCE_TIPS = "tips"
 SOURCE_DISBURSE = "disburse"
 SOURCE_BONUS = "bonus"
 SOURCE_DIG = "dig"
+SOURCE_OTHER = "other"
+
+# Ledger ``source`` prefixes → chart source. Ledger sources not listed here
+# (shop, loans, taxes, admin grants, un-tagged updates...) chart as "other".
+_LEDGER_SOURCE_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("bet", SOURCE_BETS),
+    ("dota_bet", SOURCE_BETS),
+    ("prediction", SOURCE_PREDICTIONS),
+    ("gamba", SOURCE_WHEEL),
+    ("tip", SOURCE_TIPS),
+    ("disburse", SOURCE_DISBURSE),
+    ("match", SOURCE_BONUS),
+    ("first_game_pool", SOURCE_BONUS),
+    ("dig", SOURCE_DIG),
+    ("boss_drop", SOURCE_DIG),
+)
+
+# The chart is 580px wide; more points than this only overplot.
+CHART_MAX_POINTS = 600
+
+
+def chart_source_for(ledger_source: str | None) -> str:
+    """Map an economy-ledger ``source`` onto the chart's source buckets."""
+    for prefix, chart_source in _LEDGER_SOURCE_PREFIXES:
+        if ledger_source and ledger_source.startswith(prefix):
+            return chart_source
+    return SOURCE_OTHER
 
 
 @dataclass
@@ -46,6 +73,15 @@ class BalanceHistoryService:
     streaming / exclusion / bomb-pot bonuses, cancelled-match refunds,
     dig cave-in losses, per-dig paid costs) are silently omitted — the series starts
     at 0 and does not pretend to equal live balance.
+
+    When a ``ledger_repo`` is supplied the series is read from the economy
+    ledger instead: one indexed range scan over the player's entries,
+    downsampled to chart resolution in SQL. Every balance change is covered
+    (sources without a chart colour fall under ``other``), so the series
+    tracks the real balance. Players who already had a balance when the
+    ledger was created keep their per-source history up to its
+    ``ledger_backfill`` row from the collectors above; an ``other`` step at
+    that row then brings the series to the backfilled balance.
     """
 
     def __init__(
@@ -57,6 +93,7 @@ class BalanceHistoryService:
         disburse_repo,
         tip_repo,
         dig_repo=None,
+        ledger_repo=None,
     ):
         self.bet_repo = bet_repo
         self.match_repo = match_repo
@@ -65,6 +102,7 @@ class BalanceHistoryService:
         self.disburse_repo = disburse_repo
         self.tip_repo = tip_repo
         self.dig_repo = dig_repo
+        self.ledger_repo = ledger_repo
 
     def get_balance_event_series(
         self, discord_id: int, guild_id: int | None = None
@@ -80,6 +118,18 @@ class BalanceHistoryService:
         ``per_source_totals``: ``{source: net_delta}`` for sources with a non-zero
         total. Matches are empty if the player has no recorded activity anywhere.
         """
+        if self.ledger_repo is not None:
+            backfill = self.ledger_repo.get_opening_backfill(guild_id, "player", discord_id)
+            legacy = (
+                []
+                if backfill is None
+                else [
+                    event
+                    for collector in self._event_collectors()
+                    for event in collector(discord_id, guild_id)
+                ]
+            )
+            return self._ledger_series(discord_id, guild_id, backfill, legacy)
         events = [
             event
             for collector in self._event_collectors()
@@ -91,6 +141,23 @@ class BalanceHistoryService:
         self, discord_id: int, guild_id: int | None = None
     ) -> tuple[list[tuple[int, int, dict]], dict[str, int]]:
         """Load independent balance sources concurrently for async callers."""
+        if self.ledger_repo is not None:
+            backfill = await asyncio.to_thread(
+                self.ledger_repo.get_opening_backfill, guild_id, "player", discord_id
+            )
+            legacy = (
+                []
+                if backfill is None
+                else await self._collect_events_async(discord_id, guild_id)
+            )
+            return await asyncio.to_thread(
+                self._ledger_series, discord_id, guild_id, backfill, legacy
+            )
+        return self._merge_events(await self._collect_events_async(discord_id, guild_id))
+
+    async def _collect_events_async(
+        self, discord_id: int, guild_id: int | None
+    ) -> list[_Event]:
         source_events = await asyncio.gather(
             *(
                 asyncio.to_thread(collector, discord_id, guild_id)
@@ -99,9 +166,76 @@ class BalanceHistoryService:
         )
         # ``gather`` retains collector order, so equal-timestamp events keep the
         # same stable ordering as the synchronous implementation.
-        return self._merge_events(
-            [event for events in source_events for event in events]
+        return [event for events in source_events for event in events]
+
+    def get_balance_entries_page(
+        self,
+        discord_id: int,
+        guild_id: int | None = None,
+        *,
+        after: tuple[int, int] | None = None,
+        limit: int = 50,
+    ) -> tuple[list[dict], tuple[int, int] | None]:
+        """Oldest-first ledger entries for a player with a keyset cursor for the next page."""
+        if self.ledger_repo is None:
+            return [], None
+        return self.ledger_repo.get_account_entries_page(
+            guild_id, "player", discord_id, after=after, limit=limit
+        )
+
+    def _ledger_series(
+        self,
+        discord_id: int,
+        guild_id: int | None,
+        backfill: dict | None,
+        legacy: list[_Event],
+    ) -> tuple[list[tuple[int, int, dict]], dict[str, int]]:
+        prefix: list[_Event] = []
+        after = None
+        if backfill is not None:
+            cutoff = int(backfill["created_at"])
+            prefix = [event for event in legacy if event.time <= cutoff]
+            unrecorded = int(backfill["balance_after"]) - sum(e.delta for e in prefix)
+            if unrecorded:
+                prefix.append(
+                    _Event(
+                        time=cutoff,
+                        delta=unrecorded,
+                        source=SOURCE_OTHER,
+                        detail={"ledger_source": "ledger_backfill", "entries": 1},
+                    )
+                )
+            after = (cutoff, backfill["ledger_id"])
+        series, totals = self._merge_events(prefix)
+        base = series[-1][1] if series else 0
+        data = self.ledger_repo.get_account_series(
+            guild_id,
+            "player",
+            discord_id,
+            after=after,
+            max_points=max(2, CHART_MAX_POINTS - len(series)),
+        )
+        opening = data["opening_balance"]
+        series.extend(
+            (
+                idx,
+                base + point["balance"] - opening,
+                {
+                    "time": point["time"],
+                    "delta": point["delta"],
+                    "source": chart_source_for(point["source"]),
+                    "detail": {
+                        "ledger_source": point["source"],
+                        "entries": point["entry_count"],
+                    },
+                },
+            )
+            for idx, point in enumerate(data["points"], start=len(series) + 1)
         )
+        for ledger_source, net in data["source_totals"].items():
+            chart_source = chart_source_for(ledger_source)
+            totals[chart_source] = totals.get(chart_source, 0) + net
+        return series, {src: total for src, total in totals.items() if total != 0}
 
     def _event_collectors(self):
         return (
@@ -34,6 +34,7 @@ from domain.pet_evolution import PetActivity
 from repositories.bet_repository import BetRepository
 from repositories.player_repository import PlayerRepository
 from utils.economy_scaling import adjust_generated_jc_reward
+from utils.effect_cache import effect_request_scoped
 
 if TYPE_CHECKING:
     from services.bankruptcy_service import BankruptcyService
@@ -311,6 +312,7 @@ class BettingService:
             results[pid] = result
         return results
 
+    @effect_request_scoped
     def settle_bets(
         self,
         match_id: int,
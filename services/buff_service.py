@@ -13,6 +13,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 from utils.economy_scaling import scale_minigame_jc_delta
+from utils.effect_cache import EFFECT_NAMESPACE_BUFF, scoped_lookup
 
 logger = logging.getLogger("cama_bot.services.buff")
 
@@ -185,6 +186,13 @@ class BuffService:
 
     def has_pvp_immunity(self, discord_id: int, guild_id: int | None) -> bool:
         """Counterspell or Sanctuary covers non-JC PvP attacks for 24h."""
+        return scoped_lookup(
+            EFFECT_NAMESPACE_BUFF,
+            ("pvp_immunity", guild_id if guild_id is not None else 0, discord_id),
+            lambda: self._load_pvp_immunity(discord_id, guild_id),
+        )
+
+    def _load_pvp_immunity(self, discord_id: int, guild_id: int | None) -> bool:
         if self.buff_repo.has_active(discord_id, guild_id, BUFF_COUNTERSPELL):
             return True
         # Sanctuary protects both caster and ally. Its JC capacity is consumed
@@ -215,7 +223,11 @@ class BuffService:
         return False
 
     def has_overgrowth(self, discord_id: int, guild_id: int | None) -> bool:
-        return self.buff_repo.has_active(discord_id, guild_id, BUFF_OVERGROWTH)
+        return scoped_lookup(
+            EFFECT_NAMESPACE_BUFF,
+            ("overgrowth", guild_id if guild_id is not None else 0, discord_id),
+            lambda: self.buff_repo.has_active(discord_id, guild_id, BUFF_OVERGROWTH),
+        )
 
     def consume_overgrowth_charge(self, discord_id: int, guild_id: int | None) -> bool:
         return self.buff_repo.consume_data_charge_atomic(
@@ -9,11 +9,11 @@ queued in once the window starts.
 
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 
 from domain.models.curfew import CurfewWindow
 from domain.models.lobby import LobbyKind
-from utils.curfew import find_active_window
+from utils.curfew import find_active_window, next_window_start
 from utils.timezone import is_valid_timezone
 
 logger = logging.getLogger("cama_bot.curfew_service")
@@ -124,18 +124,58 @@ class CurfewService:
                 kicks.extend(self._sweep_lobby(guild_id, lobby_kind, now))
         return kicks
 
-    def _sweep_lobby(
-        self, guild_id: int, lobby_kind: LobbyKind, now: datetime | None
-    ) -> list[CurfewKick]:
+    def next_sweep_at(self, guild_ids: list[int], *, now: datetime | None = None) -> int | None:
+        """Earliest time a window starts for anyone queued in one of these guilds' lobbies.
+
+        A queued player already inside a window makes the sweep due ``now``.
+        Returns None when no queued player has a window.
+        """
+        due: list[int] = []
+        for guild_id in guild_ids:
+            for lobby_kind in (LobbyKind.OPEN, LobbyKind.LOWSKILL):
+                lobby = self._load_lobby(guild_id, lobby_kind)
+                if lobby and lobby.players:
+                    at = self.next_window_start(list(lobby.players), guild_id, now=now)
+                    if at is not None:
+                        due.append(at)
+        return min(due, default=None)
+
+    def next_window_start(
+        self, discord_ids: list[int], guild_id: int, *, now: datetime | None = None
+    ) -> int | None:
+        """Earliest time one of these players' windows starts (``now`` if one is active)."""
+        windows_by_player = self.curfew_repo.list_for_players(discord_ids, guild_id)
+        if not windows_by_player:
+            return None
+        players = self.player_repo.get_by_ids(list(windows_by_player.keys()), guild_id)
+        timezone_by_id = {p.discord_id: p.timezone for p in players}
+        moment = now or datetime.now(UTC)
+        due: list[int] = []
+        for discord_id, windows in windows_by_player.items():
+            general_timezone = timezone_by_id.get(discord_id)
+            if find_active_window(windows, general_timezone=general_timezone, now=moment):
+                return int(moment.timestamp())
+            for window in windows:
+                start = next_window_start(window, general_timezone=general_timezone, now=moment)
+                if start is not None:
+                    due.append(int(start.timestamp()))
+        return min(due, default=None)
+
+    def _load_lobby(self, guild_id: int, lobby_kind: LobbyKind):
         try:
-            lobby = self.lobby_service.get_lobby(guild_id=guild_id, lobby_kind=lobby_kind)
+            return self.lobby_service.get_lobby(guild_id=guild_id, lobby_kind=lobby_kind)
         except Exception:
             logger.exception(
                 "Failed to load lobby for curfew sweep (guild_id=%s, kind=%s)",
                 guild_id,
                 lobby_kind,
             )
-            return []
+            return None
+
+    def _sweep_lobby(
+        self, guild_id: int, lobby_kind: LobbyKind, now: datetime | None
+    ) -> list[CurfewKick]:
+        lobby = self._load_lobby(guild_id, lobby_kind)
         if not lobby or not lobby.players:
             return []
 
@@ -0,0 +1,195 @@
+"""
+Quiet-period SQLite maintenance.
+
+One pass, in order:
+
+1. checkpoint the WAL back into the database and truncate it;
+2. refresh planner statistics table by table with a sampled ``ANALYZE``;
+3. release free pages in small ``incremental_vacuum`` batches;
+4. checkpoint again so the released pages leave the file.
+
+A pass starts only while no guild has a pending match or a populated lobby,
+and it stops early if one appears. Steps that need the write lock give up
+after ``max_lock_ms`` instead of queueing behind live writers, and each does
+a bounded amount of work followed by a short pause so writers can get in.
+The report keeps the file sizes and probe query timings from before and
+after the pass, plus the longest time any step held the write lock.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from config import DB_MAINTENANCE_MAX_LOCK_MS
+
+logger = logging.getLogger("cama_bot.services.database_maintenance")
+
+
+@dataclass
+class MaintenanceReport:
+    started_at: float
+    completed: bool = False
+    elapsed_seconds: float = 0.0
+    before: dict[str, Any] = field(default_factory=dict)
+    after: dict[str, Any] = field(default_factory=dict)
+    probes_before_ms: dict[str, float] = field(default_factory=dict)
+    probes_after_ms: dict[str, float] = field(default_factory=dict)
+    # Frames left in the WAL by the final TRUNCATE checkpoint (0 = truncated).
+    wal_frames_left: int | None = None
+    analyzed_tables: int = 0
+    # Tables whose statistics were skipped because the lock stayed busy.
+    skipped_tables: list[str] = field(default_factory=list)
+    pages_reclaimed: int = 0
+    longest_lock_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def summary(self) -> str:
+        """One-line rendering for logs and the health report."""
+        before_mb = (self.before.get("db_bytes", 0) + self.before.get("wal_bytes", 0)) / 2**20
+        after_mb = (self.after.get("db_bytes", 0) + self.after.get("wal_bytes", 0)) / 2**20
+        probes = ", ".join(
+            f"{name} {self.probes_before_ms[name]:.1f}->{ms:.1f} ms"
+            for name, ms in self.probes_after_ms.items()
+            if name in self.probes_before_ms
+        )
+        state = "done" if self.completed else "stopped early"
+        return (
+            f"{state} in {self.elapsed_seconds:.1f} s; db+wal {before_mb:.1f}->{after_mb:.1f} MiB, "
+            f"{self.pages_reclaimed} pages reclaimed, {self.analyzed_tables} tables analyzed"
+            f"{f' ({len(self.skipped_tables)} busy)' if self.skipped_tables else ''}, "
+            f"longest lock {self.longest_lock_ms:.0f} ms"
+            f"{f'; {probes}' if probes else ''}"
+        )
+
+
+class DatabaseMaintenanceService:
+    """Run bounded WAL, statistics and free-page maintenance between games."""
+
+    def __init__(
+        self,
+        maintenance_repo,
+        *,
+        max_lock_ms: int = DB_MAINTENANCE_MAX_LOCK_MS,
+        analysis_limit: int = 1000,
+        vacuum_pages_per_step: int = 256,
+        max_vacuum_pages: int = 65536,
+        step_pause_seconds: float = 0.05,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.maintenance_repo = maintenance_repo
+        self.max_lock_ms = max(1, int(max_lock_ms))
+        self.analysis_limit = max(1, int(analysis_limit))
+        self.vacuum_pages_per_step = max(1, int(vacuum_pages_per_step))
+        self.max_vacuum_pages = max(0, int(max_vacuum_pages))
+        self.step_pause_seconds = max(0.0, step_pause_seconds)
+        self._sleep = sleep
+        self.last_report: MaintenanceReport | None = None
+
+    def is_quiet(self) -> bool:
+        return not self.maintenance_repo.has_live_activity()
+
+    def run(self, *, force: bool = False) -> MaintenanceReport | None:
+        """Run one pass; returns None without touching anything if not quiet.
+
+        ``force`` skips the quiet-period checks (for the offline script).
+        """
+        if not force and not self.is_quiet():
+            return None
+        repo = self.maintenance_repo
+        report = MaintenanceReport(started_at=time.time())
+        started = time.perf_counter()
+        report.before = repo.storage_stats()
+        targets = repo.probe_targets()
+        report.probes_before_ms = repo.time_probes(targets)
+
+        steps = (self._checkpoint_wal, self._refresh_statistics, self._reclaim_free_pages)
+        completed = True
+        for step in steps:
+            if not force and not self.is_quiet():
+                completed = False
+                break
+            step(report)
+        if completed:
+            # The closing checkpoint is what moves vacuumed pages out of the
+            # WAL and shrinks both files.
+            self._checkpoint_wal(report)
+
+        report.after = repo.storage_stats()
+        report.probes_after_ms = repo.time_probes(targets)
+        report.completed = completed
+        report.elapsed_seconds = time.perf_counter() - started
+        self.last_report = report
+        logger.info("Database maintenance %s", report.summary())
+        return report
+
+    def _checkpoint_wal(self, report: MaintenanceReport) -> None:
+        repo = self.maintenance_repo
+        # PASSIVE copies the bulk of the WAL without blocking anyone, so the
+        # TRUNCATE that follows only has the tail left to do.
+        repo.checkpoint("PASSIVE", busy_timeout_ms=self.max_lock_ms)
+        started = time.perf_counter()
+        result = repo.checkpoint("TRUNCATE", busy_timeout_ms=self.max_lock_ms)
+        self._record_lock(report, time.perf_counter() - started)
+        report.wal_frames_left = 0 if not result["busy"] else result["log_frames"]
+        if result["busy"]:
+            logger.info(
+                "WAL checkpoint could not truncate within %d ms; %d frames remain",
+                self.max_lock_ms,
+                result["log_frames"],
+            )
+
+    def _refresh_statistics(self, report: MaintenanceReport) -> None:
+        for table in self.maintenance_repo.list_tables():
+            try:
+                seconds = self.maintenance_repo.analyze_table(
+                    table,
+                    analysis_limit=self.analysis_limit,
+                    busy_timeout_ms=self.max_lock_ms,
+                )
+            except sqlite3.OperationalError as exc:
+                if "locked" not in str(exc) and "busy" not in str(exc):
+                    raise
+                report.skipped_tables.append(table)
+                continue
+            report.analyzed_tables += 1
+            self._record_lock(report, seconds)
+            self._sleep(self.step_pause_seconds)
+
+    def _reclaim_free_pages(self, report: MaintenanceReport) -> None:
+        if report.before.get("auto_vacuum") != "incremental":
+            if report.before.get("freelist_count"):
+                logger.info(
+                    "%d free pages not reclaimed: auto_vacuum is %s "
+                    "(convert offline with scripts/db_maintenance.py --enable-incremental-vacuum)",
+                    report.before["freelist_count"],
+                    report.before.get("auto_vacuum"),
+                )
+            return
+        while report.pages_reclaimed < self.max_vacuum_pages:
+            batch = min(self.vacuum_pages_per_step, self.max_vacuum_pages - report.pages_reclaimed)
+            try:
+                released, seconds = self.maintenance_repo.incremental_vacuum(
+                    batch, busy_timeout_ms=self.max_lock_ms
+                )
+            except sqlite3.OperationalError as exc:
+                if "locked" not in str(exc) and "busy" not in str(exc):
+                    raise
+                return
+            self._record_lock(report, seconds)
+            report.pages_reclaimed += released
+            if released < batch:
+                return
+            if not self.is_quiet():
+                return
+            self._sleep(self.step_pause_seconds)
+
+    @staticmethod
+    def _record_lock(report: MaintenanceReport, seconds: float) -> None:
+        report.longest_lock_ms = max(report.longest_lock_ms, round(seconds * 1000, 1))
@@ -60,6 +60,7 @@ from utils.economy_scaling import (
     scale_deflationary_minigame_jc_delta,
     scale_minigame_jc_delta,
 )
+from utils.effect_cache import effect_request_scoped
 
 # Public surface plus the module-level names other modules and the dig test
 # suite import directly from ``services.dig_service``. The helpers and
@@ -508,6 +509,7 @@ class DigService(
             ),
         )
 
+    @effect_request_scoped
     def dig(
         self,
         discord_id: int,
@@ -138,6 +138,9 @@ class DuelService:
     def get_due_challenge_ids(self, now):
         return self.repo.get_due_challenge_ids(now)
 
+    def get_next_due_at(self):
+        return self.repo.get_next_due_at()
+
     def process_due(self, challenge_id, guild_id, now, *, claim_reminders=True):
         if claim_reminders:
             reminder = self.repo.claim_reminder_atomic(challenge_id, guild_id, now)
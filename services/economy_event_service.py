@@ -25,6 +25,7 @@ from domain.models.economy_event import (
     EconomyEventEffects,
 )
 from repositories.economy_event_repository import EconomyEventRepository
+from utils.effect_cache import VersionedEffectCache
 
 _EVENT_TIMEZONE = ZoneInfo("America/Los_Angeles")
 _SECOND_ANNOUNCEMENT_DELAY_SECONDS = 12 * 60 * 60
@@ -182,6 +183,8 @@ class EconomyEventService:
         self.max_reserve_burn_pct = min(1.0, max(0.0, float(max_reserve_burn_pct)))
         self.max_wallet_burn_pct = min(0.05, max(0.0, float(max_wallet_burn_pct)))
         self.trigger_hour_local = min(23, max(0, int(trigger_hour_local)))
+        # (guild_id, event_date) -> event row, valid until the next trigger.
+        self._event_cache = VersionedEffectCache()
 
     def _event_date_for_timestamp(self, timestamp: int | float) -> str:
         """Return the Pacific-local event date active at ``timestamp``."""
@@ -236,11 +239,36 @@ class EconomyEventService:
             now=now,
         )
 
+    def _get_cached_event(
+        self, guild_id: int | None, now: int | float
+    ) -> dict[str, Any] | None:
+        """Return the event card active at ``now``, cached until the next trigger.
+
+        Cards are written once per guild-day, so a lookup is stable until the
+        next trigger boundary or until the repository reports a new card.
+        """
+        event_date = self._event_date_for_timestamp(now)
+        gid = self.repository.normalize_guild_id(guild_id)
+        return self._event_cache.get_or_load(
+            (gid, event_date),
+            lambda: self.repository.get_event_for_date(guild_id, event_date),
+            ttl_seconds=self.seconds_until_next_trigger(now),
+            source_version=getattr(self.repository, "events_version", 0),
+        )
+
+    def invalidate_effects(self, guild_id: int | None) -> None:
+        """Drop cached event cards for a guild after an out-of-band write."""
+        gid = self.repository.normalize_guild_id(guild_id)
+        event_date = self._event_date_for_timestamp(time.time())
+        self._event_cache.invalidate((gid, event_date))
+
+    def get_effect_cache_stats(self) -> dict[str, int]:
+        return self._event_cache.stats()
+
     def get_effects(self, guild_id: int | None) -> EconomyEventEffects:
         if not self.enabled:
             return NEUTRAL_ECONOMY_EFFECTS
-        event_date = self._event_date_for_timestamp(time.time())
-        event = self.repository.get_event_for_date(guild_id, event_date)
+        event = self._get_cached_event(guild_id, time.time())
         if not event:
             return NEUTRAL_ECONOMY_EFFECTS
         return EconomyEventEffects.from_mapping(event.get("effects"))
@@ -255,8 +283,7 @@ class EconomyEventService:
         if not self.enabled:
             return None
         now = float(now if now is not None else time.time())
-        event_date = self._event_date_for_timestamp(now)
-        event = self.repository.get_event_for_date(guild_id, event_date)
+        event = self._get_cached_event(guild_id, now)
         if (
             not event
             or event.get("direction") != "deflationary"
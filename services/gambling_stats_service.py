@@ -646,6 +646,9 @@ class GamblingStatsService:
         all_discord_ids = [s["discord_id"] for s in all_summaries]
 
         # Fetch the remaining non-bet inputs needed for degen score calculation.
+        # These are not in player_gambling_aggregates on purpose: bankruptcy
+        # counts, lowest balances and loan counts are already running counters
+        # on bankruptcy_state, players and loan_state, read by primary key.
         bulk_bankruptcy = self.bet_repo.get_bulk_bankruptcy_counts(
             all_discord_ids, guild_id
         )
@@ -950,6 +953,10 @@ class GamblingStatsService:
         Returns list of (event_number, cumulative_pnl, event_info) tuples.
         event_info contains: amount, leverage, outcome, profit, source ('bet' or 'wheel')
         Events are sorted by time (bet_time for bets, spin_time for wheel spins).
+
+        Unlike the balance chart this stays on the per-game tables: each point
+        carries the stake, leverage, team and outcome, which ledger rows do not
+        record, and it charts gambling P&L rather than the whole balance.
         """
         # Get bet history
         bet_history = self.bet_repo.get_player_bet_history(discord_id, guild_id)
@@ -1112,3 +1119,18 @@ class GamblingStatsService:
             Number of bankruptcies
         """
         return self.bet_repo.get_player_bankruptcy_count(discord_id, guild_id)
+
+    def verify_aggregates(self, guild_id: int | None = None, *, repair: bool = False) -> list[int]:
+        """Check the stored gambling aggregates against a full bet-history scan.
+
+        Args:
+            guild_id: Guild ID (None for DMs)
+            repair: Rebuild the guild's aggregates when any row differs
+
+        Returns:
+            Discord IDs whose stored aggregates did not match
+        """
+        mismatched = self.bet_repo.verify_gambling_aggregates(guild_id)
+        if mismatched and repair:
+            self.bet_repo.rebuild_gambling_aggregates(guild_id)
+        return mismatched
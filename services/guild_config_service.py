@@ -6,6 +6,7 @@ for commands, keeping repository access out of the command layer.
 """
 
 from repositories.interfaces import IGuildConfigRepository
+from utils.effect_cache import VersionedEffectCache
 
 
 class GuildConfigService:
@@ -20,11 +21,19 @@ class GuildConfigService:
 
     def __init__(self, guild_config_repo: IGuildConfigRepository):
         self.guild_config_repo = guild_config_repo
+        # Config rows only change through the setters below, which invalidate.
+        self._config_cache = VersionedEffectCache()
 
     def get_config(self, guild_id: int | None) -> dict | None:
         """Get full configuration for a guild."""
         normalized = guild_id if guild_id is not None else 0
-        return self.guild_config_repo.get_config(normalized)
+        config = self._config_cache.get_or_load(
+            normalized, lambda: self.guild_config_repo.get_config(normalized)
+        )
+        return dict(config) if config is not None else None
+
+    def get_config_cache_stats(self) -> dict[str, int]:
+        return self._config_cache.stats()
 
     def get_league_id(self, guild_id: int | None) -> int | None:
         """Get the Valve league ID for a guild."""
@@ -35,6 +44,7 @@ class GuildConfigService:
         """Set the Valve league ID for a guild."""
         normalized = guild_id if guild_id is not None else 0
         self.guild_config_repo.set_league_id(normalized, league_id)
+        self._config_cache.invalidate(normalized)
 
     def is_auto_enrich_enabled(self, guild_id: int | None) -> bool:
         """Check if auto-enrichment is enabled for a guild. Defaults to True."""
@@ -45,6 +55,7 @@ class GuildConfigService:
         """Enable or disable auto-enrichment for a guild."""
         normalized = guild_id if guild_id is not None else 0
         self.guild_config_repo.set_auto_enrich(normalized, enabled)
+        self._config_cache.invalidate(normalized)
 
     def is_ai_enabled(self, guild_id: int | None) -> bool:
         """Check if AI features are enabled for a guild."""
@@ -55,3 +66,4 @@ class GuildConfigService:
         """Enable or disable AI features for a guild."""
         normalized = guild_id if guild_id is not None else 0
         self.guild_config_repo.set_ai_enabled(normalized, enabled)
+        self._config_cache.invalidate(normalized)
@@ -0,0 +1,256 @@
+"""
+One durable scheduler for every background worker.
+
+Features register an async handler under a name. Their jobs live in the
+``scheduled_jobs`` table, so the scheduler sleeps until the earliest
+unclaimed ``next_due_at`` (or until something new is scheduled) instead of
+each feature waking on its own fixed interval to ask whether it has work.
+
+Due jobs are claimed atomically and run with bounded concurrency. A handler
+receives its job row and returns the absolute timestamp of its next run, or
+``None`` to fall back to the job's ``interval_seconds`` (one-shot jobs
+without an interval are retired). A handler that raises is retried with
+exponential backoff. Every run's latency lands in a per-handler histogram
+and in the job row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from utils.perf_metrics import LatencyHistogram
+
+logger = logging.getLogger("cama_bot.job_scheduler")
+
+# Handlers return the next due timestamp, or None to use the job's interval.
+JobHandler = Callable[[dict[str, Any]], Awaitable[float | None]]
+
+
+@dataclass
+class _Registration:
+    handler: JobHandler
+    interval_seconds: int | None
+    latency: LatencyHistogram
+    failures: int = 0
+
+
+class JobSchedulerService:
+    """Dispatch due ``scheduled_jobs`` rows to registered async handlers."""
+
+    def __init__(
+        self,
+        job_repo,
+        *,
+        max_concurrency: int = 4,
+        retry_base_seconds: int = 30,
+        retry_max_seconds: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.job_repo = job_repo
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.retry_base_seconds = max(1, int(retry_base_seconds))
+        self.retry_max_seconds = max(self.retry_base_seconds, int(retry_max_seconds))
+        self._clock = clock
+        self._registrations: dict[str, _Registration] = {}
+        # Durable writes waiting for the run loop, in submission order. They are
+        # retried on the next pass if SQLite is briefly unavailable.
+        self._pending_writes: list[Callable[[], Any]] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+
+    # -- registration ---------------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        handler: JobHandler,
+        *,
+        interval_seconds: int | None = None,
+        first_due_at: float | None = None,
+    ) -> None:
+        """Register ``handler`` and its recurring job (keyed by ``name``).
+
+        A job seen before keeps its stored due time, including one that came
+        due while the bot was offline, so a restart does not run every job
+        again. A new job is first due at ``first_due_at``, which defaults to
+        one interval from now (or now, for jobs without an interval). Safe to
+        call before the scheduler starts running.
+        """
+        self._registrations[name] = _Registration(
+            handler, interval_seconds, LatencyHistogram()
+        )
+        if first_due_at is None:
+            first_due_at = self._clock() + (interval_seconds or 0)
+        due_at = int(first_due_at)
+        self._submit(
+            lambda: self.job_repo.upsert_job(
+                name,
+                name,
+                next_due_at=due_at,
+                interval_seconds=interval_seconds,
+                keep_stored_due=True,
+            )
+        )
+
+    def unregister(self, name: str) -> None:
+        """Stop dispatching ``name``; its row stays so a re-register resumes it."""
+        self._registrations.pop(name, None)
+
+    def schedule(
+        self,
+        handler: str,
+        *,
+        due_at: float,
+        job_key: str | None = None,
+        payload: Any = None,
+    ) -> None:
+        """Queue a one-shot job (or pull a recurring job's next run earlier)."""
+        registration = self._registrations.get(handler)
+        interval = registration.interval_seconds if job_key is None and registration else None
+        key = job_key or handler
+        self._submit(
+            lambda: self.job_repo.upsert_job(
+                key,
+                handler,
+                next_due_at=int(due_at),
+                interval_seconds=interval,
+                payload=payload,
+            )
+        )
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    # -- run loop -------------------------------------------------------------
+
+    async def run(self) -> None:
+        """Dispatch jobs until cancelled."""
+        released = await asyncio.to_thread(self.job_repo.release_claims)
+        if released:
+            logger.info("released %d job claim(s) left by a previous run", released)
+        try:
+            while True:
+                self._wake.clear()
+                timeout = await self.tick()
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except TimeoutError:
+                        pass
+        finally:
+            for task in list(self._running.values()):
+                task.cancel()
+
+    async def tick(self) -> float | None:
+        """Flush durable writes and start due jobs.
+
+        Returns the seconds until the next job is due, or ``None`` when the
+        scheduler only needs to wake for new work or a finished job.
+        """
+        if not await self._flush_writes():
+            return float(self.retry_base_seconds)
+        names = list(self._registrations)
+        free = self.max_concurrency - len(self._running)
+        if not names or free <= 0:
+            return None
+        # Claim by the floored clock so a job never starts before its due time.
+        jobs = await asyncio.to_thread(
+            self.job_repo.claim_due_jobs, int(self._clock()), names, free
+        )
+        for job in jobs:
+            self._running[job["job_key"]] = asyncio.create_task(
+                self._execute(job), name=f"job:{job['job_key']}"
+            )
+        if len(self._running) >= self.max_concurrency:
+            return None
+        next_due = await asyncio.to_thread(self.job_repo.get_next_due_at, names)
+        if next_due is None:
+            return None
+        return max(0.0, next_due - self._clock())
+
+    async def drain(self) -> None:
+        """Wait for running jobs and persist their outcomes (used by tests)."""
+        while self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+        await self._flush_writes()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-handler run counts and latency percentiles since startup."""
+        return {
+            name: {**registration.latency.summary(), "failures": registration.failures}
+            for name, registration in self._registrations.items()
+        }
+
+    # -- internals --------------------------------------------------------------
+
+    def _submit(self, write: Callable[[], Any]) -> None:
+        self._pending_writes.append(write)
+        self._wake.set()
+
+    async def _flush_writes(self) -> bool:
+        while self._pending_writes:
+            write = self._pending_writes[0]
+            try:
+                await asyncio.to_thread(write)
+            except Exception:
+                logger.exception("job scheduler write failed; retrying")
+                return False
+            self._pending_writes.pop(0)
+        return True
+
+    async def _execute(self, job: dict[str, Any]) -> None:
+        key = job["job_key"]
+        registration = self._registrations.get(job["handler"])
+        started = time.perf_counter()
+        try:
+            if registration is None:
+                raise RuntimeError(f"no handler registered for {job['handler']!r}")
+            next_due = await registration.handler(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            elapsed = time.perf_counter() - started
+            attempts = int(job.get("attempts") or 0) + 1
+            delay = min(
+                self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1)
+            )
+            logger.exception(
+                "job %s failed (attempt %d); retrying in %ds", key, attempts, delay
+            )
+            if registration is not None:
+                registration.failures += 1
+                registration.latency.observe(elapsed)
+            finished = int(self._clock())
+            error = f"{type(exc).__name__}: {exc}"
+            self._submit(
+                lambda: self.job_repo.fail_job(
+                    key,
+                    retry_at=finished + delay,
+                    finished_at=finished,
+                    latency_ms=int(elapsed * 1000),
+                    error=error,
+                )
+            )
+        else:
+            elapsed = time.perf_counter() - started
+            registration.latency.observe(elapsed)
+            finished = int(self._clock())
+            interval = job.get("interval_seconds")
+            if next_due is None and interval:
+                next_due = finished + int(interval)
+            self._submit(
+                lambda: self.job_repo.complete_job(
+                    key,
+                    next_due_at=None if next_due is None else math.ceil(next_due),
+                    finished_at=finished,
+                    latency_ms=int(elapsed * 1000),
+                )
+            )
+        finally:
+            self._running.pop(key, None)
@@ -17,6 +17,7 @@ from utils.economy_scaling import (
     adjust_generated_jc_reward,
     scale_minigame_jc_delta,
 )
+from utils.effect_cache import EFFECT_NAMESPACE_MANA, scoped_lookup
 
 logger = logging.getLogger("cama_bot.services.mana_effects")
 
@@ -52,9 +53,18 @@ class ManaEffectsService:
         Returns ManaEffects with all modifiers set based on current mana color.
         If no mana assigned today, or if today's mana has been tapped on a
         manashop ultimate, returns default (no effects).
+
+        Within an effect request scope the result is memoized per player until
+        a mana write invalidates it.
         """
-        mana = self.mana_service.get_current_mana(discord_id, guild_id)
-        return self._effects_from_mana(mana, get_today_pst())
+        return scoped_lookup(
+            EFFECT_NAMESPACE_MANA,
+            (guild_id if guild_id is not None else 0, discord_id),
+            lambda: self._effects_from_mana(
+                self.mana_service.get_current_mana(discord_id, guild_id),
+                get_today_pst(),
+            ),
+        )
 
     def get_effects_bulk(
         self,
@@ -16,6 +16,7 @@ from domain.models.pending_match_state import PendingMatchState
 from openskill_rating_system import CamaOpenSkillSystem
 from services.match._common import coalesce_os_baseline, logger
 from utils.betting_accounting import calculate_bet_jc_deltas as _calculate_bet_jc_deltas
+from utils.effect_cache import effect_request_scoped
 from utils.guild import normalize_guild_id
 
 _LEGACY_WIN_REWARD_JC = 4
@@ -28,6 +29,7 @@ class RecordingMixin:
     attributes and helpers that the other mixins and the constructor provide.
     """
 
+    @effect_request_scoped
     def _settle_match_bets_and_bonuses(
         self,
         match_id: int,
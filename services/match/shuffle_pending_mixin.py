@@ -9,6 +9,7 @@ no state of its own and is composed into ``MatchService``.
 
 import random
 import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from config import BET_LOCK_SECONDS, DOTA_BET_SEED_AMOUNT, FIRST_GAME_POOL_DAILY_AMOUNT
@@ -18,7 +19,83 @@ from domain.models.player import Player
 from domain.models.team import Team
 from rating_system import CamaRatingSystem
 from shuffler import BalancedShuffler
-from utils.region import region_split_mismatches
+from utils.region import region_split_mismatches, resolve_region
+
+# Pre-shuffles kept per lobby shape: the current inputs plus the lookahead
+# for the next wait-minute change (see ShuffleSpeculationService).
+_SPECULATIONS_PER_SHAPE = 2
+
+
+@dataclass
+class _ShuffleInputs:
+    """Everything the team search reads, loaded fresh for one shuffle."""
+
+    player_ids: list[int]
+    players: list[Player]
+    exclusion_counts: dict[str, int]
+    recent_match_names: set[str]
+    rating_system: str
+    shuffle_mode: str
+    avoids: list
+    deals: list
+    low_priority_ids: set[int]
+    lobby_wait_minutes: dict[int, int] | None
+
+    def fingerprint(self, use_glicko: bool) -> tuple:
+        """Exact identity of the search inputs.
+
+        Players contribute only the fields the search reads, after uncertainty
+        decay: a rating, RD, role or region change invalidates a speculative
+        result, while balance or betting activity does not (the balance counts
+        only when it is the rating). Wait minutes only feed the pool search; a
+        ten-player roster ignores them, and a larger one is re-speculated as
+        they tick over.
+        """
+        jopacoin = self.rating_system == "jopacoin"
+        return (
+            tuple(self.player_ids),
+            tuple(
+                (
+                    player.discord_id,
+                    player.name,
+                    player.mmr,
+                    player.glicko_rating,
+                    player.glicko_rd,
+                    player.os_mu,
+                    player.os_sigma,
+                    tuple(player.preferred_roles or ()),
+                    player.main_role,
+                    resolve_region(player),
+                    player.jopacoin_balance if jopacoin else None,
+                )
+                for player in self.players
+            ),
+            tuple(sorted(self.exclusion_counts.items())),
+            tuple(sorted(self.recent_match_names)),
+            self.rating_system,
+            self.shuffle_mode,
+            use_glicko,
+            tuple(repr(avoid) for avoid in self.avoids),
+            tuple(repr(deal) for deal in self.deals),
+            tuple(sorted(self.low_priority_ids)),
+            (
+                tuple(sorted((self.lobby_wait_minutes or {}).items()))
+                if len(self.players) > 10
+                else None
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class _ShuffleSpeculation:
+    """A precomputed team search, stored as indices into the roster."""
+
+    fingerprint: tuple
+    team1: tuple[int, ...]
+    team1_roles: tuple[str, ...] | None
+    team2: tuple[int, ...]
+    team2_roles: tuple[str, ...] | None
+    excluded: tuple[int, ...]
 
 
 class ShufflePendingMixin:
@@ -164,39 +241,122 @@ class ShufflePendingMixin:
         self.state_service.persist_state(guild_id, state)
         return state
 
-    def shuffle_players(
+    # ==================== Speculative pre-shuffle ====================
+
+    def speculate_shuffle(
         self,
         player_ids: list[int],
         guild_id: int | None = None,
-        betting_mode: str = "pool",
-        rating_system: str = "glicko",
+        *,
+        rating_systems: tuple[str, ...] = ("glicko", "openskill"),
         shuffle_mode: str = "balanced",
-        excluded_conditional_ids: list[int] | None = None,
         lobby_wait_minutes: dict[int, int] | None = None,
         lobby_kind: LobbyKind | str | None = None,
-    ) -> dict:
+    ) -> int:
+        """Run the team search ahead of ``/shuffle`` for a ready lobby.
+
+        The latest results are kept per (guild, lobby kind, rating system,
+        mode) with the fingerprint of the inputs each was computed from;
+        ``shuffle_players`` uses one only when its freshly loaded inputs carry
+        the same fingerprint, so a rating change or a roster change can never
+        leak into a match. Keeping two lets a result for the next wait-minute
+        change be computed before it is needed. Nothing is persisted. Returns
+        how many searches ran (inputs already speculated are skipped).
         """
-        Shuffle players into balanced teams.
+        searched = 0
+        for rating_system in rating_systems:
+            inputs = self._load_shuffle_inputs(
+                player_ids, guild_id, rating_system, shuffle_mode, lobby_wait_minutes
+            )
+            key = self._shuffle_speculation_key(
+                guild_id, lobby_kind, inputs.rating_system, shuffle_mode
+            )
+            fingerprint = inputs.fingerprint(self.use_glicko)
+            with self._shuffle_speculation_lock:
+                stored = self._shuffle_speculations.get(key, ())
+            if any(speculation.fingerprint == fingerprint for speculation in stored):
+                continue
+            team1, team2, excluded = self._search_shuffle_teams(
+                self._shuffler_for(inputs), inputs
+            )
+            index = {id(player): i for i, player in enumerate(inputs.players)}
+            speculation = _ShuffleSpeculation(
+                fingerprint=fingerprint,
+                team1=tuple(index[id(p)] for p in team1.players),
+                team1_roles=tuple(team1.role_assignments) if team1.role_assignments else None,
+                team2=tuple(index[id(p)] for p in team2.players),
+                team2_roles=tuple(team2.role_assignments) if team2.role_assignments else None,
+                excluded=tuple(index[id(p)] for p in excluded),
+            )
+            with self._shuffle_speculation_lock:
+                stored = self._shuffle_speculations.get(key, ())
+                self._shuffle_speculations[key] = (*stored, speculation)[
+                    -_SPECULATIONS_PER_SHAPE:
+                ]
+            searched += 1
+        return searched
+
+    def discard_shuffle_speculations(
+        self, guild_id: int | None, lobby_kind: LobbyKind | str | None = None
+    ) -> None:
+        """Drop pre-shuffles for a lobby that fell below the ready threshold."""
+        prefix = (guild_id, LobbyKind.normalize(lobby_kind).value)
+        with self._shuffle_speculation_lock:
+            for key in [key for key in self._shuffle_speculations if key[:2] == prefix]:
+                del self._shuffle_speculations[key]
+
+    @staticmethod
+    def _shuffle_speculation_key(
+        guild_id: int | None,
+        lobby_kind: LobbyKind | str | None,
+        rating_system: str,
+        shuffle_mode: str,
+    ) -> tuple:
+        return (guild_id, LobbyKind.normalize(lobby_kind).value, rating_system, shuffle_mode)
 
-        Args:
-            player_ids: List of Discord user IDs to shuffle
-            guild_id: Guild ID for multi-guild support
-            betting_mode: "pool" for parimutuel betting, "house" for 1:1 payouts
-            rating_system: "glicko" or "openskill" - determines which rating system is used for balancing
-            shuffle_mode: "balanced" or "region" - determines team-shape preference
-            excluded_conditional_ids: Conditional lobby players not selected for this match
-            lobby_wait_minutes: Whole minutes each player has waited in the current lobby
-            lobby_kind: Source lobby kind for independent lifecycle cleanup
+    def _take_shuffle_speculation(
+        self,
+        guild_id: int | None,
+        lobby_kind: LobbyKind | str | None,
+        inputs: _ShuffleInputs,
+    ) -> tuple[Team, Team, list[Player]] | None:
+        """Consume a matching pre-shuffle, rebuilt around the fresh players."""
+        key = self._shuffle_speculation_key(
+            guild_id, lobby_kind, inputs.rating_system, inputs.shuffle_mode
+        )
+        fingerprint = inputs.fingerprint(self.use_glicko)
+        with self._shuffle_speculation_lock:
+            speculation = next(
+                (
+                    speculation
+                    for speculation in self._shuffle_speculations.get(key, ())
+                    if speculation.fingerprint == fingerprint
+                ),
+                None,
+            )
+            if speculation is None:
+                return None
+            del self._shuffle_speculations[key]
+        players = inputs.players
+        return (
+            Team([players[i] for i in speculation.team1], speculation.team1_roles),
+            Team([players[i] for i in speculation.team2], speculation.team2_roles),
+            [players[i] for i in speculation.excluded],
+        )
 
-        Returns a payload containing teams, role assignments, and Radiant/Dire mapping.
-        """
-        if betting_mode not in ("house", "pool"):
-            raise ValueError("betting_mode must be 'house' or 'pool'")
+    def _load_shuffle_inputs(
+        self,
+        player_ids: list[int],
+        guild_id: int | None,
+        rating_system: str,
+        shuffle_mode: str,
+        lobby_wait_minutes: dict[int, int] | None,
+    ) -> _ShuffleInputs:
+        """Load and decay everything the team search reads (no search yet)."""
         if rating_system not in ("glicko", "openskill", "jopacoin"):
             raise ValueError("rating_system must be 'glicko', 'openskill', or 'jopacoin'")
         if shuffle_mode not in ("balanced", "region"):
             raise ValueError("shuffle_mode must be 'balanced' or 'region'")
-        excluded_conditional_ids = list(excluded_conditional_ids or [])
         (
             players,
             last_match_dates,
@@ -248,16 +408,6 @@ class ShufflePendingMixin:
         if rating_system == "openskill" and any(p.os_mu is None for p in players):
             rating_system = "glicko"
 
-        # Create a shuffler configured for the requested rating system
-        use_openskill = rating_system == "openskill"
-        use_jopacoin = rating_system == "jopacoin"
-        shuffler = BalancedShuffler(
-            use_glicko=self.use_glicko,
-            use_openskill=use_openskill,
-            use_jopacoin=use_jopacoin,
-            region_split=shuffle_mode == "region",
-        )
-
         # Load active soft avoids for these players
         avoids = []
         if self.soft_avoid_repo:
@@ -272,24 +422,102 @@ class ShufflePendingMixin:
         if self.low_priority_repo:
             low_priority_ids = self.low_priority_repo.get_active_ids(player_ids, guild_id)
 
+        return _ShuffleInputs(
+            player_ids=list(player_ids),
+            players=players,
+            exclusion_counts=exclusion_counts,
+            recent_match_names=recent_match_names,
+            rating_system=rating_system,
+            shuffle_mode=shuffle_mode,
+            avoids=avoids,
+            deals=deals,
+            low_priority_ids=low_priority_ids,
+            lobby_wait_minutes=lobby_wait_minutes,
+        )
+
+    def _shuffler_for(self, inputs: _ShuffleInputs) -> BalancedShuffler:
+        """Create a shuffler configured for the requested rating system."""
+        return BalancedShuffler(
+            use_glicko=self.use_glicko,
+            use_openskill=inputs.rating_system == "openskill",
+            use_jopacoin=inputs.rating_system == "jopacoin",
+            region_split=inputs.shuffle_mode == "region",
+        )
+
+    @staticmethod
+    def _search_shuffle_teams(
+        shuffler: BalancedShuffler, inputs: _ShuffleInputs
+    ) -> tuple[Team, Team, list[Player]]:
+        """The expensive part of a shuffle: pick the ten and split the teams."""
+        players = inputs.players
         if len(players) > 10:
             team1, team2, excluded_players = shuffler.shuffle_from_pool(
                 players,
-                exclusion_counts,
-                recent_match_names,
-                avoids=avoids,
-                deals=deals,
-                low_priority_ids=low_priority_ids,
-                lobby_wait_minutes=lobby_wait_minutes,
+                inputs.exclusion_counts,
+                inputs.recent_match_names,
+                avoids=inputs.avoids,
+                deals=inputs.deals,
+                low_priority_ids=inputs.low_priority_ids,
+                lobby_wait_minutes=inputs.lobby_wait_minutes,
             )
         else:
             team1, team2 = shuffler.shuffle(
                 players,
-                avoids=avoids,
-                deals=deals,
-                low_priority_ids=low_priority_ids,
+                avoids=inputs.avoids,
+                deals=inputs.deals,
+                low_priority_ids=inputs.low_priority_ids,
             )
             excluded_players = []
+        return team1, team2, excluded_players
+
+    def shuffle_players(
+        self,
+        player_ids: list[int],
+        guild_id: int | None = None,
+        betting_mode: str = "pool",
+        rating_system: str = "glicko",
+        shuffle_mode: str = "balanced",
+        excluded_conditional_ids: list[int] | None = None,
+        lobby_wait_minutes: dict[int, int] | None = None,
+        lobby_kind: LobbyKind | str | None = None,
+    ) -> dict:
+        """
+        Shuffle players into balanced teams.
+
+        Args:
+            player_ids: List of Discord user IDs to shuffle
+            guild_id: Guild ID for multi-guild support
+            betting_mode: "pool" for parimutuel betting, "house" for 1:1 payouts
+            rating_system: "glicko" or "openskill" - determines which rating system is used for balancing
+            shuffle_mode: "balanced" or "region" - determines team-shape preference
+            excluded_conditional_ids: Conditional lobby players not selected for this match
+            lobby_wait_minutes: Whole minutes each player has waited in the current lobby
+            lobby_kind: Source lobby kind for independent lifecycle cleanup
+
+        Returns a payload containing teams, role assignments, and Radiant/Dire mapping.
+        """
+        if betting_mode not in ("house", "pool"):
+            raise ValueError("betting_mode must be 'house' or 'pool'")
+        excluded_conditional_ids = list(excluded_conditional_ids or [])
+        inputs = self._load_shuffle_inputs(
+            player_ids, guild_id, rating_system, shuffle_mode, lobby_wait_minutes
+        )
+        players = inputs.players
+        exclusion_counts = inputs.exclusion_counts
+        recent_match_names = inputs.recent_match_names
+        rating_system = inputs.rating_system
+        avoids = inputs.avoids
+        deals = inputs.deals
+        low_priority_ids = inputs.low_priority_ids
+
+        use_openskill = rating_system == "openskill"
+        use_jopacoin = rating_system == "jopacoin"
+        shuffler = self._shuffler_for(inputs)
+        # A background pre-shuffle over identical inputs stands in for the search.
+        teams = self._take_shuffle_speculation(guild_id, lobby_kind, inputs)
+        if teams is None:
+            teams = self._search_shuffle_teams(shuffler, inputs)
+        team1, team2, excluded_players = teams
 
         off_role_mult = shuffler.off_role_multiplier
         off_role_flat_value_penalty = shuffler.off_role_flat_value_penalty
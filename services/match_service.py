@@ -109,6 +109,10 @@ class MatchService(
         # Track matches being recorded as (guild_id, pending_match_id) tuples
         # to allow concurrent recording of different matches in the same guild
         self._recording_in_progress: set[tuple[int, int | None]] = set()
+        # Speculative pre-shuffles for ready lobbies, keyed by
+        # (guild_id, lobby kind, rating system, shuffle mode); newest last.
+        self._shuffle_speculation_lock = threading.Lock()
+        self._shuffle_speculations: dict[tuple, tuple] = {}
 
     def _load_glicko_player(
         self, player_id: int, guild_id: int | None = None
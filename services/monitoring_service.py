@@ -17,6 +17,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from utils.perf_metrics import PerfMetrics, get_perf_metrics
+
 try:
     import resource  # Unix-only; absent on Windows.
 except ImportError:  # pragma: no cover - platform-dependent
@@ -116,6 +118,10 @@ class HealthSnapshot:
     discord_latency_ms: float | None
     guild_count: int
     usage: UsageSnapshot
+    performance: dict[str, Any] = field(default_factory=dict)
+    caches: dict[str, dict[str, int]] = field(default_factory=dict)
+    startup: dict[str, Any] = field(default_factory=dict)
+    maintenance: str = ""
     extra: dict[str, Any] = field(default_factory=dict)
 
 
@@ -155,6 +161,14 @@ class UsageMonitor:
 
 _GLOBAL_USAGE_MONITOR: UsageMonitor | None = None
 
+# (report name, bot attribute, stats method) for caches shown in /admin health.
+_CACHE_STATS_SOURCES = (
+    ("players", "player_repo", "get_cache_stats"),
+    ("guild_config", "guild_config_service", "get_config_cache_stats"),
+    ("economy_events", "economy_event_service", "get_effect_cache_stats"),
+    ("prediction_books", "prediction_repo", "get_order_book_stats"),
+)
+
 
 def set_global_usage_monitor(monitor: UsageMonitor) -> None:
     global _GLOBAL_USAGE_MONITOR
@@ -175,9 +189,11 @@ class MonitoringService:
         usage_monitor: UsageMonitor | None = None,
         started_at: datetime | None = None,
         git_sha: str | None = None,
+        perf_metrics: PerfMetrics | None = None,
     ) -> None:
         self.db_path = db_path
         self.usage_monitor = usage_monitor or UsageMonitor()
+        self._perf_metrics = perf_metrics
         self.started_at = started_at or _utc_now()
         self.git_sha = git_sha or _short_git_sha()
 
@@ -215,8 +231,20 @@ class MonitoringService:
             discord_latency_ms=discord_latency_ms,
             guild_count=len(getattr(bot, "guilds", []) or []) if bot is not None else 0,
             usage=self.usage_monitor.snapshot(),
+            performance=self.perf_metrics.snapshot(top=5),
+            caches=_collect_cache_stats(bot),
+            startup=_collect_startup_profile(bot),
+            maintenance=_collect_maintenance_summary(bot),
         )
 
+    @property
+    def perf_metrics(self) -> PerfMetrics:
+        return self._perf_metrics or get_perf_metrics()
+
+    def prometheus_text(self) -> str:
+        """Return latency histograms in the Prometheus text exposition format."""
+        return self.perf_metrics.render_prometheus()
+
     def _probe_db(self) -> tuple[bool, float | None, str | None]:
         started = time.perf_counter()
         try:
@@ -240,6 +268,64 @@ class MonitoringService:
             return None
 
 
+def _collect_cache_stats(bot: Any | None) -> dict[str, dict[str, int]]:
+    caches: dict[str, dict[str, int]] = {}
+    if bot is None:
+        return caches
+    for name, attribute, method in _CACHE_STATS_SOURCES:
+        stats_fn = getattr(getattr(bot, attribute, None), method, None)
+        if not callable(stats_fn):
+            continue
+        try:
+            stats = stats_fn()
+        except Exception:
+            continue
+        if isinstance(stats, dict):
+            caches[name] = stats
+    return caches
+
+
+def _collect_startup_profile(bot: Any | None) -> dict[str, Any]:
+    snapshot_fn = getattr(getattr(bot, "startup_profile", None), "snapshot", None)
+    if not callable(snapshot_fn):
+        return {}
+    try:
+        profile = snapshot_fn()
+    except Exception:
+        return {}
+    return profile if isinstance(profile, dict) else {}
+
+
+def _collect_maintenance_summary(bot: Any | None) -> str:
+    report = getattr(getattr(bot, "database_maintenance_service", None), "last_report", None)
+    if report is None:
+        return ""
+    try:
+        summary = report.summary()
+    except Exception:
+        return ""
+    return summary if isinstance(summary, str) else ""
+
+
+def _format_startup_profile(profile: dict[str, Any]) -> str:
+    milestones = ", ".join(
+        f"{name} {ms / 1000:.2f} s" for name, ms in (profile.get("milestones_ms") or {}).items()
+    )
+    phases = ", ".join(
+        f"{name} {ms:.0f} ms" for name, ms in (profile.get("phases_ms") or {}).items()
+    )
+    if not milestones and not phases:
+        return "unavailable"
+    return f"{milestones or 'no milestones'} ({phases or 'no phases'})"
+
+
+def _format_cache_stats(stats: dict[str, int]) -> str:
+    hits = stats.get("hits", 0)
+    lookups = hits + stats.get("misses", 0)
+    hit_rate = f"{hits / lookups:.0%}" if lookups else "n/a"
+    return f"{hit_rate} hit of {lookups}, {stats.get('invalidations', 0)} invalidated"
+
+
 def format_health_snapshot(snapshot: HealthSnapshot) -> str:
     """Format a compact Discord-safe health response."""
     status_line = "OK" if snapshot.status == "ok" else "DEGRADED"
@@ -260,6 +346,20 @@ def format_health_snapshot(snapshot: HealthSnapshot) -> str:
         f"{name}: {count}" for name, count in snapshot.usage.commands_by_name.items()
     ) or "none"
     reasons = "\n".join(f"- {reason}" for reason in snapshot.reasons) or "- none"
+    performance = snapshot.performance or {}
+    latency_line = ", ".join(
+        f"{name}: {stats['p50_ms']:.0f}/{stats['p95_ms']:.0f}/{stats['p99_ms']:.0f} ms"
+        for name, stats in (performance.get("commands") or {}).items()
+    ) or "none"
+    sql_line = ", ".join(
+        f"{label}: {stats['total_ms']:.0f} ms over {stats['count']} calls"
+        for label, stats in (performance.get("sql") or {}).items()
+    ) or "none"
+    loop_lag = performance.get("loop_lag") or {}
+    thread_wait = performance.get("thread_wait") or {}
+    cache_line = ", ".join(
+        f"{name}: {_format_cache_stats(stats)}" for name, stats in snapshot.caches.items()
+    ) or "none"
 
     return (
         f"**Status:** {status_line}\n"
@@ -277,5 +377,13 @@ def format_health_snapshot(snapshot: HealthSnapshot) -> str:
         f"{snapshot.usage.command_failures} failed\n"
         f"**Top commands:** {command_line}\n"
         f"**API requests:** {api_line}\n"
+        f"**Command latency p50/p95/p99:** {latency_line}\n"
+        f"**SQL hot spots:** {sql_line}\n"
+        f"**Event loop lag p99:** {loop_lag.get('p99_ms', 0.0):.1f} ms, "
+        f"thread queue wait p95: {thread_wait.get('p95_ms', 0.0):.1f} ms, "
+        f"slow queries: {performance.get('slow_queries', 0)}\n"
+        f"**Caches:** {cache_line}\n"
+        f"**Startup:** {_format_startup_profile(snapshot.startup)}\n"
+        f"**DB maintenance:** {snapshot.maintenance or 'not run since startup'}\n"
         f"**Degraded reasons:**\n{reasons}"
     )
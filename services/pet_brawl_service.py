@@ -645,6 +645,11 @@ class PetBrawlService:
             self._now(), active_ttl_seconds=PET_BRAWL_ACTIVE_TTL_SECONDS
         )
 
+    def next_sweep_at(self) -> int | None:
+        return self.pet_brawl_repo.next_stale_at(
+            active_ttl_seconds=PET_BRAWL_ACTIVE_TTL_SECONDS
+        )
+
     def record(self, pet_id: int, guild_id: int | None) -> tuple[int, int]:
         return self.pet_brawl_repo.get_pet_record(pet_id, guild_id)
 
@@ -71,22 +71,17 @@ class PetEvolutionService:
         return self.pet_repo.get_pet_by_id(pet.pet_id, pet.guild_id) or pet
 
     def find_due(self, now: int, *, limit: int = 100) -> list[Pet]:
-        pets: list[Pet] = []
-        for pet_id, guild_id in self.evolution_repo.find_due_refs(now, limit=limit):
-            pet = self.pet_repo.get_pet_by_id(pet_id, guild_id)
-            if pet is not None:
-                pets.append(pet)
-        return pets
+        return self.pet_repo.get_pets_by_ids(
+            self.evolution_repo.find_due_refs(now, limit=limit)
+        )
 
     def get_unannounced(self, *, limit: int = 100) -> list[EvolutionNotice]:
-        notices: list[EvolutionNotice] = []
-        for pet_id, guild_id in self.evolution_repo.find_unannounced_refs(
-            limit=limit
-        ):
-            pet = self.pet_repo.get_pet_by_id(pet_id, guild_id)
-            if pet is not None:
-                notices.append(EvolutionNotice(pet=pet))
-        return notices
+        return [
+            EvolutionNotice(pet=pet)
+            for pet in self.pet_repo.get_pets_by_ids(
+                self.evolution_repo.find_unannounced_refs(limit=limit)
+            )
+        ]
 
     def callingdex(
         self,
@@ -77,13 +77,18 @@ from domain.pet_constants import (
 from domain.pet_evolution import PetActivity
 from services import error_codes
 from services.result import Result
-from utils.game_date import game_date_for_timestamp
+from utils.game_date import (
+    game_date_for_timestamp,
+    game_day_start_ts,
+    weekday_of_game_date,
+)
 
 logger = logging.getLogger("cama_bot.services.pet")
 
 # Species decay multipliers are bounded; the starvation sweep uses the fastest
 # to build a candidate superset that the exact per-species check then filters.
 _MAX_DECAY_PCT = max(s.decay_pct for s in SPECIES.values())
+_DECAY_PCT_BY_SPECIES = {species_id: s.decay_pct for species_id, s in SPECIES.items()}
 
 _FORBIDDEN_NAME_FRAGMENTS = ("@", "http://", "https://", "discord.gg")
 
@@ -99,6 +104,18 @@ def _prev_week_key_for_timestamp(ts: int) -> str:
     return _week_key_for_timestamp(ts - 7 * 86400)
 
 
+def _next_week_start(ts: int) -> int:
+    """Start of the next game week (the game-date Monday boundary after ``ts``)."""
+    weekday = weekday_of_game_date(game_date_for_timestamp(ts))
+    return game_day_start_ts(ts) + (7 - weekday) * 86400
+
+
+def _is_pity_streak(recent_species: list[str]) -> bool:
+    return len(recent_species) >= PITY_THRESHOLD and all(
+        get_species(sp).tier == "common" for sp in recent_species
+    )
+
+
 class PetService:
     def __init__(
         self,
@@ -146,21 +163,53 @@ class PetService:
         """Select and persist a species once an unresolved egg reaches hatch."""
         if pet.species != UNHATCHED_SPECIES or now < pet.hatched_at:
             return pet
-        if pet.egg_tier == "gilded":
-            species = self._roll_species_tiered(GILDED_TIER_WEIGHTS)
-        elif self._pity_active(pet.discord_id, pet.guild_id):
-            species = self._roll_species_tiered(PITY_TIER_WEIGHTS)
-        else:
-            species_ids = list(SPECIES)
-            weights = [SPECIES[species_id].weight for species_id in species_ids]
-            species = random.choices(species_ids, weights=weights, k=1)[0]
+        pity = pet.egg_tier != "gilded" and self._pity_active(
+            pet.discord_id, pet.guild_id
+        )
         return self.pet_repo.resolve_hatch_species(
             pet.pet_id,
             pet.guild_id,
-            species=species,
+            species=self._roll_hatch_species(pet, pity=pity),
             now=now,
         )
 
+    def _roll_hatch_species(self, pet: Pet, *, pity: bool) -> str:
+        if pet.egg_tier == "gilded":
+            return self._roll_species_tiered(GILDED_TIER_WEIGHTS)
+        if pity:
+            return self._roll_species_tiered(PITY_TIER_WEIGHTS)
+        species_ids = list(SPECIES)
+        weights = [SPECIES[species_id].weight for species_id in species_ids]
+        return random.choices(species_ids, weights=weights, k=1)[0]
+
+    def _resolve_hatches(self, pets: list[Pet], now: int) -> list[Pet]:
+        """Batch _resolve_hatch: one pity read and one write for every due egg."""
+        due = [
+            pet for pet in pets
+            if pet.species == UNHATCHED_SPECIES and now >= pet.hatched_at
+        ]
+        if not due:
+            return pets
+        recent = self.pet_repo.recent_dead_species_many(
+            [(pet.discord_id, pet.guild_id) for pet in due if pet.egg_tier != "gilded"],
+            PITY_THRESHOLD,
+        )
+        assignments = [
+            (
+                pet,
+                self._roll_hatch_species(
+                    pet,
+                    pity=_is_pity_streak(recent.get((pet.discord_id, pet.guild_id), [])),
+                ),
+            )
+            for pet in due
+        ]
+        resolved = {
+            pet.pet_id: pet
+            for pet in self.pet_repo.resolve_hatch_species_many(assignments, now=now)
+        }
+        return [resolved.get(pet.pet_id, pet) for pet in pets]
+
     def resolve_starvation(self, pet: Pet, now: int) -> Pet | None:
         """Return the (possibly Aegis-revived) living pet, or None if it died.
 
@@ -225,6 +274,59 @@ class PetService:
             current = self.pet_repo.get_pet_by_id(current.pet_id, current.guild_id)
         return None
 
+    def _settle_starvation(self, pets: list[Pet], now: int) -> None:
+        """Batch resolve_starvation for the sweep.
+
+        Eggs are hatched in bulk, then one pass over the snapshot decides
+        each pet: plain starvations are claimed together under one write
+        lock. Pets whose evolution comes due first, Shellbacks with an unused
+        Aegis, and claims lost to a concurrent feed take the per-pet path.
+        """
+        fallback: list[Pet] = []
+        claims: list[dict] = []
+        for pet in self._resolve_hatches(pets, now):
+            if pet.died_at is not None:
+                continue
+            starvation_at = pet.starvation_time(self.decay_per_day)
+            if self.evolution_service is not None and self._evolution_pending(
+                pet, min(now, starvation_at - 1)
+            ):
+                fallback.append(pet)
+                continue
+            if not pet.is_starved(now, self.decay_per_day):
+                continue
+            if get_species(pet.species).has_aegis and not pet.aegis_used:
+                fallback.append(pet)
+                continue
+            work_units, work_at = self._dig_work_settlement(pet, starvation_at)
+            claims.append({
+                "pet_id": pet.pet_id,
+                "guild_id": pet.guild_id,
+                "died_at": starvation_at,
+                "expected_last_fed_at": pet.last_fed_at,
+                "expected_hunger": pet.hunger_at_last_fed,
+                "expected_dig_work_units": pet.dig_work_units,
+                "expected_dig_work_at": pet.dig_work_at,
+                "new_dig_work_units": work_units,
+                "new_dig_work_at": work_at,
+            })
+        lost = self.pet_repo.claim_deaths_many(claims)
+        if lost:
+            by_id = {claim["pet_id"]: claim["guild_id"] for claim in claims}
+            fallback.extend(
+                self.pet_repo.get_pets_by_ids([(pet_id, by_id[pet_id]) for pet_id in lost])
+            )
+        for pet in fallback:
+            self.resolve_starvation(pet, now)
+
+    @staticmethod
+    def _evolution_pending(pet: Pet, alive_through: int) -> bool:
+        return (
+            pet.evolved_at is None
+            and pet.evolution_due_at is not None
+            and pet.evolution_due_at <= alive_through
+        )
+
     def living_pet(self, discord_id: int, guild_id: int | None, now: int) -> Pet | None:
         pet = self.pet_repo.get_active_pet(discord_id, guild_id)
         if pet is None:
@@ -560,11 +662,8 @@ class PetService:
         return random.choice(species_ids_by_tier(tier))
 
     def _pity_active(self, discord_id: int, guild_id: int | None) -> bool:
-        recent = self.pet_repo.recent_dead_species(
-            discord_id, guild_id, PITY_THRESHOLD
-        )
-        return len(recent) >= PITY_THRESHOLD and all(
-            get_species(sp).tier == "common" for sp in recent
+        return _is_pity_streak(
+            self.pet_repo.recent_dead_species(discord_id, guild_id, PITY_THRESHOLD)
         )
 
     def rename(self, discord_id: int, guild_id: int | None, name: str) -> Result[Pet]:
@@ -915,48 +1014,93 @@ class PetService:
     def sweep(self, *, announcement_limit: int = 100) -> dict:
         """One global pass: evolution, starvation, hatch/death notices, refunds.
 
-        Delivery bookkeeping is the caller's job so failed Discord sends retry
-        next tick.
+        Starvation is settled in batches (see _settle_starvation). Hatch and
+        death notices come back one page at a time: a non-None ``"cursor"``
+        means more are waiting behind this page, fetched with
+        next_announcements. Delivery bookkeeping is the caller's job so
+        failed Discord sends retry next tick. ``"retry"`` is True when a
+        refund window failed or ran short and should be retried soon.
         """
         now = self._now()
+        pending: dict[int, Pet] = {}
         if self.evolution_service is not None:
-            for pet in self.evolution_service.find_due(now):
-                self.resolve_starvation(pet, now)
-
-        candidates = self.pet_repo.find_starvation_candidates(
-            now, decay_per_day=self.decay_per_day, max_decay_pct=_MAX_DECAY_PCT
+            pending.update((pet.pet_id, pet) for pet in self.evolution_service.find_due(now))
+        pending.update(
+            (pet.pet_id, pet)
+            for pet in self.pet_repo.find_starvation_candidates(
+                now, decay_per_day=self.decay_per_day, max_decay_pct=_MAX_DECAY_PCT
+            )
         )
-        for pet in candidates:
-            self.resolve_starvation(pet, now)
+        self._settle_starvation(list(pending.values()), now)
 
-        deaths = [
-            DeathNotice(
-                pet=p,
-                eating_outcome=(
-                    self.pet_repo.get_eating_outcome(p.pet_id, p.guild_id)
-                    if p.death_cause == "eaten"
-                    else None
-                ),
-            )
-            for p in self.pet_repo.get_unannounced_deaths(limit=announcement_limit)
-        ]
-        hatches = [
-            HatchNotice(pet=self._resolve_hatch(pet, now))
-            for pet in self.pet_repo.find_unannounced_hatches(
-                now, limit=announcement_limit
-            )
-        ]
-        evolutions = (
+        page = self._announcement_page({"now": now}, announcement_limit)
+        page["evolutions"] = (
             self.evolution_service.get_unannounced(limit=announcement_limit)
             if self.evolution_service is not None
             else []
         )
-        refunds = self._sweep_refunds(now, limit=announcement_limit)
+        page["refunds"], page["retry"] = self._sweep_refunds(
+            now, limit=announcement_limit
+        )
+        return page
+
+    def next_sweep_at(self) -> int | None:
+        """When sweep next has work: a hatch, evolution, starvation, pending
+        announcement, or the next week's refunds. Past-due work comes back as
+        a past timestamp."""
+        now = self._now()
+        pet_due = self.pet_repo.next_sweep_due_at(
+            decay_per_day=self.decay_per_day,
+            decay_pct_by_species=_DECAY_PCT_BY_SPECIES,
+            default_decay_pct=get_species(UNHATCHED_SPECIES).decay_pct,
+        )
+        refund_due = _next_week_start(now)
+        return refund_due if pet_due is None else min(pet_due, refund_due)
+
+    def next_announcements(self, cursor: dict, *, limit: int = 100) -> dict:
+        """The hatch/death page after ``cursor`` (from sweep or a prior page).
+
+        Pages are keyset-ordered, so notices whose delivery failed are not
+        fetched again until the next sweep.
+        """
+        page = self._announcement_page(cursor, limit)
+        page["evolutions"] = []
+        page["refunds"] = []
+        page["retry"] = False
+        return page
+
+    def _announcement_page(self, cursor: dict, limit: int) -> dict:
+        now = cursor["now"]
+        deaths: list[Pet] = []
+        if cursor.get("deaths_done") is not True:
+            deaths = self.pet_repo.get_unannounced_deaths(
+                limit=limit, after=cursor.get("deaths_after")
+            )
+        hatches: list[Pet] = []
+        if cursor.get("hatches_done") is not True:
+            hatches = self.pet_repo.find_unannounced_hatches(
+                now, limit=limit, after=cursor.get("hatches_after")
+            )
+        outcomes = self.pet_repo.get_eating_outcomes(
+            [(p.pet_id, p.guild_id) for p in deaths if p.death_cause == "eaten"]
+        )
+        next_cursor = {
+            "now": now,
+            "deaths_done": len(deaths) < limit,
+            "deaths_after": (deaths[-1].died_at, deaths[-1].pet_id) if deaths else None,
+            "hatches_done": len(hatches) < limit,
+            "hatches_after": (
+                (hatches[-1].hatched_at, hatches[-1].pet_id) if hatches else None
+            ),
+        }
+        more = not (next_cursor["deaths_done"] and next_cursor["hatches_done"])
         return {
-            "deaths": deaths,
-            "hatches": hatches,
-            "evolutions": evolutions,
-            "refunds": refunds,
+            "deaths": [
+                DeathNotice(pet=p, eating_outcome=outcomes.get(p.pet_id))
+                for p in deaths
+            ],
+            "hatches": [HatchNotice(pet=p) for p in self._resolve_hatches(hatches, now)],
+            "cursor": next_cursor if more else None,
         }
 
     def mark_death_announced(self, pet: Pet) -> None:
@@ -970,7 +1114,9 @@ class PetService:
             notice.guild_id, notice.week_key, self._now()
         )
 
-    def _sweep_refunds(self, now: int, *, limit: int = 100) -> list[RefundNotice]:
+    def _sweep_refunds(
+        self, now: int, *, limit: int = 100
+    ) -> tuple[list[RefundNotice], bool]:
         # Look back two weeks, oldest first: the two-slot care accumulator can
         # still substantiate both, so an outage spanning a week boundary does
         # not silently forfeit the older window.
@@ -978,11 +1124,13 @@ class PetService:
             _week_key_for_timestamp(now - 14 * 86400),
             _week_key_for_timestamp(now - 7 * 86400),
         ]
+        retry = False
         for guild_id in self.pet_repo.list_pet_guild_ids():
             for week_key in week_keys:
                 try:
                     self._pay_guild_refunds(guild_id, week_key, now)
                 except ValueError as exc:
+                    retry = True
                     if str(exc) == "fund_short":
                         logger.warning(
                             "Pet refund fund_short for guild %s %s; retrying next tick",
@@ -998,11 +1146,12 @@ class PetService:
                         guild_id, week_key,
                     )
                 except Exception:
+                    retry = True
                     logger.exception(
                         "Pet refund failed for guild %s %s; continuing sweep",
                         guild_id, week_key,
                     )
-        return self.pet_repo.get_unannounced_refunds(limit=limit)
+        return self.pet_repo.get_unannounced_refunds(limit=limit), retry
 
     def _pay_guild_refunds(
         self, guild_id: int, week_key: str, now: int
@@ -1043,12 +1192,8 @@ class PetService:
             payouts = [p for p in payouts if p.amount > 0]
             if not payouts:
                 # Fund is empty: leave the window UNCLAIMED so a later top-up
-                # can still pay this week (mirrors the fund_short retry path).
-                logger.warning(
-                    "Pet refund fund empty for guild %s %s; retrying next tick",
-                    guild_id, week_key,
-                )
-                return None
+                # can still pay this week (takes the fund_short retry path).
+                raise ValueError("fund_short")
         notice = RefundNotice(
             guild_id=guild_id,
             week_key=week_key,
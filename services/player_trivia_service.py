@@ -17,6 +17,7 @@ from typing import Any
 
 from config import CALIBRATION_RD_THRESHOLD, PREDICTION_CONTRACT_VALUE
 from domain.rating_constants import OPENSKILL_DISPLAY_SCALE, OPENSKILL_MIN_MU
+from repositories.player_trivia_repository import SNAPSHOT_TAIL_KEYS
 
 logger = logging.getLogger("cama_bot.services.player_trivia")
 
@@ -32,6 +33,13 @@ _MARKDOWN_RE = re.compile(r"[\\*_`~|>\[\]()]")
 _OPTION_MARKDOWN_RE = re.compile(r"[\\*_`~|>\[\]]")
 _DISCORD_MENTION_RE = re.compile(r"<@[1-9]\d*>")
 PLAYER_TRIVIA_SNAPSHOT_CACHE_TTL_SECONDS = 45.0
+# Between full reloads an expired snapshot is only extended with new tail rows;
+# the periodic full reload picks up in-place edits (enrichment, corrections).
+PLAYER_TRIVIA_SNAPSHOT_FULL_RELOAD_SECONDS = 600.0
+# Sessions sample a prebuilt candidate pool. The background refresher re-checks
+# pools well inside this window; an unconfirmed pool is rebuilt on demand.
+PLAYER_TRIVIA_QUESTION_POOL_MAX_AGE_SECONDS = 300.0
+PLAYER_TRIVIA_QUESTION_POOL_IDLE_SECONDS = 3600.0
 
 _RawSnapshot = Mapping[Any, tuple[Mapping[str, Any], ...]]
 
@@ -71,15 +79,42 @@ class PlayerTriviaQuestion:
 
 @dataclass(frozen=True)
 class _Candidate:
-    question: PlayerTriviaQuestion
+    """A pooled question whose options are drawn when a session uses it.
+
+    Pools only keep the answer and its distractor pool; each session samples
+    three distractors and shuffles them with the answer, so sessions built
+    from the same pool still vary their wrong answers and option order.
+    """
+
+    key: str
+    category: str
+    text: str
+    correct: str
+    distractors: tuple[str, ...]
+    explanation: str
     identity: str
+    spicy: bool = False
+
+    def render(self, rng: random.Random) -> PlayerTriviaQuestion:
+        choices = rng.sample(self.distractors, 3)
+        choices.append(self.correct)
+        rng.shuffle(choices)
+        return PlayerTriviaQuestion(
+            key=self.key,
+            category=self.category,
+            text=self.text,
+            options=tuple(choices),  # type: ignore[arg-type]
+            correct_index=choices.index(self.correct),
+            explanation=self.explanation,
+            spicy=self.spicy,
+        )
 
 
 @dataclass
 class _Context:
-    snapshot: dict[str, list[dict[str, Any]]]
+    snapshot: _RawSnapshot
     names: dict[int, str]
-    player_rows: dict[int, dict[str, Any]]
+    player_rows: dict[int, Mapping[str, Any]]
     candidates: list[_Candidate]
 
 
@@ -87,6 +122,20 @@ class _Context:
 class _SnapshotCacheEntry:
     snapshot: _RawSnapshot
     expires_at: float
+    full_reload_at: float
+    watermarks: Mapping[str, int]
+
+
+@dataclass
+class _QuestionPool:
+    """Deduped candidates for one guild snapshot and eligible player set."""
+
+    snapshot: _RawSnapshot
+    player_ids: frozenset[int]
+    members: frozenset[int]
+    candidates: tuple[_Candidate, ...]
+    built_at: float
+    last_used_at: float
 
 
 @dataclass
@@ -96,14 +145,55 @@ class _SnapshotLoad:
     error: BaseException | None = None
 
 
+def _freeze_rows(rows: Iterable[Mapping[str, Any]] | None) -> tuple[Mapping[str, Any], ...]:
+    return tuple(MappingProxyType(dict(row)) for row in (rows or ()))
+
+
 def _freeze_snapshot(snapshot: Mapping[Any, Iterable[Mapping[str, Any]]]) -> _RawSnapshot:
     """Detach and freeze the repository result before sharing it across calls."""
-    return MappingProxyType(
-        {
-            key: tuple(MappingProxyType(dict(row)) for row in (rows or ()))
-            for key, rows in snapshot.items()
-        }
-    )
+    return MappingProxyType({key: _freeze_rows(rows) for key, rows in snapshot.items()})
+
+
+def _extend_snapshot(
+    base: _RawSnapshot,
+    changes: Mapping[Any, Iterable[Mapping[str, Any]]],
+    tailed: Iterable[str],
+) -> _RawSnapshot:
+    """Append new tail rows to ``base`` and swap in fully reloaded datasets.
+
+    Rows already frozen in ``base`` are shared, not copied, so a refresh
+    costs the changed rows rather than the guild's whole history. Returns
+    ``base`` itself when nothing changed, so callers can use identity to
+    tell whether derived data (the question pool) is stale.
+    """
+    tailed = set(tailed)
+    merged = dict(base)
+    changed = False
+    for key, rows in changes.items():
+        frozen = _freeze_rows(rows)
+        if key in tailed:
+            if frozen:
+                merged[key] = base.get(key, ()) + frozen
+                changed = True
+        elif key not in base or frozen != base[key]:
+            merged[key] = frozen
+            changed = True
+    return MappingProxyType(merged) if changed else base
+
+
+def _tail_watermarks(
+    snapshot: _RawSnapshot,
+    previous: Mapping[str, int] | None = None,
+    changes: Mapping[Any, Iterable[Mapping[str, Any]]] | None = None,
+) -> Mapping[str, int]:
+    """Highest tail key held per append-only dataset (only new rows scanned)."""
+    watermarks = dict(previous or {})
+    for name, key in SNAPSHOT_TAIL_KEYS.items():
+        rows = snapshot.get(name, ()) if changes is None else (changes.get(name) or ())
+        values = [_as_int(row.get(key)) for row in rows]
+        if values:
+            watermarks[name] = max(values + [watermarks.get(name, values[0])])
+    return MappingProxyType(watermarks)
 
 
 def _safe_name(value: Any) -> str:
@@ -184,31 +274,44 @@ class PlayerTriviaService:
         rng: random.Random | None = None,
         *,
         snapshot_cache_ttl_seconds: float = PLAYER_TRIVIA_SNAPSHOT_CACHE_TTL_SECONDS,
+        snapshot_full_reload_seconds: float = PLAYER_TRIVIA_SNAPSHOT_FULL_RELOAD_SECONDS,
+        question_pool_max_age_seconds: float = PLAYER_TRIVIA_QUESTION_POOL_MAX_AGE_SECONDS,
+        question_pool_idle_seconds: float = PLAYER_TRIVIA_QUESTION_POOL_IDLE_SECONDS,
         monotonic_clock: Callable[[], float] = time.monotonic,
     ):
         self.repo = repo
         self.rng = rng or random.Random()
         self._snapshot_cache_ttl_seconds = snapshot_cache_ttl_seconds
+        self._snapshot_full_reload_seconds = snapshot_full_reload_seconds
         self._monotonic_clock = monotonic_clock
         self._snapshot_cache: dict[int, _SnapshotCacheEntry] = {}
         self._snapshot_loads: dict[int, _SnapshotLoad] = {}
         self._snapshot_cache_lock = threading.Lock()
+        self._question_pool_max_age_seconds = question_pool_max_age_seconds
+        self._question_pool_idle_seconds = question_pool_idle_seconds
+        self._question_pools: dict[int, _QuestionPool] = {}
+        self._question_pool_lock = threading.Lock()
 
     def _get_raw_snapshot(self, guild_id: int) -> _RawSnapshot:
-        """Return one immutable snapshot per guild and short cache window."""
+        """Return one immutable snapshot per guild and short cache window.
+
+        Once the window lapses the guild's snapshot is extended from its tail
+        watermarks instead of reloaded, until the full-reload deadline.
+        """
         with self._snapshot_cache_lock:
             now = self._monotonic_clock()
             expired_guild_ids = [
                 cached_guild_id
                 for cached_guild_id, entry in self._snapshot_cache.items()
-                if now >= entry.expires_at
+                if now >= entry.expires_at and cached_guild_id != guild_id
             ]
             for expired_guild_id in expired_guild_ids:
                 del self._snapshot_cache[expired_guild_id]
 
             cached = self._snapshot_cache.get(guild_id)
-            if cached is not None:
+            if cached is not None and now < cached.expires_at:
                 return cached.snapshot
+            base = cached if cached is not None and now < cached.full_reload_at else None
 
             load = self._snapshot_loads.get(guild_id)
             if load is None:
@@ -227,8 +330,15 @@ class PlayerTriviaService:
             return load.snapshot
 
         try:
-            raw_snapshot = self.repo.load_snapshot(guild_id) or {}
-            snapshot = _freeze_snapshot(raw_snapshot)
+            if base is None:
+                snapshot = _freeze_snapshot(self.repo.load_snapshot(guild_id) or {})
+                watermarks = _tail_watermarks(snapshot)
+                full_reload_at = self._monotonic_clock() + self._snapshot_full_reload_seconds
+            else:
+                changes = self.repo.load_snapshot(guild_id, since=dict(base.watermarks)) or {}
+                snapshot = _extend_snapshot(base.snapshot, changes, base.watermarks)
+                watermarks = _tail_watermarks(snapshot, base.watermarks, changes)
+                full_reload_at = base.full_reload_at
             expires_at = self._monotonic_clock() + self._snapshot_cache_ttl_seconds
         except BaseException as error:
             with self._snapshot_cache_lock:
@@ -242,6 +352,8 @@ class PlayerTriviaService:
             self._snapshot_cache[guild_id] = _SnapshotCacheEntry(
                 snapshot=snapshot,
                 expires_at=expires_at,
+                full_reload_at=full_reload_at,
+                watermarks=watermarks,
             )
             load.snapshot = snapshot
             if self._snapshot_loads.get(guild_id) is load:
@@ -249,13 +361,9 @@ class PlayerTriviaService:
             load.event.set()
         return snapshot
 
-    def _snapshot_for_generation(self, guild_id: int) -> dict[str, list[dict[str, Any]]]:
-        """Return a mutable per-call copy while keeping the shared cache read-only."""
-        raw_snapshot = self._get_raw_snapshot(guild_id)
-        return {
-            str(key): [dict(row) for row in rows]
-            for key, rows in raw_snapshot.items()
-        }
+    def _snapshot_for_generation(self, guild_id: int) -> _RawSnapshot:
+        """Return the shared read-only snapshot; builders never mutate rows."""
+        return self._get_raw_snapshot(guild_id)
 
     # ------------------------------------------------------------------
     # Session persistence delegates
@@ -327,18 +435,147 @@ class PlayerTriviaService:
         include_spicy: bool = False,
         recent_days: int = 30,
     ) -> list[PlayerTriviaQuestion]:
+        """Sample a session from the guild's precomputed candidate pool.
+
+        The pool is built on first use and kept current by
+        `refresh_question_pools`, so a warm session start is a pool lookup
+        plus the caller's recent-question keys.
+        """
         if count <= 0:
             return []
 
-        snapshot = self._snapshot_for_generation(guild_id)
         allowed = (
             {_as_int(member_id) for member_id in current_member_ids}
             if current_member_ids is not None
             else None
         )
-        names, player_rows = self._player_index(snapshot.get("players", []), allowed)
+        candidates = self._question_pool(guild_id, allowed)
+
+        since = int(time.time()) - max(0, recent_days) * 86400
+        recent_raw = self.repo.get_recent_question_keys(user_id, guild_id, since) or []
+        recent_keys = {
+            str(item.get("key") or item.get("question_key"))
+            if isinstance(item, Mapping)
+            else str(item)
+            for item in recent_raw
+        }
+        eligible = [
+            candidate
+            for candidate in candidates
+            if candidate.key not in recent_keys
+            and (include_spicy or not candidate.spicy)
+        ]
+        self.rng.shuffle(eligible)
+
+        selected: list[PlayerTriviaQuestion] = []
+        category_counts: Counter[str] = Counter()
+        identity_counts: Counter[str] = Counter()
+        for candidate in eligible:
+            if category_counts[candidate.category] >= 2:
+                continue
+            if identity_counts[candidate.identity] >= 2:
+                continue
+            selected.append(candidate.render(self.rng))
+            category_counts[candidate.category] += 1
+            identity_counts[candidate.identity] += 1
+            if len(selected) >= count:
+                break
+        return selected
+
+    def refresh_question_pools(self) -> int:
+        """Rebuild pools whose guild data changed; return how many were rebuilt.
+
+        Run in the background. Pools nobody has sampled for the idle window
+        are dropped instead of refreshed; a pool whose snapshot is unchanged
+        is only marked fresh.
+        """
+        now = self._monotonic_clock()
+        with self._question_pool_lock:
+            for guild_id in [
+                guild_id
+                for guild_id, pool in self._question_pools.items()
+                if now - pool.last_used_at >= self._question_pool_idle_seconds
+            ]:
+                del self._question_pools[guild_id]
+            pools = list(self._question_pools.items())
+
+        rebuilt = 0
+        for guild_id, pool in pools:
+            try:
+                checked_at = self._monotonic_clock()
+                snapshot = self._snapshot_for_generation(guild_id)
+                if snapshot is pool.snapshot:
+                    with self._question_pool_lock:
+                        pool.built_at = checked_at
+                    continue
+                self._build_question_pool(guild_id, snapshot, pool.members, checked_at)
+                rebuilt += 1
+            except Exception:
+                logger.exception("Failed to refresh player-trivia pool for guild %s", guild_id)
+        return rebuilt
+
+    def _question_pool(self, guild_id: int, allowed: set[int] | None) -> tuple[_Candidate, ...]:
+        """Return the guild's pool for ``allowed``, building it when missing or stale.
+
+        Pools are keyed by the eligible *players*, not the raw member list, so
+        guild members who never played do not invalidate them.
+        """
+        now = self._monotonic_clock()
+        with self._question_pool_lock:
+            pool = self._question_pools.get(guild_id)
+            if pool is not None and now - pool.built_at < self._question_pool_max_age_seconds:
+                members = pool.player_ids if allowed is None else pool.player_ids & allowed
+                if members == pool.members:
+                    pool.last_used_at = now
+                    return pool.candidates
+
+        snapshot = self._snapshot_for_generation(guild_id)
+        player_ids = self._snapshot_player_ids(snapshot)
+        members = player_ids if allowed is None else player_ids & allowed
+        if pool is not None and snapshot is pool.snapshot and members == pool.members:
+            with self._question_pool_lock:
+                pool.built_at = pool.last_used_at = now
+            return pool.candidates
+        return self._build_question_pool(guild_id, snapshot, members, now).candidates
+
+    def _build_question_pool(
+        self,
+        guild_id: int,
+        snapshot: _RawSnapshot,
+        members: frozenset[int],
+        built_at: float,
+    ) -> _QuestionPool:
+        player_ids = self._snapshot_player_ids(snapshot)
+        pool = _QuestionPool(
+            snapshot=snapshot,
+            player_ids=player_ids,
+            members=members & player_ids,
+            candidates=self._build_candidates(snapshot, members & player_ids),
+            built_at=built_at,
+            last_used_at=built_at,
+        )
+        with self._question_pool_lock:
+            current = self._question_pools.get(guild_id)
+            if current is not None:
+                pool.last_used_at = max(pool.last_used_at, current.last_used_at)
+            self._question_pools[guild_id] = pool
+        return pool
+
+    @staticmethod
+    def _snapshot_player_ids(snapshot: _RawSnapshot) -> frozenset[int]:
+        return frozenset(
+            discord_id
+            for discord_id in (_as_int(row.get("discord_id")) for row in snapshot.get("players", ()))
+            if discord_id > 0
+        )
+
+    def _build_candidates(
+        self, snapshot: _RawSnapshot, members: frozenset[int]
+    ) -> tuple[_Candidate, ...]:
+        """Run every builder once and keep the first candidate per question key."""
+        names, player_rows = self._player_index(snapshot.get("players", []), members)
         if len(names) < 4:
-            return []
+            return ()
 
         context = _Context(
             snapshot=snapshot,
@@ -369,41 +606,10 @@ class PlayerTriviaService:
                 # unavailable. Log the category and keep the other candidates.
                 logger.exception("Failed to build player-trivia candidates in %s", builder.__name__)
 
-        since = int(time.time()) - max(0, recent_days) * 86400
-        recent_raw = self.repo.get_recent_question_keys(user_id, guild_id, since) or []
-        recent_keys = {
-            str(item.get("key") or item.get("question_key"))
-            if isinstance(item, Mapping)
-            else str(item)
-            for item in recent_raw
-        }
-        eligible = [
-            candidate
-            for candidate in context.candidates
-            if candidate.question.key not in recent_keys
-            and (include_spicy or not candidate.question.spicy)
-        ]
-        self.rng.shuffle(eligible)
-
-        selected: list[PlayerTriviaQuestion] = []
-        category_counts: Counter[str] = Counter()
-        identity_counts: Counter[str] = Counter()
-        seen_keys: set[str] = set()
-        for candidate in eligible:
-            question = candidate.question
-            if question.key in seen_keys:
-                continue
-            if category_counts[question.category] >= 2:
-                continue
-            if identity_counts[candidate.identity] >= 2:
-                continue
-            selected.append(question)
-            seen_keys.add(question.key)
-            category_counts[question.category] += 1
-            identity_counts[candidate.identity] += 1
-            if len(selected) >= count:
-                break
-        return selected
+        unique: dict[str, _Candidate] = {}
+        for candidate in context.candidates:
+            unique.setdefault(candidate.key, candidate)
+        return tuple(unique.values())
 
     # ------------------------------------------------------------------
     # Generic candidate helpers
@@ -411,10 +617,10 @@ class PlayerTriviaService:
 
     def _player_index(
         self,
-        rows: Sequence[dict[str, Any]],
-        allowed: set[int] | None,
-    ) -> tuple[dict[int, str], dict[int, dict[str, Any]]]:
-        pending: list[tuple[int, str, dict[str, Any]]] = []
+        rows: Sequence[Mapping[str, Any]],
+        allowed: frozenset[int] | None,
+    ) -> tuple[dict[int, str], dict[int, Mapping[str, Any]]]:
+        pending: list[tuple[int, str, Mapping[str, Any]]] = []
         for row in sorted(rows, key=lambda item: _as_int(item.get("discord_id"))):
             discord_id = _as_int(row.get("discord_id"))
             if discord_id <= 0 or (allowed is not None and discord_id not in allowed):
@@ -423,15 +629,17 @@ class PlayerTriviaService:
             pending.append((discord_id, name, row))
 
         names: dict[int, str] = {}
-        player_rows: dict[int, dict[str, Any]] = {}
+        player_rows: dict[int, Mapping[str, Any]] = {}
         for discord_id, name, row in pending:
             names[discord_id] = name
             player_rows[discord_id] = row
         return names, player_rows
 
-    def _four_options(
-        self, correct: str, distractors: Iterable[str]
-    ) -> tuple[tuple[str, str, str, str], int] | None:
+    @staticmethod
+    def _option_pool(
+        correct: str, distractors: Iterable[str]
+    ) -> tuple[str, tuple[str, ...]] | None:
+        """Sanitized answer plus at least three distinct distractors, or None."""
         correct = _safe_option(correct)
         if not correct:
             return None
@@ -442,11 +650,7 @@ class PlayerTriviaService:
                 unique.setdefault(safe.casefold(), safe)
         if len(unique) < 3:
             return None
-        choices = self.rng.sample(sorted(unique.values(), key=str.casefold), 3)
-        choices.append(correct)
-        self.rng.shuffle(choices)
-        options = tuple(choices)
-        return options, options.index(correct)  # type: ignore[return-value]
+        return correct, tuple(sorted(unique.values(), key=str.casefold))
 
     def _add_player_leader(
         self,
@@ -479,26 +683,24 @@ class PlayerTriviaService:
         render = displayed or (lambda value: value)
         if winner_value == usable[1][1] or render(winner_value) == render(usable[1][1]):
             return
-        built = self._four_options(
+        built = self._option_pool(
             context.names[winner_id],
             (context.names[player_id] for player_id, _ in usable[1:]),
         )
         if built is None:
             return
-        options, correct_index = built
+        correct, distractors = built
         name = context.names[winner_id]
         context.candidates.append(
             _Candidate(
-                PlayerTriviaQuestion(
-                    key=key,
-                    category=category,
-                    text=text,
-                    options=options,
-                    correct_index=correct_index,
-                    explanation=explanation(name, winner_value),
-                    spicy=spicy,
-                ),
+                key=key,
+                category=category,
+                text=text,
+                correct=correct,
+                distractors=distractors,
+                explanation=explanation(name, winner_value),
                 identity=f"player:{winner_id}",
+                spicy=spicy,
             )
         )
 
@@ -515,22 +717,20 @@ class PlayerTriviaService:
         identity: str,
         spicy: bool = False,
     ) -> None:
-        built = self._four_options(correct, distractors)
+        built = self._option_pool(correct, distractors)
         if built is None:
             return
-        options, correct_index = built
+        correct, pool = built
         context.candidates.append(
             _Candidate(
-                PlayerTriviaQuestion(
-                    key=key,
-                    category=category,
-                    text=text,
-                    options=options,
-                    correct_index=correct_index,
-                    explanation=explanation,
-                    spicy=spicy,
-                ),
+                key=key,
+                category=category,
+                text=text,
+                correct=correct,
+                distractors=pool,
+                explanation=explanation,
                 identity=identity,
+                spicy=spicy,
             )
         )
 
@@ -388,88 +388,104 @@ class PredictionService:
         Returns the refresh summary plus the trade aggregation since last refresh
         so the caller can post the daily-summary message.
         """
-        pred = self.prediction_repo.get_prediction(prediction_id)
-        if not pred or pred["status"] != "open":
-            return {"skipped": True, "reason": "not open"}
+        return self.refresh_markets([prediction_id])[0]
 
-        book = self.prediction_repo.get_book(prediction_id)
-        old_price = int(pred.get("current_price") or PREDICTION_INITIAL_FAIR_DEFAULT)
-        prev_refresh = int(pred.get("last_refresh_at") or 0)
-        asks = book["yes_asks"]
-        bids = book["yes_bids"]
-        if asks and bids:
-            observed_mid = (asks[0][0] + bids[0][0]) / 2
-        elif bids and not asks:
-            # Asks fully consumed: anchor from the last lifted ask, if recorded.
-            last_lifted_ask = self.prediction_repo.get_last_fill_price_since(
-                prediction_id, ["buy_yes", "sell_no"], prev_refresh
-            )
-            observed_mid = (last_lifted_ask or bids[0][0]) + PREDICTION_FADE_TICKS
-        elif asks and not bids:
-            # Bids fully consumed: anchor from the last hit bid, if recorded.
-            last_hit_bid = self.prediction_repo.get_last_fill_price_since(
-                prediction_id, ["buy_no", "sell_yes"], prev_refresh
+    def refresh_markets(self, prediction_ids: list[int]) -> list[dict]:
+        """Refresh many markets with one snapshot read and one write transaction.
+
+        Returns one ``refresh_market``-style summary per requested id, in order.
+        """
+        inputs = self.prediction_repo.get_refresh_inputs(prediction_ids)
+        now = int(time.time())
+        planned: dict[int, dict] = {}
+        refreshes: list[dict] = []
+        for prediction_id in dict.fromkeys(prediction_ids):
+            pred = inputs.get(prediction_id)
+            if not pred or pred["status"] != "open":
+                continue
+            old_price = int(pred.get("current_price") or PREDICTION_INITIAL_FAIR_DEFAULT)
+            observed_mid = self._observed_mid(
+                old_price,
+                pred["book"],
+                pred["last_lifted_ask"],
+                pred["last_hit_bid"],
             )
-            observed_mid = (last_hit_bid or asks[0][0]) - PREDICTION_FADE_TICKS
-        else:
-            last_lifted_ask = self.prediction_repo.get_last_fill_price_since(
-                prediction_id, ["buy_yes", "sell_no"], prev_refresh
+            drift = random.randint(PREDICTION_DRIFT_MIN, PREDICTION_DRIFT_MAX)
+            new_price = self.clamp_price(round(observed_mid) + drift)
+
+            # Daily refresh keeps its normal thin/wide range, then adds a tapered
+            # extension farther from fair. Legacy quotes inside the current minimum
+            # spread are pruned while crossing arb stays.
+            levels, modifiers = self._build_event_levels(
+                new_price,
+                int(pred["guild_id"]),
+                levels_per_side=PREDICTION_REFRESH_LEVELS_PER_SIDE,
+                size_per_level=PREDICTION_REFRESH_SIZE_PER_LEVEL,
+                spread_ticks=PREDICTION_REFRESH_SPREAD_TICKS,
+                outer_level_sizes=PREDICTION_REFRESH_OUTER_LEVEL_SIZES,
             )
-            last_hit_bid = self.prediction_repo.get_last_fill_price_since(
-                prediction_id, ["buy_no", "sell_yes"], prev_refresh
+            refreshes.append(
+                {
+                    "prediction_id": prediction_id,
+                    "new_price": new_price,
+                    "levels": levels,
+                    "now_ts": now,
+                    "since_ts": int(pred.get("last_refresh_at") or 0),
+                    "min_quote_offset": max(
+                        1,
+                        min(
+                            98 // max(1, PREDICTION_TICK_SIZE),
+                            PREDICTION_SPREAD_TICKS
+                            + int(modifiers["prediction_spread_ticks_delta"]),
+                        ),
+                    )
+                    * PREDICTION_TICK_SIZE,
+                }
             )
-            if last_lifted_ask is not None and last_hit_bid is not None:
-                observed_mid = (last_lifted_ask + last_hit_bid) / 2
-            elif last_lifted_ask is not None:
-                observed_mid = last_lifted_ask + PREDICTION_FADE_TICKS
-            elif last_hit_bid is not None:
-                observed_mid = last_hit_bid - PREDICTION_FADE_TICKS
-            else:
-                observed_mid = old_price
-
-        drift = random.randint(PREDICTION_DRIFT_MIN, PREDICTION_DRIFT_MAX)
-        new_price = self.clamp_price(round(observed_mid) + drift)
-
-        # Daily refresh keeps its normal thin/wide range, then adds a tapered
-        # extension farther from fair. Legacy quotes inside the current minimum
-        # spread are pruned while crossing arb stays.
-        levels, modifiers = self._build_event_levels(
-            new_price,
-            int(pred["guild_id"]),
-            levels_per_side=PREDICTION_REFRESH_LEVELS_PER_SIDE,
-            size_per_level=PREDICTION_REFRESH_SIZE_PER_LEVEL,
-            spread_ticks=PREDICTION_REFRESH_SPREAD_TICKS,
-            outer_level_sizes=PREDICTION_REFRESH_OUTER_LEVEL_SIZES,
-        )
-        now = int(time.time())
-        self.prediction_repo.apply_refresh(
-            prediction_id,
-            new_price,
-            levels,
-            now,
-            min_quote_offset=max(
-                1,
-                min(
-                    98 // max(1, PREDICTION_TICK_SIZE),
-                    PREDICTION_SPREAD_TICKS
-                    + int(modifiers["prediction_spread_ticks_delta"]),
-                ),
+            planned[prediction_id] = {
+                "skipped": False,
+                "prediction_id": prediction_id,
+                "old_price": old_price,
+                "new_price": new_price,
+                "drift": drift,
+                "economy_event_modifiers": modifiers,
+            }
+
+        summaries = self.prediction_repo.apply_refreshes(refreshes) if refreshes else {}
+        results = []
+        for prediction_id in prediction_ids:
+            if prediction_id not in summaries:
+                results.append({"skipped": True, "reason": "not open"})
+                continue
+            results.append(
+                {**planned[prediction_id], "trade_summary": summaries[prediction_id]}
             )
-            * PREDICTION_TICK_SIZE,
-        )
+        return results
 
-        summary = self.prediction_repo.get_trade_summary_since(
-            prediction_id, prev_refresh
-        )
-        return {
-            "skipped": False,
-            "prediction_id": prediction_id,
-            "old_price": old_price,
-            "new_price": new_price,
-            "drift": drift,
-            "trade_summary": summary,
-            "economy_event_modifiers": modifiers,
-        }
+    @staticmethod
+    def _observed_mid(
+        old_price: int,
+        book: dict,
+        last_lifted_ask: int | None,
+        last_hit_bid: int | None,
+    ) -> float:
+        asks = book["yes_asks"]
+        bids = book["yes_bids"]
+        if asks and bids:
+            return (asks[0][0] + bids[0][0]) / 2
+        if bids:
+            # Asks fully consumed: anchor from the last lifted ask, if recorded.
+            return (last_lifted_ask or bids[0][0]) + PREDICTION_FADE_TICKS
+        if asks:
+            # Bids fully consumed: anchor from the last hit bid, if recorded.
+            return (last_hit_bid or asks[0][0]) - PREDICTION_FADE_TICKS
+        if last_lifted_ask is not None and last_hit_bid is not None:
+            return (last_lifted_ask + last_hit_bid) / 2
+        if last_lifted_ask is not None:
+            return last_lifted_ask + PREDICTION_FADE_TICKS
+        if last_hit_bid is not None:
+            return last_hit_bid - PREDICTION_FADE_TICKS
+        return old_price
 
     def get_markets_due_for_refresh(self, now_ts: int | None = None) -> list[dict]:
         if now_ts is None:
@@ -478,6 +494,18 @@ class PredictionService:
             PREDICTION_REFRESH_SECONDS, now_ts
         )
 
+    def get_next_refresh_due_at(self, now_ts: int | None = None) -> int:
+        """Next time any open market needs a refresh.
+
+        Markets are created with ``last_refresh_at`` set, so with no open
+        market the earliest possible refresh is one full interval away.
+        """
+        if now_ts is None:
+            now_ts = int(time.time())
+        ceiling = now_ts + PREDICTION_REFRESH_SECONDS
+        due = self.prediction_repo.get_next_refresh_due_at(PREDICTION_REFRESH_SECONDS)
+        return ceiling if due is None else min(due, ceiling)
+
     def resolve_orderbook(
         self, prediction_id: int, outcome: str, resolved_by: int | None = None
     ) -> dict:
@@ -0,0 +1,593 @@
+"""
+Offline rating backtests: replay match history under a grid of parameters.
+
+``RatingComparisonService`` scores the win probabilities each match recorded,
+so it can only judge the parameters the bot was running at the time. A
+backtest instead replays a guild's whole history from the MMR seeds once per
+parameter setting, predicts every match before updating on it, and scores
+those predictions with the same Brier / log-loss / calibration statistics.
+
+Settings replay in lockstep: ratings live in ``(settings, players)`` arrays,
+so each match costs a fixed number of numpy operations however many settings
+are in flight. Glicko-2 and OpenSkill settings are deduplicated separately (a
+grid crossing both systems' axes replays each distinct setting once), and
+chunks of settings fan out to worker processes.
+
+The update math mirrors ``CamaRatingSystem`` and ``CamaOpenSkillSystem``
+(two-team Plackett-Luce in closed form), and history is read the way
+``openskill_replay`` reads it, so default parameters reproduce the live
+predictions. Glicko-2 ``tau`` is deliberately absent: players keep a fixed
+volatility (``FixedVolatilityPlayer``), so tau never reaches an update; the
+volatility is swept instead.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import math
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from scipy.special import ndtr
+
+from config import (
+    BASE_RATING_DELTA_MULTIPLIER,
+    INITIAL_GLICKO_RD,
+    MAX_RATING_SWING_PER_GAME,
+    MAX_RD_CONTRACTION_PER_GAME,
+    RD_DECAY_CONSTANT,
+    RD_DECAY_GRACE_PERIOD_DAYS,
+)
+from openskill_rating_system import CamaOpenSkillSystem
+from openskill_replay import (
+    _parse_match_datetime,
+    _parse_team_ids,
+    _participant_team,
+    _seed_mu,
+    _streak_rate,
+    _streak_threshold,
+    _value,
+)
+from rating_system import CamaRatingSystem
+from services.rating_comparison_service import RatingSystemStats
+
+if TYPE_CHECKING:
+    from repositories.match_repository import MatchRepository
+
+logger = logging.getLogger("cama_bot.services.rating_backtest")
+
+GLICKO_FIELDS = (
+    "initial_rd",
+    "volatility",
+    "rd_decay_constant",
+    "rd_decay_grace_days",
+    "base_delta_multiplier",
+    "max_rating_swing",
+    "max_rd_contraction",
+)
+OPENSKILL_FIELDS = (
+    "os_beta",
+    "os_tau",
+    "os_sigma_decay_per_week",
+    "os_sigma_decay_grace_days",
+    "os_performance_strength",
+    "os_temperature",
+)
+# Same labels and edges as RatingComparisonService._get_bucket_key.
+_BUCKET_LABELS = tuple(f"{10 * b}-{10 * b + 10}%" for b in range(10))
+_BUCKET_EDGES = np.array([b / 10 for b in range(1, 10)])
+_OPENSKILL_KAPPA = 0.0001
+
+
+@dataclass(frozen=True)
+class BacktestParams:
+    """One setting of every parameter a backtest can vary.
+
+    Defaults are the live configuration. Fields without an ``os_`` prefix
+    drive the Glicko-2 replay; ``os_`` fields drive the OpenSkill replay.
+    """
+
+    initial_rd: float = INITIAL_GLICKO_RD
+    volatility: float = 0.06
+    rd_decay_constant: float = RD_DECAY_CONSTANT
+    rd_decay_grace_days: int = RD_DECAY_GRACE_PERIOD_DAYS
+    base_delta_multiplier: float = BASE_RATING_DELTA_MULTIPLIER
+    max_rating_swing: float = MAX_RATING_SWING_PER_GAME
+    max_rd_contraction: float = MAX_RD_CONTRACTION_PER_GAME
+    os_beta: float = CamaOpenSkillSystem.DEFAULT_MU / 6.0
+    os_tau: float = CamaOpenSkillSystem.DEFAULT_MU / 300.0
+    os_sigma_decay_per_week: float = CamaOpenSkillSystem.SIGMA_DECAY_PER_WEEK
+    os_sigma_decay_grace_days: int = CamaOpenSkillSystem.SIGMA_DECAY_GRACE_PERIOD_DAYS
+    os_performance_strength: float = CamaOpenSkillSystem.PERFORMANCE_STRENGTH
+    os_temperature: float = CamaOpenSkillSystem.WIN_PROBABILITY_TEMPERATURE
+
+    def glicko_key(self) -> tuple:
+        return tuple(getattr(self, name) for name in GLICKO_FIELDS)
+
+    def openskill_key(self) -> tuple:
+        return tuple(getattr(self, name) for name in OPENSKILL_FIELDS)
+
+    def as_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def parameter_grid(base: BacktestParams | None = None, **axes: Sequence) -> list[BacktestParams]:
+    """Every combination of the given axes, other fields taken from ``base``.
+
+    ``parameter_grid(initial_rd=[250, 350], os_beta=[3.0, 4.17])`` yields
+    four settings.
+    """
+    base = base or BacktestParams()
+    known = {f.name for f in fields(BacktestParams)}
+    unknown = sorted(set(axes) - known)
+    if unknown:
+        raise ValueError(f"Unknown backtest parameters: {', '.join(unknown)}")
+    names = list(axes)
+    return [
+        replace(base, **dict(zip(names, values, strict=True)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+@dataclass
+class BacktestResult:
+    """Scores for one parameter setting."""
+
+    params: BacktestParams
+    glicko: RatingSystemStats
+    openskill: RatingSystemStats
+
+
+@dataclass(frozen=True)
+class BacktestHistory:
+    """A guild's replayable history, encoded once and shared by every setting.
+
+    Per-match arrays are ``(matches, 10)`` with Radiant in slots 0-4. Nothing
+    here depends on a rating parameter: streaks follow outcomes alone, and
+    inactivity gaps follow match dates.
+    """
+
+    slots: np.ndarray  # player index per slot
+    radiant_won: np.ndarray  # (matches,) bool
+    days_idle: np.ndarray  # whole days since the player's last match, -1 if none
+    streak: np.ndarray  # recorded streak multiplier
+    gain: np.ndarray  # low-priority positive-gain multiplier
+    fantasy_offset: np.ndarray  # normalized fantasy minus team mean; 0 if incomplete
+    glicko_seed: np.ndarray  # (players,)
+    openskill_seed: np.ndarray  # (players,)
+    skipped: tuple[str, ...] = ()
+
+    @property
+    def match_count(self) -> int:
+        return len(self.radiant_won)
+
+
+def encode_history(
+    players: list[Any],
+    matches: list[Any],
+    participants_by_match: dict[int, list[Any]],
+) -> BacktestHistory:
+    """Encode replay rows (as loaded for ``replay_openskill``) into arrays.
+
+    Ordering, roster resolution, streaks and gain multipliers follow
+    ``openskill_replay.replay_openskill``; matches it would reject are
+    skipped with the same reasons.
+    """
+    glicko_system = CamaRatingSystem()
+    openskill_system = CamaOpenSkillSystem()
+    index: dict[tuple[int, int], int] = {}
+    glicko_seed: list[float] = []
+    openskill_seed: list[float] = []
+
+    def player_index(key: tuple[int, int], initial_mmr=None, known: bool = False) -> int:
+        if key not in index:
+            index[key] = len(glicko_seed)
+            glicko_seed.append(glicko_system.create_player_from_mmr(initial_mmr).rating)
+            openskill_seed.append(
+                _seed_mu(openskill_system, initial_mmr)
+                if known
+                else openskill_system.DEFAULT_MU
+            )
+        return index[key]
+
+    for player in players:
+        key = (int(_value(player, "guild_id", 0) or 0), int(_value(player, "discord_id")))
+        player_index(key, _value(player, "initial_mmr"), known=True)
+
+    def chronological_key(match: Any) -> tuple:
+        parsed = _parse_match_datetime(_value(match, "match_date"))
+        return (
+            int(_value(match, "guild_id", 0) or 0),
+            parsed is None,
+            parsed or datetime.max,
+            int(_value(match, "match_id", 0) or 0),
+        )
+
+    slots, radiant_won, days_idle, streak, gain, fantasy_offset = [], [], [], [], [], []
+    skipped: list[str] = []
+    last_match_at: dict[int, datetime] = {}
+    recent_outcomes: dict[int, list[bool]] = {}
+    for match in sorted(matches, key=chronological_key):
+        match_id = int(_value(match, "match_id"))
+        guild_id = int(_value(match, "guild_id", 0) or 0)
+        winning_team = _value(match, "winning_team")
+        if winning_team not in (1, 2):
+            skipped.append(f"Match {match_id}: invalid winning_team {winning_team}")
+            continue
+        participants = participants_by_match.get(match_id, [])
+        by_team = {1: [], 2: []}
+        for participant in participants:
+            team = _participant_team(participant)
+            if team in by_team:
+                by_team[team].append(int(_value(participant, "discord_id")))
+        team1_ids, team2_ids = by_team[1], by_team[2]
+        if len(team1_ids) != 5 or len(team2_ids) != 5:
+            team1_ids = _parse_team_ids(_value(match, "team1_players"))
+            team2_ids = _parse_team_ids(_value(match, "team2_players"))
+        all_ids = team1_ids + team2_ids
+        if len(team1_ids) != 5 or len(team2_ids) != 5 or len(set(all_ids)) != 10:
+            skipped.append(
+                f"Match {match_id}: invalid team sizes {len(team1_ids)}/{len(team2_ids)}"
+            )
+            continue
+
+        match_at = _parse_match_datetime(_value(match, "match_date"))
+        participants_by_id = {
+            int(_value(participant, "discord_id")): participant for participant in participants
+        }
+        rate, threshold = _streak_rate(match), _streak_threshold(match)
+        row_slots, row_days, row_streak, row_gain, row_fantasy = [], [], [], [], []
+        for position, player_id in enumerate(all_ids):
+            slot = player_index((guild_id, player_id))
+            previous_at = last_match_at.get(slot)
+            won = (position < 5) == (winning_team == 1)
+            _length, multiplier = glicko_system.calculate_streak_multiplier(
+                recent_outcomes.get(slot, []),
+                won=won,
+                streak_multiplier_per_game=rate,
+                streak_threshold=threshold,
+            )
+            participant = participants_by_id.get(player_id, {})
+            fantasy_points = _value(participant, "fantasy_points")
+            row_slots.append(slot)
+            row_days.append(
+                max(0, (match_at - previous_at).days)
+                if match_at is not None and previous_at is not None
+                else -1
+            )
+            row_streak.append(multiplier)
+            row_gain.append(float(_value(participant, "low_priority_gain_multiplier", 1.0) or 1.0))
+            row_fantasy.append(
+                None
+                if fantasy_points is None
+                else openskill_system.normalize_fantasy_score(float(fantasy_points))
+            )
+        if all(score is not None for score in row_fantasy):
+            offsets = []
+            for team_scores in (row_fantasy[:5], row_fantasy[5:]):
+                team_mean = sum(team_scores) / 5
+                offsets.extend(score - team_mean for score in team_scores)
+        else:
+            offsets = [0.0] * 10
+
+        for position, slot in enumerate(row_slots):
+            if match_at is not None:
+                last_match_at[slot] = match_at
+            outcomes = recent_outcomes.setdefault(slot, [])
+            outcomes.insert(0, (position < 5) == (winning_team == 1))
+            del outcomes[20:]
+        slots.append(row_slots)
+        radiant_won.append(winning_team == 1)
+        days_idle.append(row_days)
+        streak.append(row_streak)
+        gain.append(row_gain)
+        fantasy_offset.append(offsets)
+
+    def matrix(rows: list, dtype) -> np.ndarray:
+        return np.array(rows, dtype=dtype).reshape(len(rows), 10)
+
+    return BacktestHistory(
+        slots=matrix(slots, np.intp),
+        radiant_won=np.array(radiant_won, dtype=bool),
+        days_idle=matrix(days_idle, np.float64),
+        streak=matrix(streak, np.float64),
+        gain=matrix(gain, np.float64),
+        fantasy_offset=matrix(fantasy_offset, np.float64),
+        glicko_seed=np.array(glicko_seed, dtype=np.float64),
+        openskill_seed=np.array(openskill_seed, dtype=np.float64),
+        skipped=tuple(skipped),
+    )
+
+
+def _column(settings: Sequence[BacktestParams], name: str) -> np.ndarray:
+    """One parameter across settings, shaped to broadcast over (settings, 2, 5)."""
+    return np.array([getattr(s, name) for s in settings], dtype=np.float64)[:, None, None]
+
+
+def _decay(deviation, days, ceiling, per_week, grace_days):
+    """Vectorized ``apply_rd_decay`` / ``apply_sigma_decay``; ``days < 0`` means no gap."""
+    periods = np.maximum(days - grace_days, 0.0) / 7.0
+    decayed = np.minimum(ceiling, np.sqrt(deviation * deviation + per_week * per_week * periods))
+    decayed = np.where(days > grace_days, decayed, deviation)
+    return np.where(days >= 0, np.where(deviation >= ceiling, ceiling, decayed), deviation)
+
+
+def glicko_predictions(history: BacktestHistory, settings: Sequence[BacktestParams]) -> np.ndarray:
+    """Radiant win probability per (match, setting) under each Glicko-2 setting."""
+    scale = CamaRatingSystem.GLICKO2_SCALE
+    count = len(settings)
+    initial_rd = _column(settings, "initial_rd")
+    volatility_sq = _column(settings, "volatility") ** 2
+    decay_constant = _column(settings, "rd_decay_constant")
+    grace_days = _column(settings, "rd_decay_grace_days")
+    base_multiplier = _column(settings, "base_delta_multiplier")
+    max_swing = _column(settings, "max_rating_swing")
+    rd_floor = 1.0 - _column(settings, "max_rd_contraction")
+
+    ratings = np.repeat(history.glicko_seed[None, :], count, axis=0)
+    rds = np.repeat(initial_rd[:, 0], history.glicko_seed.size, axis=1)
+    predictions = np.empty((history.match_count, count))
+    pi_sq = math.pi**2
+    for m in range(history.match_count):
+        slots = history.slots[m]
+        rating = ratings[:, slots].reshape(count, 2, 5)
+        rd = _decay(
+            rds[:, slots].reshape(count, 2, 5),
+            history.days_idle[m].reshape(2, 5),
+            initial_rd,
+            decay_constant,
+            grace_days,
+        )
+        team_rating = rating.mean(axis=2)
+        team_rd = np.sqrt((rd * rd).mean(axis=2))
+
+        # predict_win_probability on the (mean rating, RMS RD) aggregates.
+        combined_rd = np.hypot(team_rd[:, 0], team_rd[:, 1]) / scale
+        g_combined = 1.0 / np.sqrt(1.0 + 3.0 * combined_rd**2 / pi_sq)
+        predictions[m] = np.clip(
+            1.0 / (1.0 + np.exp(-g_combined * (team_rating[:, 0] - team_rating[:, 1]) / scale)),
+            0.0,
+            1.0,
+        )
+
+        # _update_player_rating: a synthetic player at the team rating with
+        # this player's RD plays the opposing team's aggregate.
+        score = np.array([1.0, 0.0]) if history.radiant_won[m] else np.array([0.0, 1.0])
+        opponent_phi = team_rd[:, ::-1] / scale
+        g = 1.0 / np.sqrt(1.0 + 3.0 * opponent_phi**2 / pi_sq)
+        expected = 1.0 / (1.0 + np.exp(-g * (team_rating - team_rating[:, ::-1]) / scale))
+        variance = 1.0 / (g * g * expected * (1.0 - expected))
+        phi = rd / scale
+        new_phi = 1.0 / np.sqrt(
+            1.0 / (phi * phi + volatility_sq) + 1.0 / variance[:, :, None]
+        )
+        delta = new_phi * new_phi * (g * (score - expected))[:, :, None] * scale
+        delta = delta * base_multiplier * history.streak[m].reshape(2, 5)
+        delta = np.where(delta > 0, delta * history.gain[m].reshape(2, 5), delta)
+        delta = np.clip(delta, -max_swing, max_swing)
+        ratings[:, slots] = np.maximum(0.0, rating + delta).reshape(count, 10)
+        rds[:, slots] = np.minimum(rd, np.maximum(new_phi * scale, rd * rd_floor)).reshape(
+            count, 10
+        )
+    return predictions
+
+
+def openskill_predictions(
+    history: BacktestHistory, settings: Sequence[BacktestParams]
+) -> np.ndarray:
+    """Calibrated Radiant win probability per (match, setting) under each OpenSkill setting."""
+    count = len(settings)
+    default_sigma = CamaOpenSkillSystem.DEFAULT_SIGMA
+    epsilon = CamaOpenSkillSystem.WIN_PROBABILITY_EPSILON
+    beta_sq = _column(settings, "os_beta")[:, :, 0] ** 2
+    tau_sq = _column(settings, "os_tau") ** 2
+    decay_per_week = _column(settings, "os_sigma_decay_per_week")
+    grace_days = _column(settings, "os_sigma_decay_grace_days")
+    strength = _column(settings, "os_performance_strength")
+    temperature = _column(settings, "os_temperature")[:, 0, 0]
+    if np.any(temperature <= 0):
+        raise ValueError("OpenSkill probability temperature must be positive")
+
+    mus = np.repeat(history.openskill_seed[None, :], count, axis=0)
+    sigmas = np.full_like(mus, default_sigma)
+    predictions = np.empty((history.match_count, count))
+    for m in range(history.match_count):
+        slots = history.slots[m]
+        mu = mus[:, slots].reshape(count, 2, 5)
+        sigma = _decay(
+            sigmas[:, slots].reshape(count, 2, 5),
+            history.days_idle[m].reshape(2, 5),
+            default_sigma,
+            decay_per_week,
+            grace_days,
+        )
+        team_mu = mu.sum(axis=2)
+        team_sigma_sq = (sigma * sigma).sum(axis=2)
+
+        # os_predict_win_probability, then calibrate_win_probability.
+        raw = ndtr(
+            (team_mu[:, 0] - team_mu[:, 1])
+            / np.sqrt(2.0 * beta_sq[:, 0] + team_sigma_sq[:, 0] + team_sigma_sq[:, 1])
+        )
+        raw = np.clip(raw, epsilon, 1.0 - epsilon)
+        predictions[m] = 1.0 / (1.0 + np.exp(-np.log(raw / (1.0 - raw)) / temperature))
+
+        # PlackettLuce.rate for two ranked teams, after the tau correction.
+        # Both teams share delta; omega is +p_loser for the winner and
+        # -p_loser for the loser, and the loser's weights divide.
+        winner = 0 if history.radiant_won[m] else 1
+        sigma_sq = sigma * sigma + tau_sq
+        team_sigma_sq = sigma_sq.sum(axis=2)
+        c = np.sqrt(team_sigma_sq.sum(axis=1, keepdims=True) + 2.0 * beta_sq)
+        p_loser = 1.0 / (
+            1.0 + np.exp((team_mu[:, winner] - team_mu[:, 1 - winner])[:, None] / c)
+        )
+        sign = np.array([1.0, -1.0]) if winner == 0 else np.array([-1.0, 1.0])
+        omega = sign * p_loser * team_sigma_sq / c
+        delta = (1.0 - p_loser) * p_loser * team_sigma_sq * np.sqrt(team_sigma_sq) / c**3
+        weights = 1.0 + strength * history.fantasy_offset[m].reshape(2, 5)
+        weights[:, 1 - winner] = 1.0 / weights[:, 1 - winner]
+        share = sigma_sq / team_sigma_sq[:, :, None]
+        native_mu = mu + share * omega[:, :, None] * weights
+        new_sigma = np.sqrt(sigma_sq) * np.sqrt(
+            np.maximum(1.0 - share * delta[:, :, None] * weights, _OPENSKILL_KAPPA)
+        )
+
+        streak = history.streak[m].reshape(2, 5)
+        gain = history.gain[m].reshape(2, 5)
+        new_mu = np.where(streak == 1.0, native_mu, mu + (native_mu - mu) * streak)
+        new_mu = np.where((gain != 1.0) & (new_mu > mu), mu + (new_mu - mu) * gain, new_mu)
+        mus[:, slots] = new_mu.reshape(count, 10)
+        sigmas[:, slots] = new_sigma.reshape(count, 10)
+    return predictions
+
+
+def score_predictions(name: str, predictions: np.ndarray, radiant_won: np.ndarray) -> list:
+    """``RatingComparisonService._calculate_system_stats`` for every column at once."""
+    total, count = predictions.shape
+    if total == 0:
+        return [
+            RatingSystemStats(
+                name=name,
+                total_predictions=0,
+                brier_score=0.25,
+                accuracy=0.5,
+                calibration_buckets={},
+                log_loss=1.0,
+            )
+            for _ in range(count)
+        ]
+    outcome = radiant_won.astype(np.float64)[:, None]
+    brier = ((predictions - outcome) ** 2).mean(axis=0)
+    accuracy = ((predictions >= 0.5) == radiant_won[:, None]).mean(axis=0)
+    clamped = np.clip(predictions, 0.001, 0.999)
+    log_loss = -np.where(radiant_won[:, None], np.log(clamped), np.log(1.0 - clamped)).mean(axis=0)
+    bucket = np.digitize(predictions, _BUCKET_EDGES)
+    buckets = []
+    for label_index in range(len(_BUCKET_LABELS)):
+        in_bucket = bucket == label_index
+        buckets.append(
+            (
+                in_bucket.sum(axis=0),
+                np.where(in_bucket, predictions, 0.0).sum(axis=0),
+                (in_bucket & radiant_won[:, None]).sum(axis=0),
+            )
+        )
+
+    results = []
+    for column in range(count):
+        calibration = {}
+        for label, (counts, predicted, wins) in zip(_BUCKET_LABELS, buckets, strict=True):
+            bucket_count = int(counts[column])
+            calibration[label] = {
+                "predicted": float(predicted[column]),
+                "actual_wins": int(wins[column]),
+                "count": bucket_count,
+                "avg_predicted": float(predicted[column]) / bucket_count if bucket_count else 0.0,
+                "actual_rate": int(wins[column]) / bucket_count if bucket_count else 0.0,
+            }
+        results.append(
+            RatingSystemStats(
+                name=name,
+                total_predictions=total,
+                brier_score=float(brier[column]),
+                accuracy=float(accuracy[column]),
+                calibration_buckets=calibration,
+                log_loss=float(log_loss[column]),
+            )
+        )
+    return results
+
+
+def _run_backtest_chunk(args: tuple) -> list:
+    """Process-pool entry point: replay one system over a chunk of settings."""
+    system, history, settings = args
+    if system == "glicko":
+        return score_predictions(
+            "Glicko-2", glicko_predictions(history, settings), history.radiant_won
+        )
+    return score_predictions(
+        "OpenSkill", openskill_predictions(history, settings), history.radiant_won
+    )
+
+
+def run_backtest(
+    history: BacktestHistory,
+    settings: Sequence[BacktestParams],
+    *,
+    workers: int | None = None,
+) -> list[BacktestResult]:
+    """Score every setting; results come back in ``settings`` order.
+
+    ``workers`` defaults to the CPU count; with one worker (or one chunk of
+    work) everything replays in this process.
+    """
+    settings = list(settings)
+    glicko_settings = list({s.glicko_key(): s for s in settings}.values())
+    openskill_settings = list({s.openskill_key(): s for s in settings}.values())
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    tasks = []
+    for system, unique in (("glicko", glicko_settings), ("openskill", openskill_settings)):
+        chunks = min(len(unique), workers)
+        tasks.extend((system, history, unique[k::chunks]) for k in range(chunks))
+    if workers > 1 and len(tasks) > 2:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("forkserver"),
+        ) as pool:
+            scored = list(pool.map(_run_backtest_chunk, tasks))
+    else:
+        scored = [_run_backtest_chunk(task) for task in tasks]
+
+    glicko_stats: dict[tuple, RatingSystemStats] = {}
+    openskill_stats: dict[tuple, RatingSystemStats] = {}
+    for (system, _history, chunk), stats in zip(tasks, scored, strict=True):
+        target = glicko_stats if system == "glicko" else openskill_stats
+        for setting, setting_stats in zip(chunk, stats, strict=True):
+            key = setting.glicko_key() if system == "glicko" else setting.openskill_key()
+            target[key] = setting_stats
+    return [
+        BacktestResult(
+            params=setting,
+            glicko=glicko_stats[setting.glicko_key()],
+            openskill=openskill_stats[setting.openskill_key()],
+        )
+        for setting in settings
+    ]
+
+
+class RatingBacktestService:
+    """Loads a guild's history once and sweeps parameter grids over it."""
+
+    def __init__(self, match_repo: MatchRepository):
+        self.match_repo = match_repo
+
+    def load_history(self, guild_id: int | None) -> BacktestHistory:
+        players, matches, participants_by_match = self.match_repo.get_rating_backtest_history(
+            guild_id
+        )
+        history = encode_history(players, matches, participants_by_match)
+        if history.skipped:
+            logger.warning(
+                "Rating backtest skipped %d matches (first: %s)",
+                len(history.skipped),
+                history.skipped[0],
+            )
+        return history
+
+    def sweep(
+        self,
+        settings: Sequence[BacktestParams],
+        guild_id: int | None = None,
+        *,
+        workers: int | None = None,
+    ) -> list[BacktestResult]:
+        return run_backtest(self.load_history(guild_id), settings, workers=workers)
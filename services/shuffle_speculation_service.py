@@ -0,0 +1,147 @@
+"""
+Background pre-shuffles for lobbies at the ready threshold.
+
+Every lobby roster change ends in a lobby-embed refresh, which calls
+:meth:`ShuffleSpeculationService.notify`. Once a lobby holds at least
+``ready_threshold`` players, the service runs the team search for the default
+``/shuffle`` shapes (Glicko and OpenSkill, balanced mode) in a worker thread
+and leaves the result with ``MatchService``. ``/shuffle`` then only reloads
+and fingerprints its inputs; a stale speculation simply fails the
+fingerprint check and is never used.
+
+Bursts of joins coalesce: a lobby has at most one speculation task, which
+re-runs while it was notified again in the meantime.
+
+A roster of more than ten is picked by the pool search, which also scores each
+player's whole minutes in the lobby, so its fingerprint moves whenever one of
+those minutes ticks over. Such a lobby is re-speculated at each tick, and each
+run also searches the inputs for the next tick ahead of time, so ``/shuffle``
+finds a matching result on either side of it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from domain.models.lobby import LobbyKind
+
+logger = logging.getLogger("cama_bot.services.shuffle_speculation")
+
+
+class ShuffleSpeculationService:
+    """Keep a speculative ``/shuffle`` search warm per (guild, lobby kind)."""
+
+    def __init__(self, lobby_service, match_service, *, debounce_seconds: float = 1.0):
+        self.lobby_service = lobby_service
+        self.match_service = match_service
+        self.debounce_seconds = debounce_seconds
+        self._tasks: dict[tuple[int | None, LobbyKind], asyncio.Task] = {}
+        self._dirty: set[tuple[int | None, LobbyKind]] = set()
+        # When each pool-sized lobby's wait minutes next change, and the timer
+        # that re-speculates it then.
+        self._wait_ticks: dict[tuple[int | None, LobbyKind], float] = {}
+        self._tick_handles: dict[tuple[int | None, LobbyKind], asyncio.TimerHandle] = {}
+
+    def notify(self, guild_id: int | None, lobby_kind: LobbyKind | str | None = None) -> None:
+        """Note a roster change; must be called from the event loop."""
+        key = (guild_id, LobbyKind.normalize(lobby_kind))
+        self._dirty.add(key)
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            self._tasks[key] = asyncio.create_task(
+                self._run(key), name=f"preshuffle:{guild_id}:{key[1].value}"
+            )
+
+    async def _run(self, key: tuple[int | None, LobbyKind]) -> None:
+        try:
+            while key in self._dirty:
+                await asyncio.sleep(self.debounce_seconds)
+                self._dirty.discard(key)
+                try:
+                    await asyncio.to_thread(self.speculate, *key)
+                except Exception:
+                    logger.exception("Pre-shuffle failed for guild %s (%s)", *key)
+            self._arm_wait_tick(key)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+
+    def _arm_wait_tick(self, key: tuple[int | None, LobbyKind]) -> None:
+        """Re-speculate when the lobby's wait minutes next change, if they count."""
+        handle = self._tick_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        # Each run sets a fresh tick, so a failed run leaves none armed.
+        at = self._wait_ticks.pop(key, None)
+        if at is not None:
+            self._tick_handles[key] = asyncio.get_running_loop().call_later(
+                max(0.0, at - time.time()), self.notify, *key
+            )
+
+    def speculate(self, guild_id: int | None, lobby_kind: LobbyKind | str | None = None) -> int:
+        """Refresh one lobby's pre-shuffle; return how many searches ran."""
+        key = (guild_id, LobbyKind.normalize(lobby_kind))
+        snapshot = self.lobby_service.get_lobby_players_and_readycheck_snapshot(
+            guild_id=guild_id,
+            lobby_kind=lobby_kind,
+        )
+        threshold = self.lobby_service.ready_threshold
+        if snapshot is None or len(snapshot[0]) < threshold:
+            self._wait_ticks.pop(key, None)
+            self.match_service.discard_shuffle_speculations(guild_id, lobby_kind)
+            return 0
+
+        player_ids, _players, join_times, readycheck = snapshot
+        # Mirror /shuffle's roster choice: confirmed players once a ready
+        # check has gathered enough of them, otherwise the whole lobby.
+        if readycheck is not None:
+            confirmed = set(player_ids) & readycheck[1]
+            if len(confirmed) >= threshold:
+                player_ids = [player_id for player_id in player_ids if player_id in confirmed]
+        now = time.time()
+        searched = self.match_service.speculate_shuffle(
+            player_ids,
+            guild_id,
+            lobby_wait_minutes=_wait_minutes(player_ids, join_times, now),
+            lobby_kind=lobby_kind,
+        )
+        # Ten players are split without reading wait minutes.
+        tick = _next_wait_tick(player_ids, join_times, now) if len(player_ids) > 10 else None
+        if tick is None:
+            self._wait_ticks.pop(key, None)
+            return searched
+        self._wait_ticks[key] = tick
+        # Half a second past the tick, so float rounding cannot land on the
+        # old minute.
+        searched += self.match_service.speculate_shuffle(
+            player_ids,
+            guild_id,
+            lobby_wait_minutes=_wait_minutes(player_ids, join_times, tick + 0.5),
+            lobby_kind=lobby_kind,
+        )
+        return searched
+
+
+def _wait_minutes(
+    player_ids: list[int], join_times: dict[int, float], at: float
+) -> dict[int, int]:
+    """Whole minutes each player has been in the lobby at ``at`` (as ``/shuffle`` counts)."""
+    return {
+        player_id: max(0, int((at - join_times[player_id]) / 60))
+        for player_id in player_ids
+        if player_id in join_times
+    }
+
+
+def _next_wait_tick(
+    player_ids: list[int], join_times: dict[int, float], now: float
+) -> float | None:
+    """When the next player's whole-minute wait count goes up."""
+    ticks = [
+        join_times[player_id] + 60 * (max(0, int((now - join_times[player_id]) / 60)) + 1)
+        for player_id in player_ids
+        if player_id in join_times
+    ]
+    return min(ticks, default=None)
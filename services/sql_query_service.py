@@ -33,6 +33,11 @@ BLOCKED_TABLES: set[str] = {
     # Transient state
     "pending_matches",
     "lobby_state",
+    "player_cache_versions",
+    "player_gambling_aggregates",
+    "gambling_aggregate_dirty",
+    "prediction_book_versions",
+    "scheduled_jobs",
     # Server config
     "guild_config",
     # Internal voting/proposals
@@ -0,0 +1,358 @@
+"""Fan-out delivery of claimed survey DMs.
+
+The engine sends a batch of claimed recipients through an injected sender
+with a bounded concurrency window that narrows on rate limits and widens
+again as sends succeed. Database work is grouped: every chunk of claims loads
+its sessions from one snapshot and renews its leases in one transaction just
+before those sends start, and outcomes are committed together.
+
+The claim protocol is unchanged, so exactly-once delivery still rests on the
+repository's compare-and-set on ``attempt_count``:
+
+* a claim is sent only if its lease renewal succeeded, and a claim put back
+  after a rate limit, or queued longer than ``lease_refresh_seconds``, is
+  renewed again before it is sent;
+* a delivered DM is never recorded as failed; if its receipt cannot be
+  stored the row stays ``sending`` and receipt reconciliation finds the DM in
+  history before the claim can be requeued;
+* an interrupted run leaves its unrecorded claims to that same recovery.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+
+from domain.models.survey import SurveyRecipient, SurveySession
+
+logger = logging.getLogger("cama_bot.services.survey_delivery")
+
+# Sends one DM and returns ``(dm_channel_id, dm_message_id)``.
+SurveyDmSender = Callable[[SurveyRecipient, SurveySession], Awaitable[tuple[int, int]]]
+
+# A queued claim: (claim, session, rate-limit retries, monotonic time its lease
+# was last renewed, or None once it must be renewed before sending).
+_Queued = tuple[SurveyRecipient, SurveySession, int, float | None]
+
+
+@dataclass(slots=True)
+class SurveyDeliveryStats:
+    """Throughput counters for one ``deliver`` call, or summed across calls."""
+
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    # Claims not sent because their lease was no longer active (subset of failed).
+    lease_lost: int = 0
+    # Sends put back in the queue after a rate limit.
+    rate_limited: int = 0
+    # Delivered DMs whose receipt is left to history reconciliation.
+    unrecorded: int = 0
+    # Failures that could not be persisted.
+    unsaved_failures: int = 0
+    commits: int = 0
+    peak_in_flight: int = 0
+    elapsed_seconds: float = 0.0
+    # (survey_id, discord_id) of receipts attached after their survey closed.
+    late_receipts: list[tuple[int, int]] = field(default_factory=list)
+
+    @property
+    def sends_per_second(self) -> float:
+        return self.sent / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def add(self, other: SurveyDeliveryStats) -> None:
+        self.claimed += other.claimed
+        self.sent += other.sent
+        self.failed += other.failed
+        self.lease_lost += other.lease_lost
+        self.rate_limited += other.rate_limited
+        self.unrecorded += other.unrecorded
+        self.unsaved_failures += other.unsaved_failures
+        self.commits += other.commits
+        self.peak_in_flight = max(self.peak_in_flight, other.peak_in_flight)
+        self.elapsed_seconds += other.elapsed_seconds
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """Seconds to back off if ``exc`` is a rate limit, else None."""
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, int | float) and not isinstance(retry_after, bool):
+        return max(0.0, float(retry_after))
+    if getattr(exc, "status", None) == 429:
+        return 1.0
+    return None
+
+
+class SurveyDeliveryEngine:
+    """Send claimed survey DMs with bounded, rate-aware concurrency."""
+
+    def __init__(
+        self,
+        survey_service,
+        send: SurveyDmSender,
+        *,
+        max_concurrency: int = 5,
+        sends_per_second: float = 10.0,
+        chunk_size: int = 25,
+        flush_interval_seconds: float = 1.0,
+        max_rate_limit_retries: int = 3,
+        max_rate_limit_pause_seconds: float = 60.0,
+        lease_refresh_seconds: float = 60.0,
+    ) -> None:
+        if max_concurrency < 1 or chunk_size < 1:
+            raise ValueError("max_concurrency and chunk_size must be positive")
+        self.survey_service = survey_service
+        self._send_dm = send
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.max_rate_limit_pause_seconds = max_rate_limit_pause_seconds
+        # Well below the 300 s after which stale-claim recovery may requeue a
+        # lease, however many rate-limit pauses a claim waits behind.
+        self.lease_refresh_seconds = lease_refresh_seconds
+        self._send_interval = 1.0 / sends_per_second if sends_per_second > 0 else 0.0
+        self._window = max_concurrency
+        self._successes_at_window = 0
+        self._next_send_at = 0.0
+        self._paused_until = 0.0
+        self.totals = SurveyDeliveryStats()
+
+    @property
+    def window(self) -> int:
+        """Current concurrency limit; halves on a rate limit, regrows by one."""
+        return self._window
+
+    async def deliver(self, claims: Sequence[SurveyRecipient]) -> SurveyDeliveryStats:
+        stats = SurveyDeliveryStats(claimed=len(claims))
+        started = time.monotonic()
+        waiting = deque(claims)
+        ready: deque[_Queued] = deque()
+        in_flight: dict[asyncio.Task, tuple[SurveyRecipient, SurveySession, int]] = {}
+        sent_rows: list[tuple[SurveyRecipient, int, int]] = []
+        failed_rows: list[tuple[SurveyRecipient, str]] = []
+        last_flush = started
+        try:
+            while waiting or ready or in_flight:
+                while (waiting or ready) and len(in_flight) < self._window:
+                    if not ready:
+                        await self._prepare_chunk(waiting, ready, failed_rows, stats)
+                        continue
+                    await self._pace()
+                    if self._lease_is_stale(ready[0]):
+                        await self._renew_queued(ready, failed_rows, stats)
+                        if not ready:
+                            continue
+                    claim, session, retries, _renewed_at = ready.popleft()
+                    task = asyncio.create_task(self._send(claim, session))
+                    in_flight[task] = (claim, session, retries)
+                    stats.peak_in_flight = max(stats.peak_in_flight, len(in_flight))
+
+                if in_flight:
+                    done, _pending = await asyncio.wait(
+                        in_flight,
+                        timeout=self.flush_interval_seconds,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        claim, session, retries = in_flight.pop(task)
+                        result = task.result()
+                        if isinstance(result, tuple):
+                            sent_rows.append((claim, *result))
+                            stats.sent += 1
+                            self._on_success()
+                            continue
+                        pause = _retry_after(result)
+                        if (
+                            pause is not None
+                            and pause <= self.max_rate_limit_pause_seconds
+                            and retries < self.max_rate_limit_retries
+                        ):
+                            stats.rate_limited += 1
+                            self._on_rate_limit(pause)
+                            ready.appendleft((claim, session, retries + 1, None))
+                            continue
+                        # Never log respondent IDs; the persisted error is a category.
+                        logger.warning("Survey DM delivery failed (%s)", type(result).__name__)
+                        failed_rows.append((claim, type(result).__name__))
+                        stats.failed += 1
+
+                buffered = len(sent_rows) + len(failed_rows)
+                if buffered and (
+                    buffered >= self.chunk_size
+                    or not (waiting or ready or in_flight)
+                    or time.monotonic() - last_flush >= self.flush_interval_seconds
+                ):
+                    await self._flush(sent_rows, failed_rows, stats)
+                    last_flush = time.monotonic()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if sent_rows or failed_rows:
+                # Interrupted: keep what already completed so recovery has less
+                # DM history to scan.
+                await self._flush(sent_rows, failed_rows, stats)
+            stats.elapsed_seconds = time.monotonic() - started
+            self.totals.add(stats)
+        return stats
+
+    async def _prepare_chunk(
+        self,
+        waiting: deque[SurveyRecipient],
+        ready: deque[_Queued],
+        failed_rows: list[tuple[SurveyRecipient, str]],
+        stats: SurveyDeliveryStats,
+    ) -> None:
+        """Load sessions and renew leases for the next chunk of claims."""
+        chunk = [waiting.popleft() for _ in range(min(self.chunk_size, len(waiting)))]
+
+        def fail(claim: SurveyRecipient, error: str) -> None:
+            failed_rows.append((claim, error))
+            stats.failed += 1
+
+        try:
+            sessions = await asyncio.to_thread(
+                self.survey_service.get_response_sessions,
+                [(claim.survey_id, claim.discord_id) for claim in chunk],
+            )
+        except Exception as exc:
+            # No Discord send was attempted, so these attempts can safely
+            # become retryable delivery failures.
+            logger.warning("Survey delivery sessions could not be loaded (%s)", type(exc).__name__)
+            for claim in chunk:
+                fail(claim, type(exc).__name__)
+            return
+
+        sendable = []
+        for claim in chunk:
+            session = sessions.get((claim.survey_id, claim.discord_id))
+            if session is None:
+                fail(claim, "SessionUnavailable")
+            else:
+                sendable.append((claim, session))
+        if not sendable:
+            return
+
+        renewed, lost_error, renewed_at = await self._renew([claim for claim, _ in sendable])
+        for claim, session in sendable:
+            if claim.recipient_id in renewed:
+                ready.append((claim, session, 0, renewed_at))
+            else:
+                stats.lease_lost += 1
+                fail(claim, lost_error)
+
+    def _lease_is_stale(self, queued: _Queued) -> bool:
+        renewed_at = queued[3]
+        return renewed_at is None or time.monotonic() - renewed_at > self.lease_refresh_seconds
+
+    async def _renew_queued(
+        self,
+        ready: deque[_Queued],
+        failed_rows: list[tuple[SurveyRecipient, str]],
+        stats: SurveyDeliveryStats,
+    ) -> None:
+        """Renew every stale lease in ``ready`` together; drop the lost ones."""
+        stale = [queued[0] for queued in ready if self._lease_is_stale(queued)]
+        renewed, lost_error, renewed_at = await self._renew(stale)
+        stale_ids = {claim.recipient_id for claim in stale}
+        kept: list[_Queued] = []
+        for claim, session, retries, last_renewed_at in ready:
+            if claim.recipient_id not in stale_ids:
+                kept.append((claim, session, retries, last_renewed_at))
+            elif claim.recipient_id in renewed:
+                kept.append((claim, session, retries, renewed_at))
+            else:
+                stats.lease_lost += 1
+                failed_rows.append((claim, lost_error))
+                stats.failed += 1
+        ready.clear()
+        ready.extend(kept)
+
+    async def _renew(self, claims: list[SurveyRecipient]) -> tuple[set[int], str, float]:
+        """Renew leases in one transaction.
+
+        Returns the renewed recipient IDs, the error to record for the rest,
+        and when the renewal started.
+        """
+        renewed_at = time.monotonic()
+        try:
+            renewed = await asyncio.to_thread(
+                self.survey_service.renew_delivery_claims,
+                [(claim.recipient_id, claim.attempt_count) for claim in claims],
+            )
+            lost_error = "SurveyStateError"
+        except Exception as exc:
+            logger.warning("Survey delivery claims could not be renewed (%s)", type(exc).__name__)
+            renewed = set()
+            lost_error = type(exc).__name__
+        return renewed, lost_error, renewed_at
+
+    async def _send(
+        self, claim: SurveyRecipient, session: SurveySession
+    ) -> tuple[int, int] | Exception:
+        # Exceptions come back as values so one failed DM never cancels its
+        # siblings; cancellation still propagates.
+        try:
+            channel_id, message_id = await self._send_dm(claim, session)
+        except Exception as exc:
+            return exc
+        return int(channel_id), int(message_id)
+
+    async def _pace(self) -> None:
+        now = time.monotonic()
+        start_at = max(now, self._next_send_at, self._paused_until)
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+        self._next_send_at = start_at + self._send_interval
+
+    def _on_success(self) -> None:
+        self._successes_at_window += 1
+        if self._successes_at_window >= self._window:
+            self._successes_at_window = 0
+            self._window = min(self.max_concurrency, self._window + 1)
+
+    def _on_rate_limit(self, pause: float) -> None:
+        self._successes_at_window = 0
+        self._window = max(1, self._window // 2)
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+    async def _flush(
+        self,
+        sent_rows: list[tuple[SurveyRecipient, int, int]],
+        failed_rows: list[tuple[SurveyRecipient, str]],
+        stats: SurveyDeliveryStats,
+    ) -> None:
+        sent = [
+            (claim.recipient_id, claim.attempt_count, channel_id, message_id)
+            for claim, channel_id, message_id in sent_rows
+        ]
+        failed = [(claim.recipient_id, claim.attempt_count, error) for claim, error in failed_rows]
+        claims_by_id = {claim.recipient_id: claim for claim, *_ in sent_rows}
+        sent_rows.clear()
+        failed_rows.clear()
+        try:
+            outcomes = await asyncio.to_thread(
+                self.survey_service.record_delivery_outcomes, sent, failed
+            )
+        except Exception as exc:
+            # The DMs succeeded. Do not relabel them as failed: their
+            # persistent component IDs let receipt recovery resolve them.
+            logger.warning(
+                "Survey delivery outcomes could not be persisted (%s)", type(exc).__name__
+            )
+            stats.unrecorded += len(sent)
+            stats.unsaved_failures += len(failed)
+            return
+        stats.commits += 1
+        for recipient_id in outcomes.reconciled:
+            claim = claims_by_id[recipient_id]
+            stats.late_receipts.append((claim.survey_id, claim.discord_id))
+        rejected = set(outcomes.rejected)
+        stats.unrecorded += sum(1 for row in sent if row[0] in rejected)
+        stats.unsaved_failures += sum(1 for row in failed if row[0] in rejected)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import Enum
 
 from domain.models.survey import (
@@ -9,6 +10,7 @@ from domain.models.survey import (
     MAX_SURVEY_TITLE_LENGTH,
     MAX_TEXT_ANSWER_LENGTH,
     Survey,
+    SurveyDeliveryOutcomes,
     SurveyDeliveryStatus,
     SurveyNotFoundError,
     SurveyQuestion,
@@ -214,6 +216,14 @@ class SurveyService:
             expected_attempt_count,
         )
 
+    def renew_delivery_claims(self, claims: Sequence[tuple[int, int]]) -> set[int]:
+        for recipient_id, expected_attempt_count in claims:
+            self._positive_id(recipient_id, label="Survey recipient")
+            self._positive_id(expected_attempt_count, label="Delivery attempt")
+        if not claims:
+            return set()
+        return self.repo.renew_delivery_claims(claims)
+
     def recover_stale_deliveries(self, stale_after_seconds: int = 300) -> int:
         return self.repo.recover_stale_deliveries(stale_after_seconds)
 
@@ -281,6 +291,23 @@ class SurveyService:
             dm_message_id,
         )
 
+    def record_delivery_outcomes(
+        self,
+        sent: Sequence[tuple[int, int, int, int]],
+        failed: Sequence[tuple[int, int, str]],
+    ) -> SurveyDeliveryOutcomes:
+        for recipient_id, expected_attempt_count, dm_channel_id, dm_message_id in sent:
+            self._positive_id(recipient_id, label="Survey recipient")
+            self._positive_id(expected_attempt_count, label="Delivery attempt")
+            self._positive_id(dm_channel_id, label="DM channel")
+            self._positive_id(dm_message_id, label="DM message")
+        for recipient_id, expected_attempt_count, _error in failed:
+            self._positive_id(recipient_id, label="Survey recipient")
+            self._positive_id(expected_attempt_count, label="Delivery attempt")
+        if not sent and not failed:
+            return SurveyDeliveryOutcomes()
+        return self.repo.record_delivery_outcomes(sent, failed)
+
     def mark_delivery_receipt_checked(
         self,
         recipient_id: int,
@@ -313,6 +340,14 @@ class SurveyService:
         self._positive_id(discord_id, label="Respondent")
         return self.repo.get_response_session(survey_id, discord_id)
 
+    def get_response_sessions(
+        self,
+        keys: Sequence[tuple[int, int]],
+    ) -> dict[tuple[int, int], SurveySession]:
+        if not keys:
+            return {}
+        return self.repo.get_response_sessions(keys)
+
     def list_recoverable_response_sessions(self) -> list[SurveySession]:
         return self.repo.list_recoverable_response_sessions()
 
@@ -6,10 +6,15 @@ import heapq
 import itertools
 import logging
 import math
+import multiprocessing
+import os
 import random
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from config import (
     PACKAGE_DEAL_PENALTY,
     PACKAGE_DEAL_SPLIT_PENALTY,
@@ -54,6 +59,16 @@ _DRAFT_POOL_SPLITS = tuple(
     for team_a_indices in itertools.combinations(range(8), 4)
 )
 
+# Exact draft pool search accepts only pairs that beat the incumbent by more
+# than this, so float noise between bound and score cannot prune the optimum
+# and exact ties cannot defeat pruning.
+_DRAFT_POOL_SCORE_TOLERANCE = 1e-6
+# Below this many candidates the search finishes faster than worker startup.
+_DRAFT_POOL_PARALLEL_MIN_CANDIDATES = 16
+# Lane matchups face carry with offlane, mid with mid and soft with hard
+# support, so role value r meets the opponent's _LANE_OPPONENT_ROLES[r].
+_LANE_OPPONENT_ROLES = np.array([2, 1, 0, 4, 3])
+
 
 @dataclass
 class DraftPoolResult:
@@ -112,6 +127,44 @@ class _TeamRoleMetricsSummary:
     team_values_are_finite: bool
 
 
+@dataclass(frozen=True, slots=True)
+class _DraftPairTables:
+    """Score inputs for every captain-plus-four team of a draft pool search.
+
+    Row ``i`` describes ``fours[i]``, four candidate indices in ascending
+    order, once under each captain. ``pool_terms`` is the four's share of the
+    per-player pool terms (exclusion and recent-match penalties, RD
+    priority); ``*_base`` adds the team's minimum off-role penalty. The
+    per-assignment columns hold the first three role assignments the scorer
+    tries, repeating the last one for teams with fewer.
+    """
+
+    fours: tuple[tuple[int, ...], ...]
+    masks: np.ndarray
+    pool_terms: np.ndarray
+    a_base: np.ndarray
+    a_min_value: np.ndarray
+    a_max_value: np.ndarray
+    a_values: np.ndarray
+    a_off_role_penalties: np.ndarray
+    a_role_values: np.ndarray
+    a_finite: np.ndarray
+    b_base: np.ndarray
+    b_min_value: np.ndarray
+    b_max_value: np.ndarray
+    b_values: np.ndarray
+    b_off_role_penalties: np.ndarray
+    b_role_values: np.ndarray
+    b_finite: np.ndarray
+    value_gap_weight: float
+
+
+def _search_draft_pool_rows(args: tuple) -> tuple[float, int, int] | None:
+    """Process-pool entry point for ``BalancedShuffler._search_draft_pool_pairs``."""
+    shuffler, *search_args = args
+    return shuffler._search_draft_pool_pairs(*search_args)
+
+
 @dataclass(slots=True)
 class _ShuffleScoringContext:
     """Request-local values and role metrics reused across candidate splits."""
@@ -2277,6 +2330,281 @@ class BalancedShuffler:
             pool_score=best_score,
         )
 
+    def _build_draft_pair_tables(
+        self,
+        captain_a: Player,
+        captain_b: Player,
+        candidates: list[Player],
+        exclusion_counts: dict[str, int],
+        recent_match_names: set[str],
+        scoring_context: _ShuffleScoringContext,
+    ) -> _DraftPairTables:
+        """Tabulate the pool terms and role metrics of every captain-plus-four team."""
+        # A pool's exclusion, recent-match and RD terms are sums over players,
+        # so each candidate contributes a fixed amount once selected.
+        player_terms = [
+            self.recent_match_penalty_weight * (player.name in recent_match_names)
+            - self.exclusion_penalty_weight * exclusion_counts.get(player.name, 0)
+            - self._calculate_rd_priority([player])
+            for player in candidates
+        ]
+        fours = tuple(itertools.combinations(range(len(candidates)), 4))
+        pool_terms = np.array([sum(player_terms[i] for i in four) for four in fours])
+        masks = np.array([sum(1 << i for i in four) for four in fours], dtype=np.int64)
+
+        # Lane and parity deltas each pair every role value of one team with
+        # one of the other, so each is at least the team value difference.
+        value_gap_weight = 1.0 + 2.0 * self.role_matchup_delta_weight
+        bounds_hold = self.off_role_flat_penalty >= 0 and self.role_matchup_delta_weight >= 0
+        columns = []
+        for captain in (captain_a, captain_b):
+            base = pool_terms.copy()
+            min_value = np.full(len(fours), -math.inf)
+            max_value = np.full(len(fours), math.inf)
+            values = np.zeros((len(fours), 3))
+            off_role_penalties = np.zeros((len(fours), 3))
+            role_values = np.zeros((len(fours), 3, Team.TEAM_SIZE))
+            finite = np.zeros(len(fours), dtype=bool)
+            for row, four in enumerate(fours):
+                summary = self._team_role_metrics_summary(
+                    [captain, *(candidates[i] for i in four)], 3, scoring_context
+                )
+                if not summary.team_values_are_finite:
+                    continue
+                metrics = summary.metrics + (summary.metrics[-1],) * (3 - len(summary.metrics))
+                base[row] += summary.min_off_role_count * self.off_role_flat_penalty
+                min_value[row] = summary.min_team_value
+                max_value[row] = summary.max_team_value
+                values[row] = [metric.team_value for metric in metrics]
+                off_role_penalties[row] = [
+                    metric.off_role_count * self.off_role_flat_penalty for metric in metrics
+                ]
+                role_values[row] = [metric.role_values for metric in metrics]
+                finite[row] = True
+            if not bounds_hold:
+                base[:] = -math.inf
+            columns.append(
+                (base, min_value, max_value, values, off_role_penalties, role_values, finite)
+            )
+
+        a_columns, b_columns = columns
+        return _DraftPairTables(
+            fours,
+            masks,
+            pool_terms,
+            *a_columns,
+            *b_columns,
+            value_gap_weight=value_gap_weight if bounds_hold else 0.0,
+        )
+
+    def _search_draft_pool_pairs(
+        self,
+        captain_a: Player,
+        captain_b: Player,
+        candidates: list[Player],
+        tables: _DraftPairTables,
+        a_rows: Sequence[int],
+        upper_bound: float,
+    ) -> tuple[float, int, int] | None:
+        """
+        Branch and bound over disjoint (team A four, team B four) pairs.
+
+        ``a_rows`` must be ordered by ascending ``a_base``. A pair's score is
+        its split score plus both fours' pool terms. Each team A row first
+        drops team B rows whose off-role and value-gap floor cannot beat the
+        best score so far, then scores the survivors' role assignment pairs
+        in one array pass. That pass is exactly the unconstrained split
+        score, and a floor for the region-split one, so only pairs that can
+        still win reach ``_score_role_assignments_for_matchup``.
+
+        Returns:
+            ``(score, a_row, b_row)`` of the best pair beating
+            ``upper_bound``, or None if no pair does.
+        """
+        scoring_context = _ShuffleScoringContext()
+        tolerance = _DRAFT_POOL_SCORE_TOLERANCE
+        role_weight = self.role_matchup_delta_weight
+        b_floor = float(tables.b_base.min())
+        best: tuple[float, int, int] | None = None
+        bound = upper_bound
+
+        for a_row in a_rows:
+            a_base = tables.a_base[a_row]
+            if a_base + b_floor >= bound - tolerance:
+                # Rows are sorted, so no later team A can do better either.
+                break
+            value_gap = np.maximum(
+                tables.a_min_value[a_row] - tables.b_max_value,
+                tables.b_min_value - tables.a_max_value[a_row],
+            )
+            floors = tables.b_base + a_base + tables.value_gap_weight * np.maximum(value_gap, 0.0)
+            floors[(tables.masks & tables.masks[a_row]) != 0] = math.inf
+            b_rows = np.flatnonzero(floors < bound - tolerance)
+            if not b_rows.size:
+                continue
+
+            # Axes are (team B row, team A assignment, team B assignment).
+            a_roles = tables.a_role_values[a_row][:, None, :]
+            b_roles = tables.b_role_values[b_rows][:, None, :, :]
+            role_deltas = np.abs(a_roles - b_roles).sum(axis=3) + np.abs(
+                a_roles[:, :, _LANE_OPPONENT_ROLES] - b_roles
+            ).sum(axis=3)
+            split_scores = (
+                np.abs(tables.a_values[a_row][:, None] - tables.b_values[b_rows][:, None, :])
+                + tables.a_off_role_penalties[a_row][:, None]
+                + tables.b_off_role_penalties[b_rows][:, None, :]
+                + role_deltas * role_weight
+            ).min(axis=(1, 2))
+            if not tables.a_finite[a_row]:
+                split_scores[:] = -math.inf
+            else:
+                split_scores[~tables.b_finite[b_rows]] = -math.inf
+            floors = split_scores + tables.pool_terms[a_row] + tables.pool_terms[b_rows]
+            order = np.argsort(floors, kind="stable")
+
+            team_a = [captain_a, *(candidates[i] for i in tables.fours[a_row])]
+            a_terms = tables.pool_terms[a_row]
+            for b_row, floor in zip(b_rows[order].tolist(), floors[order].tolist()):
+                if floor >= bound - tolerance:
+                    break
+                _, _, split_score = self._score_role_assignments_for_matchup(
+                    team_a,
+                    [captain_b, *(candidates[i] for i in tables.fours[b_row])],
+                    max_assignments_per_team=3,
+                    _scoring_context=scoring_context,
+                    _rd_priority=0.0,
+                )
+                score = split_score + a_terms + tables.pool_terms[b_row]
+                if score < bound - tolerance:
+                    bound = score
+                    best = (score, a_row, b_row)
+
+        return best
+
+    def select_draft_pool_exact(
+        self,
+        captain_a: Player,
+        captain_b: Player,
+        candidates: list[Player],
+        exclusion_counts: dict[str, int] | None = None,
+        recent_match_names: set[str] | None = None,
+        workers: int | None = None,
+    ) -> DraftPoolResult:
+        """
+        Select the 8-player pool with the lowest ``_score_full_pool`` score.
+
+        A pool's score is its best split plus per-player terms, so the
+        minimum over pools equals the minimum over disjoint pairs of
+        captain-plus-four teams, which ``_search_draft_pool_pairs`` finds
+        without visiting every pair. Pools are scored in lobby order, as the
+        exhaustive search scores them. The result is optimal up to
+        ``_DRAFT_POOL_SCORE_TOLERANCE``; among tied pools, which one comes
+        back can depend on ``workers``.
+
+        Args:
+            captain_a: First captain
+            captain_b: Second captain
+            candidates: Non-captain lobby players (8+)
+            exclusion_counts: Dict mapping player names to exclusion counts
+            recent_match_names: Set of player names from most recent match
+            workers: Processes to split team A rows across (default: CPU
+                count); small lobbies always search in-process
+
+        Returns:
+            DraftPoolResult with selected/excluded players and score
+
+        Raises:
+            ValueError: If fewer than 8 candidates
+        """
+        if len(candidates) < 8:
+            raise ValueError(f"Need at least 8 candidates, got {len(candidates)}")
+
+        exclusion_counts = exclusion_counts or {}
+        recent_match_names = recent_match_names or set()
+        scoring_context = _ShuffleScoringContext()
+
+        def pool_result(pool_indices: Iterable[int]) -> DraftPoolResult:
+            selected = set(pool_indices)
+            pool = [c for i, c in enumerate(candidates) if i in selected]
+            excluded = [c for i, c in enumerate(candidates) if i not in selected]
+            score = self._score_full_pool(
+                captain_a,
+                captain_b,
+                pool,
+                excluded,
+                exclusion_counts,
+                recent_match_names,
+                _scoring_context=scoring_context,
+            )
+            return DraftPoolResult(
+                selected_players=pool, excluded_players=excluded, pool_score=score
+            )
+
+        # Seed the bound with the beam search's greedy starting pool.
+        values = [self._player_value(c, scoring_context) for c in candidates]
+        incumbent = pool_result(sorted(range(len(candidates)), key=lambda i: -values[i])[:8])
+        tables = self._build_draft_pair_tables(
+            captain_a,
+            captain_b,
+            candidates,
+            exclusion_counts,
+            recent_match_names,
+            scoring_context,
+        )
+        # Pool terms of the captains and of excluding everyone are shared by
+        # every pool; pair scores leave them out.
+        pool_constant = (
+            sum(exclusion_counts.get(c.name, 0) for c in candidates)
+            * self.exclusion_penalty_weight
+            - self._calculate_rd_priority([captain_a, captain_b])
+        )
+        upper_bound = incumbent.pool_score - pool_constant
+        a_rows = np.argsort(tables.a_base, kind="stable").tolist()
+
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers > 1 and len(candidates) >= _DRAFT_POOL_PARALLEL_MIN_CANDIDATES:
+            # Deal rows round-robin so every worker starts on cheap floors. The
+            # bot is multi-threaded, where fork() can deadlock its children.
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+            ) as executor:
+                found = list(
+                    executor.map(
+                        _search_draft_pool_rows,
+                        [
+                            (
+                                self,
+                                captain_a,
+                                captain_b,
+                                candidates,
+                                tables,
+                                a_rows[offset::workers],
+                                upper_bound,
+                            )
+                            for offset in range(workers)
+                        ],
+                    )
+                )
+        else:
+            found = [
+                self._search_draft_pool_pairs(
+                    captain_a, captain_b, candidates, tables, a_rows, upper_bound
+                )
+            ]
+
+        best = min((result for result in found if result is not None), default=None)
+        if best is None:
+            result = incumbent
+        else:
+            _, a_row, b_row = best
+            result = pool_result((*tables.fours[a_row], *tables.fours[b_row]))
+
+        logger.info(
+            f"Draft pool selection (exact): {len(candidates)} candidates, "
+            f"best score={result.pool_score:.1f}"
+        )
+        return result
+
     def select_draft_pool(
         self,
         captain_a: Player,
@@ -2284,19 +2612,22 @@ class BalancedShuffler:
         candidates: list[Player],
         exclusion_counts: dict[str, int] | None = None,
         recent_match_names: set[str] | None = None,
+        workers: int | None = None,
     ) -> DraftPoolResult:
         """
         Select 8 non-captain players for draft such that snake-draft produces
         balanced teams regardless of who picks first.
 
-        Uses exhaustive search for <=12 candidates, beam search for larger pools.
+        Uses exhaustive search for <=12 candidates and the exact branch and
+        bound search for larger pools; both return an optimal pool.
 
         Args:
             captain_a: First captain
             captain_b: Second captain
-            candidates: Non-captain lobby players (8+, uses beam search for >12)
+            candidates: Non-captain lobby players (8+)
             exclusion_counts: Dict mapping player names to exclusion counts
             recent_match_names: Set of player names from most recent match
+            workers: Process count for the exact search (default: CPU count)
 
         Returns:
             DraftPoolResult with selected/excluded players and scores
@@ -2335,17 +2666,17 @@ class BalancedShuffler:
                 pool_score=pool_score,
             )
 
-        # For larger pools (>12), use beam search instead of exhaustive enumeration
-        # C(12,8) = 495 pools is manageable; C(13,8) = 1287; C(14,8) = 3003
-        # Beam search is ~5% worse but much faster for large pools
-        BEAM_SEARCH_THRESHOLD = 12
-        if len(candidates) > BEAM_SEARCH_THRESHOLD:
-            logger.info(
-                f"Using beam search for {len(candidates)} candidates "
-                f"(threshold: {BEAM_SEARCH_THRESHOLD})"
-            )
-            return self.select_draft_pool_beam(
-                captain_a, captain_b, candidates, exclusion_counts, recent_match_names
+        # C(12,8) = 495 pools is manageable; C(13,8) = 1287; C(24,8) = 735471.
+        # Past the threshold, prune pairs of teams instead of listing pools.
+        EXACT_SEARCH_THRESHOLD = 12
+        if len(candidates) > EXACT_SEARCH_THRESHOLD:
+            return self.select_draft_pool_exact(
+                captain_a,
+                captain_b,
+                candidates,
+                exclusion_counts,
+                recent_match_names,
+                workers=workers,
             )
 
         # Enumerate all C(N, 8) pools and pick the best (for <=12 candidates)
@@ -83,6 +83,20 @@ def _isolate_random_state():
     random.setstate(state)
 
 
+@pytest.fixture(autouse=True)
+def _reset_global_load_budget():
+    """
+    Give every test a full bot-wide load budget.
+
+    ``GLOBAL_LOAD_BUDGET`` lives for the whole process and sheds expensive
+    commands once drained, so a long run of command tests would otherwise
+    start refusing ``/dig`` or ``/calibration`` partway through the suite.
+    """
+    from utils.rate_limiter import GLOBAL_LOAD_BUDGET
+
+    GLOBAL_LOAD_BUDGET.reset()
+
+
 @pytest.fixture(autouse=True)
 def _disable_dig_weather(request, monkeypatch):
     """
@@ -17,6 +17,7 @@ import pytest
 import commands.ask as ask_module
 from commands.ask import AskCommands
 from services.sql_query_service import QueryResult
+from utils.rate_limiter import RateLimitResult
 
 # ---------------------------------------------------------------------------
 # Discord interaction shims
@@ -87,10 +88,9 @@ def patch_safe_io(monkeypatch):
 @pytest.fixture(autouse=True)
 def reset_rate_limiter():
     """Avoid bleed-over state in the module-level RateLimiter across tests."""
-    ask_module.AI_RATE_LIMITER._hits.clear()
-    ask_module.AI_RATE_LIMITER._next_purge_at = 0.0
+    ask_module.AI_RATE_LIMITER.reset()
     yield
-    ask_module.AI_RATE_LIMITER._hits.clear()
+    ask_module.AI_RATE_LIMITER.reset()
 
 
 def make_cog(query_result: QueryResult | None = None):
@@ -150,7 +150,7 @@ class TestAskRateLimit:
 
         def check(**kwargs):
             captured.update(kwargs)
-            return types.SimpleNamespace(allowed=False, retry_after_seconds=1)
+            return RateLimitResult(allowed=False, retry_after_seconds=1)
 
         monkeypatch.setattr(ask_module, "AI_RATE_LIMIT_REQUESTS", 3)
         monkeypatch.setattr(ask_module, "AI_RATE_LIMIT_WINDOW", 17)
@@ -167,7 +167,7 @@ class TestAskRateLimit:
         interaction = FakeInteraction()
 
         # Force the rate limiter to deny.
-        rl_result = types.SimpleNamespace(allowed=False, retry_after_seconds=42)
+        rl_result = RateLimitResult(allowed=False, retry_after_seconds=42)
         monkeypatch.setattr(ask_module.AI_RATE_LIMITER, "check", lambda **kw: rl_result)
 
         await cog.ask.callback(cog, interaction, "what is the average rating?")
@@ -4,22 +4,27 @@ from __future__ import annotations
 
 import asyncio
 import json
+import sqlite3
 from unittest.mock import MagicMock
 
 import pytest
 
 import services.balance_history_service as balance_history_module
+from repositories.economy_ledger_repository import EconomyLedgerRepository
+from repositories.player_repository import PlayerRepository
 from services.balance_history_service import (
     SOURCE_BETS,
     SOURCE_BONUS,
     SOURCE_DIG,
     SOURCE_DISBURSE,
     SOURCE_DOUBLE_OR_NOTHING,
+    SOURCE_OTHER,
     SOURCE_PREDICTIONS,
     SOURCE_TIPS,
     SOURCE_WHEEL,
     BalanceHistoryService,
 )
+from tests.conftest import TEST_GUILD_ID
 
 
 def _build_service(**overrides):
@@ -487,3 +492,103 @@ def test_cumulative_series_starts_at_zero_and_sums_correctly():
     # Series: (1, 10), (2, 5), (3, 25)
     assert [cum for _, cum, _ in series] == [10, 5, 25]
     assert [idx for idx, _, _ in series] == [1, 2, 3]
+
+
+def _ledger_player(db_path, changes):
+    players = PlayerRepository(db_path)
+    players.add(1, "p1", TEST_GUILD_ID)
+    for amount, source in changes:
+        players.add_balance(1, TEST_GUILD_ID, amount, source=source)
+    return players
+
+
+def test_ledger_series_tracks_real_balance_and_maps_sources(repo_db_path):
+    players = _ledger_player(
+        repo_db_path,
+        [(10, "bet_settlement"), (-4, "gamba"), (7, "dig"), (-2, "shop"), (5, None)],
+    )
+    svc, repos = _build_service(ledger_repo=EconomyLedgerRepository(repo_db_path))
+
+    series, totals = svc.get_balance_event_series(discord_id=1, guild_id=TEST_GUILD_ID)
+
+    assert series[-1][1] == players.get_balance(1, TEST_GUILD_ID)
+    assert [info["source"] for _, _, info in series[-5:]] == [
+        SOURCE_BETS,
+        SOURCE_WHEEL,
+        SOURCE_DIG,
+        SOURCE_OTHER,
+        SOURCE_OTHER,
+    ]
+    assert totals[SOURCE_BETS] == 10 and totals[SOURCE_WHEEL] == -4
+    repos["bet_repo"].get_player_bet_history.assert_not_called()
+    assert asyncio.run(
+        svc.get_balance_event_series_async(discord_id=1, guild_id=TEST_GUILD_ID)
+    ) == (series, totals)
+
+
+def test_ledger_series_downsamples_in_sql_and_keeps_the_endpoint(repo_db_path, monkeypatch):
+    players = _ledger_player(repo_db_path, [(step % 7 - 3 or 1, "bet") for step in range(50)])
+    monkeypatch.setattr(balance_history_module, "CHART_MAX_POINTS", 8)
+    svc, _ = _build_service(ledger_repo=EconomyLedgerRepository(repo_db_path))
+
+    series, _ = svc.get_balance_event_series(discord_id=1, guild_id=TEST_GUILD_ID)
+
+    assert len(series) == 8
+    assert sum(info["detail"]["entries"] for _, _, info in series) == 51
+    assert sum(info["delta"] for _, _, info in series) == series[-1][1]
+    assert series[-1][1] == players.get_balance(1, TEST_GUILD_ID)
+
+
+def test_ledger_series_keeps_pre_ledger_history_per_source(repo_db_path):
+    players = _ledger_player(repo_db_path, [(40, "bet_settlement"), (-5, "gamba")])
+    with sqlite3.connect(repo_db_path) as conn:
+        # Stand the player's first row in for the opening balance the ledger
+        # migration backfilled: 3 jopacoin as of t=1000, later rows after it.
+        conn.execute(
+            "UPDATE economy_ledger_entries SET created_at = 1000 + ledger_id"
+        )
+        conn.execute(
+            "UPDATE economy_ledger_entries SET source = 'ledger_backfill' "
+            "WHERE ledger_id = (SELECT MIN(ledger_id) FROM economy_ledger_entries)"
+        )
+    bet_repo = MagicMock()
+    bet_repo.get_player_bet_history.return_value = [
+        {"bet_time": 500, "profit": 30, "outcome": "won", "amount": 10, "leverage": 1, "match_id": 1},
+        {"bet_time": 900, "profit": -20, "outcome": "lost", "amount": 20, "leverage": 1, "match_id": 2},
+        # Settled after the backfill: the ledger already holds it.
+        {"bet_time": 5000, "profit": 40, "outcome": "won", "amount": 40, "leverage": 1, "match_id": 3},
+    ]
+    svc, _ = _build_service(
+        ledger_repo=EconomyLedgerRepository(repo_db_path), bet_repo=bet_repo
+    )
+
+    series, totals = svc.get_balance_event_series(discord_id=1, guild_id=TEST_GUILD_ID)
+
+    assert [(info["source"], info["delta"]) for _, _, info in series] == [
+        (SOURCE_BETS, 30),
+        (SOURCE_BETS, -20),
+        (SOURCE_OTHER, -7),
+        (SOURCE_BETS, 40),
+        (SOURCE_WHEEL, -5),
+    ]
+    assert [cumulative for _, cumulative, _ in series] == [30, 10, 3, 43, 38]
+    assert series[-1][1] == players.get_balance(1, TEST_GUILD_ID)
+    assert totals == {SOURCE_BETS: 50, SOURCE_OTHER: -7, SOURCE_WHEEL: -5}
+    assert asyncio.run(
+        svc.get_balance_event_series_async(discord_id=1, guild_id=TEST_GUILD_ID)
+    ) == (series, totals)
+
+
+def test_ledger_entries_page_with_keyset_cursor(repo_db_path):
+    _ledger_player(repo_db_path, [(n, "tip") for n in range(1, 8)])
+    svc, _ = _build_service(ledger_repo=EconomyLedgerRepository(repo_db_path))
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = svc.get_balance_entries_page(1, TEST_GUILD_ID, after=cursor, limit=3)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert [entry["delta"] for entry in seen] == [3, 1, 2, 3, 4, 5, 6, 7]
+    assert len({entry["ledger_id"] for entry in seen}) == 8
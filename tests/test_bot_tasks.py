@@ -25,20 +25,16 @@ def bot_module():
     import bot as bot_module
 
     bot_module._reminder_recovery_task = None
-    bot_module._duel_challenge_task = None
-    bot_module._economy_event_task = None
-    bot_module._first_game_pool_task = None
+    bot_module._job_scheduler_task = None
+    bot_module._deferred_extensions_task = None
+    bot_module._first_game_pool_dates.clear()
     bot_module._lobby_message_update_locks.clear()
     with patch.object(bot_module.bot, "is_closed", return_value=False):
         yield bot_module
 
     bot_module._lobby_message_update_locks.clear()
-    for attr in (
-        "_reminder_recovery_task",
-        "_duel_challenge_task",
-        "_economy_event_task",
-        "_first_game_pool_task",
-    ):
+    bot_module._first_game_pool_dates.clear()
+    for attr in ("_reminder_recovery_task", "_job_scheduler_task", "_deferred_extensions_task"):
         task = getattr(bot_module, attr)
         if task is not None:
             if task.done() and not task.cancelled():
@@ -48,15 +44,12 @@ def bot_module():
         setattr(bot_module, attr, None)
 
 
-async def test_first_game_pool_loop_funds_every_guild_for_current_game_date(bot_module):
+async def test_first_game_pool_job_funds_every_guild_for_current_game_date(bot_module):
     guilds = [SimpleNamespace(id=41), SimpleNamespace(id=42)]
     loan_service = MagicMock()
-    worker = getattr(bot_module, "_first_game_pool_loop", None)
-    assert worker is not None
+    now = 1_786_000_000
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -64,29 +57,29 @@ async def test_first_game_pool_loop_funds_every_guild_for_current_game_date(bot_
         ),
         patch.object(bot_module.bot, "loan_service", loan_service, create=True),
         patch.object(bot_module, "get_game_date", return_value="2026-08-05"),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()) as sleep,
+        patch.object(bot_module.time, "time", return_value=now),
     ):
-        await worker()
+        next_due = await bot_module._first_game_pool_job({})
 
     assert loan_service.fund_first_game_pools.call_args_list == [
         call(41, "2026-08-05", 100),
         call(42, "2026-08-05", 100),
     ]
-    sleep.assert_awaited_once_with(900)
+    # The job sleeps until the next 4 AM PST rollover, not a fixed wake.
+    assert next_due == bot_module.game_day_start_ts(now) + 86400
+    assert now < next_due <= now + 86400
 
 
-async def test_first_game_pool_loop_skips_guilds_already_processed_for_game_date(
+async def test_first_game_pool_job_skips_guilds_already_processed_for_game_date(
     bot_module,
 ):
-    """Funding changes once per game-date, so later wakes must not re-enter the
+    """Funding changes once per game-date, so later runs must not re-enter the
     write transaction for an already-processed guild/date."""
     guilds = [SimpleNamespace(id=41)]
     loan_service = MagicMock()
     loan_service.fund_first_game_pools.return_value = {"funded_dates": []}
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -94,21 +87,19 @@ async def test_first_game_pool_loop_skips_guilds_already_processed_for_game_date
         ),
         patch.object(bot_module.bot, "loan_service", loan_service, create=True),
         patch.object(bot_module, "get_game_date", return_value="2026-08-05"),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()),
     ):
-        await bot_module._first_game_pool_loop()
+        await bot_module._first_game_pool_job({})
+        await bot_module._first_game_pool_job({})
 
     loan_service.fund_first_game_pools.assert_called_once_with(41, "2026-08-05", 100)
 
 
-async def test_first_game_pool_loop_funds_again_when_game_date_advances(bot_module):
+async def test_first_game_pool_job_funds_again_when_game_date_advances(bot_module):
     guilds = [SimpleNamespace(id=41)]
     loan_service = MagicMock()
     loan_service.fund_first_game_pools.return_value = {"funded_dates": []}
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -118,9 +109,9 @@ async def test_first_game_pool_loop_funds_again_when_game_date_advances(bot_modu
         patch.object(
             bot_module, "get_game_date", side_effect=["2026-08-05", "2026-08-06"]
         ),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()),
     ):
-        await bot_module._first_game_pool_loop()
+        await bot_module._first_game_pool_job({})
+        await bot_module._first_game_pool_job({})
 
     assert loan_service.fund_first_game_pools.call_args_list == [
         call(41, "2026-08-05", 100),
@@ -128,7 +119,7 @@ async def test_first_game_pool_loop_funds_again_when_game_date_advances(bot_modu
     ]
 
 
-async def test_first_game_pool_loop_retries_failed_guild_on_next_wake(bot_module):
+async def test_first_game_pool_job_retries_failed_guild_soon(bot_module):
     """A failed funding attempt is not treated as processed for the game-date."""
     guilds = [SimpleNamespace(id=41)]
     loan_service = MagicMock()
@@ -138,8 +129,6 @@ async def test_first_game_pool_loop_retries_failed_guild_on_next_wake(bot_module
     ]
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -147,14 +136,31 @@ async def test_first_game_pool_loop_retries_failed_guild_on_next_wake(bot_module
         ),
         patch.object(bot_module.bot, "loan_service", loan_service, create=True),
         patch.object(bot_module, "get_game_date", return_value="2026-08-05"),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()),
+        patch.object(bot_module.time, "time", return_value=1_786_000_000),
     ):
-        await bot_module._first_game_pool_loop()
+        retry_at = await bot_module._first_game_pool_job({})
+        await bot_module._first_game_pool_job({})
 
+    assert retry_at == 1_786_000_000 + bot_module.FIRST_GAME_POOL_WAKE_SECONDS
     assert loan_service.fund_first_game_pools.call_count == 2
 
 
-async def test_first_game_pool_loop_refreshes_open_lobby_messages_after_funding(
+async def test_guild_join_funds_first_game_pools_without_waiting_for_rollover(
+    bot_module,
+):
+    scheduler = MagicMock()
+
+    with (
+        patch.object(bot_module.bot, "job_scheduler", scheduler, create=True),
+        patch.object(bot_module, "FIRST_GAME_POOL_DAILY_AMOUNT", 100),
+        patch.object(bot_module.time, "time", return_value=1_786_000_000),
+    ):
+        await bot_module.on_guild_join(SimpleNamespace(id=43))
+
+    scheduler.schedule.assert_called_once_with("first_game_pool", due_at=1_786_000_000)
+
+
+async def test_first_game_pool_job_refreshes_open_lobby_messages_after_funding(
     bot_module,
 ):
     guild = SimpleNamespace(id=41)
@@ -185,8 +191,6 @@ async def test_first_game_pool_loop_refreshes_open_lobby_messages_after_funding(
     }
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -210,7 +214,7 @@ async def test_first_game_pool_loop_refreshes_open_lobby_messages_after_funding(
         patch.object(bot_module.asyncio, "sleep", AsyncMock()),
         patch.object(bot_module, "update_lobby_message", AsyncMock()) as update_message,
     ):
-        await bot_module._first_game_pool_loop()
+        await bot_module._first_game_pool_job({})
 
     assert update_message.await_args_list == [
         call(
@@ -231,7 +235,7 @@ async def test_first_game_pool_loop_refreshes_open_lobby_messages_after_funding(
     fetch_channel.assert_awaited_once_with(202)
 
 
-async def test_first_game_pool_loop_does_not_refresh_after_idempotent_funding(
+async def test_first_game_pool_job_does_not_refresh_after_idempotent_funding(
     bot_module,
 ):
     guild = SimpleNamespace(id=41)
@@ -240,8 +244,6 @@ async def test_first_game_pool_loop_does_not_refresh_after_idempotent_funding(
     lobby_service = MagicMock()
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -253,7 +255,7 @@ async def test_first_game_pool_loop_does_not_refresh_after_idempotent_funding(
         patch.object(bot_module.asyncio, "sleep", AsyncMock()),
         patch.object(bot_module, "update_lobby_message", AsyncMock()) as update_message,
     ):
-        await bot_module._first_game_pool_loop()
+        await bot_module._first_game_pool_job({})
 
     update_message.assert_not_awaited()
     lobby_service.get_lobby.assert_not_called()
@@ -292,7 +294,7 @@ async def test_first_game_pool_refresh_retries_failed_current_generation(bot_mod
     sleep.assert_awaited_once_with(1)
 
 
-async def test_first_game_pool_loop_isolates_lobby_refresh_failures_across_guilds(
+async def test_first_game_pool_job_isolates_lobby_refresh_failures_across_guilds(
     bot_module,
 ):
     guilds = [SimpleNamespace(id=41), SimpleNamespace(id=42)]
@@ -333,8 +335,6 @@ async def test_first_game_pool_loop_isolates_lobby_refresh_failures_across_guild
     }
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -347,7 +347,7 @@ async def test_first_game_pool_loop_isolates_lobby_refresh_failures_across_guild
         patch.object(bot_module.asyncio, "sleep", AsyncMock()),
         patch.object(bot_module, "update_lobby_message", AsyncMock()) as update_message,
     ):
-        await bot_module._first_game_pool_loop()
+        await bot_module._first_game_pool_job({})
 
     assert update_message.await_args_list == [
         call(
@@ -469,12 +469,12 @@ async def test_log_task_exit_silent_on_cancel(bot_module, caplog):
     assert not any("exited unexpectedly" in rec.message for rec in caplog.records)
 
 
-async def test_duel_loop_catches_up_immediately_and_isolates_delivery_failures(
-    bot_module, caplog
-):
+async def test_duel_job_isolates_delivery_failures(bot_module, caplog):
     """One failed due delivery cannot prevent later durable claims."""
     service = MagicMock()
     service.get_due_challenge_ids.return_value = [(7, 42), (8, 42)]
+    # Challenge 7 failed, so it is still due when the run ends.
+    service.get_next_due_at.return_value = 1_700_000_000
     cog = SimpleNamespace(
         process_due_challenge=AsyncMock(side_effect=[RuntimeError("boom"), None])
     )
@@ -483,57 +483,53 @@ async def test_duel_loop_catches_up_immediately_and_isolates_delivery_failures(
         patch.object(bot_module.time, "time", return_value=1_700_000_000),
         patch.object(bot_module.bot, "duel_service", service, create=True),
         patch.object(bot_module.bot, "get_cog", return_value=cog),
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()) as sleep,
         caplog.at_level(logging.ERROR, logger="cama_bot"),
     ):
-        await bot_module._duel_challenge_loop()
+        next_due = await bot_module._duel_challenge_job({})
 
     service.get_due_challenge_ids.assert_called_once_with(1_700_000_000)
     assert cog.process_due_challenge.await_args_list == [
         call(7, 42, 1_700_000_000),
         call(8, 42, 1_700_000_000),
     ]
-    sleep.assert_awaited_once_with(bot_module.DUEL_WORKER_WAKE_SECONDS)
+    assert next_due == 1_700_000_000 + bot_module.DUEL_WORKER_RETRY_SECONDS
     assert any("duel due delivery failed challenge=7" in rec.message for rec in caplog.records)
 
 
-async def test_on_ready_retains_supervised_duel_and_first_game_pool_workers(bot_module):
-    """Reconnect-ready events reuse both live workers and observe their exits."""
-    running = MagicMock()
-    running.done.return_value = False
-    bot_module._prediction_refresh_task = running
-    bot_module._prediction_digest_task = running
-    bot_module._manashop_debt_task = running
-    bot_module._economy_event_task = running
-    bot_module._duel_challenge_task = None
-    bot_module._first_game_pool_task = None
-
-    duel_task = MagicMock()
-    duel_task.done.return_value = False
-    pool_task = MagicMock()
-    pool_task.done.return_value = False
+async def test_duel_job_sleeps_until_the_next_deadline(bot_module):
+    service = MagicMock()
+    service.get_due_challenge_ids.return_value = []
+    service.get_next_due_at.return_value = 1_700_003_600
+
+    with (
+        patch.object(bot_module.time, "time", return_value=1_700_000_000),
+        patch.object(bot_module.bot, "duel_service", service, create=True),
+        patch.object(bot_module.bot, "get_cog", return_value=SimpleNamespace()),
+    ):
+        assert await bot_module._duel_challenge_job({}) == 1_700_003_600
+        service.get_next_due_at.return_value = None
+        # Nothing pending: the job retires until a new challenge schedules it.
+        assert await bot_module._duel_challenge_job({}) is None
+
+
+async def test_on_ready_starts_one_supervised_job_scheduler(bot_module):
+    """Reconnect-ready events reuse the live scheduler and observe its exit."""
+    scheduler = MagicMock()
+    scheduler_task = MagicMock()
+    scheduler_task.done.return_value = False
     warm_tasks: list[MagicMock] = []
 
     def create_task(awaitable):
         if inspect.iscoroutine(awaitable):
             awaitable.close()
-        if awaitable is duel_supervised:
-            return duel_task
-        if awaitable is pool_supervised:
-            return pool_task
+        if awaitable is supervised:
+            return scheduler_task
         task = MagicMock()
         warm_tasks.append(task)
         return task
 
-    duel_supervised = object()
-    pool_supervised = object()
-    supervisor = MagicMock(
-        side_effect=lambda name, _body: (
-            duel_supervised if name == "duel_challenges" else pool_supervised
-        )
-    )
+    supervised = object()
+    supervisor = MagicMock(return_value=supervised)
     exit_callback = object()
     fake_loop = SimpleNamespace(create_task=MagicMock(side_effect=create_task))
 
@@ -544,6 +540,7 @@ async def test_on_ready_retains_supervised_duel_and_first_game_pool_workers(bot_
         patch.object(type(bot_module.bot), "guilds", new_callable=lambda: property(lambda _self: [])),
         patch.object(bot_module.bot, "player_service", None, create=True),
         patch.object(bot_module.bot, "reminder_service", None, create=True),
+        patch.object(bot_module.bot, "job_scheduler", scheduler, create=True),
         patch.object(
             bot_module,
             "_reconcile_persisted_lobby_messages",
@@ -555,21 +552,84 @@ async def test_on_ready_retains_supervised_duel_and_first_game_pool_workers(bot_
         await bot_module.on_ready()
         await bot_module.on_ready()
 
-    assert supervisor.call_args_list == [
-        call("duel_challenges", bot_module._duel_challenge_loop),
-        call("first_game_pool", bot_module._first_game_pool_loop),
-    ]
-    assert log_exit.call_args_list == [
-        call("duel_challenges"),
-        call("first_game_pool"),
-    ]
-    duel_task.add_done_callback.assert_called_once_with(exit_callback)
-    pool_task.add_done_callback.assert_called_once_with(exit_callback)
-    assert bot_module._duel_challenge_task is duel_task
-    assert bot_module._first_game_pool_task is pool_task
+    assert supervisor.call_args_list == [call("job_scheduler", scheduler.run)]
+    assert log_exit.call_args_list == [call("job_scheduler")]
+    scheduler_task.add_done_callback.assert_called_once_with(exit_callback)
+    assert bot_module._job_scheduler_task is scheduler_task
+    registered = [c.args[0] for c in scheduler.register.call_args_list]
+    assert {"prediction_refresh", "prediction_digest", "duel_challenges"} <= set(registered)
+    assert len(registered) == len(set(registered))
     assert reconcile_lobbies.await_count == 2
 
 
+async def test_on_ready_syncs_commands_only_after_deferred_extensions_load(bot_module):
+    """A partial tree sync would unregister the cogs still loading."""
+    loaded = asyncio.Event()
+    bot_module._deferred_extensions_task = asyncio.create_task(loaded.wait())
+    sync = AsyncMock()
+
+    with (
+        patch.object(bot_module.bot.tree, "walk_commands", return_value=[]),
+        patch.object(bot_module.bot.tree, "sync", sync),
+        patch.object(type(bot_module.bot), "guilds", new_callable=lambda: property(lambda _self: [])),
+        patch.object(bot_module.bot, "player_service", None, create=True),
+        patch.object(bot_module.bot, "reminder_service", None, create=True),
+        patch.object(bot_module.bot, "job_scheduler", None, create=True),
+        patch.object(bot_module, "_reconcile_persisted_lobby_messages", AsyncMock()),
+    ):
+        ready = asyncio.create_task(bot_module.on_ready())
+        await asyncio.sleep(0.01)
+        assert sync.await_count == 0
+        assert bot_module._deferred_extensions_loading()
+
+        loaded.set()
+        await ready
+
+    sync.assert_awaited_once()
+    assert "gateway_ready" in bot_module.startup_profile.milestones
+
+
+async def test_deferred_load_replays_on_ready_for_cogs_loaded_after_ready(bot_module):
+    from discord.ext import commands
+
+    replayed = asyncio.Event()
+
+    class LateCog(commands.Cog):
+        @commands.Cog.listener()
+        async def on_ready(self):
+            replayed.set()
+
+    late_cog = LateCog()
+    load = AsyncMock(return_value=[LateCog.__module__])
+
+    with (
+        patch.object(bot_module, "_load_extensions", load),
+        patch.object(bot_module, "_preload_deferred_modules", lambda: None),
+        patch.object(bot_module.bot, "is_ready", return_value=True),
+        patch.object(
+            type(bot_module.bot),
+            "cogs",
+            new_callable=lambda: property(lambda _self: {"LateCog": late_cog}),
+        ),
+    ):
+        await bot_module._start_deferred_extensions()
+        await asyncio.wait_for(replayed.wait(), timeout=1)
+
+    load.assert_awaited_once_with(
+        bot_module.DEFERRED_EXTENSIONS, stage="Deferred extension load"
+    )
+    assert not bot_module._deferred_extensions_loading()
+    assert {"deferred_preload", "deferred_extensions"} <= set(bot_module.startup_profile.phases)
+
+
+def test_core_and_deferred_extensions_partition_the_extension_list(bot_module):
+    assert set(bot_module.CORE_EXTENSIONS) <= set(bot_module.EXTENSIONS)
+    assert set(bot_module.CORE_EXTENSIONS).isdisjoint(bot_module.DEFERRED_EXTENSIONS)
+    assert len(bot_module.CORE_EXTENSIONS) + len(bot_module.DEFERRED_EXTENSIONS) == len(
+        bot_module.EXTENSIONS
+    )
+
+
 def test_refresh_vanity_tax_memberships_uses_current_guild_members(bot_module):
     service = MagicMock()
     snapshot = [
@@ -921,7 +981,9 @@ async def test_sword_reaction_uses_gateway_member_and_partial_message(bot_module
         send=AsyncMock(),
     )
     bot_user = SimpleNamespace(id=999)
-    lobby_cog = SimpleNamespace(sync_readycheck_with_lobby=AsyncMock())
+    lobby_cog = SimpleNamespace(
+        sync_readycheck_with_lobby=AsyncMock(), arm_curfew_sweep=AsyncMock()
+    )
     reminder_service = SimpleNamespace(
         notify_lobby_player_subscribers=AsyncMock(return_value=1)
     )
@@ -965,6 +1027,7 @@ async def test_sword_reaction_uses_gateway_member_and_partial_message(bot_module
         payload.guild_id,
         lobby_kind=bot_module.LobbyKind.LOWSKILL,
     )
+    lobby_cog.arm_curfew_sweep.assert_awaited_once_with(member.id, payload.guild_id)
     notify_rally.assert_awaited_once_with(
         channel,
         None,
@@ -2372,7 +2435,7 @@ async def test_concurrent_readycheck_completion_retries_after_failed_delivery(
     assert send_attempts == 2
 
 
-async def test_economy_event_loop_does_not_pause_disbursement_voting(bot_module):
+async def test_economy_event_job_does_not_pause_disbursement_voting(bot_module):
     """Direction comes from the rolling band without a static recovery mode."""
     guild = SimpleNamespace(id=42)
     order: list[str] = []
@@ -2389,8 +2452,6 @@ async def test_economy_event_loop_does_not_pause_disbursement_voting(bot_module)
     economy_service.seconds_until_next_trigger.return_value = 900
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -2408,16 +2469,16 @@ async def test_economy_event_loop_does_not_pause_disbursement_voting(bot_module)
             economy_service,
             create=True,
         ),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()) as sleep,
+        patch.object(bot_module.time, "time", return_value=1_700_000_000),
     ):
-        await bot_module._economy_event_loop()
+        next_due = await bot_module._economy_event_job({})
 
     assert order == ["event"]
     disburse_service.enforce_voting_moratorium.assert_not_called()
-    sleep.assert_awaited_once_with(900)
+    assert next_due == 1_700_000_000 + 900
 
 
-async def test_economy_event_loop_preserves_ballot_for_severe_deflationary_edict(
+async def test_economy_event_job_preserves_ballot_for_severe_deflationary_edict(
     bot_module,
     repo_db_path,
 ):
@@ -2463,8 +2524,6 @@ async def test_economy_event_loop_preserves_ballot_for_severe_deflationary_edict
     restriction_active = True
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -2482,9 +2541,8 @@ async def test_economy_event_loop_preserves_ballot_for_severe_deflationary_edict
             disburse_service,
             create=True,
         ),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()),
     ):
-        await bot_module._economy_event_loop()
+        await bot_module._economy_event_job({})
 
     preserved = disburse_service.get_proposal(TEST_GUILD_ID)
     assert preserved is not None
@@ -2507,7 +2565,7 @@ async def test_economy_event_loop_preserves_ballot_for_severe_deflationary_edict
         (60, 3600, 60),
     ],
 )
-async def test_economy_event_loop_wakes_at_interval_or_trigger_whichever_is_first(
+async def test_economy_event_job_wakes_at_interval_or_trigger_whichever_is_first(
     bot_module,
     configured_wake,
     seconds_until_trigger,
@@ -2520,8 +2578,6 @@ async def test_economy_event_loop_wakes_at_interval_or_trigger_whichever_is_firs
     economy_service.seconds_until_next_trigger.return_value = seconds_until_trigger
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -2529,15 +2585,15 @@ async def test_economy_event_loop_wakes_at_interval_or_trigger_whichever_is_firs
         ),
         patch.object(bot_module.bot, "economy_event_service", economy_service, create=True),
         patch.object(bot_module, "ECONOMY_EVENT_WAKE_SECONDS", configured_wake),
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()) as sleep,
+        patch.object(bot_module.time, "time", return_value=1_700_000_000),
     ):
-        await bot_module._economy_event_loop()
+        next_due = await bot_module._economy_event_job({})
 
     economy_service.seconds_until_next_trigger.assert_called_once_with()
-    sleep.assert_awaited_once_with(expected_sleep)
+    assert next_due == 1_700_000_000 + expected_sleep
 
 
-async def test_economy_event_loop_posts_and_stamps_second_daily_announcement(
+async def test_economy_event_job_posts_and_stamps_second_daily_announcement(
     bot_module,
 ):
     guild = SimpleNamespace(id=42)
@@ -2548,8 +2604,6 @@ async def test_economy_event_loop_posts_and_stamps_second_daily_announcement(
     economy_service.seconds_until_next_trigger.return_value = 900
 
     with (
-        patch.object(bot_module.bot, "wait_until_ready", AsyncMock()),
-        patch.object(bot_module.bot, "is_closed", side_effect=[False, True]),
         patch.object(
             type(bot_module.bot),
             "guilds",
@@ -2566,9 +2620,8 @@ async def test_economy_event_loop_posts_and_stamps_second_daily_announcement(
             "_announce_economy_event",
             AsyncMock(return_value=True),
         ) as announce,
-        patch.object(bot_module.asyncio, "sleep", AsyncMock()),
     ):
-        await bot_module._economy_event_loop()
+        await bot_module._economy_event_job({})
 
     announce.assert_awaited_once_with(guild, event)
     economy_service.mark_event_reminder_announced.assert_called_once_with(
@@ -2994,6 +3047,40 @@ async def test_process_one_refresh_revives_thread_for_daily_summary(bot_module):
     assert thread.archived_at_send == [False]
 
 
+async def test_refresh_batch_refreshes_once_and_publishes_concurrently(bot_module):
+    """All due markets go through one refresh_markets call; embed refreshes run
+    side by side up to the post-concurrency bound."""
+    import contextlib
+
+    thread = _ArchivedThread()
+    cog, patches = _refresh_env(bot_module, thread)
+    svc = patches[0].new
+    svc.refresh_markets = MagicMock(return_value=[_refresh_summary() for _ in range(3)])
+    active = 0
+    peak = 0
+
+    async def slow_embed(_pid):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    cog.refresh_market_embed = AsyncMock(side_effect=slow_embed)
+    markets = [{"prediction_id": pid, "thread_id": None} for pid in (1, 2, 3)]
+
+    with contextlib.ExitStack() as stack:
+        for p in patches:
+            stack.enter_context(p)
+        stack.enter_context(patch("config.PREDICTION_REFRESH_POST_CONCURRENCY", 2))
+        await bot_module._process_refresh_batch(markets)
+
+    svc.refresh_markets.assert_called_once_with([1, 2, 3])
+    svc.refresh_market.assert_not_called()
+    assert cog.refresh_market_embed.await_count == 3
+    assert peak == 2
+
+
 async def test_process_one_refresh_skips_summary_when_market_no_longer_open(bot_module):
     """A market resolved between refresh_market and the summary post must not
     get its just-archived thread revived or a 'Daily refresh' message."""
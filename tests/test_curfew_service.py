@@ -215,3 +215,28 @@ class TestSweep:
         kicks = curfew_service.sweep([TEST_GUILD_ID, 999999], now=ELEVEN_PM_ET)
 
         assert [k.guild_id for k in kicks] == [TEST_GUILD_ID]
+
+
+class TestNextSweep:
+    def test_next_sweep_is_the_next_window_start_for_a_queued_player(self, repo_db_path):
+        lobby_service, _, _, curfew_service = make_services(repo_db_path, player_ids=[1])
+        seat(lobby_service, 1, LobbyKind.OPEN)
+        curfew_service.add_window(1, TEST_GUILD_ID, "work", start_hour=9, start_minute=0, end_hour=17, end_minute=0)
+
+        due = curfew_service.next_sweep_at([TEST_GUILD_ID], now=ELEVEN_PM_ET)
+
+        nine_am_et = datetime(2026, 1, 2, 9, 0, tzinfo=ZoneInfo("America/New_York"))
+        assert due == int(nine_am_et.timestamp())
+
+    def test_next_sweep_is_now_when_a_queued_player_is_inside_a_window(self, repo_db_path):
+        lobby_service, _, _, curfew_service = make_services(repo_db_path, player_ids=[1])
+        seat(lobby_service, 1, LobbyKind.LOWSKILL)
+        curfew_service.add_window(1, TEST_GUILD_ID, "sleep", start_hour=22, start_minute=0, end_hour=6, end_minute=0)
+
+        assert curfew_service.next_sweep_at([TEST_GUILD_ID], now=ELEVEN_PM_ET) == int(ELEVEN_PM_ET.timestamp())
+
+    def test_next_sweep_ignores_players_who_are_not_queued(self, repo_db_path):
+        _, _, _, curfew_service = make_services(repo_db_path, player_ids=[1])
+        curfew_service.add_window(1, TEST_GUILD_ID, "sleep", start_hour=22, start_minute=0, end_hour=6, end_minute=0)
+
+        assert curfew_service.next_sweep_at([TEST_GUILD_ID], now=NOON_ET) is None
@@ -0,0 +1,98 @@
+"""Quiet-period SQLite maintenance against a real database file."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+from repositories.maintenance_repository import MaintenanceRepository
+from services.database_maintenance_service import DatabaseMaintenanceService
+
+
+def _service(db_path: str, **options) -> DatabaseMaintenanceService:
+    return DatabaseMaintenanceService(
+        MaintenanceRepository(db_path), step_pause_seconds=0, **options
+    )
+
+
+def _churn(db_path: str) -> sqlite3.Connection:
+    """Grow then shrink the players table; the returned connection pins the WAL."""
+    pin = sqlite3.connect(db_path)
+    pin.execute("SELECT 1").fetchall()
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO players (discord_id, guild_id, discord_username) VALUES (?, 1, ?)",
+            [(i, "x" * 200) for i in range(5000)],
+        )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM players WHERE discord_id >= 100")
+    return pin
+
+
+def test_pass_truncates_wal_reclaims_free_pages_and_reports(repo_db_path):
+    pin = _churn(repo_db_path)
+    service = _service(repo_db_path)
+    try:
+        report = service.run()
+    finally:
+        pin.close()
+
+    assert report is not None and report.completed
+    assert report.before["auto_vacuum"] == "incremental"
+    assert report.before["wal_bytes"] > 0 and report.before["freelist_count"] > 0
+    assert report.wal_frames_left == 0
+    assert report.after["wal_bytes"] <= 32  # at most the WAL header
+    assert report.after["freelist_count"] == 0
+    assert report.pages_reclaimed > 0
+    assert report.after["page_count"] < report.before["page_count"]
+    assert report.analyzed_tables > 0 and not report.skipped_tables
+    assert set(report.probes_after_ms) == set(report.probes_before_ms) == {
+        "glicko_leaderboard",
+        "player_match_history",
+        "recent_matches",
+    }
+    assert service.last_report is report
+    assert "pages reclaimed" in report.summary()
+    with sqlite3.connect(repo_db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+
+
+def test_pass_waits_for_lobbies_and_matches_to_finish(repo_db_path):
+    service = _service(repo_db_path)
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute(
+            "INSERT INTO lobby_state (lobby_id, guild_id, players) VALUES (1, 1, ?)",
+            (json.dumps([10, 11]),),
+        )
+    assert service.run() is None
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("UPDATE lobby_state SET players = '[]'")
+        conn.execute("INSERT INTO pending_matches (guild_id, payload) VALUES (1, '{}')")
+    assert service.run() is None
+    assert service.last_report is None
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("DELETE FROM pending_matches")
+    assert service.run().completed
+
+
+def test_held_write_lock_is_skipped_within_the_budget(repo_db_path):
+    service = _service(repo_db_path, max_lock_ms=20)
+    writer = sqlite3.connect(repo_db_path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("UPDATE players SET wins = wins")
+    try:
+        started = time.perf_counter()
+        report = service.run()
+        elapsed = time.perf_counter() - started
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    assert report.completed
+    assert report.analyzed_tables == 0
+    assert report.skipped_tables == service.maintenance_repo.list_tables()
+    # Every step gave up after its own short busy wait.
+    assert elapsed < 0.1 * (len(report.skipped_tables) + 4)
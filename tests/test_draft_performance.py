@@ -7,6 +7,10 @@ Performance is asserted via deterministic work counts (calls to
 wall-clock time, which flakes under ``-n auto`` CPU oversubscription.
 """
 
+import random
+
+import pytest
+
 from domain.models.player import Player
 from shuffler import BalancedShuffler
 
@@ -27,6 +31,25 @@ def _make_player(
     )
 
 
+def _random_lobby(count: int, seed: int) -> tuple[Player, Player, list[Player], dict, set]:
+    """Captains, candidates, exclusion counts and recent names for one lobby."""
+    rng = random.Random(seed)
+
+    def player(name: str) -> Player:
+        return Player(
+            name=name,
+            glicko_rating=rng.gauss(1500, 250),
+            glicko_rd=rng.uniform(50, 300),
+            preferred_roles=rng.sample(["1", "2", "3", "4", "5"], rng.randint(1, 3)),
+            discord_id=rng.randrange(10**9),
+        )
+
+    candidates = [player(f"P{i}") for i in range(count)]
+    exclusion_counts = {p.name: rng.randint(0, 4) for p in candidates}
+    recent_match_names = {p.name for p in candidates if rng.random() < 0.4}
+    return player("CaptA"), player("CaptB"), candidates, exclusion_counts, recent_match_names
+
+
 def _count_score_evals(shuffler: BalancedShuffler) -> dict:
     """Instrument shuffler._score_full_pool to count pool evaluations.
 
@@ -193,6 +216,75 @@ class TestBeamSearchPerformance:
         assert len(result.excluded_players) == 16
 
 
+class TestExactDraftPoolSelection:
+    """Tests that the exact search returns an optimal pool."""
+
+    @pytest.mark.parametrize("count,seed", [(9, 0), (10, 1), (11, 2), (12, 3), (12, 4)])
+    def test_matches_exhaustive_enumeration(self, count, seed):
+        shuffler = BalancedShuffler()
+        lobby = _random_lobby(count, seed)
+
+        exhaustive = shuffler.select_draft_pool(*lobby)
+        exact = shuffler.select_draft_pool_exact(*lobby, workers=1)
+
+        assert exact.pool_score == pytest.approx(exhaustive.pool_score, abs=1e-6)
+        assert {p.name for p in exact.selected_players} == {
+            p.name for p in exhaustive.selected_players
+        }
+
+    def test_never_loses_to_beam_search(self):
+        shuffler = BalancedShuffler()
+        captain_a, captain_b, candidates, exclusion_counts, recent = _random_lobby(16, 5)
+
+        exact = shuffler.select_draft_pool_exact(
+            captain_a, captain_b, candidates, exclusion_counts, recent, workers=1
+        )
+        beam = shuffler.select_draft_pool_beam(
+            captain_a, captain_b, candidates, exclusion_counts, recent
+        )
+        # Rescore the beam's pool in lobby order, the order the exact and
+        # exhaustive searches score pools in.
+        beam_names = {p.name for p in beam.selected_players}
+        beam_score = shuffler._score_full_pool(
+            captain_a,
+            captain_b,
+            [p for p in candidates if p.name in beam_names],
+            [p for p in candidates if p.name not in beam_names],
+            exclusion_counts,
+            recent,
+        )
+
+        assert exact.pool_score <= beam_score + 1e-6
+        assert len(exact.selected_players) == 8
+        assert len(exact.excluded_players) == 8
+
+    def test_workers_agree_with_in_process_search(self):
+        shuffler = BalancedShuffler()
+        lobby = _random_lobby(16, 6)
+
+        serial = shuffler.select_draft_pool_exact(*lobby, workers=1)
+        parallel = shuffler.select_draft_pool_exact(*lobby, workers=2)
+
+        assert parallel.pool_score == pytest.approx(serial.pool_score, abs=1e-6)
+
+    def test_prunes_most_team_pairs(self):
+        """Only pairs that can beat the incumbent reach the scalar scorer."""
+        shuffler = BalancedShuffler()
+        calls = {"n": 0}
+        original = shuffler._score_role_assignments_for_matchup
+
+        def counted(*args, **kwargs):
+            calls["n"] += 1
+            return original(*args, **kwargs)
+
+        shuffler._score_role_assignments_for_matchup = counted
+        shuffler.select_draft_pool_exact(*_random_lobby(20, 7), workers=1)
+
+        # C(20, 4) * C(16, 4) = 8817900 disjoint pairs, and the exhaustive
+        # search would score 70 splits for each of C(20, 8) = 125970 pools.
+        assert calls["n"] <= 5000
+
+
 class TestSelectDraftPoolRouting:
     """Tests that select_draft_pool routes to the correct algorithm."""
 
@@ -243,29 +335,28 @@ class TestSelectDraftPoolRouting:
         # scorer explores three tied role assignments for each team.
         assert metric_calls == 2 * 495 * 3
 
-    def test_13_candidates_uses_beam_search(self):
-        """13 candidates should use beam search (above threshold)."""
+    def test_13_candidates_uses_exact_search(self):
+        """13 candidates should use the exact search (above threshold)."""
         shuffler = BalancedShuffler()
         captain_a = _make_player("CaptA", 1600)
         captain_b = _make_player("CaptB", 1550)
         candidates = [_make_player(f"P{i}", 1400 + i * 30) for i in range(13)]
 
-        # Spy on the beam entry point to verify routing directly (the old
-        # wall-clock check only inferred it).
-        beam_calls = {"n": 0}
-        original_beam = shuffler.select_draft_pool_beam
+        # Spy on the exact entry point to verify routing directly.
+        exact_calls = {"n": 0}
+        original_exact = shuffler.select_draft_pool_exact
 
-        def spying_beam(*args, **kwargs):
-            beam_calls["n"] += 1
-            return original_beam(*args, **kwargs)
+        def spying_exact(*args, **kwargs):
+            exact_calls["n"] += 1
+            return original_exact(*args, **kwargs)
 
-        shuffler.select_draft_pool_beam = spying_beam
+        shuffler.select_draft_pool_exact = spying_exact
 
         result = shuffler.select_draft_pool(captain_a, captain_b, candidates)
 
         assert len(result.selected_players) == 8
         assert len(result.excluded_players) == 5
-        assert beam_calls["n"] == 1, "13 candidates should route to beam search"
+        assert exact_calls["n"] == 1, "13 candidates should route to the exact search"
 
 
 class TestEdgeCases:
@@ -892,6 +892,22 @@ def test_due_scan_returns_guild_pairs_with_expiry_first(repo_db_path):
     ]
 
 
+def test_next_due_time_matches_the_due_scan(repo_db_path):
+    seed_player(repo_db_path, 1, 1400.0, 550)
+    seed_player(repo_db_path, 2, 1500.0, 500)
+    repo = DuelChallengeRepository(repo_db_path)
+    challenge = create_challenge(repo)
+
+    # An unbound challenge is not due until its message is posted.
+    assert repo.get_next_due_at() is None
+    repo.bind_message(challenge.challenge_id, GUILD_ID, 1001)
+    next_due = repo.get_next_due_at()
+
+    assert next_due == NOW + DAY
+    assert repo.get_due_challenge_ids(next_due - 1) == []
+    assert repo.get_due_challenge_ids(next_due) == [(challenge.challenge_id, GUILD_ID)]
+
+
 def test_reminder_claim_catches_up_to_next_daily_boundary(duel_fixture):
     """The claim bumps the schedule to the next daily boundary while
     preserving the claimed slot for delivery-failure rearm."""
@@ -0,0 +1,82 @@
+"""Tests for the bulk economy-ledger writer used by batch balance changes."""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+
+from repositories.economy_ledger_repository import EconomyLedgerRepository
+from repositories.player_repository import PlayerRepository
+from tests.conftest import TEST_GUILD_ID
+
+DELTAS = {1: 40, 2: -15, 3: 0, 4: 7}
+CONTEXT = {
+    "source": "bulk_test",
+    "actor_id": 9,
+    "related_type": "match",
+    "related_id": 77,
+    "reason": "batch payout",
+    "metadata": {"n": 3},
+}
+
+
+def _ledger(db_path: str) -> list[tuple]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            """
+            SELECT guild_id, account_type, account_id, delta, balance_before,
+                   balance_after, source, actor_id, related_type, related_id,
+                   reason, metadata
+            FROM economy_ledger_entries
+            WHERE source = 'bulk_test'
+            ORDER BY account_id
+            """
+        ).fetchall()
+
+
+def _seed(db_path: str) -> PlayerRepository:
+    repo = PlayerRepository(db_path)
+    for discord_id in (1, 2, 3, 4):
+        repo.add(discord_id, f"p{discord_id}", TEST_GUILD_ID)
+        repo.add_balance(discord_id, TEST_GUILD_ID, discord_id * 10)
+    return repo
+
+
+def test_bulk_writer_matches_trigger_entries(repo_db_path, tmp_path):
+    trigger_db = str(tmp_path / "trigger.db")
+    shutil.copy2(repo_db_path, trigger_db)
+    trigger_repo = _seed(trigger_db)
+    for discord_id, delta in DELTAS.items():
+        trigger_repo.add_balance(discord_id, TEST_GUILD_ID, delta, **CONTEXT)
+
+    bulk_repo = _seed(repo_db_path)
+    bulk_repo.add_balance_many({**DELTAS, 99: 5}, TEST_GUILD_ID, **CONTEXT)
+
+    assert _ledger(repo_db_path) == _ledger(trigger_db)
+    assert len(_ledger(repo_db_path)) == 3
+    assert bulk_repo.get_balance(2, TEST_GUILD_ID) == trigger_repo.get_balance(2, TEST_GUILD_ID)
+
+
+def test_bulk_writes_conserve_balances_and_clear_context(repo_db_path):
+    repo = _seed(repo_db_path)
+    ledger = EconomyLedgerRepository(repo_db_path)
+
+    repo.add_balance_many(DELTAS, TEST_GUILD_ID, **CONTEXT)
+    repo.add_balance(1, TEST_GUILD_ID, -3)
+
+    assert ledger.find_conservation_breaks(TEST_GUILD_ID) == []
+    with sqlite3.connect(repo_db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM economy_ledger_context").fetchone()[0] == 0
+
+
+def test_conservation_checker_reports_untracked_balance_changes(repo_db_path):
+    _seed(repo_db_path)
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("DROP TRIGGER trg_economy_ledger_players_update")
+        conn.execute(
+            "UPDATE players SET jopacoin_balance = jopacoin_balance + 1 WHERE discord_id = 2"
+        )
+
+    breaks = EconomyLedgerRepository(repo_db_path).find_conservation_breaks(TEST_GUILD_ID)
+
+    assert [(b["account_id"], b["problem"]) for b in breaks] == [(2, "balance")]
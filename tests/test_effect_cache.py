@@ -0,0 +1,154 @@
+"""Tests for the versioned and request-scoped effect caches."""
+
+from __future__ import annotations
+
+import time
+
+from repositories.buff_repository import BuffRepository
+from repositories.economy_event_repository import EconomyEventRepository
+from services.buff_service import BuffService
+from services.economy_event_service import EconomyEventService
+from tests.conftest import TEST_GUILD_ID
+from utils.effect_cache import (
+    VersionedEffectCache,
+    effect_request_scope,
+    invalidate_request_effects,
+    scoped_lookup,
+)
+
+
+class _CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestVersionedEffectCache:
+    def test_hit_until_invalidated(self):
+        cache = VersionedEffectCache()
+        loader = _CountingLoader("a")
+
+        assert cache.get_or_load("k", loader) == "a"
+        assert cache.get_or_load("k", loader) == "a"
+        assert loader.calls == 1
+
+        cache.invalidate("k")
+        assert cache.get_or_load("k", loader) == "a"
+        assert loader.calls == 2
+        assert cache.stats() == {
+            "entries": 1,
+            "hits": 1,
+            "misses": 2,
+            "invalidations": 1,
+        }
+
+    def test_expiry_and_source_version_force_reload(self):
+        now = [100.0]
+        cache = VersionedEffectCache(clock=lambda: now[0])
+        loader = _CountingLoader(1)
+
+        cache.get_or_load("k", loader, ttl_seconds=10)
+        now[0] = 109.0
+        cache.get_or_load("k", loader, ttl_seconds=10)
+        assert loader.calls == 1
+
+        now[0] = 110.0
+        cache.get_or_load("k", loader, ttl_seconds=10)
+        assert loader.calls == 2
+
+        cache.get_or_load("k", loader, ttl_seconds=10, source_version=1)
+        assert loader.calls == 3
+
+    def test_invalidation_during_load_is_not_stored(self):
+        cache = VersionedEffectCache()
+
+        def racing_loader():
+            cache.invalidate("k")
+            return "stale"
+
+        assert cache.get_or_load("k", racing_loader) == "stale"
+        assert cache.get_or_load("k", lambda: "fresh") == "fresh"
+
+
+class TestRequestScope:
+    def test_lookup_without_scope_is_uncached(self):
+        loader = _CountingLoader(True)
+        scoped_lookup("buff", 1, loader)
+        scoped_lookup("buff", 1, loader)
+        assert loader.calls == 2
+
+    def test_scope_memoizes_until_namespace_invalidated(self):
+        loader = _CountingLoader(True)
+        with effect_request_scope():
+            scoped_lookup("buff", 1, loader)
+            with effect_request_scope():
+                scoped_lookup("buff", 1, loader)
+            assert loader.calls == 1
+
+            invalidate_request_effects("mana")
+            scoped_lookup("buff", 1, loader)
+            assert loader.calls == 1
+
+            invalidate_request_effects("buff")
+            scoped_lookup("buff", 1, loader)
+            assert loader.calls == 2
+
+        scoped_lookup("buff", 1, loader)
+        assert loader.calls == 3
+
+
+def test_buff_grant_invalidates_scoped_snapshot(repo_db_path):
+    buff_service = BuffService(BuffRepository(repo_db_path))
+
+    with effect_request_scope():
+        assert buff_service.has_overgrowth(1, TEST_GUILD_ID) is False
+        buff_service.grant_overgrowth(1, TEST_GUILD_ID)
+        assert buff_service.has_overgrowth(1, TEST_GUILD_ID) is True
+        assert buff_service.consume_overgrowth_charge(1, TEST_GUILD_ID) is True
+
+
+def test_economy_effects_resolve_once_and_see_new_cards(repo_db_path):
+    repo = EconomyEventRepository(repo_db_path)
+    service = EconomyEventService(repo, enabled=True)
+    calls = []
+    original = repo.get_event_for_date
+
+    def counting_get_event_for_date(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    repo.get_event_for_date = counting_get_event_for_date
+
+    for _ in range(10):
+        assert service.get_effects(TEST_GUILD_ID).reward_multiplier == 1.0
+    assert len(calls) == 1
+
+    now = int(time.time())
+    repo.activate_event_atomic(
+        TEST_GUILD_ID,
+        {
+            "event_date": service._event_date_for_timestamp(now),
+            "name": "Doom",
+            "hero": "Doom",
+            "direction": "deflationary",
+            "severity": 1,
+            "target_effect_jc": 0,
+            "forecast_flow_jc": 0,
+            "expected_effect_jc": 0,
+            "monetary_stock_before": 0,
+            "effects": {"reward_multiplier": 0.5},
+            "announcement": "Doomed.",
+            "starts_at": now,
+            "ends_at": now + 86400,
+            "created_at": now,
+        },
+    )
+
+    for _ in range(10):
+        assert service.get_effects(TEST_GUILD_ID).reward_multiplier == 0.5
+    assert len(calls) == 2
+    assert service.get_effect_cache_stats()["hits"] == 18
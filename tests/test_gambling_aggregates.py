@@ -0,0 +1,134 @@
+"""Tests for the incrementally maintained player_gambling_aggregates table."""
+
+import sqlite3
+import time
+
+import pytest
+
+from repositories.bet_repository import BetRepository
+from repositories.match_repository import MatchRepository
+from repositories.player_repository import PlayerRepository
+
+GUILD_ID = 111
+
+
+@pytest.fixture
+def repos(repo_db_path):
+    return (
+        PlayerRepository(repo_db_path),
+        BetRepository(repo_db_path),
+        MatchRepository(repo_db_path),
+    )
+
+
+def _player(player_repo, discord_id):
+    player_repo.add(
+        discord_id=discord_id,
+        discord_username=f"p{discord_id}",
+        guild_id=GUILD_ID,
+        initial_mmr=3000,
+    )
+    player_repo.update_balance(discord_id, GUILD_ID, 1000)
+
+
+def _bet(bet_repo, match_repo, bets, winner, bet_time=None):
+    """Place ``bets`` ({discord_id: (team, amount, leverage)}) and settle one match."""
+    now = bet_time or int(time.time())
+    for discord_id, (team, amount, leverage) in bets.items():
+        bet_repo.place_bet_atomic(
+            guild_id=GUILD_ID,
+            discord_id=discord_id,
+            team=team,
+            amount=amount,
+            bet_time=now,
+            since_ts=now - 100,
+            leverage=leverage,
+            max_debt=500,
+        )
+    match_id = match_repo.record_match(
+        team1_ids=[901],
+        team2_ids=[902],
+        winning_team=1 if winner == "radiant" else 2,
+        guild_id=GUILD_ID,
+    )
+    bet_repo.settle_pending_bets_atomic(
+        match_id=match_id,
+        guild_id=GUILD_ID,
+        since_ts=now - 100,
+        winning_team=winner,
+        house_payout_multiplier=1.0,
+        betting_mode="house",
+    )
+    return match_id
+
+
+def _dirty_count(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM gambling_aggregate_dirty").fetchone()[0]
+
+
+def test_settlement_updates_only_its_bettors_and_matches_full_scan(repos, repo_db_path):
+    player_repo, bet_repo, match_repo = repos
+    for discord_id in (1, 2, 3):
+        _player(player_repo, discord_id)
+
+    _bet(bet_repo, match_repo, {1: ("radiant", 10, 1), 2: ("dire", 5, 2)}, "dire", 1000)
+    _bet(bet_repo, match_repo, {1: ("radiant", 20, 3)}, "radiant", 2000)
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("UPDATE player_gambling_aggregates SET updated_at = 0 WHERE discord_id = 2")
+    _bet(bet_repo, match_repo, {3: ("dire", 4, 1)}, "radiant", 3000)
+
+    assert _dirty_count(repo_db_path) == 0
+    with sqlite3.connect(repo_db_path) as conn:
+        untouched = conn.execute(
+            "SELECT updated_at FROM player_gambling_aggregates WHERE discord_id = 2"
+        ).fetchone()[0]
+    assert untouched == 0
+    metrics = bet_repo.get_bulk_gambling_metrics(GUILD_ID)
+    assert metrics[1]["total_bets"] == 2
+    assert metrics[1]["leverage_3x_bets"] == 1
+    assert metrics[1]["sequences_analyzed"] == 1
+    assert metrics[1]["times_increased_after_loss"] == 1
+    assert metrics[2]["wins"] == 1
+    assert metrics[2]["leverage_2x_bets"] == 1
+    assert metrics[3]["losses"] == 1
+    assert bet_repo.verify_gambling_aggregates(GUILD_ID) == []
+
+
+def test_raw_sql_edits_mark_players_dirty_until_next_read(repos, repo_db_path):
+    player_repo, bet_repo, match_repo = repos
+    _player(player_repo, 1)
+    match_id = _bet(bet_repo, match_repo, {1: ("radiant", 10, 1)}, "radiant")
+    assert bet_repo.get_bulk_gambling_metrics(GUILD_ID)[1]["wins"] == 1
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("UPDATE matches SET winning_team = 2 WHERE match_id = ?", (match_id,))
+    assert _dirty_count(repo_db_path) == 1
+
+    metrics = bet_repo.get_bulk_gambling_metrics(GUILD_ID, [1])
+    assert metrics[1]["wins"] == 0
+    assert metrics[1]["net_pnl"] == -10
+    assert _dirty_count(repo_db_path) == 0
+
+
+def test_deleting_all_settled_bets_removes_the_row(repos, repo_db_path):
+    player_repo, bet_repo, match_repo = repos
+    _player(player_repo, 1)
+    _bet(bet_repo, match_repo, {1: ("radiant", 10, 1)}, "dire")
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("DELETE FROM bets WHERE discord_id = 1")
+
+    assert bet_repo.get_bulk_gambling_metrics(GUILD_ID) == {}
+
+
+def test_rebuild_repairs_drifted_rows(repos, repo_db_path):
+    player_repo, bet_repo, match_repo = repos
+    _player(player_repo, 1)
+    _bet(bet_repo, match_repo, {1: ("radiant", 10, 1)}, "radiant")
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute("UPDATE player_gambling_aggregates SET wins = 7")
+
+    assert bet_repo.verify_gambling_aggregates(GUILD_ID) == [1]
+    assert bet_repo.rebuild_gambling_aggregates(GUILD_ID) == 1
+    assert bet_repo.verify_gambling_aggregates(GUILD_ID) == []
@@ -0,0 +1,187 @@
+"""Tests for the durable background job scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from repositories.scheduled_job_repository import ScheduledJobRepository
+from services.job_scheduler_service import JobSchedulerService
+
+NOW = 1_800_000_000
+
+
+class FakeClock:
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(db_path: str, clock: FakeClock, **kwargs) -> JobSchedulerService:
+    return JobSchedulerService(ScheduledJobRepository(db_path), clock=clock, **kwargs)
+
+
+def _job(db_path: str, job_key: str) -> dict:
+    return next(j for j in ScheduledJobRepository(db_path).get_jobs() if j["job_key"] == job_key)
+
+
+async def test_scheduler_sleeps_until_earliest_due_job(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock)
+    calls: list[str] = []
+
+    async def sweep(job):
+        calls.append(job["job_key"])
+
+    async def daily(job):
+        calls.append(job["job_key"])
+        return clock.now + 86400
+
+    scheduler.register("sweep", sweep, interval_seconds=600)
+    scheduler.register("daily", daily, first_due_at=NOW + 3600)
+
+    # A new interval job is first due one interval out, not at startup.
+    assert await scheduler.tick() == 600
+    assert calls == []
+
+    clock.now = NOW + 600
+    assert await scheduler.tick() == 3000
+    await scheduler.drain()
+    assert calls == ["sweep"]
+    # Nothing else is due: the next wake is the sweep's interval, not a poll.
+    assert await scheduler.tick() == 600
+
+    clock.now = NOW + 3600
+    await scheduler.tick()
+    await scheduler.drain()
+    assert sorted(calls) == ["daily", "sweep", "sweep"]
+    assert _job(repo_db_path, "daily")["next_due_at"] == NOW + 3600 + 86400
+    assert _job(repo_db_path, "sweep")["run_count"] == 2
+
+
+async def test_failed_jobs_back_off_exponentially(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock, retry_base_seconds=10, retry_max_seconds=25)
+    attempts = 0
+
+    async def flaky(_job):
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("db locked")
+
+    scheduler.register("flaky", flaky, interval_seconds=600, first_due_at=NOW)
+    retry_times = []
+    for _ in range(3):
+        clock.now = _job(repo_db_path, "flaky")["next_due_at"] if attempts else NOW
+        await scheduler.tick()
+        await scheduler.drain()
+        retry_times.append(_job(repo_db_path, "flaky")["next_due_at"] - clock.now)
+
+    assert attempts == 3
+    assert retry_times == [10, 20, 25]
+    row = _job(repo_db_path, "flaky")
+    assert row["failure_count"] == 3
+    assert row["last_error"] == "RuntimeError: db locked"
+    assert scheduler.stats()["flaky"]["failures"] == 3
+
+
+async def test_concurrency_is_bounded_and_claims_survive_restart(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock, max_concurrency=2)
+    release = asyncio.Event()
+    active = 0
+    peak = 0
+
+    async def slow(_job):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await release.wait()
+        active -= 1
+
+    scheduler.register("slow", slow)
+    for index in range(4):
+        scheduler.schedule("slow", due_at=NOW, job_key=f"slow:{index}")
+
+    assert await scheduler.tick() is None
+    await asyncio.sleep(0)
+    assert peak == 2
+
+    # A restarted process releases claims left behind by a crash.
+    assert ScheduledJobRepository(repo_db_path).release_claims() == 2
+
+    release.set()
+    await scheduler.drain()
+    for _ in range(3):
+        await scheduler.tick()
+        await scheduler.drain()
+    assert peak == 2
+    # One-shot jobs without an interval are retired once they succeed.
+    assert ScheduledJobRepository(repo_db_path).get_jobs() == []
+
+
+async def test_reregistering_keeps_an_overdue_time(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock)
+
+    async def handler(_job):
+        return None
+
+    scheduler.register("digest", handler, first_due_at=NOW - 60)
+    await scheduler.drain()
+    restarted = _scheduler(repo_db_path, clock)
+    restarted.register("digest", handler, first_due_at=NOW + 3600)
+    await restarted.drain()
+
+    assert _job(repo_db_path, "digest")["next_due_at"] == NOW - 60
+
+
+async def test_restart_resumes_the_stored_schedule(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock)
+    runs = 0
+
+    async def sweep(_job):
+        nonlocal runs
+        runs += 1
+
+    scheduler.register("sweep", sweep, interval_seconds=600)
+    clock.now = NOW + 600
+    await scheduler.tick()
+    await scheduler.drain()
+    assert _job(repo_db_path, "sweep")["next_due_at"] == NOW + 1200
+
+    # Restarting 100s later neither runs the sweep at once nor pushes it back.
+    clock.now = NOW + 700
+    restarted = _scheduler(repo_db_path, clock)
+    restarted.register("sweep", sweep, interval_seconds=600)
+    assert await restarted.tick() == 500
+    assert runs == 1
+    assert _job(repo_db_path, "sweep")["next_due_at"] == NOW + 1200
+
+
+async def test_run_requested_while_running_is_kept(repo_db_path):
+    clock = FakeClock()
+    scheduler = _scheduler(repo_db_path, clock)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def digest(_job):
+        started.set()
+        await release.wait()
+
+    scheduler.register("digest", digest, interval_seconds=3600, first_due_at=NOW)
+    scheduler.register("notify", digest)
+    await scheduler.tick()
+    await started.wait()
+    # Both arrive mid-run: an earlier run of the recurring job and a second
+    # run of the one-shot job.
+    scheduler.schedule("digest", due_at=NOW + 60)
+    scheduler.schedule("notify", due_at=NOW + 30)
+    await scheduler.tick()
+    release.set()
+    await scheduler.drain()
+
+    assert _job(repo_db_path, "digest")["next_due_at"] == NOW + 60
+    assert _job(repo_db_path, "notify")["next_due_at"] == NOW + 30
@@ -9,11 +9,12 @@ extracted from interaction.guild.id.
 import asyncio
 import logging
 from types import SimpleNamespace
-from unittest.mock import ANY, AsyncMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 from discord import app_commands
 
+import commands.lobby as lobby_commands
 from commands.lobby import LobbyCommands
 from domain.models.lobby import LobbyKind
 from domain.models.player import Player
@@ -1733,3 +1734,25 @@ class TestGuildIdDefinitionOrder:
 
         # Verify get_player was called with the correct guild_id
         assert any(call[2] == TEST_GUILD_ID for call in call_order if call[0] == "get_player")
+
+
+@pytest.mark.asyncio
+async def test_curfew_sweep_sleeps_until_the_next_window_and_joins_arm_it(monkeypatch):
+    now = 1_800_000_000
+    monkeypatch.setattr(lobby_commands.time, "time", lambda: now)
+    curfew_service = MagicMock()
+    curfew_service.sweep.return_value = []
+    curfew_service.next_sweep_at.return_value = now + 3600
+    curfew_service.next_window_start.return_value = now + 600
+    scheduler = MagicMock()
+    bot = SimpleNamespace(guilds=[SimpleNamespace(id=TEST_GUILD_ID)], job_scheduler=scheduler)
+    cog = LobbyCommands(bot, None, None, curfew_service)
+
+    assert await cog._curfew_sweep() == now + 3600
+
+    await cog.arm_curfew_sweep(1, TEST_GUILD_ID)
+    scheduler.schedule.assert_called_once_with("curfew_sweep", due_at=now + 600)
+
+    # A player still inside an active window after the sweep retries soon.
+    curfew_service.next_sweep_at.return_value = now
+    assert await cog._curfew_sweep() == now + lobby_commands.CURFEW_SWEEP_RETRY_SECONDS
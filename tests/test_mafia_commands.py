@@ -202,6 +202,21 @@ async def test_join_command_describes_conditional_queue(monkeypatch):
     assert "eligible" in message.lower()
 
 
+@pytest.mark.asyncio
+async def test_join_command_wakes_the_phase_job(monkeypatch):
+    service = SimpleNamespace(join=MagicMock(return_value={"ok": True}))
+    monkeypatch.setattr(
+        mafia_commands, "require_mafia_channel", AsyncMock(return_value=True)
+    )
+    bot = SimpleNamespace(job_scheduler=MagicMock())
+    cog = MafiaCommands(bot, service, MagicMock())
+
+    await cog.join.callback(cog, _interaction())
+
+    bot.job_scheduler.schedule.assert_called_once()
+    assert bot.job_scheduler.schedule.call_args.args == ("mafia_phase",)
+
+
 @pytest.mark.asyncio
 async def test_inactive_status_directs_players_to_join(monkeypatch):
     service = SimpleNamespace(
@@ -588,3 +603,36 @@ async def test_graveyard_member_adds_are_bounded_to_four(
 
     assert thread.add_user.await_count == len(dead_players)
     assert peak_adds == mafia_commands.THREAD_MEMBER_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_phase_tick_sleeps_until_the_reminder_then_the_fallback(
+    cog, game, guild, mafia_service, monkeypatch
+):
+    monkeypatch.setattr(mafia_commands.asyncio, "to_thread", _run_sync)
+    monkeypatch.setattr(cog, "_advance_guild", AsyncMock())
+    mafia_service.repo.get_active_game = MagicMock(return_value=game)
+    cog.bot.guilds = [guild]
+    phase_start = game.phase_started_at
+
+    monkeypatch.setattr(mafia_commands.time, "time", lambda: phase_start + 60)
+    assert await cog._mafia_phase_tick() == phase_start + mafia_commands.PHASE_REMINDER_AFTER_S
+
+    monkeypatch.setattr(
+        mafia_commands.time,
+        "time",
+        lambda: phase_start + mafia_commands.PHASE_REMINDER_AFTER_S + 60,
+    )
+    assert await cog._mafia_phase_tick() == cog._phase_ends_at(game)
+
+
+@pytest.mark.asyncio
+async def test_phase_tick_sleeps_until_woken_without_a_game(
+    cog, guild, mafia_service, monkeypatch
+):
+    monkeypatch.setattr(mafia_commands.asyncio, "to_thread", _run_sync)
+    monkeypatch.setattr(cog, "_advance_guild", AsyncMock())
+    mafia_service.repo.get_active_game = MagicMock(return_value=None)
+    cog.bot.guilds = [guild]
+
+    assert await cog._mafia_phase_tick() is None
@@ -133,3 +133,61 @@ def test_opendota_counter_increments_on_actual_request_attempt(monkeypatch):
         api.make_request("https://api.opendota.com/api/test")
 
     assert monitor.snapshot().api_requests["opendota"] == 1
+
+
+def test_health_report_includes_startup_profile(repo_db_path):
+    from utils.startup_profile import StartupProfile
+
+    profile = StartupProfile(started_at=0.0)
+    profile.add_phase("imports", 0.4)
+    profile.add_phase("core_extensions", 0.1)
+    profile.milestones["core_commands_loaded"] = 1.25
+    bot = MagicMock()
+    bot.latency = 0.05
+    bot.guilds = []
+    bot.startup_profile = profile
+
+    snapshot = MonitoringService(repo_db_path, git_sha="abc123").snapshot(bot)
+
+    assert snapshot.startup == {
+        "phases_ms": {"imports": 400.0, "core_extensions": 100.0},
+        "milestones_ms": {"core_commands_loaded": 1250.0},
+    }
+    assert (
+        "**Startup:** core_commands_loaded 1.25 s (imports 400 ms, core_extensions 100 ms)"
+        in format_health_snapshot(snapshot)
+    )
+
+
+def test_commands_available_is_the_later_of_core_commands_and_gateway():
+    from utils.startup_profile import StartupProfile
+
+    profile = StartupProfile(started_at=0.0)
+    profile.milestones["core_commands_loaded"] = 1.25
+    assert profile.mark_after("commands_available", "core_commands_loaded", "gateway_ready") is None
+
+    profile.milestones["gateway_ready"] = 1.75
+    assert profile.mark_after("commands_available", "core_commands_loaded", "gateway_ready") == 1.75
+    assert profile.milestones["commands_available"] == 1.75
+
+
+def test_health_report_includes_last_database_maintenance(repo_db_path):
+    from repositories.maintenance_repository import MaintenanceRepository
+    from services.database_maintenance_service import DatabaseMaintenanceService
+
+    bot = MagicMock()
+    bot.latency = 0.05
+    bot.guilds = []
+    bot.database_maintenance_service = DatabaseMaintenanceService(
+        MaintenanceRepository(repo_db_path), step_pause_seconds=0
+    )
+    service = MonitoringService(repo_db_path, git_sha="abc123")
+
+    assert "**DB maintenance:** not run since startup" in format_health_snapshot(
+        service.snapshot(bot)
+    )
+
+    bot.database_maintenance_service.run()
+    report = format_health_snapshot(service.snapshot(bot))
+    assert "**DB maintenance:** done in" in report
+    assert "tables analyzed" in report
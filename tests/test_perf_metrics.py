@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from repositories.player_repository import PlayerRepository
+from services.monitoring_service import MonitoringService, format_health_snapshot
+from tests.conftest import TEST_GUILD_ID
+from utils.perf_metrics import (
+    InstrumentedConnection,
+    LatencyHistogram,
+    PerfMetrics,
+    get_perf_metrics,
+    run_loop_probe,
+    set_perf_metrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    previous = get_perf_metrics()
+    fresh = PerfMetrics(enabled=True, slow_query_ms=10_000)
+    set_perf_metrics(fresh)
+    yield fresh
+    set_perf_metrics(previous)
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.observe(0.004)
+    for _ in range(10):
+        histogram.observe(0.2)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 100
+    assert 2.5 <= summary["p50_ms"] <= 5.0
+    assert 100.0 <= summary["p95_ms"] <= 200.0
+    assert summary["max_ms"] == pytest.approx(200.0)
+
+
+def test_command_latency_pairs_start_and_finish(metrics):
+    metrics.command_started(1)
+    metrics.command_finished(1, "lobby")
+    metrics.command_finished(2, "never-started")
+
+    commands = metrics.snapshot()["commands"]
+
+    assert list(commands) == ["lobby"]
+    assert commands["lobby"]["count"] == 1
+
+
+def test_metrics_are_off_unless_enabled():
+    assert PerfMetrics().enabled is False
+
+
+def test_repository_calls_are_attributed_to_their_method(metrics, repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    repo.add(1, "one", TEST_GUILD_ID, initial_mmr=3000)
+    repo.add(2, "two", TEST_GUILD_ID, initial_mmr=3000)
+    repo.get_by_ids([1, 2], TEST_GUILD_ID)
+
+    sql = metrics.snapshot(top=50)["sql"]
+
+    assert sql["PlayerRepository.add"]["count"] >= 2
+    assert sql["PlayerRepository.get_by_ids"]["count"] == 1
+    assert sql["PlayerRepository.get_by_ids"]["rows"] >= 2
+
+
+def test_explain_statements_are_not_counted(metrics, repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+
+    with repo.connection() as conn:
+        assert isinstance(conn, InstrumentedConnection)
+        before = conn._statements
+        conn.execute("EXPLAIN QUERY PLAN SELECT * FROM players").fetchall()
+        assert conn._statements == before
+
+
+def test_slow_queries_capture_query_plan(metrics, repo_db_path):
+    metrics.slow_query_ms = 0.0
+    repo = PlayerRepository(repo_db_path)
+
+    repo.get_by_ids([1], TEST_GUILD_ID)
+
+    # Nothing is explained while the query runs; the plan is taken on read.
+    assert all(not entry.plan for entry in metrics._slow_queries)
+    slow = metrics.slow_queries()
+    assert slow
+    assert slow[0].label == "PlayerRepository.get_by_ids"
+    assert slow[0].plan
+    assert metrics.slow_queries()[0].plan == slow[0].plan
+
+
+def test_disabled_metrics_use_plain_connections(repo_db_path):
+    previous = get_perf_metrics()
+    set_perf_metrics(PerfMetrics(enabled=False))
+    try:
+        repo = PlayerRepository(repo_db_path)
+        with repo.connection() as conn:
+            assert not isinstance(conn, InstrumentedConnection)
+    finally:
+        set_perf_metrics(previous)
+
+
+async def test_loop_probe_records_lag_and_thread_wait(metrics):
+    await asyncio.wait_for(
+        run_loop_probe(metrics, interval_seconds=0.01, iterations=3), timeout=5
+    )
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["loop_lag"]["count"] == 3
+    assert snapshot["thread_wait"]["count"] == 3
+
+
+def test_prometheus_dump_and_health_report(metrics, repo_db_path):
+    metrics.record_command_latency("shuffle", 0.3)
+    metrics.record_sql("PlayerRepository", 0.02, rows=10)
+    service = MonitoringService(repo_db_path, git_sha="abc123", perf_metrics=metrics)
+
+    text = service.prometheus_text()
+    report = format_health_snapshot(service.snapshot())
+
+    assert 'cama_command_latency_seconds_bucket{command="shuffle",le="0.5"} 1' in text
+    assert 'cama_command_latency_seconds_count{command="shuffle"} 1' in text
+    assert 'cama_sql_rows_total{repository="PlayerRepository"} 10' in text
+    assert "**Command latency p50/p95/p99:** shuffle:" in report
+    assert "PlayerRepository" in report
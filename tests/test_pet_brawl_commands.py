@@ -654,5 +654,5 @@ class TestSweepHook:
         with patch.object(
             brawl_cog.pet_brawl_service, "sweep_stale", return_value={}
         ) as sweep:
-            await brawl_cog._pet_sweep_loop.coro(brawl_cog)
+            await brawl_cog._pet_sweep()
         sweep.assert_called_once()
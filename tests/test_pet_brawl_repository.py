@@ -394,6 +394,20 @@ class TestWagerEconomy:
             for player_id in (100, 200, 300, 400)
         ) == (100, 100, 100, 100)
 
+    def test_next_stale_at_tracks_the_earliest_expiry_or_void(
+        self, repo_db_path, brawl_repo, insert_pet
+    ):
+        for player_id in (100, 200, 300, 400):
+            seed_player(repo_db_path, player_id, 100)
+        make_pending(brawl_repo, insert_pet, 100, 200)
+        make_active(brawl_repo, insert_pet, 300, 400)
+
+        assert brawl_repo.next_stale_at(active_ttl_seconds=1_800) == NOW + 180
+        brawl_repo.sweep_stale(NOW + 180, active_ttl_seconds=1_800)
+        assert brawl_repo.next_stale_at(active_ttl_seconds=1_800) == NOW + 1_801
+        brawl_repo.sweep_stale(NOW + 1_801, active_ttl_seconds=1_800)
+        assert brawl_repo.next_stale_at(active_ttl_seconds=1_800) is None
+
     def test_new_challenge_cleans_up_expired_pending_brawl(
         self, repo_db_path, brawl_repo, insert_pet
     ):
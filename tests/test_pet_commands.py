@@ -66,12 +66,14 @@ def make_cog(sweep_result=None, channel=None) -> PetCommands:
     service.sweep.return_value = sweep_result or {
         "hatches": [], "evolutions": [], "deaths": [], "refunds": []
     }
+    service.next_sweep_at.return_value = None
     bot = MagicMock()
     cog = PetCommands.__new__(PetCommands)
     cog.bot = bot
     cog.pet_service = service
     brawl_service = MagicMock()
     brawl_service.sweep_stale.return_value = {"expired": 0, "voided": 0}
+    brawl_service.next_sweep_at.return_value = None
     cog.pet_brawl_service = brawl_service
     cog._brawl_sessions = {}
     if channel is not None:
@@ -139,7 +141,7 @@ class TestSweepDelivery:
         cog._direct_death_deliveries = {pet.pet_id: 1}
         cog._deliver_death = AsyncMock()
 
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
 
         cog._deliver_death.assert_not_awaited()
 
@@ -173,20 +175,50 @@ class TestSweepDelivery:
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
         cog._dm_death_notice = AsyncMock()
 
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
 
         assert channel.send.await_count == 2
         assert "evolved" in channel.send.await_args_list[0].kwargs["embed"].title
         evolution_service.mark_announced.assert_called_once_with(pet)
         cog.pet_service.mark_death_announced.assert_called_once_with(dead)
 
+    @pytest.mark.asyncio
+    async def test_sweep_streams_further_announcement_pages(self):
+        first = make_pet(pet_id=1, died_at=T0 + 9 * DAY, death_cause="starvation")
+        second = make_pet(pet_id=2, died_at=T0 + 9 * DAY, death_cause="starvation")
+        cog = make_cog(
+            {
+                "hatches": [],
+                "evolutions": [],
+                "deaths": [DeathNotice(pet=first)],
+                "refunds": [],
+                "cursor": {"page": 1},
+            }
+        )
+        cog.pet_service.next_announcements.return_value = {
+            "hatches": [],
+            "evolutions": [],
+            "deaths": [DeathNotice(pet=second)],
+            "refunds": [],
+            "cursor": None,
+        }
+        cog._deliver_death = AsyncMock()
+
+        await cog._pet_sweep()
+
+        cog.pet_service.next_announcements.assert_called_once_with({"page": 1})
+        assert [c.args[0].pet for c in cog._deliver_death.await_args_list] == [
+            first,
+            second,
+        ]
+
     @pytest.mark.asyncio
     async def test_hatch_posts_to_channel_and_marks(self, channel, monkeypatch):
         pet = make_pet()
         cog = make_cog({"hatches": [HatchNotice(pet=pet)], "deaths": [], "refunds": []})
         cog._rearm_warning = AsyncMock()
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         channel.send.assert_awaited_once()
         cog.pet_service.mark_hatch_announced.assert_called_once_with(pet)
         cog._rearm_warning.assert_awaited_once_with(pet)
@@ -218,7 +250,7 @@ class TestSweepDelivery:
         pet = make_pet(died_at=T0 + 9 * 86400, death_cause="starvation")
         cog = make_cog({"hatches": [], "deaths": [DeathNotice(pet=pet)], "refunds": []})
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: None)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         cog.pet_service.mark_death_announced.assert_called_once_with(pet)
 
     @pytest.mark.asyncio
@@ -267,7 +299,7 @@ class TestSweepDelivery:
         channel.send.side_effect = forbidden()
         cog = make_cog({"hatches": [], "deaths": [DeathNotice(pet=pet)], "refunds": []})
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         cog.pet_service.mark_death_announced.assert_called_once_with(pet)
 
     @pytest.mark.asyncio
@@ -278,9 +310,31 @@ class TestSweepDelivery:
         channel.send.side_effect = RuntimeError("discord hiccup")
         cog = make_cog({"hatches": [], "deaths": [DeathNotice(pet=pet)], "refunds": []})
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         cog.pet_service.mark_death_announced.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_sweep_sleeps_until_the_next_deadline(self, monkeypatch):
+        monkeypatch.setattr(pet_commands.time, "time", lambda: T0)
+        cog = make_cog()
+        cog.pet_service.next_sweep_at.return_value = T0 + DAY
+        cog.pet_brawl_service.next_sweep_at.return_value = T0 + 600
+
+        assert await cog._pet_sweep() == T0 + 600
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_retries_before_the_next_deadline(
+        self, channel, monkeypatch
+    ):
+        monkeypatch.setattr(pet_commands.time, "time", lambda: T0)
+        pet = make_pet(died_at=T0 - 60, death_cause="starvation")
+        channel.send.side_effect = RuntimeError("discord hiccup")
+        cog = make_cog({"hatches": [], "deaths": [DeathNotice(pet=pet)], "refunds": []})
+        cog.pet_service.next_sweep_at.return_value = T0 + DAY
+        monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
+
+        assert await cog._pet_sweep() == T0 + pet_commands.PET_SWEEP_RETRY_SECONDS
+
     @pytest.mark.asyncio
     async def test_one_bad_notice_does_not_block_others(self, channel, monkeypatch):
         bad = make_pet(pet_id=1, died_at=T0 + 9 * 86400, death_cause="starvation")
@@ -300,7 +354,7 @@ class TestSweepDelivery:
             "refunds": [],
         })
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         cog.pet_service.mark_death_announced.assert_called_once_with(good)
 
     @pytest.mark.asyncio
@@ -317,7 +371,7 @@ class TestSweepDelivery:
         )
         cog = make_cog({"hatches": [], "deaths": [], "refunds": [notice]})
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
         channel.send.assert_awaited_once()
         embed = channel.send.await_args.kwargs["embed"]
         assert "150%" in embed.description
@@ -345,7 +399,7 @@ class TestSweepDelivery:
         cog = make_cog({"hatches": [], "deaths": [], "refunds": [notice]})
         monkeypatch.setattr(cog, "_pet_channel", lambda gid: channel)
 
-        await cog._pet_sweep_loop.coro(cog)
+        await cog._pet_sweep()
 
         cog.pet_service.mark_refund_announced.assert_not_called()
 
@@ -353,7 +407,7 @@ class TestSweepDelivery:
     async def test_sweep_service_failure_is_contained(self):
         cog = make_cog()
         cog.pet_service.sweep.side_effect = RuntimeError("db locked")
-        await cog._pet_sweep_loop.coro(cog)  # must not raise
+        await cog._pet_sweep()  # must not raise
 
 
 class TestSetup:
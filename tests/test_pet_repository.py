@@ -488,6 +488,30 @@ class TestDeathAndRevival:
         )
         assert any(p.pet_id == pet.pet_id for p in due)
 
+    def test_next_sweep_due_uses_exact_per_species_starvation(self, pet_repo, rich_player):
+        from domain.pet_constants import SPECIES
+
+        decay = {species_id: s.decay_pct for species_id, s in SPECIES.items()}
+        pet = adopt(pet_repo, species="pudge_cama")
+
+        # The unannounced hatch is the earliest work.
+        assert pet_repo.next_sweep_due_at(
+            decay_per_day=20, decay_pct_by_species=decay, default_decay_pct=100
+        ) == pet.hatched_at
+
+        pet_repo.mark_hatch_announced(pet.pet_id, TEST_GUILD_ID, pet.hatched_at)
+        expected = pet.starvation_time(20)
+        if pet.evolution_due_at is not None:
+            expected = min(expected, pet.evolution_due_at)
+        assert pet_repo.next_sweep_due_at(
+            decay_per_day=20, decay_pct_by_species=decay, default_decay_pct=100
+        ) == expected
+
+        claim_death(pet_repo, pet, died_at=NOW + 777)
+        assert pet_repo.next_sweep_due_at(
+            decay_per_day=20, decay_pct_by_species=decay, default_decay_pct=100
+        ) == NOW + 777
+
     def test_stale_anchor_death_claim_loses_to_a_feed(self, pet_repo, rich_player):
         """Regression: the sweep must not kill a pet fed after its snapshot."""
         pet = adopt(pet_repo)
@@ -14,6 +14,7 @@ from repositories.player_repository import PlayerRepository
 from services import error_codes
 from services.pet_service import (
     PetService,
+    _next_week_start,
     _prev_week_key_for_timestamp,
     _week_key_for_timestamp,
 )
@@ -482,6 +483,13 @@ class TestGacha:
             clock.now = pet.hatched_at + 9 * DAY  # starves; resolved lazily
             assert service.living_pet(100, TEST_GUILD_ID, clock.now) is None
         assert service._pity_active(100, TEST_GUILD_ID)
+        # The sweep's bulk pity read agrees with the per-owner one.
+        assert service.pet_repo.recent_dead_species_many(
+            [(100, TEST_GUILD_ID), (999, TEST_GUILD_ID)], 3
+        ) == {
+            (100, TEST_GUILD_ID): service.pet_repo.recent_dead_species(100, TEST_GUILD_ID, 3),
+            (999, TEST_GUILD_ID): [],
+        }
         result = service.adopt(100, TEST_GUILD_ID, "Pity Roll")
         assert result.success
         assert result.value["pity_active"]
@@ -615,6 +623,22 @@ class TestSweep:
         service.mark_death_announced(result["deaths"][0].pet)
         assert service.sweep()["deaths"] == []
 
+    def test_next_sweep_at_is_the_next_hatch_starvation_or_refund_week(
+        self, service, clock
+    ):
+        pet = adopt_common(service, clock)
+        week_start = _next_week_start(clock.now)
+        assert _week_key_for_timestamp(week_start - 1) == _week_key_for_timestamp(clock.now)
+        assert _week_key_for_timestamp(week_start) != _week_key_for_timestamp(clock.now)
+        assert service.next_sweep_at() == min(pet.hatched_at, week_start)
+
+        service.mark_hatch_announced(hatch(service, clock, pet))
+        fresh = service.pet_repo.get_pet_by_id(pet.pet_id, TEST_GUILD_ID)
+        deadlines = [fresh.starvation_time(20), _next_week_start(clock.now)]
+        if fresh.evolution_due_at is not None:
+            deadlines.append(fresh.evolution_due_at)
+        assert service.next_sweep_at() == min(deadlines)
+
     def test_refund_requires_alive_at_payout(self, service, clock):
         pet = adopt_common(service, clock)
         service.buy(100, TEST_GUILD_ID, "tango", 4)
@@ -669,6 +693,44 @@ class TestSweep:
         assert resolved is not None
         assert resolved.died_at is None
 
+    def test_sweep_claims_many_starvations_in_one_batch(self, service, clock):
+        pets = _adopt_for_owners(service, clock, (100, 101, 102))
+        clock.now = pets[0].hatched_at + 9 * DAY
+        with patch.object(
+            service.pet_repo, "claim_death", side_effect=AssertionError("per-pet claim")
+        ):
+            result = service.sweep()
+        assert sorted(n.pet.pet_id for n in result["deaths"]) == sorted(
+            p.pet_id for p in pets
+        )
+        assert {n.pet.died_at for n in result["deaths"]} == {pets[0].hatched_at + 5 * DAY}
+        assert result["cursor"] is None
+
+    def test_batch_sweep_rereads_a_pet_fed_after_its_snapshot(self, service, clock):
+        pet = adopt_common(service, clock)
+        service.buy(100, TEST_GUILD_ID, "cheese", 2)
+        clock.now = pet.hatched_at + 4 * DAY
+        assert service.feed(100, TEST_GUILD_ID, "cheese").success
+        clock.now = pet.hatched_at + 6 * DAY
+        with patch.object(
+            service.pet_repo, "find_starvation_candidates", return_value=[pet]
+        ):
+            assert service.sweep()["deaths"] == []
+        assert service.living_pet(100, TEST_GUILD_ID, clock.now) is not None
+
+    def test_sweep_streams_announcement_pages(self, service, clock):
+        pets = _adopt_for_owners(service, clock, (100, 101, 102))
+        clock.now = pets[0].hatched_at + 9 * DAY
+        first = service.sweep(announcement_limit=2)
+        assert len(first["deaths"]) == 2
+        assert first["cursor"] is not None
+        # Undelivered notices are not re-fetched by later pages of this sweep.
+        second = service.next_announcements(first["cursor"], limit=2)
+        seen = [n.pet.pet_id for n in first["deaths"] + second["deaths"]]
+        assert sorted(seen) == sorted(p.pet_id for p in pets)
+        assert second["cursor"] is None
+        assert second["evolutions"] == [] and second["refunds"] == []
+
     def test_empty_fund_leaves_week_unclaimed_until_topped_up(self, service, clock):
         pet = adopt_common(service, clock)
         service.buy(100, TEST_GUILD_ID, "cheese", 20)
@@ -680,7 +742,9 @@ class TestSweep:
             service.feed(100, TEST_GUILD_ID, "cheese")
         _seed_fund(service, 0)
         with patch("services.pet_service.random.randint", return_value=200):
-            assert service.sweep()["refunds"] == []
+            result = service.sweep()
+        assert result["refunds"] == []
+        assert result["retry"]  # an empty fund asks the sweep to come back soon
         assert not service.pet_repo.is_refund_window_paid(
             TEST_GUILD_ID, week_of_feed
         )
@@ -735,6 +799,23 @@ class TestSweep:
         assert service.pet_repo.get_nonprofit_balance(TEST_GUILD_ID) == 0
 
 
+def _adopt_for_owners(service, clock, owners):
+    pets = []
+    for discord_id in owners:
+        if discord_id != 100:
+            service.player_repo.add(discord_id, f"Owner {discord_id}", TEST_GUILD_ID)
+            service.player_repo.update_balance(discord_id, TEST_GUILD_ID, 1000)
+        result = service.adopt(discord_id, TEST_GUILD_ID, f"Pet {discord_id}")
+        assert result.success, result.error
+        egg = result.value["pet"]
+        pets.append(
+            service.pet_repo.resolve_hatch_species(
+                egg.pet_id, TEST_GUILD_ID, species="common_cama", now=egg.hatched_at
+            )
+        )
+    return pets
+
+
 def _balance(service, discord_id):
     return PlayerRepository(service.pet_repo.db_path).get_balance(
         discord_id, TEST_GUILD_ID
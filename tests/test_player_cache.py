@@ -0,0 +1,132 @@
+"""Tests for the version-stamped read-through player cache."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from repositories.player_repository import PlayerRepository
+from services.monitoring_service import MonitoringService, format_health_snapshot
+from tests.conftest import TEST_GUILD_ID
+
+
+def _seed(repo: PlayerRepository, *ids: int) -> None:
+    for discord_id in ids:
+        repo.add(discord_id, f"p{discord_id}", TEST_GUILD_ID, initial_mmr=3000)
+
+
+def test_repeated_reads_are_served_from_cache(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    _seed(repo, 1)
+
+    for _ in range(5):
+        assert repo.get_by_id(1, TEST_GUILD_ID).name == "p1"
+
+    stats = repo.get_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 4
+
+
+def test_writes_from_any_path_invalidate_the_entry(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    other = PlayerRepository(repo_db_path)
+    _seed(repo, 1)
+    starting_balance = repo.get_by_id(1, TEST_GUILD_ID).jopacoin_balance
+
+    other.add_balance(1, TEST_GUILD_ID, 25)
+    assert repo.get_by_id(1, TEST_GUILD_ID).jopacoin_balance == starting_balance + 25
+
+    repo.update_roles(1, TEST_GUILD_ID, ["1", "2"])
+    assert repo.get_by_id(1, TEST_GUILD_ID).preferred_roles == ["1", "2"]
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute(
+            "UPDATE players SET current_mmr = 4200 WHERE discord_id = 1 AND guild_id = ?",
+            (TEST_GUILD_ID,),
+        )
+    assert repo.get_by_id(1, TEST_GUILD_ID).mmr == 4200
+    assert repo.get_cache_stats()["invalidations"] == 3
+
+
+def test_absent_players_are_cached_until_registered_and_after_delete(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+
+    assert repo.get_by_id(7, TEST_GUILD_ID) is None
+    assert repo.get_by_id(7, TEST_GUILD_ID) is None
+    assert repo.get_cache_stats()["hits"] == 1
+
+    _seed(repo, 7)
+    assert repo.get_by_id(7, TEST_GUILD_ID).name == "p7"
+
+    repo.delete(7, TEST_GUILD_ID)
+    assert repo.get_by_id(7, TEST_GUILD_ID) is None
+
+
+def test_callers_cannot_mutate_cached_players(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    _seed(repo, 1)
+    repo.update_roles(1, TEST_GUILD_ID, ["3"])
+
+    player = repo.get_by_id(1, TEST_GUILD_ID)
+    player.mmr = 1
+    player.preferred_roles.append("5")
+
+    cached = repo.get_by_id(1, TEST_GUILD_ID)
+    assert cached.mmr == 3000
+    assert cached.preferred_roles == ["3"]
+
+
+def test_bulk_get_loads_only_misses_and_preserves_order(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    _seed(repo, 1, 2, 3, 4)
+    repo.get_by_ids([1, 2], TEST_GUILD_ID)
+
+    loaded = []
+    original = repo._load_by_ids
+
+    def spy(guild_id, discord_ids):
+        loaded.append(list(discord_ids))
+        return original(guild_id, discord_ids)
+
+    repo._load_by_ids = spy
+    players = repo.get_by_ids([4, 2, 99, 1, 3], TEST_GUILD_ID)
+
+    assert [p.discord_id for p in players] == [4, 2, 1, 3]
+    assert loaded == [[4, 99, 3]]
+
+
+def test_cache_is_bounded(repo_db_path):
+    repo = PlayerRepository(repo_db_path, cache_max_entries=2)
+    _seed(repo, 1, 2, 3)
+
+    repo.get_by_ids([1, 2, 3], TEST_GUILD_ID)
+
+    stats = repo.get_cache_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_health_report_lists_cache_hit_rates(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    _seed(repo, 1)
+    repo.get_by_id(1, TEST_GUILD_ID)
+    repo.get_by_id(1, TEST_GUILD_ID)
+    bot = type("Bot", (), {"player_repo": repo, "guilds": []})()
+
+    snapshot = MonitoringService(repo_db_path, git_sha="abc123").snapshot(bot)
+
+    assert snapshot.caches["players"]["hits"] == 1
+    assert "**Caches:** players: 50% hit of 2, 0 invalidated" in format_health_snapshot(snapshot)
+
+
+def test_bulk_loaded_players_are_slotted_and_never_share_decoded_lists(repo_db_path):
+    repo = PlayerRepository(repo_db_path)
+    _seed(repo, 1, 2)
+    repo.update_roles(1, TEST_GUILD_ID, ["1", "2"])
+    repo.update_roles(2, TEST_GUILD_ID, ["1", "2"])
+
+    first, second = sorted(repo.get_all(TEST_GUILD_ID), key=lambda p: p.discord_id)
+    first.preferred_roles.append("5")
+
+    assert second.preferred_roles == ["1", "2"]
+    assert repo.get_by_id(1, TEST_GUILD_ID).preferred_roles == ["1", "2"]
+    assert not hasattr(first, "__dict__")
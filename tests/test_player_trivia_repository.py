@@ -8,7 +8,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from repositories.player_trivia_repository import PlayerTriviaRepository
+from repositories.player_trivia_repository import SNAPSHOT_TAIL_KEYS, PlayerTriviaRepository
 from tests.conftest import TEST_GUILD_ID, TEST_GUILD_ID_SECONDARY
 
 
@@ -618,6 +618,30 @@ def test_load_snapshot_is_complete_deterministic_private_and_guild_scoped(trivia
     assert "result" not in snapshot["mafia_actions"][0]
 
 
+def test_load_snapshot_since_returns_only_newer_tail_rows(trivia_repo):
+    _seed_snapshot_guild(trivia_repo, TEST_GUILD_ID, 1_000)
+    full = trivia_repo.load_snapshot(TEST_GUILD_ID)
+    since = {
+        name: max(row[key] for row in full[name])
+        for name, key in SNAPSHOT_TAIL_KEYS.items()
+    }
+    since["wheel_spins"] = min(row["spin_id"] for row in full["wheel_spins"])
+
+    tail = trivia_repo.load_snapshot(TEST_GUILD_ID, since=since)
+
+    assert list(tail) == list(full)
+    assert tail["wheel_spins"] == [
+        row for row in full["wheel_spins"] if row["spin_id"] > since["wheel_spins"]
+    ]
+    assert len(tail["wheel_spins"]) == 1
+    assert all(
+        tail[name] == [] for name in SNAPSHOT_TAIL_KEYS if name != "wheel_spins"
+    )
+    # Datasets that can change in place are always reloaded in full.
+    assert tail["players"] == full["players"]
+    assert tail["prediction_positions"] == full["prediction_positions"]
+
+
 def test_load_snapshot_does_not_expose_active_mafia_roles(trivia_repo):
     with trivia_repo.connection() as conn:
         cursor = conn.execute(
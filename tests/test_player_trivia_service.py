@@ -8,6 +8,7 @@ from unittest.mock import Mock, call
 
 import pytest
 
+from repositories.player_trivia_repository import SNAPSHOT_TAIL_KEYS
 from services.player_trivia_service import PlayerTriviaQuestion, PlayerTriviaService
 
 
@@ -196,7 +197,42 @@ def test_snapshot_cache_expires_using_monotonic_time():
     clock.advance(0.001)
     service._snapshot_for_generation(7)
 
-    assert repo.load_snapshot.call_args_list == [call(7), call(7)]
+    # The lapsed snapshot is refreshed; with no tail rows held it reloads all.
+    assert repo.load_snapshot.call_args_list == [call(7), call(7, since={})]
+
+
+def test_expired_snapshot_is_extended_from_tail_watermarks():
+    clock = ManualClock(now=100.0)
+    tips = [{"id": 1, "sender_id": 1, "recipient_id": 2, "amount": 10}]
+    players = _players(4)
+    calls = []
+
+    def load_snapshot(guild_id, since=None):
+        calls.append(since)
+        rows = [tip for tip in tips if since is None or tip["id"] > since["tips"]]
+        return {"players": players, "tips": rows}
+
+    repo = Mock()
+    repo.load_snapshot.side_effect = load_snapshot
+    service = PlayerTriviaService(
+        repo,
+        snapshot_cache_ttl_seconds=45.0,
+        snapshot_full_reload_seconds=600.0,
+        monotonic_clock=clock,
+    )
+
+    first = service._snapshot_for_generation(7)
+    tips.append({"id": 2, "sender_id": 2, "recipient_id": 3, "amount": 5})
+    players[0] = {**players[0], "username": "Renamed"}
+    clock.advance(45.0)
+    second = service._snapshot_for_generation(7)
+
+    assert [tip["id"] for tip in second["tips"]] == [1, 2]
+    assert second["tips"][0] is first["tips"][0]
+    assert second["players"][0]["username"] == "Renamed"
+    clock.advance(600.0)
+    service._snapshot_for_generation(7)
+    assert calls == [None, {"tips": 1}, None]
 
 
 def test_snapshot_cache_prunes_expired_inactive_guilds():
@@ -269,10 +305,11 @@ def test_snapshot_cache_collapses_concurrent_same_guild_misses():
 
     repo.load_snapshot.assert_called_once_with(7)
     assert all(snapshot["players"][0]["username"] == "P01" for snapshot in snapshots)
-    assert len({id(snapshot) for snapshot in snapshots}) == worker_count
+    # Every waiter shares the one read-only snapshot instead of a copy.
+    assert len({id(snapshot) for snapshot in snapshots}) == 1
 
 
-def test_snapshot_cache_returns_isolated_per_call_copies():
+def test_generation_shares_the_read_only_snapshot_without_copying():
     repo = Mock()
     repo.load_snapshot.return_value = {
         "players": _players(4),
@@ -281,26 +318,108 @@ def test_snapshot_cache_returns_isolated_per_call_copies():
     service = PlayerTriviaService(repo)
 
     first = service._snapshot_for_generation(7)
-    first["players"][0]["username"] = "Changed"
-    first["players"].append({"discord_id": 99, "username": "Added"})
-    first["tips"].clear()
+    with pytest.raises(TypeError):
+        first["players"][0]["username"] = "Changed"
+    with pytest.raises(AttributeError):
+        first["players"].append({"discord_id": 99, "username": "Added"})
+    with pytest.raises(TypeError):
+        first["players"] = ()
 
     second = service._snapshot_for_generation(7)
-    assert [row["username"] for row in second["players"]] == [
-        "P01",
-        "P02",
-        "P03",
-        "P04",
-    ]
-    assert second["tips"] == [{"sender_id": 1, "recipient_id": 2, "amount": 10}]
+    assert second is first
+    assert [row["username"] for row in second["players"]] == ["P01", "P02", "P03", "P04"]
+    assert second["tips"] == ({"sender_id": 1, "recipient_id": 2, "amount": 10},)
+    repo.load_snapshot.assert_called_once_with(7)
 
-    cached = service._get_raw_snapshot(7)
-    with pytest.raises(TypeError):
-        cached["players"][0]["username"] = "Changed"
-    with pytest.raises(TypeError):
-        cached["players"] = ()
+
+def test_warm_sessions_sample_the_pool_without_rerunning_builders(monkeypatch):
+    repo = Mock()
+    repo.load_snapshot.return_value = _rich_snapshot()
+    repo.get_recent_question_keys.return_value = []
+    service = PlayerTriviaService(repo, rng=random.Random(5))
+    builds = Mock(wraps=service._build_candidates)
+    monkeypatch.setattr(service, "_build_candidates", builds)
+
+    members = set(range(1, 9))
+    first = service.generate_questions(1, 7, members, count=10)
+    repo.get_recent_question_keys.return_value = [{"question_key": first[0].key}]
+    # A new guild member who never played does not invalidate the pool.
+    second = service.generate_questions(2, 7, members | {500}, count=10)
+
+    assert builds.call_count == 1
+    assert first[0].key not in {question.key for question in second}
+    assert repo.get_recent_question_keys.call_count == 2
     repo.load_snapshot.assert_called_once_with(7)
 
+    # A departed player changes the eligible set, so the pool is rebuilt.
+    service.generate_questions(3, 7, members - {8}, count=10)
+    assert builds.call_count == 2
+    assert builds.call_args.args[1] == frozenset(range(1, 8))
+
+
+def test_sessions_from_one_pool_draw_their_own_options(monkeypatch):
+    repo = Mock()
+    repo.load_snapshot.return_value = _rich_snapshot()
+    repo.get_recent_question_keys.return_value = []
+    service = PlayerTriviaService(repo, rng=random.Random(11))
+    builds = Mock(wraps=service._build_candidates)
+    monkeypatch.setattr(service, "_build_candidates", builds)
+
+    sessions = [_by_key(service.generate_questions(1, 7, count=50)) for _ in range(8)]
+    shared = set.intersection(*(set(session) for session in sessions))
+
+    assert builds.call_count == 1
+    assert shared
+    for key in shared:
+        assert len({_answer(session[key]) for session in sessions}) == 1
+    assert any(len({session[key].options for session in sessions}) > 1 for key in shared)
+
+
+def test_refresh_rebuilds_question_pools_only_after_data_changes():
+    clock = ManualClock(now=100.0)
+    snapshot = _rich_snapshot()
+    repo = Mock()
+    repo.load_snapshot.side_effect = lambda guild_id, since=None: {
+        key: [
+            row
+            for row in rows
+            if since is None
+            or key not in SNAPSHOT_TAIL_KEYS
+            or row[SNAPSHOT_TAIL_KEYS[key]] > since.get(key, 0)
+        ]
+        for key, rows in snapshot.items()
+    }
+    repo.get_recent_question_keys.return_value = []
+    service = PlayerTriviaService(
+        repo,
+        rng=random.Random(5),
+        snapshot_cache_ttl_seconds=45.0,
+        question_pool_max_age_seconds=300.0,
+        question_pool_idle_seconds=3600.0,
+        monotonic_clock=clock,
+    )
+    service.generate_questions(1, 7, count=10)
+    pool = service._question_pools[7]
+
+    clock.advance(60.0)
+    assert service.refresh_question_pools() == 0
+    assert service._question_pools[7] is pool
+    assert pool.built_at == 160.0
+
+    snapshot["tips"].append({"id": 9999, "sender_id": 1, "recipient_id": 2, "amount": 10_000})
+    clock.advance(60.0)
+    assert service.refresh_question_pools() == 1
+    refreshed = service._question_pools[7]
+    assert refreshed.snapshot["tips"][-1]["id"] == 9999
+    tip_leader = next(
+        candidate for candidate in refreshed.candidates if candidate.key == "tips:most_jc_sent"
+    )
+    assert tip_leader.correct == "<@1>"
+
+    clock.advance(3600.0)
+    assert service.refresh_question_pools() == 0
+    assert service._question_pools == {}
+
 
 def test_snapshot_cache_does_not_cache_failed_loads():
     repo = Mock()
@@ -0,0 +1,117 @@
+"""Tests for the in-memory prediction order books."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from repositories.player_repository import PlayerRepository
+from repositories.prediction_order_book import PriceLadder
+from repositories.prediction_repository import PredictionRepository
+from tests.conftest import TEST_GUILD_ID
+
+LEVELS = [
+    ("yes_ask", 60, 3),
+    ("yes_ask", 55, 2),
+    ("yes_ask", 70, 5),
+    ("yes_bid", 40, 4),
+    ("yes_bid", 45, 1),
+]
+
+
+@pytest.fixture
+def market(repo_db_path):
+    player_repo = PlayerRepository(repo_db_path)
+    player_repo.add(discord_id=1, discord_username="u1", guild_id=TEST_GUILD_ID)
+    player_repo.update_balance(1, TEST_GUILD_ID, 1000)
+    repo = PredictionRepository(repo_db_path)
+    prediction_id = repo.create_orderbook_prediction(
+        guild_id=TEST_GUILD_ID,
+        creator_id=999,
+        question="Cached book?",
+        initial_fair=50,
+        initial_levels=LEVELS,
+    )
+    return repo, prediction_id
+
+
+def _stored_book(db_path, prediction_id):
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            """
+            SELECT side, price, remaining_size FROM prediction_levels
+            WHERE prediction_id = ? AND remaining_size > 0
+            """,
+            (prediction_id,),
+        ).fetchall()
+    return {
+        "yes_asks": sorted((p, s) for side, p, s in rows if side == "yes_ask"),
+        "yes_bids": sorted(((p, s) for side, p, s in rows if side == "yes_bid"), reverse=True),
+    }
+
+
+def test_ladder_walks_best_price_first_and_drops_empty_levels():
+    ladder = PriceLadder(descending=False)
+    ladder.add(1, 60, 3)
+    ladder.add(2, 55, 2)
+    ladder.add(3, 60, 1)
+
+    fills, unfilled = ladder.plan(6)
+    assert fills == [(2, 55, 2), (1, 60, 3), (3, 60, 1)]
+    assert unfilled == 0
+
+    assert ladder.apply(fills[:2]) == [2, 1]
+    assert ladder.best() == 60
+    assert ladder.depth() == [(60, 1)]
+    assert ladder.plan(5) == ([(3, 60, 1)], 4)
+
+
+def test_quotes_reuse_the_book_until_levels_change(market, repo_db_path):
+    repo, prediction_id = market
+
+    assert repo.quote_buy_contracts(prediction_id, "yes", 3)["fills"] == [(55, 2), (60, 1)]
+    assert repo.quote_buy_contracts(prediction_id, "no", 2)["fills"] == [(45, 1), (40, 1)]
+    assert repo.get_order_book_stats()["misses"] == 1
+
+    with sqlite3.connect(repo_db_path) as conn:
+        conn.execute(
+            "UPDATE prediction_levels SET remaining_size = 9 WHERE prediction_id = ? AND price = 55",
+            (prediction_id,),
+        )
+
+    assert repo.quote_buy_contracts(prediction_id, "yes", 3)["fills"] == [(55, 3)]
+    assert repo.get_order_book_stats()["misses"] == 2
+
+
+def test_trades_keep_memory_and_storage_in_step(market, repo_db_path):
+    repo, prediction_id = market
+    repo.get_book(prediction_id)
+
+    repo.buy_contracts_atomic(prediction_id, 1, "yes", 4)
+    repo.sell_contracts_atomic(prediction_id, 1, "yes", 2)
+
+    book = repo.get_book(prediction_id)
+    assert book["yes_asks"] == [(60, 1), (70, 5)]
+    assert book["yes_bids"] == [(40, 3)]
+    assert {k: book[k] for k in ("yes_asks", "yes_bids")} == _stored_book(
+        repo_db_path, prediction_id
+    )
+    assert repo.get_order_book_stats()["misses"] == 1
+
+    # A fresh repository (e.g. after restart) rebuilds the same book from SQLite.
+    reloaded = PredictionRepository(repo_db_path).get_book(prediction_id)
+    assert reloaded["yes_asks"] == book["yes_asks"]
+    assert reloaded["yes_bids"] == book["yes_bids"]
+
+
+def test_status_is_never_served_from_memory(market):
+    repo, prediction_id = market
+    repo.quote_buy_contracts(prediction_id, "yes", 1)
+
+    repo.update_prediction_status(prediction_id, "locked")
+
+    with pytest.raises(ValueError, match="not open"):
+        repo.quote_buy_contracts(prediction_id, "yes", 1)
+    with pytest.raises(ValueError, match="not found"):
+        repo.quote_buy_contracts(prediction_id + 1000, "yes", 1)
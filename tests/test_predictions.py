@@ -1047,6 +1047,47 @@ def test_refresh_uses_observed_mid_when_book_intact(prediction_service, predicti
     assert summary["new_price"] == 50
 
 
+def test_refresh_markets_batches_reads_and_writes(
+    prediction_service, prediction_repo, player_repository, monkeypatch
+):
+    """Due markets share one snapshot read and one write transaction, and each
+    summary matches what a one-market refresh reports."""
+    _add_player(player_repository, 1)
+    pids = [
+        prediction_service.create_orderbook_prediction(
+            guild_id=TEST_GUILD_ID, creator_id=1, question=f"batch {n}?", initial_fair=50,
+        )["prediction_id"]
+        for n in range(3)
+    ]
+    prediction_repo.buy_contracts_atomic(pids[1], 1, "yes", 2)
+    prediction_repo.update_prediction_status(pids[2], "locked")
+    monkeypatch.setattr(random, "randint", lambda lo, hi: 0)
+
+    connections = 0
+    statements: list[str] = []
+    original_get_connection = prediction_repo.get_connection
+
+    def traced_get_connection():
+        nonlocal connections
+        connections += 1
+        conn = original_get_connection()
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(prediction_repo, "get_connection", traced_get_connection)
+    results = prediction_service.refresh_markets(pids)
+
+    assert connections == 2
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert [r["skipped"] for r in results] == [False, False, True]
+    assert results[0]["new_price"] == 50
+    assert results[0]["trade_summary"]["trade_count"] == 0
+    assert results[1]["trade_summary"]["trade_count"] == 1
+    monkeypatch.setattr(prediction_repo, "get_connection", original_get_connection)
+    assert prediction_repo.get_prediction(pids[1])["last_refresh_at"] > 0
+    assert prediction_repo.get_prediction(pids[2])["current_price"] == 50
+
+
 def test_refresh_prunes_legacy_inner_quotes_but_keeps_crossing_levels(
     prediction_service, prediction_repo, monkeypatch,
 ):
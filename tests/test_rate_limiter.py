@@ -2,7 +2,7 @@
 Tests for RateLimiter.
 """
 
-from utils.rate_limiter import RateLimiter
+from utils.rate_limiter import LoadBudget, RateLimiter
 
 
 def test_rate_limiter_allows_within_limit(monkeypatch):
@@ -41,6 +41,7 @@ def test_rate_limiter_blocks_and_sets_retry(monkeypatch):
     blocked = limiter.check(scope="test", guild_id=1, user_id=2, limit=2, per_seconds=10)
 
     assert blocked.allowed is False
+    # The first slot comes back a full window after the first call.
     assert blocked.retry_after_seconds == 8
 
 
@@ -55,3 +56,69 @@ def test_rate_limiter_allows_after_window(monkeypatch):
     allowed = limiter.check(scope="test", guild_id=1, user_id=2, limit=2, per_seconds=10)
 
     assert allowed.allowed is True
+
+
+def test_rate_limiter_keeps_one_timestamp_per_key(monkeypatch):
+    limiter = RateLimiter()
+    clock = iter(float(t) for t in range(100))
+    monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: next(clock))
+
+    results = [
+        limiter.check(scope="test", guild_id=1, user_id=2, limit=60, per_seconds=60)
+        for _ in range(50)
+    ]
+
+    assert all(r.allowed for r in results)
+    assert limiter._tat == {("test", 1, 2): 50 * 60.0}
+
+
+def test_rate_limiter_purges_idle_keys(monkeypatch):
+    limiter = RateLimiter()
+    limiter.PURGE_SIZE_THRESHOLD = 2
+    times = iter([0.0, 0.0, 400.0])
+    monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: next(times))
+
+    limiter.check(scope="test", guild_id=1, user_id=1, limit=2, per_seconds=10)
+    limiter.check(scope="test", guild_id=1, user_id=2, limit=2, per_seconds=10)
+    limiter.check(scope="test", guild_id=1, user_id=3, limit=2, per_seconds=10)
+
+    assert list(limiter._tat) == [("test", 1, 3)]
+
+
+def test_load_budget_sheds_expensive_commands_only(monkeypatch):
+    limiter = RateLimiter(budget=LoadBudget(units=10, per_seconds=10))
+    monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: 0.0)
+
+    def check(user_id, cost):
+        return limiter.check(
+            scope="chart", guild_id=1, user_id=user_id, limit=5, per_seconds=60, cost=cost
+        )
+
+    assert [check(user_id, 4).allowed for user_id in (1, 2, 3)] == [True, True, False]
+    shed = check(3, 4)
+    assert shed.shed is True
+    assert shed.retry_after_seconds == 2
+    # A shed request does not use up the caller's own limit...
+    assert ("chart", 1, 3) not in limiter._tat
+    # ...and ordinary commands still get through a drained budget.
+    assert check(4, 1).allowed is True
+    assert [check(5, 1).allowed for _ in range(5)] == [True] * 5
+    assert check(5, 1).allowed is False
+    assert check(5, 1).shed is False
+
+
+def test_rate_limiter_never_admits_more_than_limit_per_window(monkeypatch):
+    limiter = RateLimiter()
+    now = [0.0]
+    monkeypatch.setattr("utils.rate_limiter.time.monotonic", lambda: now[0])
+
+    admitted = []
+    for tick in range(400):
+        now[0] = tick * 0.5
+        if limiter.check(scope="test", guild_id=1, user_id=2, limit=3, per_seconds=10).allowed:
+            admitted.append(now[0])
+
+    # A full burst, then one more each time a slot comes back.
+    assert admitted[:5] == [0.0, 0.5, 1.0, 10.0, 20.0]
+    for i, start in enumerate(admitted):
+        assert sum(1 for t in admitted[i:] if t < start + 10) <= 3
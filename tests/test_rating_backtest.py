@@ -0,0 +1,166 @@
+"""Tests for the offline rating backtest engine."""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from openskill_replay import replay_openskill
+from rating_system import CamaRatingSystem
+from repositories.match_repository import MatchRepository
+from repositories.player_repository import PlayerRepository
+from services.rating_backtest_service import (
+    BacktestParams,
+    RatingBacktestService,
+    encode_history,
+    glicko_predictions,
+    openskill_predictions,
+    parameter_grid,
+    run_backtest,
+)
+from tests.conftest import TEST_GUILD_ID
+
+
+def _history(match_count: int = 40, seed: int = 3):
+    rng = random.Random(seed)
+    player_ids = list(range(100, 114))
+    players = [
+        {"discord_id": pid, "guild_id": 0, "initial_mmr": rng.choice([None, 2500, 4200, 6100])}
+        for pid in player_ids[:-1]  # the last player is unknown to the players table
+    ]
+    matches, participants_by_match = [], {}
+    when = datetime(2025, 1, 1)
+    for match_id in range(1, match_count + 1):
+        when += timedelta(days=rng.choice([0, 1, 3, 9, 30]), hours=rng.randint(0, 5))
+        roster = rng.sample(player_ids, 10)
+        with_fantasy = rng.random() < 0.5
+        matches.append(
+            {
+                "match_id": match_id,
+                "guild_id": 0,
+                "winning_team": rng.choice([1, 2]),
+                "match_date": when.isoformat(),
+                "team1_players": json.dumps(roster[:5]),
+                "team2_players": json.dumps(roster[5:]),
+                "streak_multiplier_per_game": rng.choice([None, 0.1]),
+                "streak_threshold": None,
+            }
+        )
+        participants_by_match[match_id] = [
+            {
+                "match_id": match_id,
+                "discord_id": pid,
+                "team_number": 1 if position < 5 else 2,
+                "fantasy_points": rng.uniform(0, 35) if with_fantasy else None,
+                "low_priority_gain_multiplier": rng.choice([1.0, 1.0, 0.5]),
+            }
+            for position, pid in enumerate(roster)
+        ]
+    return players, matches, participants_by_match
+
+
+def _reference_glicko(players, matches, participants_by_match) -> list[float]:
+    """Replay through CamaRatingSystem itself, one player object at a time."""
+    system = CamaRatingSystem()
+    mmr = {p["discord_id"]: p["initial_mmr"] for p in players}
+    state, last_at, outcomes, predictions = {}, {}, {}, []
+    for match in matches:
+        when = datetime.fromisoformat(match["match_date"])
+        rows = participants_by_match[match["match_id"]]
+        teams = {1: [], 2: []}
+        streaks, gains = {}, {}
+        for row in rows:
+            pid = row["discord_id"]
+            player = state.get(pid) or system.create_player_from_mmr(mmr.get(pid))
+            if pid in last_at:
+                player.rd = system.apply_rd_decay(player.rd, (when - last_at[pid]).days)
+            teams[row["team_number"]].append((player, pid))
+            _length, streaks[pid] = system.calculate_streak_multiplier(
+                outcomes.get(pid, []),
+                won=row["team_number"] == match["winning_team"],
+                streak_multiplier_per_game=match["streak_multiplier_per_game"] or 0.2,
+                streak_threshold=3,
+            )
+            gains[pid] = row["low_priority_gain_multiplier"]
+        rating1, rd1, _ = system.aggregate_team_stats([p for p, _ in teams[1]])
+        rating2, rd2, _ = system.aggregate_team_stats([p for p, _ in teams[2]])
+        predictions.append(system.predict_win_probability(rating1, rd1, rating2, rd2))
+        updated1, updated2 = system.update_ratings_after_match(
+            teams[1], teams[2], match["winning_team"],
+            streak_multipliers=streaks, gain_multipliers=gains,
+        )
+        for rating, rd, vol, pid in updated1 + updated2:
+            state[pid] = system.create_player_from_rating(rating, rd, vol)
+            last_at[pid] = when
+            won = (pid in {p for _, p in teams[1]}) == (match["winning_team"] == 1)
+            outcomes.setdefault(pid, []).insert(0, won)
+    return predictions
+
+
+def test_default_parameters_reproduce_the_live_rating_systems():
+    players, matches, participants_by_match = _history()
+    history = encode_history(players, matches, participants_by_match)
+    assert history.match_count == len(matches)
+
+    glicko = glicko_predictions(history, [BacktestParams()])[:, 0]
+    assert glicko.tolist() == pytest.approx(
+        _reference_glicko(players, matches, participants_by_match), abs=1e-9
+    )
+
+    openskill = openskill_predictions(history, [BacktestParams()])[:, 0]
+    reference = replay_openskill(
+        players=players, matches=matches, participants_by_match=participants_by_match
+    )
+    assert openskill.tolist() == pytest.approx(
+        [row["openskill_radiant_win_prob"] for row in reference.prediction_rows], abs=1e-9
+    )
+
+
+def test_sweep_matches_settings_run_one_at_a_time():
+    history = encode_history(*_history(seed=11))
+    grid = parameter_grid(
+        initial_rd=[250.0, 350.0],
+        rd_decay_constant=[50.0],
+        os_beta=[2.5, 25.0 / 6.0],
+        os_tau=[0.05, 0.2],
+    )
+    assert len(grid) == 8
+
+    swept = run_backtest(history, grid, workers=2)
+    for setting, result in zip(grid, swept, strict=True):
+        alone = run_backtest(history, [setting], workers=1)[0]
+        assert result.params == setting
+        assert result.glicko.brier_score == pytest.approx(alone.glicko.brier_score, abs=1e-12)
+        assert result.openskill.log_loss == pytest.approx(alone.openskill.log_loss, abs=1e-12)
+        assert {k: b["count"] for k, b in result.openskill.calibration_buckets.items()} == {
+            k: b["count"] for k, b in alone.openskill.calibration_buckets.items()
+        }
+    assert len({r.glicko.brier_score for r in swept}) == 2
+    assert len({r.openskill.brier_score for r in swept}) == 4
+
+    with pytest.raises(ValueError, match="tau"):
+        parameter_grid(tau=[0.5])
+
+
+def test_service_backtests_recorded_matches(repo_db_path):
+    player_repo = PlayerRepository(repo_db_path)
+    match_repo = MatchRepository(repo_db_path)
+    ids = [2000 + i for i in range(10)]
+    for pid in ids:
+        player_repo.add(
+            discord_id=pid,
+            discord_username=f"P{pid}",
+            guild_id=TEST_GUILD_ID,
+            initial_mmr=3000 + 100 * (pid - 2000),
+        )
+    for winning_team in (1, 1, 2):
+        match_repo.record_match(ids[:5], ids[5:], winning_team, guild_id=TEST_GUILD_ID)
+
+    [result] = RatingBacktestService(match_repo).sweep(
+        [BacktestParams()], TEST_GUILD_ID, workers=1
+    )
+
+    assert result.glicko.total_predictions == 3
+    assert result.openskill.total_predictions == 3
+    assert sum(b["count"] for b in result.glicko.calibration_buckets.values()) == 3
@@ -0,0 +1,62 @@
+"""Tests for the lock-free role assignment table."""
+
+import itertools
+import random
+import threading
+
+from domain.models.team import compute_optimal_role_assignments
+from utils import role_assignment_cache
+from utils.role_assignment_cache import (
+    clear_role_assignment_cache,
+    get_cached_role_assignments,
+    team_mask_key,
+)
+
+
+def _random_roles_key(rng: random.Random) -> tuple[tuple[str, ...], ...]:
+    pool = ["1", "2", "3", "4", "5", "6", "carry", ""]
+    return tuple(tuple(rng.sample(pool, rng.randint(0, 4))) for _ in range(5))
+
+
+def test_table_matches_permutation_search():
+    clear_role_assignment_cache()
+    rng = random.Random(7)
+    for _ in range(2000):
+        key = _random_roles_key(rng)
+        assert get_cached_role_assignments(key) == compute_optimal_role_assignments(key)
+    # Second pass is served from the table and must not change the answer.
+    rng = random.Random(7)
+    for _ in range(2000):
+        key = _random_roles_key(rng)
+        assert get_cached_role_assignments(key) == compute_optimal_role_assignments(key)
+
+
+def test_irrelevant_role_strings_share_an_entry():
+    clear_role_assignment_cache()
+    plain = (("1",), ("2", "3"), (), ("4",), ("5",))
+    noisy = (("1", "mid"), ("3", "2", "2"), ("7",), ("4",), ("5",))
+    assert team_mask_key(plain) == team_mask_key(noisy)
+    assert get_cached_role_assignments(plain) is get_cached_role_assignments(noisy)
+    assert len(role_assignment_cache._table) == 1
+
+
+def test_concurrent_lookups_agree():
+    clear_role_assignment_cache()
+    keys = [
+        tuple((str(r),) for r in perm) for perm in itertools.permutations(range(1, 6))
+    ]
+    expected = {key: compute_optimal_role_assignments(key) for key in keys}
+    mismatches = []
+
+    def worker():
+        for key in keys * 5:
+            if get_cached_role_assignments(key) != expected[key]:
+                mismatches.append(key)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mismatches == []
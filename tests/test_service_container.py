@@ -221,6 +221,7 @@ class TestServiceContainerBotExposure:
             "prediction_service": "prediction_service",
             "lobby_service": "lobby_service",
             "lobby_manager": "lobby_manager",
+            "shuffle_speculation_service": "shuffle_speculation_service",
             "gambling_stats_service": "gambling_stats_service",
             "balance_history_service": "balance_history_service",
             "guild_config_service": "guild_config_service",
@@ -251,6 +252,8 @@ class TestServiceContainerBotExposure:
             "duel_flavor_service": "duel_flavor_service",
             "reminder_service": "reminder_service",
             "curfew_service": "curfew_service",
+            "job_scheduler": "job_scheduler",
+            "database_maintenance_service": "database_maintenance_service",
             "mafia_service": "mafia_service",
             "mafia_flavor_service": "mafia_flavor_service",
             "pet_service": "pet_service",
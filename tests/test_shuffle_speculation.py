@@ -0,0 +1,215 @@
+"""Tests for speculative background pre-shuffles."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import services.shuffle_speculation_service as speculation_module
+from domain.models.lobby import LobbyKind
+from repositories.match_repository import MatchRepository
+from repositories.player_repository import PlayerRepository
+from services.match_service import MatchService
+from services.shuffle_speculation_service import ShuffleSpeculationService
+from tests.conftest import TEST_GUILD_ID
+
+
+def _service(repo_db_path) -> tuple[MatchService, PlayerRepository]:
+    player_repo = PlayerRepository(repo_db_path)
+    service = MatchService(
+        player_repo=player_repo,
+        match_repo=MatchRepository(repo_db_path),
+        use_glicko=True,
+    )
+    return service, player_repo
+
+
+def _seed_players(repo: PlayerRepository, count: int = 10) -> list[int]:
+    for i in range(count):
+        repo.add(
+            discord_id=1000 + i,
+            discord_username=f"Player{1000 + i}",
+            guild_id=TEST_GUILD_ID,
+            preferred_roles=[str(i % 5 + 1)],
+            initial_mmr=3000,
+            glicko_rating=1400.0 + 25 * i,
+            glicko_rd=80.0,
+            glicko_volatility=0.06,
+        )
+    return [1000 + i for i in range(count)]
+
+
+def _team_ids(result: dict) -> tuple[frozenset, frozenset]:
+    return (
+        frozenset(p.discord_id for p in result["radiant_team"].players),
+        frozenset(p.discord_id for p in result["dire_team"].players),
+    )
+
+
+def test_shuffle_commits_the_matching_pre_shuffle_without_searching(repo_db_path, monkeypatch):
+    service, player_repo = _service(repo_db_path)
+    player_ids = _seed_players(player_repo)
+
+    # No player has OpenSkill ratings, so both shapes resolve to one Glicko search.
+    assert service.speculate_shuffle(player_ids, TEST_GUILD_ID) == 1
+    assert service.speculate_shuffle(player_ids, TEST_GUILD_ID) == 0
+    (speculation,) = next(iter(service._shuffle_speculations.values()))
+    expected = {
+        frozenset(player_ids[i] for i in speculation.team1),
+        frozenset(player_ids[i] for i in speculation.team2),
+    }
+
+    def no_search(*_args, **_kwargs):
+        raise AssertionError("a ready pre-shuffle must replace the search")
+
+    monkeypatch.setattr(service, "_search_shuffle_teams", no_search)
+    result = service.shuffle_players(player_ids, guild_id=TEST_GUILD_ID)
+
+    assert set(_team_ids(result)) == expected
+    assert service._shuffle_speculations == {}
+
+
+@pytest.mark.parametrize("change", ["rating", "roster"])
+def test_stale_pre_shuffle_is_never_used(repo_db_path, monkeypatch, change):
+    service, player_repo = _service(repo_db_path)
+    player_ids = _seed_players(player_repo, 11)
+    roster = player_ids[:10]
+    service.speculate_shuffle(roster, TEST_GUILD_ID)
+
+    if change == "rating":
+        player_repo.update_glicko_rating(roster[0], TEST_GUILD_ID, 2200.0, 80.0, 0.06)
+    else:
+        roster = [*roster[1:], player_ids[10]]
+
+    searches = []
+    real_search = service._search_shuffle_teams
+
+    def counting_search(shuffler, inputs):
+        searches.append(inputs)
+        return real_search(shuffler, inputs)
+
+    monkeypatch.setattr(service, "_search_shuffle_teams", counting_search)
+    result = service.shuffle_players(roster, guild_id=TEST_GUILD_ID)
+
+    assert len(searches) == 1
+    assert set().union(*_team_ids(result)) == set(roster)
+
+
+def test_pool_shuffle_after_wait_minutes_move_on_uses_the_pre_shuffle(
+    repo_db_path, monkeypatch
+):
+    service, player_repo = _service(repo_db_path)
+    player_ids = _seed_players(player_repo, 12)
+    joined = 1_800_000_000.0
+    join_times = {pid: joined + 5 * i for i, pid in enumerate(player_ids)}
+    lobby_service = Mock()
+    lobby_service.ready_threshold = 10
+    lobby_service.get_lobby_players_and_readycheck_snapshot.return_value = (
+        player_ids, [], join_times, None
+    )
+    speculator = ShuffleSpeculationService(lobby_service, service)
+    clock = {"now": joined + 90}
+    monkeypatch.setattr(speculation_module.time, "time", lambda: clock["now"])
+
+    # The current minutes plus the lookahead for the next tick.
+    assert speculator.speculate(TEST_GUILD_ID, LobbyKind.OPEN) == 2
+    tick = speculator._wait_ticks[(TEST_GUILD_ID, LobbyKind.OPEN)]
+    assert tick == joined + 95  # the eighth player reaches one minute
+
+    # The tick re-speculation only searches the tick after it.
+    clock["now"] = tick
+    assert speculator.speculate(TEST_GUILD_ID, LobbyKind.OPEN) == 1
+
+    def no_search(*_args, **_kwargs):
+        raise AssertionError("a pre-shuffle for the current wait minutes must be used")
+
+    monkeypatch.setattr(service, "_search_shuffle_teams", no_search)
+    shuffle_time = tick + 2
+    wait_minutes = {
+        pid: max(0, int((shuffle_time - joined_at) / 60))
+        for pid, joined_at in join_times.items()
+    }
+    result = service.shuffle_players(
+        player_ids,
+        guild_id=TEST_GUILD_ID,
+        lobby_wait_minutes=wait_minutes,
+        lobby_kind=LobbyKind.OPEN,
+    )
+
+    assert len(set().union(*_team_ids(result))) == 10
+
+
+def test_balance_changes_keep_the_pre_shuffle(repo_db_path, monkeypatch):
+    service, player_repo = _service(repo_db_path)
+    player_ids = _seed_players(player_repo)
+    service.speculate_shuffle(player_ids, TEST_GUILD_ID)
+
+    player_repo.add_balance(player_ids[0], TEST_GUILD_ID, 250)
+
+    def no_search(*_args, **_kwargs):
+        raise AssertionError("a balance change must not invalidate the pre-shuffle")
+
+    monkeypatch.setattr(service, "_search_shuffle_teams", no_search)
+    result = service.shuffle_players(player_ids, guild_id=TEST_GUILD_ID)
+
+    assert set().union(*_team_ids(result)) == set(player_ids)
+
+
+def test_speculation_follows_the_ready_threshold_and_confirmed_roster():
+    lobby_service = Mock()
+    lobby_service.ready_threshold = 10
+    match_service = Mock()
+    speculator = ShuffleSpeculationService(lobby_service, match_service)
+    ids = list(range(1, 13))
+
+    lobby_service.get_lobby_players_and_readycheck_snapshot.return_value = (
+        ids[:9], [], {}, None
+    )
+    assert speculator.speculate(7, LobbyKind.OPEN) == 0
+    match_service.discard_shuffle_speculations.assert_called_once_with(7, LobbyKind.OPEN)
+
+    confirmed = set(ids[:10])
+    lobby_service.get_lobby_players_and_readycheck_snapshot.return_value = (
+        ids, [], dict.fromkeys(ids, 0.0), (555, confirmed)
+    )
+    speculator.speculate(7, LobbyKind.OPEN)
+    args, kwargs = match_service.speculate_shuffle.call_args
+    assert args == (ids[:10], 7)
+    assert set(kwargs["lobby_wait_minutes"]) == confirmed
+    assert kwargs["lobby_kind"] is LobbyKind.OPEN
+
+
+async def test_notify_coalesces_bursts_of_roster_changes(monkeypatch):
+    speculator = ShuffleSpeculationService(Mock(), Mock(), debounce_seconds=0)
+    calls = []
+    monkeypatch.setattr(speculator, "speculate", lambda *key: calls.append(key))
+
+    for _ in range(5):
+        speculator.notify(7, "open")
+    await asyncio.gather(*speculator._tasks.values())
+
+    assert calls == [(7, LobbyKind.OPEN)]
+    assert speculator._tasks == {}
+
+
+async def test_pool_lobby_is_re_speculated_when_wait_minutes_tick(monkeypatch):
+    speculator = ShuffleSpeculationService(Mock(), Mock(), debounce_seconds=0)
+    calls = []
+
+    def speculate(*key):
+        calls.append(key)
+        if len(calls) == 1:
+            speculator._wait_ticks[key] = time.time()
+
+    monkeypatch.setattr(speculator, "speculate", speculate)
+
+    speculator.notify(7, "open")
+    for _ in range(100):
+        if len(calls) == 2:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*speculator._tasks.values())
+
+    assert calls == [(7, LobbyKind.OPEN), (7, LobbyKind.OPEN)]
+    assert speculator._tick_handles == {}
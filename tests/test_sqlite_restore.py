@@ -7,8 +7,9 @@ from pathlib import Path
 
 import pytest
 
-from scripts.sqlite_backup import backup
-from scripts.sqlite_restore import restore, sha256
+from scripts import sqlite_backup
+from scripts.sqlite_backup import backup, backup_chunked, prune_chunked_backups
+from scripts.sqlite_restore import restore, restore_chunked, sha256
 
 
 def create_database(path: Path, value: str) -> None:
@@ -147,3 +148,87 @@ def test_restore_rejects_backup_for_a_different_database(tmp_path: Path) -> None
 
     assert sha256(expected_database) == expected_digest
     assert marker(expected_database) == "expected-live"
+
+
+def test_chunked_backups_dedupe_and_restore_byte_identical(tmp_path: Path) -> None:
+    database = tmp_path / "cama_shuffle.db"
+    backups = tmp_path / "backups"
+    create_database(database, "first")
+    with sqlite3.connect(database) as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE filler(blob BLOB NOT NULL)")
+        connection.executemany(
+            "INSERT INTO filler(blob) VALUES (?)", [(bytes([i]) * 4000,) for i in range(200)]
+        )
+
+    first = backup_chunked(database, backups / "one.json", chunk_size=8192, pages_per_step=7)
+    with sqlite3.connect(database) as connection:
+        connection.execute("UPDATE marker SET value='second'")
+    second = backup_chunked(database, backups / "two.json", chunk_size=8192, pages_per_step=7)
+
+    assert first["chunks_written"] == len(first["chunks"])
+    assert first["schema_migration_count"] == 1
+    assert 0 < second["chunks_written"] < len(second["chunks"]) // 4
+    assert second["bytes_written"] < second["size_bytes"] // 4
+
+    for manifest, expected in ((first, "first"), (second, "second")):
+        report = restore_chunked(Path(str(manifest["backup"])), database)
+        assert report["sha256"] == manifest["sha256"]
+        assert sha256(database) == manifest["sha256"]
+        assert database.stat().st_size == manifest["size_bytes"]
+        assert marker(database) == expected
+
+    assert prune_chunked_backups(backups, keep=1)["removed_manifests"] == 1
+    assert not (backups / "one.json").exists()
+    restore_chunked(backups / "two.json", database)
+    assert marker(database) == "second"
+
+
+def test_chunked_backup_finishes_under_constant_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database = tmp_path / "cama_shuffle.db"
+    create_database(database, "first")
+    with sqlite3.connect(database) as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE filler(blob BLOB NOT NULL)")
+        connection.executemany(
+            "INSERT INTO filler(blob) VALUES (?)", [(bytes([i]) * 4000,) for i in range(50)]
+        )
+
+    writes = 0
+
+    def write_between_steps(_seconds: float) -> None:
+        # Every paced step sees a changed source and restarts the copy.
+        nonlocal writes
+        writes += 1
+        with sqlite3.connect(database) as connection:
+            connection.execute("UPDATE marker SET value=?", (f"write-{writes}",))
+
+    monkeypatch.setattr(sqlite_backup.time, "sleep", write_between_steps)
+    manifest = backup_chunked(
+        database, tmp_path / "backups" / "one.json", pages_per_step=2, max_restarts=3
+    )
+    monkeypatch.undo()
+
+    assert writes <= 5
+    assert not list((tmp_path / "backups").glob(".*.snapshot"))
+    restore_chunked(tmp_path / "backups" / "one.json", database)
+    assert marker(database) == f"write-{writes}"
+    assert manifest["schema_migration_count"] == 1
+
+
+def test_chunked_restore_rejects_corrupted_chunk(tmp_path: Path) -> None:
+    database = tmp_path / "cama_shuffle.db"
+    create_database(database, "live")
+    manifest = backup_chunked(database, tmp_path / "backups" / "one.json", chunk_size=4096)
+    live_digest = sha256(database)
+    digest = manifest["chunks"][-1]
+    chunk = tmp_path / "backups" / "chunks" / digest[:2] / digest
+    chunk.write_bytes(chunk.read_bytes()[:-1] + b"x")
+
+    with pytest.raises(RuntimeError, match="does not match its digest"):
+        restore_chunked(tmp_path / "backups" / "one.json", database)
+
+    assert sha256(database) == live_digest
+    assert not list(tmp_path.glob(".*.restore.partial"))
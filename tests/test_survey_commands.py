@@ -13,6 +13,7 @@ import pytest
 from commands import survey as survey_commands
 from domain.models.survey import (
     Survey,
+    SurveyDeliveryOutcomes,
     SurveyDeliveryStatus,
     SurveyDraftAnswer,
     SurveyQuestion,
@@ -150,6 +151,28 @@ def _cog(*, bot=None, survey_service=None, player_service=None):
     )
 
 
+def _delivery_service(*sessions: SurveySession) -> MagicMock:
+    """A service mock whose grouped delivery calls succeed for ``sessions``."""
+    by_key = {
+        (session.survey.survey_id, session.recipient.discord_id): session
+        for session in sessions
+    }
+    service = MagicMock()
+    service.get_response_sessions.side_effect = lambda keys: {
+        key: by_key[key] for key in keys if key in by_key
+    }
+    service.renew_delivery_claims.side_effect = lambda claims: {
+        recipient_id for recipient_id, _attempt in claims
+    }
+    service.record_delivery_outcomes.side_effect = lambda sent, failed: (
+        SurveyDeliveryOutcomes(
+            sent=tuple(row[0] for row in sent),
+            failed=tuple(row[0] for row in failed),
+        )
+    )
+    return service
+
+
 def test_survey_commands_are_guild_only_without_discord_visibility_gate():
     commands = (
         survey_commands.SurveyCommands.create,
@@ -341,8 +364,7 @@ async def test_successful_dm_marks_delivery_sent_with_persistent_controls():
         dm_message_id=None,
     )
     session = _session(recipient=claimed)
-    service = MagicMock()
-    service.get_response_session.return_value = session
+    service = _delivery_service(session)
     user = SimpleNamespace(
         send=AsyncMock(
             return_value=SimpleNamespace(id=7001, channel=SimpleNamespace(id=6001))
@@ -355,16 +377,17 @@ async def test_successful_dm_marks_delivery_sent_with_persistent_controls():
     )
     cog = _cog(bot=bot, survey_service=service)
 
-    await cog._deliver_recipient(claimed)
+    await cog._deliver_claims([claimed])
 
     sent_kwargs = user.send.await_args.kwargs
     assert isinstance(sent_kwargs["view"], survey_commands.SurveyQuestionView)
     assert sent_kwargs["view"].timeout is None
     assert sent_kwargs["nonce"] == survey_commands._delivery_nonce(501)
     assert sent_kwargs["allowed_mentions"] == survey_commands._ALLOWED_MENTIONS
-    service.mark_delivery_sent.assert_called_once_with(501, 1, 6001, 7001)
-    service.mark_delivery_failed.assert_not_called()
+    service.renew_delivery_claims.assert_called_once_with([(501, 1)])
+    service.record_delivery_outcomes.assert_called_once_with([(501, 1, 6001, 7001)], [])
     bot.fetch_user.assert_not_awaited()
+    assert cog.delivery_stats.sent == 1
 
 
 @pytest.mark.asyncio
@@ -373,9 +396,8 @@ async def test_successful_dm_is_not_relabelled_failed_when_receipt_persistence_f
         delivery_status=SurveyDeliveryStatus.SENDING,
         dm_message_id=None,
     )
-    service = MagicMock()
-    service.get_response_session.return_value = _session(recipient=claimed)
-    service.mark_delivery_sent.side_effect = RuntimeError("database unavailable")
+    service = _delivery_service(_session(recipient=claimed))
+    service.record_delivery_outcomes.side_effect = RuntimeError("database unavailable")
     user = SimpleNamespace(
         send=AsyncMock(
             return_value=SimpleNamespace(id=7001, channel=SimpleNamespace(id=6001))
@@ -387,11 +409,15 @@ async def test_successful_dm_is_not_relabelled_failed_when_receipt_persistence_f
         add_view=MagicMock(),
     )
     cog = _cog(bot=bot, survey_service=service)
+    cog._schedule_delivery_recovery = MagicMock()
 
-    await cog._deliver_recipient(claimed)
+    await cog._deliver_claims([claimed])
 
-    service.mark_delivery_sent.assert_called_once_with(501, 1, 6001, 7001)
+    service.record_delivery_outcomes.assert_called_once_with([(501, 1, 6001, 7001)], [])
     service.mark_delivery_failed.assert_not_called()
+    cog._schedule_delivery_recovery.assert_called_once_with(
+        survey_commands._DELIVERY_STALE_SECONDS
+    )
     assert user.send.await_args.kwargs["nonce"] == survey_commands._delivery_nonce(501)
     assert survey_commands._delivery_nonce(501) == survey_commands._delivery_nonce(501)
 
@@ -426,13 +452,12 @@ async def test_late_post_close_dm_receipt_is_attached_and_controls_removed():
         send=AsyncMock(return_value=sent_message),
         create_dm=AsyncMock(return_value=dm_channel),
     )
-    service = MagicMock()
-    service.get_response_session.side_effect = [
-        open_session,
-        closed_session,
-        closed_session,
-    ]
-    service.mark_delivery_sent.side_effect = RuntimeError("survey closed")
+    service = _delivery_service(open_session)
+    service.get_response_session.return_value = closed_session
+    # The survey closed mid-send: the grouped commit attaches the receipt
+    # through the reconcile path instead of the open-survey one.
+    service.record_delivery_outcomes.side_effect = None
+    service.record_delivery_outcomes.return_value = SurveyDeliveryOutcomes(reconciled=(501,))
     bot = SimpleNamespace(
         get_user=MagicMock(return_value=user),
         fetch_user=AsyncMock(),
@@ -440,9 +465,9 @@ async def test_late_post_close_dm_receipt_is_attached_and_controls_removed():
     )
     cog = _cog(bot=bot, survey_service=service)
 
-    await cog._deliver_recipient(claimed)
+    await cog._deliver_claims([claimed])
 
-    service.reconcile_delivery_sent.assert_called_once_with(501, 1, 6001, 7001)
+    service.record_delivery_outcomes.assert_called_once_with([(501, 1, 6001, 7001)], [])
     edit_kwargs = persisted_message.edit.await_args.kwargs
     assert edit_kwargs["embed"].title == "Survey closed"
     assert edit_kwargs["view"] is None
@@ -548,8 +573,7 @@ async def test_failed_dm_persists_only_sanitized_failure_category():
         delivery_status=SurveyDeliveryStatus.SENDING,
         dm_message_id=None,
     )
-    service = MagicMock()
-    service.get_response_session.return_value = _session(recipient=claimed)
+    service = _delivery_service(_session(recipient=claimed))
     forbidden = discord.Forbidden(
         SimpleNamespace(status=403, reason="Forbidden"),
         {"code": 50007, "message": "Cannot send messages to this user"},
@@ -562,10 +586,9 @@ async def test_failed_dm_persists_only_sanitized_failure_category():
     )
     cog = _cog(bot=bot, survey_service=service)
 
-    await cog._deliver_recipient(claimed)
+    await cog._deliver_claims([claimed])
 
-    service.mark_delivery_sent.assert_not_called()
-    service.mark_delivery_failed.assert_called_once_with(501, 1, "Forbidden")
+    service.record_delivery_outcomes.assert_called_once_with([], [(501, 1, "Forbidden")])
 
 
 @pytest.mark.asyncio
@@ -574,8 +597,7 @@ async def test_interrupted_dm_keeps_claim_for_reconnect_recovery():
         delivery_status=SurveyDeliveryStatus.SENDING,
         dm_message_id=None,
     )
-    service = MagicMock()
-    service.get_response_session.return_value = _session(recipient=claimed)
+    service = _delivery_service(_session(recipient=claimed))
     user = SimpleNamespace(send=AsyncMock(side_effect=asyncio.CancelledError()))
     bot = SimpleNamespace(
         get_user=MagicMock(return_value=user),
@@ -585,9 +607,9 @@ async def test_interrupted_dm_keeps_claim_for_reconnect_recovery():
     cog = _cog(bot=bot, survey_service=service)
 
     with pytest.raises(asyncio.CancelledError):
-        await cog._deliver_recipient(claimed)
+        await cog._deliver_claims([claimed])
 
-    service.mark_delivery_sent.assert_not_called()
+    service.record_delivery_outcomes.assert_not_called()
     service.mark_delivery_failed.assert_not_called()
 
 
@@ -602,12 +624,8 @@ async def test_delivery_dispatch_is_bounded_to_five_concurrent_dms():
         )
         for index in range(8)
     ]
-    sessions = {
-        recipient.discord_id: _session(recipient=recipient) for recipient in recipients
-    }
-    service = MagicMock()
+    service = _delivery_service(*(_session(recipient=recipient) for recipient in recipients))
     service.claim_deliveries.side_effect = [recipients, []]
-    service.get_response_session.side_effect = lambda _survey_id, user_id: sessions[user_id]
     active = 0
     peak = 0
     # Deterministic overlap: sends block on an event instead of a wall-clock
@@ -645,7 +663,11 @@ async def test_delivery_dispatch_is_bounded_to_five_concurrent_dms():
     release.set()
     assert await dispatch == 8
     assert peak == survey_commands._DELIVERY_CONCURRENCY
-    assert service.mark_delivery_sent.call_count == 8
+    recorded = [
+        row for sent, _failed in (c.args for c in service.record_delivery_outcomes.call_args_list)
+        for row in sent
+    ]
+    assert sorted(row[0] for row in recorded) == [500 + index for index in range(8)]
     assert service.claim_deliveries.call_args_list == [
         call(survey_commands._DELIVERY_BATCH_SIZE, survey_commands._DELIVERY_STALE_SECONDS),
         call(survey_commands._DELIVERY_BATCH_SIZE, survey_commands._DELIVERY_STALE_SECONDS),
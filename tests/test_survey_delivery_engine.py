@@ -0,0 +1,238 @@
+"""Survey fan-out delivery against a real repository and a fake Discord sender."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from domain.models.survey import SurveyDeliveryStatus
+from repositories.survey_repository import SurveyRepository
+from services.survey_delivery_engine import SurveyDeliveryEngine
+from services.survey_service import SurveyService
+
+
+class _RateLimited(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("rate limited")
+        self.retry_after = retry_after
+
+
+class FakeSender:
+    """Stands in for ``user.send``: records DMs and tracks concurrency."""
+
+    def __init__(self, *, rate_limit_first: int = 0, fail_for: frozenset[int] = frozenset()):
+        self.delivered: Counter[int] = Counter()
+        self.attempts = 0
+        self.active = 0
+        self.peak = 0
+        self.rate_limit_first = rate_limit_first
+        self.fail_for = fail_for
+
+    async def __call__(self, recipient, session):
+        self.attempts += 1
+        attempt = self.attempts
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0)
+            if attempt <= self.rate_limit_first:
+                raise _RateLimited(0.01)
+            if recipient.discord_id in self.fail_for:
+                raise PermissionError("DMs closed")
+            assert session.recipient.recipient_id == recipient.recipient_id
+            self.delivered[recipient.recipient_id] += 1
+            return 6000 + recipient.discord_id, 7000 + recipient.discord_id
+        finally:
+            self.active -= 1
+
+
+def _open_survey(repo_db_path: str, recipients: int) -> SurveyService:
+    service = SurveyService(SurveyRepository(repo_db_path))
+    survey = service.create_survey(10, "Fan-out")
+    service.add_question(10, survey.survey_id, "Recommend?", "nps")
+    service.open_survey(
+        10, survey.survey_id, list(range(1, recipients + 1)), target_type="all_registered"
+    )
+    return service
+
+
+def _statuses(service: SurveyService) -> Counter:
+    with service.repo.connection() as conn:
+        rows = conn.execute("SELECT delivery_status FROM survey_recipients").fetchall()
+    return Counter(row["delivery_status"] for row in rows)
+
+
+async def test_batch_is_delivered_exactly_once_with_grouped_commits(repo_db_path):
+    service = _open_survey(repo_db_path, 300)
+    sender = FakeSender(fail_for=frozenset({7, 8}))
+    engine = SurveyDeliveryEngine(
+        service, sender, max_concurrency=8, sends_per_second=0, chunk_size=50
+    )
+
+    claims = service.claim_deliveries(limit=300)
+    stats = await engine.deliver(claims)
+
+    assert stats.claimed == 300
+    assert stats.sent == 298 and stats.failed == 2
+    assert set(sender.delivered.values()) == {1}
+    assert sender.peak <= 8
+    assert stats.commits <= 300 // 50 + 2
+    assert stats.unrecorded == stats.unsaved_failures == 0
+    assert stats.sends_per_second > 0
+    assert _statuses(service) == {"sent": 298, "failed": 2}
+    first = service.get_response_session(claims[0].survey_id, claims[0].discord_id)
+    assert first.recipient.delivery_status is SurveyDeliveryStatus.SENT
+    assert first.recipient.dm_message_id == 7000 + claims[0].discord_id
+    # Nothing is left to claim, so a second pass sends nothing.
+    assert service.claim_deliveries(limit=300) == []
+
+
+async def test_rate_limits_narrow_the_window_and_retry_without_duplicates(repo_db_path):
+    service = _open_survey(repo_db_path, 40)
+    sender = FakeSender(rate_limit_first=6)
+    engine = SurveyDeliveryEngine(service, sender, max_concurrency=8, sends_per_second=0)
+
+    stats = await engine.deliver(service.claim_deliveries(limit=40))
+
+    assert stats.rate_limited == 6
+    # Halved on each rate limit, then regrown one slot per full window of successes.
+    assert engine.window == 8
+    assert stats.sent == 40 and stats.failed == 0
+    assert set(sender.delivered.values()) == {1}
+    assert _statuses(service) == {"sent": 40}
+
+
+async def test_rate_limited_claims_renew_their_lease_before_resending(repo_db_path):
+    service = _open_survey(repo_db_path, 3)
+    claims = service.claim_deliveries(limit=3)
+    renewals = []
+    renew = service.renew_delivery_claims
+
+    def recording_renew(batch):
+        renewals.append([recipient_id for recipient_id, _attempt in batch])
+        return renew(batch)
+
+    service.renew_delivery_claims = recording_renew
+    limited = claims[0].recipient_id
+
+    async def sender(recipient, _session):
+        if recipient.recipient_id == limited:
+            # The first send is rate limited; meanwhile another worker takes
+            # the recipient over, so the retry must not go out.
+            with service.repo.connection() as conn:
+                conn.execute(
+                    "UPDATE survey_recipients SET attempt_count = attempt_count + 1 "
+                    "WHERE recipient_id = ?",
+                    (limited,),
+                )
+            raise _RateLimited(0.01)
+        return 6000 + recipient.discord_id, 7000 + recipient.discord_id
+
+    stats = await SurveyDeliveryEngine(
+        service, sender, max_concurrency=1, sends_per_second=0
+    ).deliver(claims)
+
+    assert renewals == [[claim.recipient_id for claim in claims], [limited]]
+    assert stats.rate_limited == 1 and stats.lease_lost == 1
+    assert stats.sent == 2 and stats.failed == 1
+
+
+async def test_long_queued_claims_renew_their_lease(repo_db_path):
+    service = _open_survey(repo_db_path, 3)
+    claims = service.claim_deliveries(limit=3)
+    renewals = []
+    renew = service.renew_delivery_claims
+
+    def recording_renew(batch):
+        renewals.append(len(batch))
+        return renew(batch)
+
+    service.renew_delivery_claims = recording_renew
+    sender = FakeSender()
+
+    stats = await SurveyDeliveryEngine(
+        service, sender, max_concurrency=1, sends_per_second=0, lease_refresh_seconds=0
+    ).deliver(claims)
+
+    # Every queued claim outlived the refresh window, so each send renews
+    # whatever is still queued.
+    assert renewals == [3, 3, 2, 1]
+    assert stats.sent == 3 and stats.lease_lost == 0
+
+
+async def test_lost_leases_are_never_sent(repo_db_path):
+    service = _open_survey(repo_db_path, 5)
+    claims = service.claim_deliveries(limit=5)
+    # Another worker's newer attempt owns the first two recipients now.
+    with service.repo.connection() as conn:
+        conn.execute(
+            "UPDATE survey_recipients SET attempt_count = attempt_count + 1 "
+            "WHERE recipient_id IN (?, ?)",
+            (claims[0].recipient_id, claims[1].recipient_id),
+        )
+    sender = FakeSender()
+
+    stats = await SurveyDeliveryEngine(service, sender, sends_per_second=0).deliver(claims)
+
+    assert stats.lease_lost == 2
+    assert set(sender.delivered) == {claim.recipient_id for claim in claims[2:]}
+    # The failure rows were stale too, so nothing overwrote the newer attempt.
+    assert stats.unsaved_failures == 2
+    assert _statuses(service) == {"sent": 3, "sending": 2}
+
+
+async def test_unrecorded_sends_wait_for_receipt_reconciliation(repo_db_path, monkeypatch):
+    service = _open_survey(repo_db_path, 4)
+    claims = service.claim_deliveries(limit=4)
+
+    def unavailable(*_args):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(service, "record_delivery_outcomes", unavailable)
+    sender = FakeSender()
+    stats = await SurveyDeliveryEngine(service, sender, sends_per_second=0).deliver(claims)
+
+    assert stats.sent == 4 and stats.unrecorded == 4
+    assert _statuses(service) == {"sending": 4}
+    # Stale-claim recovery must not requeue a possibly delivered attempt
+    # until its DM history has been checked.
+    assert service.recover_stale_deliveries(stale_after_seconds=0) == 0
+    assert service.claim_deliveries(limit=4, stale_after_seconds=0) == []
+    unconfirmed = service.list_unconfirmed_deliveries(sending_stale_after_seconds=0)
+    assert {row.recipient_id for row in unconfirmed} == {claim.recipient_id for claim in claims}
+
+
+async def test_cancelled_delivery_keeps_completed_outcomes(repo_db_path):
+    service = _open_survey(repo_db_path, 6)
+    claims = service.claim_deliveries(limit=6)
+    release = asyncio.Event()
+    delivered = []
+
+    async def sender(recipient, session):
+        if recipient.recipient_id != claims[0].recipient_id:
+            await release.wait()
+        delivered.append(recipient.recipient_id)
+        return 6000, 7000 + recipient.recipient_id
+
+    engine = SurveyDeliveryEngine(
+        service, sender, sends_per_second=0, flush_interval_seconds=60
+    )
+    task = asyncio.create_task(engine.deliver(claims))
+    while not delivered:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The completed DM was committed on the way out; the interrupted ones
+    # keep their claims for recovery.
+    assert _statuses(service) == {"sent": 1, "sending": 5}
+    assert engine.totals.sent == 1
+
+
+def test_engine_rejects_non_positive_bounds():
+    with pytest.raises(ValueError):
+        SurveyDeliveryEngine(object(), FakeSender(), max_concurrency=0)
+
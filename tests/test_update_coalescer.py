@@ -0,0 +1,139 @@
+"""Tests for latest-state-wins lobby embed coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from utils.update_coalescer import (
+    UpdateCoalescer,
+    flush_lobby_message_updates,
+    lobby_message_coalescer,
+)
+
+
+class _Publisher:
+    def __init__(self):
+        self.published = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, payload):
+        await self.gate.wait()
+        self.published.append(payload)
+        return True
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_burst_folds_into_one_follow_up_with_latest_payload():
+    coalescer = UpdateCoalescer(min_interval_seconds=0)
+    publish = _Publisher()
+    publish.gate.clear()
+
+    first = asyncio.create_task(coalescer.submit("lobby", 1, publish))
+    await _settle()
+    rest = [asyncio.create_task(coalescer.submit("lobby", n, publish)) for n in range(2, 11)]
+    await _settle()
+    publish.gate.set()
+
+    assert await asyncio.gather(first, *rest) == [True] * 10
+    assert publish.published == [1, 10]
+    assert coalescer.stats()["coalesced"] == 8
+
+
+async def test_min_interval_spaces_edits_and_immediate_skips_it():
+    now = [0.0]
+    coalescer = UpdateCoalescer(min_interval_seconds=60, clock=lambda: now[0])
+    publish = _Publisher()
+
+    await coalescer.submit("lobby", "a", publish)
+    delayed = asyncio.create_task(coalescer.submit("lobby", "b", publish))
+    await _settle()
+    assert publish.published == ["a"]
+
+    await coalescer.submit("lobby", "ready", publish, immediate=True)
+    assert await delayed is True
+    assert publish.published == ["a", "ready"]
+
+
+async def test_flush_publishes_matching_keys_only():
+    now = [0.0]
+    coalescer = UpdateCoalescer(min_interval_seconds=60, clock=lambda: now[0])
+    publish = _Publisher()
+    await coalescer.submit(("g", 1), "a", publish)
+    await coalescer.submit(("g", 2), "x", publish)
+    first = asyncio.create_task(coalescer.submit(("g", 1), "b", publish))
+    second = asyncio.create_task(coalescer.submit(("g", 2), "y", publish))
+    await _settle()
+
+    assert await coalescer.flush(lambda key: key[1] == 1) == 1
+    assert await first is True
+    assert publish.published == ["a", "x", "b"]
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+
+
+async def test_failed_publication_reaches_folded_callers():
+    coalescer = UpdateCoalescer(min_interval_seconds=0)
+    gate = asyncio.Event()
+
+    async def failing(payload):
+        await gate.wait()
+        raise RuntimeError(payload)
+
+    leader = asyncio.create_task(coalescer.submit("k", "a", failing))
+    await _settle()
+    follower = asyncio.create_task(coalescer.submit("k", "b", failing))
+    folded = asyncio.create_task(coalescer.submit("k", "c", failing))
+    await _settle()
+    gate.set()
+
+    results = await asyncio.gather(leader, follower, folded, return_exceptions=True)
+    assert [str(result) for result in results] == ["a", "c", "c"]
+
+
+async def test_lobby_join_burst_builds_embed_once_per_window():
+    import bot as bot_module
+
+    lobby_service = MagicMock()
+    lobby_service.is_ready.return_value = False
+    lobby_service.build_lobby_embed.side_effect = lambda lobby, guild_id: lobby.embed
+    message = SimpleNamespace(id=555, edit=AsyncMock())
+    lobbies = [
+        SimpleNamespace(
+            kind=bot_module.LobbyKind.OPEN,
+            embed=object(),
+            get_player_count=MagicMock(return_value=n),
+        )
+        for n in range(5)
+    ]
+
+    bot_module._lobby_message_update_locks.clear()
+    lobby_message_coalescer.clear()
+    with patch.object(lobby_message_coalescer, "min_interval_seconds", 60):
+        await bot_module.update_lobby_message(message, lobbies[0], 42, lobby_service=lobby_service)
+        burst = [
+            asyncio.create_task(
+                bot_module.update_lobby_message(message, lobby, 42, lobby_service=lobby_service)
+            )
+            for lobby in lobbies[1:]
+        ]
+        await _settle()
+        assert message.edit.await_count == 1
+
+        assert await flush_lobby_message_updates(42, bot_module.LobbyKind.OPEN) == 1
+        assert await asyncio.gather(*burst) == [True] * 4
+    bot_module._lobby_message_update_locks.clear()
+    lobby_message_coalescer.clear()
+
+    assert lobby_service.build_lobby_embed.call_count == 2
+    assert message.edit.await_args.kwargs["embed"] is lobbies[-1].embed
@@ -10,7 +10,7 @@ commands (join check, display formatting).
 """
 
 import re
-from datetime import UTC, datetime
+from datetime import UTC, datetime, time, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from utils.timezone import DEFAULT_TIMEZONE
@@ -62,6 +62,32 @@ def is_within_window(
     return minutes_now >= start_minutes or minutes_now < end_minutes
 
 
+def next_window_start(
+    window, *, general_timezone: str | None = None, now: datetime | None = None
+) -> datetime | None:
+    """Return the first moment after ``now`` at which ``window`` starts.
+
+    Zero-length windows never start. A start time skipped by a DST jump
+    resolves to the instant the clock would have shown it.
+    """
+    start_minutes = window.start_hour * 60 + (window.start_minute or 0)
+    end_minutes = window.end_hour * 60 + (window.end_minute or 0)
+    if start_minutes == end_minutes:
+        return None
+    try:
+        tz = ZoneInfo(effective_timezone(window, general_timezone))
+    except ZoneInfoNotFoundError:
+        tz = ZoneInfo(DEFAULT_TIMEZONE)
+
+    moment = (now or datetime.now(UTC)).astimezone(tz)
+    start = time(window.start_hour, window.start_minute or 0)
+    for days in range(3):
+        candidate = datetime.combine(moment.date() + timedelta(days=days), start, tzinfo=tz)
+        if candidate > moment:
+            return candidate.astimezone(UTC)
+    return None
+
+
 def find_active_window(windows, *, general_timezone: str | None = None, now: datetime | None = None):
     """Return the first (by name) of ``windows`` that's currently active, or None."""
     for window in sorted(windows, key=lambda w: w.name):
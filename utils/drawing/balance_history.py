@@ -37,6 +37,7 @@ SOURCE_COLORS: dict[str, str] = {
     "disburse": "#22C55E",          # Green
     "bonus": "#9CA3AF",             # Grey
     "dig": "#A16207",               # Amber/Brown
+    "other": "#64748B",             # Slate
 }
 
 # Short labels used in the legend.
@@ -49,6 +50,7 @@ SOURCE_LABELS: dict[str, str] = {
     "disburse": "Disburse",
     "bonus": "Bonuses",
     "dig": "Dig",
+    "other": "Other",
 }
 
 
@@ -0,0 +1,196 @@
+"""
+Caching for effect lookups that reward paths resolve repeatedly.
+
+Two layers live here:
+
+- ``VersionedEffectCache`` is a process-wide, thread-safe map for values that
+  are stable until a known boundary (today's economy event until the next
+  trigger, a guild's config until it is written). Each entry carries the
+  source version it was loaded under and an absolute expiry, so a bumped
+  version or an elapsed boundary both force a reload.
+- Request scopes are per-command/per-settlement memo tables held in a
+  ``ContextVar``. Per-player mana and buff snapshots are only cached while a
+  scope is open, and every grant/consume clears the affected namespace, so a
+  cached snapshot can never outlive the operation that read it.
+
+Outside of an open request scope, ``scoped_lookup`` simply calls its loader,
+which keeps ad-hoc reads (and tests) on the uncached path.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+EFFECT_NAMESPACE_MANA = "mana"
+EFFECT_NAMESPACE_BUFF = "buff"
+
+_MISSING = object()
+
+
+@dataclass
+class _VersionedEntry:
+    value: Any
+    version: tuple[int, int]
+    expires_at: float
+
+
+class VersionedEffectCache:
+    """Thread-safe key/value cache invalidated by version bumps and expiry."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._entries: dict[Hashable, _VersionedEntry] = {}
+        self._versions: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def version(self, key: Hashable) -> int:
+        """Return the current version stamp for ``key``."""
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def get_or_load[T](
+        self,
+        key: Hashable,
+        loader: Callable[[], T],
+        *,
+        ttl_seconds: float | None = None,
+        source_version: int = 0,
+    ) -> T:
+        """Return the cached value for ``key`` or load and store it.
+
+        ``source_version`` lets callers fold an external version (for example
+        a repository write counter) into the freshness check. ``ttl_seconds``
+        of ``None`` caches until the next invalidation.
+        """
+        now = self._clock()
+        with self._lock:
+            version = (self._versions.get(key, 0), int(source_version))
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version and now < entry.expires_at:
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+
+        value = loader()
+        expires_at = float("inf") if ttl_seconds is None else now + max(0.0, ttl_seconds)
+        with self._lock:
+            # A concurrent invalidation during the load bumps the version; the
+            # stale value is returned to this caller but never stored.
+            if self._versions.get(key, 0) == version[0]:
+                self._entries[key] = _VersionedEntry(value, version, expires_at)
+            # Boundary-keyed entries (e.g. one per event date) would otherwise
+            # accumulate; misses are rare enough to sweep expired keys here.
+            for stale_key in [
+                k for k, e in self._entries.items() if now >= e.expires_at
+            ]:
+                del self._entries[stale_key]
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` and bump its version so in-flight loads are discarded."""
+        with self._lock:
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.pop(key, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+# namespace -> {key: value}; None when no request scope is open.
+_request_scope: ContextVar[dict[str, dict[Hashable, Any]] | None] = ContextVar(
+    "effect_request_scope", default=None
+)
+
+
+@contextmanager
+def effect_request_scope() -> Iterator[None]:
+    """Open a request scope for per-player effect snapshots.
+
+    Nested scopes share the outermost table, so a settlement that calls into
+    other scoped service methods still resolves each effect once.
+    """
+    if _request_scope.get() is not None:
+        yield
+        return
+    token = _request_scope.set({})
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def effect_request_scoped[T](func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator form of ``effect_request_scope`` for service entry points."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with effect_request_scope():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def scoped_lookup[T](namespace: str, key: Hashable, loader: Callable[[], T]) -> T:
+    """Memoize ``loader()`` under ``(namespace, key)`` for the open request scope."""
+    scope = _request_scope.get()
+    if scope is None:
+        return loader()
+    table = scope.setdefault(namespace, {})
+    value = table.get(key, _MISSING)
+    if value is _MISSING:
+        value = loader()
+        table[key] = value
+    return value
+
+
+def invalidate_request_effects(*namespaces: str) -> None:
+    """Forget scoped snapshots for ``namespaces`` after a grant/consume."""
+    scope = _request_scope.get()
+    if scope is None:
+        return
+    for namespace in namespaces:
+        scope.pop(namespace, None)
+
+
+def invalidates_request_effects(*namespaces: str):
+    """Decorate a write method so it clears scoped snapshots when it returns.
+
+    Invalidation also runs when the write raises, because a partially applied
+    write must not leave a pre-write snapshot in place.
+    """
+
+    def decorator[T](func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                invalidate_request_effects(*namespaces)
+
+        return wrapper
+
+    return decorator
@@ -248,8 +248,11 @@ async def update_lobby_message_closed(
     Shared between match and lobby commands to avoid duplication.
     """
     from domain.models.lobby import LobbyKind
+    from utils.update_coalescer import flush_lobby_message_updates
 
     kind = LobbyKind.normalize(lobby_kind)
+    # A debounced roster refresh landing after this edit would reopen the embed.
+    await flush_lobby_message_updates(guild_id, kind)
     message_id = lobby_service.get_lobby_message_id(
         guild_id=guild_id,
         lobby_kind=kind,
@@ -0,0 +1,500 @@
+"""
+Hot-path latency instrumentation.
+
+A process-wide ``PerfMetrics`` registry records:
+
+- per-command latency histograms (``record_command_latency``),
+- per-repository-method SQL time and row counts, fed by the instrumented
+  SQLite connection that ``BaseRepository.get_connection`` opens,
+- slow statements and the repository method that ran them; their
+  ``EXPLAIN QUERY PLAN`` is taken when the log is read, not on the hot path,
+- ``asyncio.to_thread`` queue wait and event-loop lag from ``run_loop_probe``.
+
+Histograms use fixed log-spaced buckets so recording is O(buckets) with no
+per-sample storage; percentiles are interpolated inside the bucket, which is
+the same estimate Prometheus' ``histogram_quantile`` makes. ``snapshot`` feeds
+the health report and ``render_prometheus`` produces a text exposition dump.
+
+Instrumentation wraps every statement and fetch, so it is off unless
+``PERF_METRICS_ENABLED`` turns it on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import functools
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any
+
+logger = logging.getLogger("cama_bot.perf")
+
+# Seconds. Covers sub-millisecond SQLite reads through multi-second renders.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+SLOW_QUERY_LOG_SIZE = 50
+
+
+class LatencyHistogram:
+    """Cumulative bucketed latency histogram (not thread-safe on its own)."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by linear interpolation within a bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+                upper = (
+                    LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else self.max
+                )
+                fraction = (rank - seen) / bucket_count
+                return min(self.max, lower + (upper - lower) * fraction)
+            seen += bucket_count
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.quantile(0.50) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+@dataclass
+class _SqlStats:
+    histogram: LatencyHistogram
+    statements: int = 0
+    rows: int = 0
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    label: str
+    sql: str
+    duration_ms: float
+    # Empty until ``PerfMetrics.slow_queries`` explains the statement.
+    plan: tuple[str, ...]
+    recorded_at: float
+    parameters: Any = None
+    db_path: str | None = None
+
+
+class PerfMetrics:
+    """Thread-safe registry for the latency metrics described above."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        slow_query_ms: float = 100.0,
+    ) -> None:
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._commands: dict[str, LatencyHistogram] = {}
+        self._sql: dict[str, _SqlStats] = {}
+        self._slow_queries: deque[SlowQuery] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self._thread_wait = LatencyHistogram()
+        self._loop_lag = LatencyHistogram()
+        self._command_starts: dict[int, float] = {}
+
+    # -- commands -----------------------------------------------------------
+
+    def command_started(self, interaction_id: int) -> None:
+        with self._lock:
+            # Interactions that never complete (e.g. autocomplete or a dropped
+            # gateway event) must not grow this map without bound.
+            if len(self._command_starts) > 4096:
+                self._command_starts.clear()
+            self._command_starts[interaction_id] = time.perf_counter()
+
+    def command_finished(self, interaction_id: int | None, name: str | None) -> None:
+        with self._lock:
+            started = self._command_starts.pop(interaction_id, None)
+        if started is not None:
+            self.record_command_latency(name, time.perf_counter() - started)
+
+    def record_command_latency(self, name: str | None, seconds: float) -> None:
+        with self._lock:
+            histogram = self._commands.get(name or "unknown")
+            if histogram is None:
+                histogram = self._commands[name or "unknown"] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    # -- SQL ----------------------------------------------------------------
+
+    def record_sql(
+        self, label: str, seconds: float, rows: int = 0, statements: int = 1
+    ) -> None:
+        """Record one repository call: its total SQL time, rows and statements."""
+        with self._lock:
+            stats = self._sql.get(label)
+            if stats is None:
+                stats = self._sql[label] = _SqlStats(LatencyHistogram())
+            stats.histogram.observe(seconds)
+            stats.statements += statements
+            stats.rows += max(0, rows)
+
+    def record_slow_query(
+        self,
+        label: str,
+        sql: str,
+        seconds: float,
+        *,
+        parameters: Any = None,
+        db_path: str | None = None,
+    ) -> None:
+        """Log a slow statement; its plan is explained later, off the hot path."""
+        entry = SlowQuery(
+            label=label,
+            sql=sql,
+            duration_ms=seconds * 1000,
+            plan=(),
+            recorded_at=time.time(),
+            parameters=parameters,
+            db_path=db_path,
+        )
+        with self._lock:
+            self._slow_queries.append(entry)
+        logger.warning(
+            "Slow query in %s (%.1f ms): %s", label, entry.duration_ms, " ".join(sql.split())[:500]
+        )
+
+    # -- event loop ---------------------------------------------------------
+
+    def record_thread_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._thread_wait.observe(seconds)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        with self._lock:
+            self._loop_lag.observe(seconds)
+
+    # -- reporting ----------------------------------------------------------
+
+    def slow_queries(self) -> list[SlowQuery]:
+        """The recent slow statements, each explained on its own connection."""
+        with self._lock:
+            entries = list(self._slow_queries)
+        explained = [
+            replace(
+                entry,
+                plan=_explain(entry.db_path, entry.sql, entry.parameters),
+                parameters=None,
+            )
+            if entry.parameters is not None
+            else entry
+            for entry in entries
+        ]
+        with self._lock:
+            # Keep the plans so each statement is explained at most once.
+            for entry, resolved in zip(entries, explained):
+                if resolved is entry:
+                    continue
+                try:
+                    index = self._slow_queries.index(entry)
+                except ValueError:
+                    continue  # rotated out of the log meanwhile
+                self._slow_queries[index] = resolved
+        return explained
+
+    def snapshot(self, *, top: int = 8) -> dict[str, Any]:
+        """Return summaries of the slowest commands and repositories."""
+        with self._lock:
+            commands = {
+                name: histogram.summary() for name, histogram in self._commands.items()
+            }
+            sql = {
+                label: {
+                    **stats.histogram.summary(),
+                    "total_ms": stats.histogram.total * 1000,
+                    "rows": stats.rows,
+                    "statements": stats.statements,
+                }
+                for label, stats in self._sql.items()
+            }
+            thread_wait = self._thread_wait.summary()
+            loop_lag = self._loop_lag.summary()
+            slow_count = len(self._slow_queries)
+        return {
+            "commands": dict(
+                sorted(commands.items(), key=lambda item: -item[1]["p95_ms"])[:top]
+            ),
+            "sql": dict(
+                sorted(sql.items(), key=lambda item: -item[1]["total_ms"])[:top]
+            ),
+            "thread_wait": thread_wait,
+            "loop_lag": loop_lag,
+            "slow_queries": slow_count,
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all histograms in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def emit_histogram(
+            metric: str, histogram: LatencyHistogram, labels: dict[str, str]
+        ) -> None:
+            label_text = ",".join(
+                f'{key}="{_escape_label(value)}"' for key, value in labels.items()
+            )
+            prefix = f"{label_text}," if label_text else ""
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS, histogram.counts):
+                cumulative += bucket_count
+                lines.append(f'{metric}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{prefix}le="+Inf"}} {histogram.count}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{metric}_sum{suffix} {histogram.total:.6f}")
+            lines.append(f"{metric}_count{suffix} {histogram.count}")
+
+        with self._lock:
+            lines.append("# TYPE cama_command_latency_seconds histogram")
+            for name, histogram in sorted(self._commands.items()):
+                emit_histogram("cama_command_latency_seconds", histogram, {"command": name})
+            lines.append("# TYPE cama_sql_latency_seconds histogram")
+            for label, stats in sorted(self._sql.items()):
+                emit_histogram(
+                    "cama_sql_latency_seconds", stats.histogram, {"repository": label}
+                )
+            lines.append("# TYPE cama_sql_rows_total counter")
+            for label, stats in sorted(self._sql.items()):
+                lines.append(
+                    f'cama_sql_rows_total{{repository="{_escape_label(label)}"}} {stats.rows}'
+                )
+            lines.append("# TYPE cama_thread_queue_wait_seconds histogram")
+            emit_histogram("cama_thread_queue_wait_seconds", self._thread_wait, {})
+            lines.append("# TYPE cama_event_loop_lag_seconds histogram")
+            emit_histogram("cama_event_loop_lag_seconds", self._loop_lag, {})
+            lines.append("# TYPE cama_slow_queries_total counter")
+            lines.append(f"cama_slow_queries_total {len(self._slow_queries)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._commands.clear()
+            self._sql.clear()
+            self._slow_queries.clear()
+            self._thread_wait = LatencyHistogram()
+            self._loop_lag = LatencyHistogram()
+            self._command_starts.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_GLOBAL_PERF_METRICS = PerfMetrics()
+
+
+def get_perf_metrics() -> PerfMetrics:
+    return _GLOBAL_PERF_METRICS
+
+
+def set_perf_metrics(metrics: PerfMetrics) -> None:
+    global _GLOBAL_PERF_METRICS
+    _GLOBAL_PERF_METRICS = metrics
+
+
+# ---------------------------------------------------------------------------
+# SQLite instrumentation
+# ---------------------------------------------------------------------------
+
+
+_call_site = threading.local()
+
+
+def label_sql_calls(method, label: str):
+    """Wrap a repository method so the connections it opens report ``label``.
+
+    ``BaseRepository`` applies this to each public method once, when the
+    class is created, so naming the call site costs an attribute store per
+    call rather than a stack walk per query. The outermost labelled call
+    wins: a repository method that calls another is charged for both.
+    """
+
+    @functools.wraps(method)
+    def labelled(*args, **kwargs):
+        if not _GLOBAL_PERF_METRICS.enabled or getattr(_call_site, "label", None):
+            return method(*args, **kwargs)
+        _call_site.label = label
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _call_site.label = None
+
+    return labelled
+
+
+def current_sql_call_site() -> str | None:
+    """The label of the repository method running on this thread, if any."""
+    return getattr(_call_site, "label", None)
+
+
+def _explain(db_path: str | None, sql: str, params: Any) -> tuple[str, ...]:
+    if not db_path:
+        return ()
+    try:
+        connection = sqlite3.connect(db_path, uri=db_path.startswith("file:"), timeout=1.0)
+    except sqlite3.Error:
+        return ()
+    try:
+        rows = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    except sqlite3.Error:
+        return ()
+    finally:
+        connection.close()
+    return tuple(str(row[-1]) for row in rows)
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that attributes statement time and fetched rows to its connection."""
+
+    def execute(self, sql, parameters=(), /):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection._observe(sql, parameters, time.perf_counter() - started, self)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.connection._observe(sql, None, time.perf_counter() - started, self)
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            self.connection._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self.connection._rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        self.connection._rows += len(rows)
+        return rows
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """SQLite connection that reports per-call-site timing to ``PerfMetrics``.
+
+    Statement time is accumulated while the connection is open and flushed
+    as a single sample on ``close`` so one repository method call is one
+    observation, matching how repositories use one connection per call.
+    Samples and slow statements are labelled with the repository method that
+    opened the connection (see ``label_sql_calls``). ``EXPLAIN`` statements
+    are diagnostics, not workload, and are not counted.
+    """
+
+    metrics_label = "unknown"
+    metrics_db_path: str | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._elapsed = 0.0
+        self._rows = 0
+        self._statements = 0
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=(), /):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def _observe(self, sql: str, parameters: Any, seconds: float, cursor) -> None:
+        head = sql.lstrip()[:7].upper()
+        if head.startswith("EXPLAIN"):
+            return
+        self._elapsed += seconds
+        self._statements += 1
+        if cursor.rowcount > 0:
+            self._rows += cursor.rowcount
+        metrics = _GLOBAL_PERF_METRICS
+        if (
+            seconds * 1000 >= metrics.slow_query_ms
+            and parameters is not None
+            and head.startswith(("SELECT", "WITH", "UPDATE", "DELETE", "INSERT"))
+        ):
+            metrics.record_slow_query(
+                self.metrics_label,
+                sql,
+                seconds,
+                parameters=parameters,
+                db_path=self.metrics_db_path,
+            )
+
+    def close(self):
+        if self._statements:
+            _GLOBAL_PERF_METRICS.record_sql(
+                self.metrics_label, self._elapsed, self._rows, self._statements
+            )
+            self._statements = 0
+        super().close()
+
+
+# ---------------------------------------------------------------------------
+# Event-loop probe
+# ---------------------------------------------------------------------------
+
+
+async def run_loop_probe(
+    metrics: PerfMetrics | None = None,
+    *,
+    interval_seconds: float = 1.0,
+    iterations: int | None = None,
+) -> None:
+    """Sample event-loop lag and default-executor queue wait forever.
+
+    Lag is how late ``asyncio.sleep(interval)`` wakes up. Queue wait is the
+    delay between submitting a no-op to the default executor (the pool
+    ``asyncio.to_thread`` uses) and that no-op starting on a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    count = 0
+    while iterations is None or count < iterations:
+        target = metrics or _GLOBAL_PERF_METRICS
+        expected = loop.time() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        target.record_loop_lag(max(0.0, loop.time() - expected))
+
+        submitted = time.perf_counter()
+        started = await loop.run_in_executor(None, time.perf_counter)
+        target.record_thread_wait(max(0.0, started - submitted))
+        count += 1
@@ -11,19 +11,69 @@ import math
 import time
 from dataclasses import dataclass
 
+from config import RATE_LIMIT_GLOBAL_BUDGET, RATE_LIMIT_GLOBAL_WINDOW_SECONDS
+
+# Absorbs float drift from summing TAT increments.
+_EPSILON = 1e-9
+
 
 @dataclass(frozen=True)
 class RateLimitResult:
     allowed: bool
     retry_after_seconds: int = 0
+    # True when the key had room but the bot-wide load budget did not.
+    shed: bool = False
 
 
-class RateLimiter:
+class LoadBudget:
+    """
+    Bot-wide budget of cost units, refilled at ``units`` per ``per_seconds``.
+
+    Every command admitted by a :class:`RateLimiter` that holds the budget is
+    charged its cost; commands that skip the limiter are not counted. Only
+    commands that declare a cost above the default 1 are refused when it runs
+    dry: a saturated bot sheds renders and LLM calls first and keeps answering
+    cheap commands. While cheap traffic alone keeps the budget dry, expensive
+    commands stay refused.
     """
-    Token-bucket-ish limiter: allow N events per window per key.
 
-    Periodically purges keys whose window has fully expired so a long-lived
-    bot doesn't accumulate dead entries from users who never come back.
+    def __init__(self, units: float, per_seconds: float) -> None:
+        self._interval = per_seconds / units
+        self._window = float(per_seconds)
+        # Theoretical arrival time: when the budget would be fully refilled.
+        self._tat = 0.0
+
+    def charge(self, now: float, cost: float) -> float:
+        """Charge ``cost`` and return 0, or return seconds until it would fit."""
+        new_tat = max(self._tat, now) + cost * self._interval
+        if cost > 1 and new_tat - now > self._window + _EPSILON:
+            return new_tat - self._window - now
+        # Cheap commands always get through. Their debt is capped at one
+        # window, so expensive work resumes at most one window after the cheap
+        # load drops below the refill rate, however long the burst lasted.
+        self._tat = min(new_tat, now + self._window)
+        return 0.0
+
+    def reset(self) -> None:
+        """Refill the budget completely."""
+        self._tat = 0.0
+
+
+class RateLimiter:
+    """
+    GCRA limiter: allow at most N events in any window per key.
+
+    Each key stores only its theoretical arrival time (TAT), so a check is
+    O(1) in time and memory however busy the key is. A full bucket allows a
+    burst of ``limit``, and spent slots come back one per ``per_seconds``, so
+    no window ever holds more than ``limit`` events. (Refilling a slot every
+    ``per_seconds / limit`` would admit up to ``2 * limit - 1`` per window;
+    keeping both that refill rate and the exact cap needs every timestamp.)
+    A ``cost`` is charged against the shared :class:`LoadBudget`, if any, not
+    against the key's own limit.
+
+    Periodically purges keys whose TAT has passed (they are indistinguishable
+    from keys never seen) so a long-lived bot doesn't accumulate dead entries.
     """
 
     # Sweep dead keys at most every PURGE_INTERVAL_SECONDS, and only when
@@ -31,50 +81,54 @@ class RateLimiter:
     PURGE_INTERVAL_SECONDS: float = 300.0
     PURGE_SIZE_THRESHOLD: int = 1024
 
-    def __init__(self) -> None:
-        # key -> list of timestamps (monotonic seconds)
-        self._hits: dict[tuple[str, int, int], list[float]] = {}
-        # max(per_seconds) seen; used so the purge scan knows when a key is
-        # definitively cold without tracking per-key windows.
-        self._max_window_seen: float = 0.0
+    def __init__(self, budget: LoadBudget | None = None) -> None:
+        # key -> theoretical arrival time (monotonic seconds)
+        self._tat: dict[tuple[str, int, int], float] = {}
         self._next_purge_at: float = 0.0
+        self.budget = budget
 
     def check(
-        self, *, scope: str, guild_id: int, user_id: int, limit: int, per_seconds: int
+        self,
+        *,
+        scope: str,
+        guild_id: int,
+        user_id: int,
+        limit: int,
+        per_seconds: int,
+        cost: float = 1,
     ) -> RateLimitResult:
         now = time.monotonic()
         key = (scope, guild_id, user_id)
-        window_start = now - per_seconds
-
-        if per_seconds > self._max_window_seen:
-            self._max_window_seen = float(per_seconds)
         self._maybe_purge(now)
 
-        hits = self._hits.get(key, [])
-        hits = [t for t in hits if t >= window_start]
-
-        if len(hits) >= limit:
-            oldest = min(hits)
-            retry_after = math.ceil(max(0.0, (oldest + per_seconds) - now))
-            self._hits[key] = hits
+        new_tat = max(self._tat.get(key, now), now) + per_seconds
+        if new_tat - now > limit * per_seconds + _EPSILON:
+            retry_after = math.ceil(new_tat - limit * per_seconds - now - _EPSILON)
             return RateLimitResult(allowed=False, retry_after_seconds=retry_after)
 
-        hits.append(now)
-        self._hits[key] = hits
+        if self.budget is not None:
+            wait = self.budget.charge(now, cost)
+            if wait:
+                return RateLimitResult(
+                    allowed=False, retry_after_seconds=math.ceil(wait), shed=True
+                )
+
+        self._tat[key] = new_tat
         return RateLimitResult(allowed=True, retry_after_seconds=0)
 
+    def reset(self) -> None:
+        """Forget every key."""
+        self._tat.clear()
+        self._next_purge_at = 0.0
+
     def _maybe_purge(self, now: float) -> None:
         if now < self._next_purge_at:
             return
         self._next_purge_at = now + self.PURGE_INTERVAL_SECONDS
-        if len(self._hits) < self.PURGE_SIZE_THRESHOLD:
+        if len(self._tat) < self.PURGE_SIZE_THRESHOLD:
             return
-        cutoff = now - self._max_window_seen
-        # Drop keys whose newest hit is older than any observed window.
-        self._hits = {
-            key: hits for key, hits in self._hits.items()
-            if hits and hits[-1] >= cutoff
-        }
+        self._tat = {key: tat for key, tat in self._tat.items() if tat > now}
 
 
-GLOBAL_RATE_LIMITER = RateLimiter()
+GLOBAL_LOAD_BUDGET = LoadBudget(RATE_LIMIT_GLOBAL_BUDGET, RATE_LIMIT_GLOBAL_WINDOW_SECONDS)
+GLOBAL_RATE_LIMITER = RateLimiter(budget=GLOBAL_LOAD_BUDGET)
@@ -1,32 +1,62 @@
 """
 Service-layer caching for role assignment calculations.
 
-This moves the performance optimization (lru_cache) out of the domain layer
-to maintain clean architecture. Domain models should be pure business logic
-without performance concerns.
-
-Thread-safety: Uses a lock to prevent cache corruption during parallel test
-execution with pytest-xdist.
+This moves the performance optimization out of the domain layer to maintain
+clean architecture. Domain models should be pure business logic without
+performance concerns.
+
+Only membership of roles "1".."5" affects the result, so each player's
+preferred roles reduce to a 5-bit mask and a team to five masks packed into
+one 25-bit int. Results live in a plain dict keyed by that int. Lookups take
+no lock: dict reads and writes are atomic, and two threads that miss the same
+key simply compute the same value, so the worst case is redundant work.
 """
 
-import threading
-from functools import lru_cache
+import itertools
 
-# Lock to protect cache operations during parallel execution
-_cache_lock = threading.Lock()
+ROLES = ("1", "2", "3", "4", "5")
+_ROLE_BITS = {role: 1 << index for index, role in enumerate(ROLES)}
 
+# Lexicographic, like compute_optimal_role_assignments: callers slice a prefix.
+_PERMUTATIONS = tuple(itertools.permutations(ROLES))
+# Each permutation as a packed key with exactly the assigned role's bit set per
+# player, so ``(team_key & perm_key).bit_count()`` counts on-role players.
+_PERMUTATION_KEYS = tuple(
+    sum(_ROLE_BITS[role] << (5 * shift) for shift, role in enumerate(perm))
+    for perm in _PERMUTATIONS
+)
 
-@lru_cache(maxsize=1024)
-def _compute_cached_role_assignments(
-    player_roles_key: tuple[tuple[str, ...], ...],
-) -> tuple[tuple[str, ...], ...]:
-    """
-    Internal cached computation. Protected by _cache_lock in public wrapper.
-    """
-    # Import here to avoid circular import at module level
-    from domain.models.team import compute_optimal_role_assignments
+# The key space is 32**5; clearing at this size bounds memory for pathological
+# callers while a real lobby's teams stay far below it.
+MAX_TABLE_SIZE = 1 << 16
+
+# packed team mask -> optimal assignments
+_table: dict[int, tuple[tuple[str, ...], ...]] = {}
+# Distinct results are few; share one tuple per result across keys.
+_results: dict[tuple[tuple[str, ...], ...], tuple[tuple[str, ...], ...]] = {}
+
+
+def roles_mask(roles) -> int:
+    """Return the 5-bit mask of ``roles``; unknown role strings are ignored."""
+    mask = 0
+    for role in roles or ():
+        mask |= _ROLE_BITS.get(role, 0)
+    return mask
 
-    return compute_optimal_role_assignments(player_roles_key)
+
+def team_mask_key(player_roles_key: tuple[tuple[str, ...], ...]) -> int:
+    """Pack each player's role mask into 5 bits of one int, first player lowest."""
+    key = 0
+    for shift, roles in enumerate(player_roles_key):
+        key |= roles_mask(roles) << (5 * shift)
+    return key
+
+
+def _compute_assignments(key: int) -> tuple[tuple[str, ...], ...]:
+    on_role = [(key & perm_key).bit_count() for perm_key in _PERMUTATION_KEYS]
+    best = max(on_role)
+    result = tuple(perm for perm, count in zip(_PERMUTATIONS, on_role) if count == best)
+    return _results.setdefault(result, result)
 
 
 def get_cached_role_assignments(
@@ -37,19 +67,35 @@ def get_cached_role_assignments(
 
     This is cached because the same 5 players will be evaluated many times
     during shuffle operations. The cache key is a tuple of tuples representing
-    each player's preferred roles.
+    each player's preferred roles; it is reduced to a packed role mask so
+    teams that differ only in irrelevant role strings share an entry.
 
-    Thread-safe: Uses a lock to prevent cache corruption during parallel execution.
+    Thread-safe without locking (see module docstring).
 
     Args:
         player_roles_key: Tuple of (player_preferred_roles_tuple, ...)
 
     Returns:
-        Tuple of optimal role assignments (each assignment is a tuple of 5 role strings)
+        Tuple of optimal role assignments (each assignment is a tuple of 5 role strings),
+        identical to ``compute_optimal_role_assignments``
     """
-    with _cache_lock:
-        return _compute_cached_role_assignments(player_roles_key)
-
-
-
-
+    if len(player_roles_key) != len(ROLES):
+        # Not a full team; the mask table only covers five players.
+        from domain.models.team import compute_optimal_role_assignments
+
+        return compute_optimal_role_assignments(player_roles_key)
+
+    key = team_mask_key(player_roles_key)
+    result = _table.get(key)
+    if result is None:
+        result = _compute_assignments(key)
+        if len(_table) >= MAX_TABLE_SIZE:
+            _table.clear()
+        _table[key] = result
+    return result
+
+
+def clear_role_assignment_cache() -> None:
+    """Drop every cached entry (tests and benchmarks)."""
+    _table.clear()
+    _results.clear()
@@ -0,0 +1,78 @@
+"""
+Cold-start timing.
+
+A ``StartupProfile`` records how long each startup phase took (module
+imports, service initialization, core and deferred extension loads) and when
+the milestones users notice were reached, measured from the moment ``bot.py``
+began importing. The bot logs the summary once background loading finishes
+and the health report shows it.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+logger = logging.getLogger("cama_bot.startup")
+
+
+class StartupProfile:
+    """Per-phase durations and milestone offsets for one process start."""
+
+    def __init__(self, started_at: float | None = None) -> None:
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        # phase name -> seconds spent in it, in the order phases first ran
+        self.phases: dict[str, float] = {}
+        # milestone name -> seconds after ``started_at`` it was first reached
+        self.milestones: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block; repeated phases accumulate."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - started)
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def mark(self, name: str) -> float:
+        """Record ``name`` the first time it is reached and return its offset."""
+        if name not in self.milestones:
+            self.milestones[name] = time.perf_counter() - self.started_at
+        return self.milestones[name]
+
+    def mark_after(self, name: str, *milestones: str) -> float | None:
+        """Record ``name`` at the latest of ``milestones`` once all are reached.
+
+        Returns its offset, or None while any of them is still pending.
+        """
+        if name not in self.milestones:
+            if not all(milestone in self.milestones for milestone in milestones):
+                return None
+            self.milestones[name] = max(self.milestones[milestone] for milestone in milestones)
+        return self.milestones[name]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in self.phases.items()},
+            "milestones_ms": {
+                name: round(seconds * 1000, 1) for name, seconds in self.milestones.items()
+            },
+        }
+
+    def summary(self) -> str:
+        """One-line rendering for logs and the health report."""
+        phases = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.phases.items())
+        milestones = ", ".join(
+            f"{name} at {seconds:.2f} s" for name, seconds in self.milestones.items()
+        )
+        return f"{phases or 'no phases'}; {milestones or 'no milestones'}"
+
+    def log(self) -> None:
+        logger.info("Startup profile: %s", self.summary())
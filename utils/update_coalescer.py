@@ -0,0 +1,202 @@
+"""
+Latest-state-wins coalescing for Discord message refreshes.
+
+A burst of lobby joins used to rebuild and re-publish the lobby embed once per
+join. ``UpdateCoalescer`` collapses those bursts per key:
+
+- At most one publication per key runs at a time. Requests that arrive while
+  one is running (or waiting) fold into a single follow-up, and only the
+  newest payload is published. Every folded caller receives that follow-up's
+  result.
+- After a successful publication the next one for the same key waits out
+  ``min_interval_seconds``, so a rush is spread into a few edits instead of
+  one edit per event.
+- ``immediate=True`` requests and ``flush()`` skip the wait, for state
+  transitions (lobby ready, shuffle) that must be visible right away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from config import LOBBY_EMBED_MIN_EDIT_INTERVAL_SECONDS
+from domain.models.lobby import LobbyKind
+from utils.guild import normalize_guild_id
+
+
+class _PendingUpdate:
+    __slots__ = ("future", "payload", "wake")
+
+    def __init__(self, payload: Any, future: asyncio.Future) -> None:
+        self.payload = payload
+        self.future = future
+        self.wake = asyncio.Event()
+
+
+class _Slot:
+    __slots__ = ("last_published", "lock", "pending")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.pending: _PendingUpdate | None = None
+        self.last_published: float | None = None
+
+
+class UpdateCoalescer:
+    """Per-key publication queue with latest-state-wins semantics."""
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_interval_seconds = min_interval_seconds
+        self._clock = clock
+        self._slots: dict[Hashable, _Slot] = {}
+        self._requested = 0
+        self._published = 0
+        self._coalesced = 0
+
+    async def submit[T](
+        self,
+        key: Hashable,
+        payload: Any,
+        publish: Callable[[Any], Awaitable[T]],
+        *,
+        immediate: bool = False,
+        merge: Callable[[Any, Any], Any] | None = None,
+    ) -> T:
+        """Publish ``payload`` for ``key``, folding into a queued update if any.
+
+        ``merge(queued, new)`` combines a queued payload with a newer one; by
+        default the newer payload replaces the queued one. ``publish`` returns
+        a truthy value when it actually changed the message, which starts the
+        minimum-interval window.
+        """
+        self._requested += 1
+        slot = self._slots.get(key)
+        if slot is None:
+            self._sweep_idle()
+            slot = self._slots[key] = _Slot()
+
+        pending = slot.pending
+        if pending is not None:
+            pending.payload = merge(pending.payload, payload) if merge else payload
+            self._coalesced += 1
+            if immediate:
+                pending.wake.set()
+            return await asyncio.shield(pending.future)
+
+        pending = _PendingUpdate(payload, asyncio.get_running_loop().create_future())
+        if immediate:
+            pending.wake.set()
+        slot.pending = pending
+        try:
+            async with slot.lock:
+                await self._wait_for_window(slot, pending)
+                # Later requests now queue behind this publication instead of
+                # folding into a payload that has already been taken.
+                slot.pending = None
+                result = await publish(pending.payload)
+                self._published += 1
+                if result:
+                    slot.last_published = self._clock()
+        except BaseException as exc:
+            if slot.pending is pending:
+                slot.pending = None
+            if isinstance(exc, Exception):
+                pending.future.set_exception(exc)
+                # Folded callers re-raise it; mark it retrieved for the rest.
+                pending.future.exception()
+            else:
+                pending.future.cancel()
+            raise
+        pending.future.set_result(result)
+        return result
+
+    async def flush(self, match: Callable[[Hashable], bool] | None = None) -> int:
+        """Publish queued updates now and wait for them; returns how many ran."""
+        futures = []
+        for key, slot in list(self._slots.items()):
+            pending = slot.pending
+            if pending is None or (match is not None and not match(key)):
+                continue
+            pending.wake.set()
+            futures.append(pending.future)
+        if futures:
+            await asyncio.gather(
+                *(asyncio.shield(future) for future in futures),
+                return_exceptions=True,
+            )
+        return len(futures)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "keys": len(self._slots),
+            "requested": self._requested,
+            "published": self._published,
+            "coalesced": self._coalesced,
+        }
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._requested = 0
+        self._published = 0
+        self._coalesced = 0
+
+    async def _wait_for_window(self, slot: _Slot, pending: _PendingUpdate) -> None:
+        if slot.last_published is None or pending.wake.is_set():
+            return
+        remaining = slot.last_published + self.min_interval_seconds - self._clock()
+        if remaining <= 0:
+            return
+        try:
+            await asyncio.wait_for(pending.wake.wait(), timeout=remaining)
+        except TimeoutError:
+            pass
+
+    def _sweep_idle(self) -> None:
+        now = self._clock()
+        idle = [
+            key
+            for key, slot in self._slots.items()
+            if slot.pending is None
+            and not slot.lock.locked()
+            and (
+                slot.last_published is None
+                or now - slot.last_published >= self.min_interval_seconds
+            )
+        ]
+        for key in idle:
+            del self._slots[key]
+
+
+# Shared by ``bot.update_lobby_message`` (which publishes through it) and the
+# cogs that must flush it before a lobby is shuffled or closed. Keys are
+# ``(guild_id, lobby_kind, message_id)``.
+lobby_message_coalescer = UpdateCoalescer(LOBBY_EMBED_MIN_EDIT_INTERVAL_SECONDS)
+
+
+def lobby_message_key(guild_id: int | None, lobby_kind: LobbyKind, message) -> tuple:
+    return (
+        normalize_guild_id(guild_id),
+        lobby_kind,
+        getattr(message, "id", None) or id(message),
+    )
+
+
+async def flush_lobby_message_updates(
+    guild_id: int | None,
+    lobby_kind: LobbyKind | str | None = None,
+) -> int:
+    """Publish any queued embed refresh for this lobby without waiting out the interval."""
+    try:
+        kind = LobbyKind.normalize(lobby_kind)
+    except (TypeError, ValueError):
+        kind = LobbyKind.OPEN
+    target = (normalize_guild_id(guild_id), kind)
+    return await lobby_message_coalescer.flush(lambda key: key[:2] == target)